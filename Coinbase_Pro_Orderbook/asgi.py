@@ -7,10 +7,34 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
 
+import asyncio
 import os
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Coinbase_Pro_Orderbook.settings')
 
-application = get_asgi_application()
+import config
+from Orderbook.aio import AsyncWebsocketClient
+from Orderbook.services import OrderBookManager
+from Orderbook.streaming import BookStreamApp
+
+
+def get_book(product_id):
+    return config.BOOK_MANAGER.get_book(product_id)
+
+
+async def start_feed():
+    # manage.py starts the feed when it runs the server, otherwise read it from
+    # the event loop of this application
+    if getattr(config, 'BOOK_MANAGER', None) is None:
+        product_ids = os.environ.get('ORDERBOOK_PRODUCTS', 'BTC-USD').split(',')
+        config.BOOK_MANAGER = OrderBookManager(product_ids, ["full"])
+        asyncio.ensure_future(AsyncWebsocketClient(config.BOOK_MANAGER).run())
+
+
+# orderbook/api/stream pushes the book to the browser with server-sent events,
+# at most 1 / ORDERBOOK_STREAM_INTERVAL updates per second
+application = BookStreamApp(get_asgi_application(), get_book,
+                            interval=float(os.environ.get('ORDERBOOK_STREAM_INTERVAL', 0.25)),
+                            on_startup=start_feed)
@@ -0,0 +1,174 @@
+#######################################
+# asyncio feed client: drive a WebsocketClient (an OrderBook or an
+# OrderBookManager) from an event loop instead of a blocking listen() thread,
+# so several feeds and the ASGI app can share one loop
+#
+import asyncio
+import json
+
+from Orderbook.services import logger
+
+# websockets is optional, only this client needs it
+try:
+    import websockets
+    from websockets.exceptions import ConnectionClosed
+except ImportError:
+    websockets = None
+    ConnectionClosed = None
+
+
+class AsyncWebsocketClient:
+    """
+    connect to the feed of a WebsocketClient from an event loop and call its
+    on_open / on_message / on_message_error / on_close hooks.
+    a reader task only receives frames into a queue, an apply task drains the
+    queue in batches, decodes the frames and hands them to the client; a message
+    which fails to apply goes to on_message_error, an OrderBook resyncs. the
+    connection is opened again, with an increasing delay, whenever it fails
+    or stays silent for recv_timeout seconds
+    """
+    def __init__(self, client, batch_size=500, queue_size=100000, recv_timeout=30,
+                 reconnect_delay=1, max_reconnect_delay=30):
+        """
+        :param client: the WebsocketClient whose product_ids, channels, url, decoder and hooks are used
+        :param batch_size: most frames applied before the apply task yields to the loop
+        :param queue_size: most received frames waiting to be applied, the reader waits when it is full
+        :param recv_timeout: seconds without any frame after which the connection is considered dead
+        :param reconnect_delay: seconds to wait before the first reconnect, doubled on every failure
+        :param max_reconnect_delay: longest wait between reconnects
+        """
+        if websockets is None:
+            raise ImportError("AsyncWebsocketClient needs the websockets package")
+        self.client = client
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.recv_timeout = recv_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.ws = None
+        self.stop_flag = False
+        self.connections = 0
+
+    def on_open(self):
+        self.client.on_open()
+
+    def on_message(self, message):
+        self.client.on_message(message)
+
+    def on_close(self):
+        self.client.on_close()
+
+    def on_message_error(self, message, error):
+        self.client.on_message_error(message, error)
+
+    async def subscribe(self):
+        """
+        open the connection and subscribe to the channels of the client
+        :return: the first message, normally the subscriptions response
+        """
+        self.ws = await websockets.connect(self.client.url, max_size=None, open_timeout=self.recv_timeout)
+        params = {
+            "type": "subscribe",
+            "product_ids": self.client.get_product_ids(),
+            "channels": self.client.channels
+        }
+        await self.ws.send(json.dumps(params))
+        self.connections += 1
+        logger.info("async client subscribed to {}".format(self.client.url))
+        self.on_open()
+        data = await asyncio.wait_for(self.ws.recv(), self.recv_timeout)
+        return json.loads(data)
+
+    async def run(self):
+        """
+        keep the feed running until stop() is called
+        """
+        self.stop_flag = False
+        delay = self.reconnect_delay
+        while not self.stop_flag:
+            try:
+                logger.info(await self.subscribe())
+                delay = self.reconnect_delay
+                await self.listen()
+            except (OSError, asyncio.TimeoutError, ConnectionClosed) as e:
+                logger.error("feed connection failed: {!r}".format(e))
+            except Exception as e:
+                # anything else ends this connection only, the feed is opened again
+                logger.exception("feed failed: {!r}".format(e))
+            finally:
+                await self._close_connection()
+            if self.stop_flag:
+                break
+            logger.info("reconnecting in {} seconds".format(delay))
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def listen(self):
+        """
+        run the reader and the apply task of the open connection until either ends
+        """
+        queue = asyncio.Queue(self.queue_size)
+        reader = asyncio.ensure_future(self._read(queue))
+        applier = asyncio.ensure_future(self._apply(queue))
+        try:
+            done, pending = await asyncio.wait((reader, applier), return_when=asyncio.FIRST_COMPLETED)
+            if reader in done:
+                # the connection was closed, apply what was received before it
+                joined = asyncio.ensure_future(queue.join())
+                await asyncio.wait((joined, applier), return_when=asyncio.FIRST_COMPLETED)
+                joined.cancel()
+                done = {reader} | ({applier} if applier.done() else set())
+        finally:
+            for task in (reader, applier):
+                task.cancel()
+            await asyncio.gather(reader, applier, return_exceptions=True)
+        for task in done:
+            if task.exception():
+                raise task.exception()
+
+    async def _read(self, queue):
+        journal = self.client.journal
+        while not self.stop_flag:
+            try:
+                data = await asyncio.wait_for(self.ws.recv(), self.recv_timeout)
+            except ConnectionClosed as e:
+                if e.rcvd is not None and e.rcvd.code == 1000:
+                    return
+                raise
+            if journal is not None:
+                journal.append(data)
+            await queue.put(data)
+
+    async def _apply(self, queue):
+        decode = self.client.decoder.decode
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            for data in batch:
+                try:
+                    message = decode(data)
+                except ValueError:
+                    logger.warning('one incomplete message, ignored')
+                    continue
+                try:
+                    self.on_message(message)
+                except Exception as e:
+                    # e.g. an order the book does not know, the client resyncs and the feed goes on
+                    self.on_message_error(message, e)
+            for _ in batch:
+                queue.task_done()
+
+    async def _close_connection(self):
+        if self.ws is not None:
+            ws, self.ws = self.ws, None
+            await ws.close()
+            self.on_close()
+
+    def stop(self):
+        """
+        end run() once the current batch is applied
+        """
+        self.stop_flag = True
+        if self.ws is not None:
+            asyncio.ensure_future(self.ws.close())
@@ -0,0 +1,492 @@
+#######################################
+# periodic binary checkpoints of the full level 3 book, and the warm restart
+# from them: the latest checkpoint is loaded and only the journaled frames
+# after its sequence are applied, see Orderbook.journal. the book is copied
+# a slice of levels at a time between feed messages, on the thread applying
+# them; sorting, encoding and writing the copy is done by a checkpointer thread
+#
+# file layout, little endian:
+#   HEADER    magic, format version, flags, sequence, capture time in ns
+#   3 texts   product_id, quote_increment, base_increment ('' in decimal mode), each u16 length + utf-8
+#   per side  (buy then sell) u32 level count, then every level from the lowest price:
+#             LEVEL       price, order count
+#             per order   ORDER_UUID if every order id is a uuid, otherwise u16 length + id + NUMBER
+#   u32       crc32 of everything before it
+# a number is an int64 mantissa and an int8 decimal exponent, fixed point values have exponent 0
+#
+import contextlib
+import decimal
+import gc
+import itertools
+import os
+import queue
+import re
+import struct
+import threading
+import time
+import zlib
+
+from Orderbook.journal import JournalReader
+from Orderbook.services import logger, FixedPointCodec, Order, PriceLevel
+
+MAGIC = b'OBCP'
+FORMAT_VERSION = 1
+FLAG_FIXED_POINT = 1
+FLAG_UUID_IDS = 2
+HEADER = struct.Struct('<4sBBQQ')
+LEVEL = struct.Struct('<qbI')
+ORDER_UUID = struct.Struct('<36sqb')
+NUMBER = struct.Struct('<qb')
+LENGTH = struct.Struct('<H')
+COUNT = struct.Struct('<I')
+CHECKPOINT_SUFFIX = '.checkpoint'
+# 1E<exponent> of every exponent of a number
+_SCALES = {exponent: decimal.Decimal((0, (1,), exponent)) for exponent in range(-128, 128)}
+_UUID = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+
+@contextlib.contextmanager
+def _collector_paused():
+    # the garbage collector would walk the whole book again and again while a
+    # copy of it is made, which takes as long as making the copy
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def capture_state(book):
+    """
+    copy the resting orders of book, called between two feed messages
+    :return: the state, a dict in the format of
+        {
+        'product_id': 'BTC-USD', 'sequence': 4816542102, 'captured_ns': ...,
+        'codec': the codec of the book,
+        'buy': [(price, [(order_id, size), ...]), ...],   levels from the lowest price
+        'sell': [...]
+        }
+    """
+    state = dict(product_id=book.get_product_ids()[0], sequence=book._sequence_id,
+                 captured_ns=time.time_ns(), codec=book._codec)
+    with _collector_paused():
+        for side in ('buy', 'sell'):
+            state[side] = [(price, [(order.order_id, order.size) for order in level.orders.values()])
+                           for price, level in book.get_orders(side).items()]
+    return state
+
+
+class StateCapture:
+    """
+    copy the resting orders of a book a slice of levels at a time, between feed
+    messages, so no message waits for the copy of the whole book. a level which
+    changes after it was copied is found in the change log of the book and copied
+    again by the last slice; the copy starts over if the change log was cleared
+    or overflowed meanwhile
+    """
+    def __init__(self, book, slice_levels=1000):
+        """
+        :param book: the OrderBook
+        :param slice_levels: how many price levels are copied by one step()
+        """
+        self.book = book
+        self.slice_levels = slice_levels
+        self.restarts = 0
+        self._start()
+
+    def _start(self):
+        book = self.book
+        self._version = book._version
+        self._pending = [(side, price) for side in ('buy', 'sell') for price in book.get_orders(side).keys()]
+        self._copies = dict(buy={}, sell={})
+
+    def _copy(self, side, price):
+        level = self.book.get_orders(side).get(price)
+        if level is None:
+            self._copies[side].pop(price, None)
+        else:
+            self._copies[side][price] = [(order.order_id, order.size) for order in level.orders.values()]
+
+    def step(self):
+        """
+        copy the next slice of levels, called between two feed messages
+        :return: the state in the format of capture_state() once every level was copied, else None
+        """
+        book = self.book
+        with _collector_paused():
+            pending = self._pending
+            for side, price in pending[-self.slice_levels:]:
+                self._copy(side, price)
+            del pending[-self.slice_levels:]
+            if pending:
+                return None
+            changes = book._changes
+            changed = book._version > self._version
+            if book._change_floor > self._version or (changed and (not changes or changes[0][0] > self._version + 1)):
+                # the book was replaced, or the changes since the copy started are no longer all kept
+                logger.info("checkpoint: the book changed too much during the copy, starting over")
+                self.restarts += 1
+                self._start()
+                return None
+            if changed:
+                for side, price in {(side, price) for version, side, price in
+                                    itertools.islice(changes, self._version - changes[0][0] + 1, None)}:
+                    self._copy(side, price)
+        state = dict(product_id=book.get_product_ids()[0], sequence=book._sequence_id,
+                     captured_ns=time.time_ns(), codec=book._codec)
+        # sorted by sort_levels() on the checkpointer thread
+        state.update(self._copies)
+        return state
+
+
+def sort_levels(state):
+    """
+    :param state: a state of StateCapture.step(), whose sides are dicts of price -> orders
+    :return: the state in the format of capture_state(), levels from the lowest price
+    """
+    for side in ('buy', 'sell'):
+        if isinstance(state[side], dict):
+            state[side] = sorted(state[side].items())
+    return state
+
+
+def _number(value):
+    """
+    :return: (mantissa, exponent) of a fixed point int or a decimal.Decimal
+    """
+    if isinstance(value, int):
+        return value, 0
+    exponent = value.as_tuple().exponent
+    return int(value.scaleb(-exponent)), exponent
+
+
+def _text(value):
+    data = value.encode()
+    return LENGTH.pack(len(data)) + data
+
+
+def encode_state(state):
+    """
+    :return: the checkpoint bytes of a state of capture_state()
+    """
+    codec = state['codec']
+    fixed_point = getattr(codec, 'fixed_point', False)
+    uuid_ids = all(_UUID.fullmatch(order_id)
+                   for side in ('buy', 'sell') for _, orders in state[side] for order_id, _ in orders)
+    flags = (FLAG_FIXED_POINT if fixed_point else 0) | (FLAG_UUID_IDS if uuid_ids else 0)
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, flags, state['sequence'], state['captured_ns']),
+             _text(state['product_id']),
+             _text(str(codec.quote_increment) if fixed_point else ''),
+             _text(str(codec.base_increment) if fixed_point else '')]
+    pack_level, pack_order, pack_number = LEVEL.pack, ORDER_UUID.pack, NUMBER.pack
+    for side in ('buy', 'sell'):
+        levels = state[side]
+        parts.append(COUNT.pack(len(levels)))
+        for price, orders in levels:
+            parts.append(pack_level(*_number(price), len(orders)))
+            if uuid_ids:
+                parts.extend(pack_order(order_id.encode(), *_number(size))
+                             for order_id, size in orders)
+            else:
+                for order_id, size in orders:
+                    parts.append(_text(order_id))
+                    parts.append(pack_number(*_number(size)))
+    data = b''.join(parts)
+    return data + COUNT.pack(zlib.crc32(data))
+
+
+def _fixed_point(mantissa, exponent):
+    return mantissa
+
+
+def _decimal(mantissa, exponent):
+    # multiplying by 1E<exponent> is exact and keeps the exponent, so str() of the
+    # result is the text the value was parsed from
+    return decimal.Decimal(mantissa) * _SCALES[exponent]
+
+
+def _fill(level, orders):
+    """
+    PriceLevel.add of a whole level of new orders, without a call per order
+    """
+    by_id = level.orders
+    size = 0
+    for order in orders:
+        order.level = level
+        by_id[order.order_id] = order
+        size += order.size
+    level.size = size
+
+
+def _read_text(data, offset):
+    length, = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    return bytes(data[offset:offset + length]).decode(), offset + length
+
+
+def decode_state(data):
+    """
+    :param data: the bytes of a checkpoint
+    :return: the state, as of capture_state() with the values already in the representation of
+            the book: 'fixed_point', 'quote_increment' and 'base_increment' take the place of
+            'codec', and every level is a PriceLevel in a dict by price
+    :raise ValueError: if data is not a whole checkpoint of this format
+    """
+    with _collector_paused():
+        return _decode_state(data)
+
+
+def _decode_state(data):
+    data = memoryview(data)
+    if len(data) < HEADER.size + COUNT.size or bytes(data[:4]) != MAGIC:
+        raise ValueError("not a checkpoint")
+    crc, = COUNT.unpack_from(data, len(data) - COUNT.size)
+    data = data[:len(data) - COUNT.size]
+    if zlib.crc32(data) != crc:
+        raise ValueError("the checkpoint is damaged, its checksum does not match")
+    _, version, flags, sequence, captured_ns = HEADER.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise ValueError("unsupported checkpoint format version {}".format(version))
+    fixed_point = bool(flags & FLAG_FIXED_POINT)
+    offset = HEADER.size
+    product_id, offset = _read_text(data, offset)
+    quote_increment, offset = _read_text(data, offset)
+    base_increment, offset = _read_text(data, offset)
+    state = dict(product_id=product_id, sequence=sequence, captured_ns=captured_ns, fixed_point=fixed_point,
+                 quote_increment=quote_increment or None, base_increment=base_increment or None)
+
+    Decimal, scales = decimal.Decimal, _SCALES
+    unpack_level, unpack_number = LEVEL.unpack_from, NUMBER.unpack_from
+    number = _fixed_point if fixed_point else _decimal
+    for side in ('buy', 'sell'):
+        count, = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        levels = {}
+        for _ in range(count):
+            mantissa, exponent, order_count = unpack_level(data, offset)
+            offset += LEVEL.size
+            price = number(mantissa, exponent)
+            level = levels[price] = PriceLevel(side, price)
+            if flags & FLAG_UUID_IDS:
+                end = offset + order_count * ORDER_UUID.size
+                records = ORDER_UUID.iter_unpack(data[offset:end])
+                if fixed_point:
+                    orders = [Order(raw_id.decode(), size) for raw_id, size, _ in records]
+                else:
+                    orders = [Order(raw_id.decode(), Decimal(mantissa) * scales[exponent])
+                              for raw_id, mantissa, exponent in records]
+                offset = end
+            else:
+                orders = []
+                for _ in range(order_count):
+                    order_id, offset = _read_text(data, offset)
+                    mantissa, exponent = unpack_number(data, offset)
+                    offset += NUMBER.size
+                    orders.append(Order(order_id, number(mantissa, exponent)))
+            _fill(level, orders)
+        state[side] = levels
+    return state
+
+
+def checkpoint_name(product_id, sequence):
+    """
+    :return: the file name of the checkpoint of product_id at sequence, names of one
+            product sort in sequence order
+    """
+    return '{}-{:020d}{}'.format(product_id, sequence, CHECKPOINT_SUFFIX)
+
+
+def list_checkpoints(directory, product_id):
+    """
+    :return: paths of the checkpoints of product_id in directory, oldest first
+    """
+    if not os.path.isdir(directory):
+        return []
+    prefix = product_id + '-'
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith(prefix) and name.endswith(CHECKPOINT_SUFFIX)
+                   and name[len(prefix):-len(CHECKPOINT_SUFFIX)].isdigit())
+    return [os.path.join(directory, name) for name in names]
+
+
+def write_checkpoint(directory, state):
+    """
+    encode state and write it to directory. the file is written under a temporary
+    name and renamed, so a checkpoint is never seen half written
+    :return: the path of the checkpoint
+    """
+    data = encode_state(state)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, checkpoint_name(state['product_id'], state['sequence']))
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return path
+
+
+def read_header(path):
+    """
+    :return: {'sequence': ..., 'captured_ns': ...} of the checkpoint at path, without reading the book
+    :raise ValueError: if the file is not a checkpoint
+    """
+    with open(path, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size or data[:4] != MAGIC:
+        raise ValueError("not a checkpoint")
+    _, _, _, sequence, captured_ns = HEADER.unpack(data)
+    return dict(sequence=sequence, captured_ns=captured_ns)
+
+
+def read_checkpoint(path):
+    """
+    :return: the state of the checkpoint at path, see decode_state()
+    """
+    with open(path, 'rb') as f:
+        return decode_state(f.read())
+
+
+def load_state(book, state):
+    """
+    replace the whole book with a state of read_checkpoint()
+    :raise ValueError: if the state is of another product, or in another mode than the book
+    """
+    if state['product_id'] != book.get_product_ids()[0]:
+        raise ValueError("the checkpoint is of {}, not {}".format(state['product_id'], book.get_product_ids()[0]))
+    if state['fixed_point']:
+        if book._codec is None:
+            book._codec = FixedPointCodec(state['quote_increment'], state['base_increment'])
+        elif not getattr(book._codec, 'fixed_point', False) or \
+                (book._codec.quote_increment, book._codec.base_increment) != \
+                (decimal.Decimal(state['quote_increment']), decimal.Decimal(state['base_increment'])):
+            raise ValueError("the checkpoint is in fixed point mode with other increments than the book")
+    elif book._codec is None or getattr(book._codec, 'fixed_point', False):
+        raise ValueError("the checkpoint is in decimal mode, the book is not")
+    book.load_levels(state['sequence'], state)
+
+
+def warm_start(book, checkpoint_directory, journal_directory=None):
+    """
+    load the latest checkpoint of the book's product, then apply the journaled frames
+    after its sequence up to the end of the journal, or up to the first gap
+    :return: the number of journaled messages applied, or None if there is no usable checkpoint
+    """
+    product_id = book.get_product_ids()[0]
+    start = time.perf_counter()
+    for path in reversed(list_checkpoints(checkpoint_directory, product_id)):
+        try:
+            state = read_checkpoint(path)
+            load_state(book, state)
+            break
+        except (OSError, ValueError, struct.error) as e:
+            logger.error("warm start: cannot load {}: {}".format(path, e))
+    else:
+        return None
+    logger.info("warm start: loaded {} at sequence={} in {:.3f}s".format(
+        path, book._sequence_id, time.perf_counter() - start))
+
+    applied = 0
+    if journal_directory is None or not os.path.isdir(journal_directory):
+        return applied
+    decode = book.decoder.decode
+    for _, _, frame in JournalReader(journal_directory).read(after_sequence=book._sequence_id):
+        try:
+            message = decode(bytes(frame))
+        except ValueError:
+            continue
+        message_sequence = message.get('sequence')
+        if message.get('product_id') != product_id or message_sequence is None \
+                or message_sequence <= book._sequence_id:
+            continue
+        if message_sequence > book._sequence_id + 1:
+            logger.info("warm start: the journal has a gap after sequence={}".format(book._sequence_id))
+            break
+        book._sequence_id = message_sequence
+        book.apply_message(message)
+        applied += 1
+    logger.info("warm start: applied {} journaled messages, sequence={}".format(applied, book._sequence_id))
+    return applied
+
+
+class BookCheckpointer:
+    """
+    write a checkpoint of an OrderBook every interval seconds and keep the latest few.
+    the checkpointer thread sets requested, and the book calls capture() after each
+    message it applies, on its own thread, until a StateCapture copied the book a
+    slice of levels at a time; the copy is sorted, encoded and written on the
+    checkpointer thread. no checkpoint is taken while the book resyncs
+    """
+    def __init__(self, book, directory, interval=60, keep=3, slice_levels=1000):
+        """
+        :param book: the OrderBook
+        :param directory: where the checkpoints are written, shared by the books of all products
+        :param interval: seconds between two checkpoints
+        :param keep: how many checkpoints of the product are kept, older ones are deleted
+        :param slice_levels: how many price levels are copied after one message, which
+                bounds how long the feed thread is held up by a checkpoint
+        """
+        self.book = book
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self.slice_levels = slice_levels
+        self.requested = False
+        self.written = 0
+        self._capture = None
+        self._captured = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(name='book_checkpoint Thread', target=self.run, daemon=True)
+
+    def start(self):
+        self.book.checkpointer = self
+        self._thread.start()
+        return self
+
+    def capture(self):
+        """
+        called by the book between two messages, copies the next slice of the book
+        """
+        if self._capture is None:
+            self._capture = StateCapture(self.book, self.slice_levels)
+        state = self._capture.step()
+        if state is not None:
+            self.requested = False
+            self._capture = None
+            self._captured.put(state)
+
+    def close(self):
+        self.book.checkpointer = None
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def run(self):
+        while not self._stop.wait(self.interval):
+            self.requested = True
+            state = None
+            while state is None:
+                try:
+                    state = self._captured.get(timeout=1)
+                except queue.Empty:
+                    if self._stop.is_set():
+                        return
+            self.save(sort_levels(state))
+
+    def save(self, state):
+        start = time.perf_counter()
+        try:
+            path = write_checkpoint(self.directory, state)
+        except OSError as e:
+            logger.error("checkpoint: failed to write: {}".format(e))
+            return
+        self.written += 1
+        logger.info("checkpoint: wrote {} in {:.3f}s".format(path, time.perf_counter() - start))
+        for old in list_checkpoints(self.directory, state['product_id'])[:-self.keep]:
+            try:
+                os.remove(old)
+            except OSError as e:
+                logger.warning("checkpoint: failed to delete {}: {}".format(old, e))
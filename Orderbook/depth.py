@@ -0,0 +1,190 @@
+#######################################
+# cumulative depth of one side of the order book over a window of price ticks
+# next to the best price, kept in Fenwick trees so the size and the notional
+# between the best price and any price are sums over log(window) nodes
+#
+import threading
+
+
+class FenwickTree:
+    """
+    prefix sums over a fixed number of values, each update and each prefix
+    sum visits log2(size) nodes
+    """
+    __slots__ = ('size', 'tree')
+
+    def __init__(self, values):
+        """
+        :param values: the initial values, their count is the size of the tree
+        """
+        self.size = len(values)
+        tree = [0]
+        tree.extend(values)
+        # build in O(size): every node passes its sum on to its parent
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def add(self, i, delta):
+        """
+        add delta to the value at index i (0 based)
+        """
+        tree = self.tree
+        i += 1
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """
+        :return: the sum of the first i values
+        """
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def search(self, target):
+        """
+        :return: the smallest i for which the sum of the first i + 1 values reaches target,
+                or size if all values together stay below it (values must not be negative)
+        """
+        tree = self.tree
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+
+class SideDepth:
+    """
+    size and notional (price * size) of the price levels of one side, indexed
+    by their distance in ticks from the start of the window: index 0 is the
+    best end of the window, which is placed margin ticks better than the best
+    price so the best price can improve a little without leaving the window.
+    levels further than width ticks are not indexed, queries walk them.
+    a change only records the new size, the trees are brought up to date by the
+    next query, so the feed does not pay for them between queries
+    """
+    __slots__ = ('side', 'tick', 'width', 'start', 'sizes', 'notionals', 'values', 'applied', 'pending',
+                 'flush_lock')
+
+    def __init__(self, side, levels, tick, width, margin=None):
+        """
+        :param side: (String) 'buy' or 'sell'
+        :param levels: the SortedDict of the side, price -> PriceLevel
+        :param tick: the price increment, 1 for fixed point prices
+        :param width: how many ticks the window covers
+        :param margin: how many ticks the window reaches beyond the best price, width / 8 by default
+        """
+        self.side = side
+        self.tick = tick
+        self.width = width
+        self.values = [0] * width
+        # index -> price of the levels changed since the trees were last updated. the feed
+        # thread adds to it while a query thread flushes it, queries flush one at a time
+        self.pending = {}
+        self.flush_lock = threading.Lock()
+        if not levels:
+            # placed by the next change, which rebuilds the side
+            self.start = None
+            self.sizes = self.notionals = None
+            return
+        if margin is None:
+            margin = width // 8
+        if side == 'sell':
+            self.start = levels.keys()[0] - margin * tick
+            in_window = levels.irange(self.start, self.start + (width - 1) * tick)
+        else:
+            self.start = levels.keys()[-1] + margin * tick
+            in_window = levels.irange(self.start - (width - 1) * tick, self.start)
+        notionals = [0] * width
+        for price in in_window:
+            i = self.index(price)
+            self.values[i] = size = levels[price].size
+            notionals[i] = price * size
+        # the sizes the trees hold
+        self.applied = list(self.values)
+        self.sizes = FenwickTree(self.values)
+        self.notionals = FenwickTree(notionals)
+
+    def index(self, price):
+        """
+        :return: the distance of price from the start of the window in ticks, negative if
+                price is better than the start
+        """
+        if self.side == 'sell':
+            return int((price - self.start) // self.tick)
+        return int((self.start - price) // self.tick)
+
+    def price(self, i):
+        if self.side == 'sell':
+            return self.start + i * self.tick
+        return self.start - i * self.tick
+
+    def edge(self):
+        """
+        :return: the price of the first level beyond the window
+        """
+        return self.price(self.width)
+
+    def set(self, price, size):
+        """
+        record the new total size of the level at price
+        :return: False if the window has to be placed again, because the side was
+                empty or price is better than the start of the window
+        """
+        if self.start is None:
+            return False
+        i = self.index(price)
+        if i < 0:
+            return False
+        if i >= self.width:
+            return True
+        if size != self.values[i]:
+            self.values[i] = size
+            self.pending[i] = price
+        return True
+
+    def flush(self):
+        """
+        add the changes recorded since the last query to the trees
+        """
+        values, applied, pending = self.values, self.applied, self.pending
+        with self.flush_lock:
+            while pending:
+                # popitem() is atomic, the feed thread may add entries meanwhile
+                i, price = pending.popitem()
+                delta = values[i] - applied[i]
+                if delta:
+                    applied[i] += delta
+                    self.sizes.add(i, delta)
+                    self.notionals.add(i, delta * price)
+
+    def up_to(self, i):
+        """
+        :return: (size, notional) of the levels from the start of the window to index i, included
+        """
+        if self.pending:
+            self.flush()
+        return self.sizes.prefix(i + 1), self.notionals.prefix(i + 1)
+
+    def fill(self, size):
+        """
+        :return: (index, size, notional) where index is the level at which size is reached,
+                size and notional are those of the levels before it; index is width
+                if the window holds less than size
+        """
+        if self.pending:
+            self.flush()
+        i = self.sizes.search(size)
+        return i, self.sizes.prefix(i), self.notionals.prefix(i)
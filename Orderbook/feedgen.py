@@ -0,0 +1,232 @@
+#######################################
+# seeded generator of synthetic full channel feeds: a level 3 snapshot and the
+# open/received/done/match/change messages which follow it. the generator
+# keeps its own model of the book, so every done, match and change refers to
+# an order which rests at the price it names, as on the live feed, and the
+# same seed always gives the same snapshot and messages
+#
+import datetime
+import json
+import random
+import uuid
+
+from sortedcontainers import SortedDict
+
+from Orderbook.services import format_units
+
+# share of each message type in messages(), see FeedGenerator
+DEFAULT_MIX = dict(received=0.30, open=0.30, done=0.25, match=0.10, change=0.05)
+
+
+class FeedGenerator:
+    """
+    synthetic feed of one product. prices are whole ticks of quote_increment
+    around a fixed mid, bids below it and asks above it, so the book never
+    crosses. new orders are placed within depth ticks of the mid, closer
+    prices being more likely; matches take from the best level of a side
+    """
+    def __init__(self, seed=1, product_id='BTC-USD', mid='19230.00', depth=1000, orders_per_level=5,
+                 mix=None, quote_increment='0.01', base_increment='0.00000001', start_sequence=1000):
+        """
+        :param seed: seed of the random generator
+        :param mid: (String) the price between the two sides
+        :param depth: how many price levels per side the snapshot has, and how many
+                ticks from the mid new orders are placed at most
+        :param orders_per_level: how many orders rest at each price level of the snapshot
+        :param mix: dict of message type -> share of messages(), DEFAULT_MIX by default.
+                a done or match message needs a resting order, with an empty side an
+                open message is sent instead
+        :param start_sequence: sequence of the snapshot
+        """
+        self.rng = random.Random(seed)
+        self.product_id = product_id
+        self.depth = depth
+        self.orders_per_level = orders_per_level
+        mix = dict(DEFAULT_MIX if mix is None else mix)
+        self.types = list(mix)
+        self.weights = [mix[message_type] for message_type in self.types]
+        self.quote_places = len(quote_increment.partition('.')[2])
+        self.base_places = len(base_increment.partition('.')[2])
+        self.mid = round(float(mid) * 10 ** self.quote_places)
+        self.sequence = start_sequence
+        # the generator's book: side -> SortedDict of price ticks -> [order_id, ...] in
+        # queue order, and order_id -> [side, price ticks, size units]
+        self.levels = dict(buy=SortedDict(), sell=SortedDict())
+        self.orders = {}
+        # resting order ids in no order, for picking one to cancel or change
+        self._ids = []
+        self._positions = {}
+        self._time = datetime.datetime(2022, 9, 22, tzinfo=datetime.timezone.utc)
+
+    def _price_str(self, ticks):
+        return format_units(ticks, self.quote_places)
+
+    def _size_str(self, units):
+        return format_units(units, self.base_places)
+
+    def _new_id(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _new_size(self):
+        # mostly small orders with a few large ones, at least one unit
+        return max(1, int(self.rng.lognormvariate(-3, 1.5) * 10 ** self.base_places))
+
+    def _new_price(self, side):
+        distance = min(self.depth, 1 + int(self.rng.expovariate(10 / self.depth)))
+        return self.mid - distance if side == 'buy' else self.mid + distance
+
+    def _rest(self, side, price, order_id, size):
+        self.levels[side].setdefault(price, []).append(order_id)
+        self.orders[order_id] = [side, price, size]
+        self._positions[order_id] = len(self._ids)
+        self._ids.append(order_id)
+
+    def _remove(self, order_id):
+        side, price, size = self.orders.pop(order_id)
+        queue = self.levels[side][price]
+        queue.remove(order_id)
+        if not queue:
+            del self.levels[side][price]
+        # swap with the last id, so removing is constant time
+        position = self._positions.pop(order_id)
+        last = self._ids.pop()
+        if last != order_id:
+            self._ids[position] = last
+            self._positions[last] = position
+
+    def snapshot(self):
+        """
+        fill the book with depth levels per side of orders_per_level orders each, replacing
+        anything it held
+        :return: the book in the format of OrderBook.get_initial_OrderBook(), prices and
+                sizes being strings as in the REST response
+        """
+        self.levels = dict(buy=SortedDict(), sell=SortedDict())
+        self.orders.clear()
+        self._ids = []
+        self._positions.clear()
+        book = {'sequence': self.sequence, 'bids': [], 'asks': []}
+        for side, key in (('buy', 'bids'), ('sell', 'asks')):
+            rows = book[key]
+            for distance in range(1, self.depth + 1):
+                price = self.mid - distance if side == 'buy' else self.mid + distance
+                price_str = self._price_str(price)
+                for _ in range(self.orders_per_level):
+                    order_id, size = self._new_id(), self._new_size()
+                    self._rest(side, price, order_id, size)
+                    rows.append([price_str, self._size_str(size), order_id])
+        return book
+
+    def _message(self, message_type, **fields):
+        self.sequence += 1
+        self._time += datetime.timedelta(microseconds=self.rng.randrange(1, 2000))
+        message = {'type': message_type}
+        message.update(fields)
+        message['product_id'] = self.product_id
+        message['time'] = self._time.isoformat().replace('+00:00', 'Z')
+        message['sequence'] = self.sequence
+        return message
+
+    def _received(self):
+        side = self.rng.choice(('buy', 'sell'))
+        return self._message('received', side=side, order_id=self._new_id(), order_type='limit',
+                             price=self._price_str(self._new_price(side)),
+                             size=self._size_str(self._new_size()))
+
+    def _open(self):
+        side = self.rng.choice(('buy', 'sell'))
+        order_id, price, size = self._new_id(), self._new_price(side), self._new_size()
+        self._rest(side, price, order_id, size)
+        return self._message('open', side=side, order_id=order_id, price=self._price_str(price),
+                             remaining_size=self._size_str(size))
+
+    def _cancel(self):
+        order_id = self._ids[self.rng.randrange(len(self._ids))]
+        side, price, size = self.orders[order_id]
+        self._remove(order_id)
+        return self._message('done', side=side, order_id=order_id, reason='canceled',
+                             price=self._price_str(price), remaining_size=self._size_str(size))
+
+    def _match(self):
+        sides = [side for side in ('buy', 'sell') if self.levels[side]]
+        side = self.rng.choice(sides)
+        levels = self.levels[side]
+        price, queue = levels.peekitem(-1 if side == 'buy' else 0)
+        maker_order_id = queue[0]
+        order = self.orders[maker_order_id]
+        # half of the matches fill the maker order completely
+        size = order[2] if self.rng.random() < 0.5 else self.rng.randint(1, order[2])
+        messages = [self._message('match', side=side, maker_order_id=maker_order_id,
+                                  taker_order_id=self._new_id(), trade_id=self.sequence,
+                                  price=self._price_str(price), size=self._size_str(size))]
+        if size == order[2]:
+            self._remove(maker_order_id)
+            messages.append(self._message('done', side=side, order_id=maker_order_id, reason='filled',
+                                          price=self._price_str(price), remaining_size='0'))
+        else:
+            order[2] -= size
+        return messages
+
+    def _change(self):
+        order_id = self._ids[self.rng.randrange(len(self._ids))]
+        side, price, size = order = self.orders[order_id]
+        new_size = self.rng.randint(1, size)
+        if self.rng.random() < 0.5:
+            order[2] = new_size
+            return self._message('change', side=side, order_id=order_id, reason='STP',
+                                 price=self._price_str(price), old_size=self._size_str(size),
+                                 new_size=self._size_str(new_size))
+        new_price = self._new_price(side)
+        self._remove(order_id)
+        self._rest(side, new_price, order_id, new_size)
+        return self._message('change', side=side, order_id=order_id, reason='modify_order',
+                             old_price=self._price_str(price), new_price=self._price_str(new_price),
+                             old_size=self._size_str(size), new_size=self._size_str(new_size))
+
+    def messages(self, count):
+        """
+        :param count: how many messages
+        :return: a generator of count message dicts following the snapshot, or the previous
+                messages, in sequence. the type of each message is drawn from mix; a match
+                which fills its maker order is followed by the done message of that order
+        """
+        sent = 0
+        while sent < count:
+            message_type = self.rng.choices(self.types, self.weights)[0]
+            if message_type in ('done', 'match', 'change') and not self._ids:
+                message_type = 'open'
+            if message_type == 'received':
+                batch = [self._received()]
+            elif message_type == 'open':
+                batch = [self._open()]
+            elif message_type == 'done':
+                batch = [self._cancel()]
+            elif message_type == 'match':
+                batch = self._match()
+            elif message_type == 'change':
+                batch = [self._change()]
+            else:
+                raise ValueError("unknown message type {}".format(message_type))
+            for message in batch[:count - sent]:
+                sent += 1
+                yield message
+
+    def frames(self, count):
+        """
+        :return: a generator of count messages encoded as the json bytes of websocket frames
+        """
+        for message in self.messages(count):
+            yield json.dumps(message).encode()
+
+    def get_levels(self):
+        """
+        :return: the generator's book in the format of OrderBook.get_levels() with every level,
+                for checking a book which applied the snapshot and messages
+        """
+        levels = dict(asks=[], bids=[], stale=False)
+        for side, key in (('sell', 'asks'), ('buy', 'bids')):
+            prices = self.levels[side].keys() if side == 'sell' else reversed(self.levels[side].keys())
+            for price in prices:
+                size = sum(self.orders[order_id][2] for order_id in self.levels[side][price])
+                levels[key].append([self._price_str(price), self._size_str(size)])
+        return levels
@@ -0,0 +1,228 @@
+#######################################
+# the order book as it was at any past time, rebuilt from the checkpoints
+# (see Orderbook.checkpoint) and the feed journal (see Orderbook.journal):
+# the latest checkpoint taken before the time is loaded, and the journaled
+# frames after its sequence are applied up to the time. a sparse index of
+# the journal finds where to start reading, and the book of the last query
+# is kept as a cursor, so queries moving forward in time only apply the
+# frames in between
+#
+# usage:
+#   python -m Orderbook.history --checkpoints dir --journal dir --at 2022-09-22T14:03:27.512Z [--depth 10]
+#
+import argparse
+import bisect
+import datetime
+import json
+import logging
+import re
+
+from Orderbook.checkpoint import list_checkpoints, load_state, read_checkpoint, read_header
+from Orderbook.journal import list_segments, read_segment, RECORD_HEADER
+from Orderbook.services import logger, OrderBook
+
+_PRODUCT_ID = re.compile(rb'"product_id"\s*:\s*"([^"]+)"')
+
+
+def to_ns(value):
+    """
+    :param value: ns since the epoch, a datetime (UTC if it has no time zone) or an
+            ISO 8601 text, e.g. '2022-09-22T14:03:27.512Z'
+    :return: ns since the epoch
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    delta = value - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+class BookHistory:
+    """
+    rebuild the book of one product at past times. the journal is indexed by
+    refresh(), call it again to take in frames journaled since
+    """
+    def __init__(self, checkpoint_directory, journal_directory, product_id='BTC-USD', index_interval=1.0):
+        """
+        :param checkpoint_directory: the directory of the checkpoints, see BookCheckpointer
+        :param journal_directory: the directory of the journal, see FeedJournal
+        :param index_interval: seconds of receive time between two entries of the journal index
+        """
+        self.checkpoint_directory = checkpoint_directory
+        self.journal_directory = journal_directory
+        self.product_id = product_id
+        self.index_interval = int(index_interval * 1e9)
+        # how many journaled messages were applied by all queries
+        self.applied = 0
+        # the checkpoints of the product: captured_ns, sequence and path in capture order
+        self._checkpoint_times = []
+        self._checkpoints = []
+        # the sparse journal index: every index_interval, the receive time and sequence of a frame
+        # of the product, and its position (segment number, offset in the segment)
+        self._segments = []
+        self._index_times = []
+        self._index_sequences = []
+        self._index_positions = []
+        self._scanned = (0, 0)
+        self._next_entry_ns = 0
+        # the book of the last query, the position of the next frame to apply and the query time
+        self._book = None
+        self._position = None
+        self._time = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        take in the checkpoints written and the frames journaled since the last refresh
+        """
+        checkpoints = []
+        for path in list_checkpoints(self.checkpoint_directory, self.product_id):
+            try:
+                header = read_header(path)
+            except (OSError, ValueError) as e:
+                logger.warning("history: skip {}: {}".format(path, e))
+                continue
+            checkpoints.append((header['captured_ns'], header['sequence'], path))
+        checkpoints.sort()
+        self._checkpoints = checkpoints
+        self._checkpoint_times = [captured_ns for captured_ns, _, _ in checkpoints]
+
+        self._segments = list_segments(self.journal_directory)
+        product_id = self.product_id.encode()
+        segment, offset = self._scanned
+        for segment in range(segment, len(self._segments)):
+            if segment != self._scanned[0]:
+                offset = 0
+            for received_ns, sequence, frame in read_segment(self._segments[segment], offset):
+                if sequence and received_ns >= self._next_entry_ns:
+                    match = _PRODUCT_ID.search(frame)
+                    if match and match.group(1) == product_id:
+                        self._index_times.append(received_ns)
+                        self._index_sequences.append(sequence)
+                        self._index_positions.append((segment, offset))
+                        self._next_entry_ns = received_ns + self.index_interval
+                offset += RECORD_HEADER.size + len(frame)
+        if self._segments:
+            self._scanned = (segment, offset)
+
+    def sequence_at(self, at):
+        """
+        :return: the sequence of the latest indexed frame received at or before at, None if
+                there is none; a lower bound of the sequence of the book at that time
+        """
+        i = bisect.bisect_right(self._index_times, to_ns(at))
+        return self._index_sequences[i - 1] if i else None
+
+    def _seek(self, sequence):
+        """
+        :return: the position of an indexed frame at or before the frame after sequence
+        """
+        i = bisect.bisect_right(self._index_sequences, sequence)
+        return self._index_positions[i - 1] if i else (0, 0)
+
+    def _start(self, at_ns):
+        """
+        load the latest checkpoint captured at or before at_ns, unless the query moves forward
+        from the last one, whose book is then the start
+        :raise ValueError: if there is no such checkpoint
+        """
+        if self._book is not None and self._time <= at_ns:
+            return
+        i = bisect.bisect_right(self._checkpoint_times, at_ns)
+        if not i:
+            raise ValueError("no checkpoint of {} was taken before {}".format(self.product_id, at_ns))
+        _, sequence, path = self._checkpoints[i - 1]
+        state = read_checkpoint(path)
+        book = OrderBook([self.product_id], ["full"], fixed_point=state['fixed_point'],
+                         quote_increment=state['quote_increment'], base_increment=state['base_increment'],
+                         signal_window=0)
+        load_state(book, state)
+        self._book = book
+        self._position = self._seek(sequence)
+        logger.debug("history: from %s at sequence=%s", path, sequence)
+
+    def _advance(self, at_ns):
+        """
+        apply the journaled frames of the product received up to at_ns
+        :raise ValueError: if the journal misses a message in between
+        """
+        book = self._book
+        decode = book.decoder.decode
+        product_id = self.product_id
+        segment, offset = self._position
+        for segment in range(segment, len(self._segments)):
+            if segment != self._position[0]:
+                offset = 0
+            for received_ns, sequence, frame in read_segment(self._segments[segment], offset):
+                if received_ns > at_ns:
+                    self._position = (segment, offset)
+                    return
+                offset += RECORD_HEADER.size + len(frame)
+                if sequence <= book._sequence_id:
+                    continue
+                try:
+                    message = decode(bytes(frame))
+                except ValueError:
+                    continue
+                message_sequence = message.get('sequence')
+                if message.get('product_id') != product_id or message_sequence is None:
+                    continue
+                if message_sequence > book._sequence_id + 1:
+                    self._book = None
+                    raise ValueError("the journal has a gap after sequence={}, before {}".format(
+                        book._sequence_id, at_ns))
+                book._sequence_id = message_sequence
+                book.apply_message(message)
+                self.applied += 1
+        if self._segments:
+            self._position = (segment, offset)
+
+    def get_book(self, at):
+        """
+        :param at: the time, see to_ns()
+        :return: the OrderBook at that time. it is the cursor of the next query, so it
+                must not be changed, and is only valid until then
+        :raise ValueError: if there is no checkpoint before the time, or the journal has a gap
+        """
+        at_ns = to_ns(at)
+        self._start(at_ns)
+        self._advance(at_ns)
+        self._time = at_ns
+        return self._book
+
+    def get_levels(self, at, depth=10):
+        """
+        :param at: the time, see to_ns()
+        :param depth: how many best price levels per side
+        :return: a dict in the format of OrderBook.get_levels(), with the 'sequence' of the book
+            and the time as 'time_ns'
+        """
+        book = self.get_book(at)
+        levels = dict(book.get_levels(depth))
+        levels['sequence'] = book._sequence_id
+        levels['time_ns'] = self._time
+        return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description='the order book at a past time, from checkpoints and the journal')
+    parser.add_argument('--checkpoints', required=True, help='checkpoint directory')
+    parser.add_argument('--journal', required=True, help='journal directory')
+    parser.add_argument('--product', default='BTC-USD')
+    parser.add_argument('--at', required=True, action='append',
+                        help='ISO 8601 time, e.g. 2022-09-22T14:03:27.512Z, may be given several times')
+    parser.add_argument('--depth', type=int, default=10)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    history = BookHistory(args.checkpoints, args.journal, args.product)
+    # in time order, so the cursor only moves forward
+    for at in sorted(args.at, key=to_ns):
+        print(json.dumps(dict(history.get_levels(at, args.depth), at=at), indent=4))
+
+
+if __name__ == '__main__':
+    main()
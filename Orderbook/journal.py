@@ -0,0 +1,242 @@
+#######################################
+# append-only journal of the raw feed frames. every frame is stored with the
+# time it was received and its sequence in length-prefixed records, in
+# segment files of a bounded size. the feed thread only timestamps the frame
+# and hands it over, a writer thread encodes and writes it
+#
+import mmap
+import os
+import queue
+import re
+import struct
+import threading
+import time
+
+from Orderbook.services import logger
+
+# record header: frame length, receive time in ns since the epoch, feed sequence (0 if none)
+RECORD_HEADER = struct.Struct('<IQQ')
+SEGMENT_SUFFIX = '.journal'
+_SEQUENCE = re.compile(rb'"sequence"\s*:\s*(\d+)')
+
+
+def segment_name(received_ns):
+    """
+    :return: the file name of a segment whose first frame was received at received_ns,
+            names sort in time order
+    """
+    return 'segment-{:020d}{}'.format(received_ns, SEGMENT_SUFFIX)
+
+
+def list_segments(directory):
+    """
+    :return: paths of the segments in directory, oldest first
+    """
+    names = sorted(name for name in os.listdir(directory)
+                   if name.startswith('segment-') and name.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, name) for name in names]
+
+
+def segment_start(path):
+    """
+    :return: the receive time in ns of the first frame of the segment at path
+    """
+    return int(os.path.basename(path)[len('segment-'):-len(SEGMENT_SUFFIX)])
+
+
+class FeedJournal:
+    """
+    write raw feed frames to segments in directory from a background thread.
+    append() never blocks: frames wait in a bounded queue until the writer
+    thread takes them in batches, and are dropped when the queue is full
+    """
+    # seconds close() waits before checking the writer thread is still alive
+    CLOSE_TIMEOUT = 1
+
+    def __init__(self, directory, segment_size=1 << 26, flush_interval=1.0, queue_size=100000):
+        """
+        :param directory: where the segments are written, created if needed
+        :param segment_size: a new segment is started when the current one would grow past this many bytes
+        :param flush_interval: most seconds written frames stay in the file buffer
+        :param queue_size: most frames waiting for the writer thread
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.appended = 0
+        self.written = 0
+        self.dropped = 0
+        self.high_water_mark = 0
+        self._queue = queue.Queue(queue_size)
+        self._file = None
+        self._file_size = 0
+        self._thread = threading.Thread(name='feed_journal Thread', target=self.run, daemon=True)
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def append(self, data, received_ns=None):
+        """
+        called on the feed thread with every frame as it was received
+        :param data: (String or bytes) the raw frame
+        :param received_ns: receive time in ns since the epoch, now by default
+        """
+        self.appended += 1
+        try:
+            self._queue.put_nowait((received_ns or time.time_ns(), data))
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped & (self.dropped - 1) == 0:
+                # log the 1st, 2nd, 4th, 8th... drop only
+                logger.warning("journal writer behind, {} frames dropped".format(self.dropped))
+            return
+        backlog = self._queue.qsize()
+        if backlog > self.high_water_mark:
+            self.high_water_mark = backlog
+
+    def get_metrics(self):
+        return {
+            'backlog': self._queue.qsize(),
+            'high_water_mark': self.high_water_mark,
+            'queue_size': self.queue_size,
+            'appended': self.appended,
+            'written': self.written,
+            'dropped': self.dropped,
+        }
+
+    def close(self):
+        """
+        write the frames appended so far and stop the writer thread
+        """
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=self.CLOSE_TIMEOUT)
+                break
+            except queue.Full:
+                # the writer thread failed and no longer drains the queue
+                pass
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def run(self):
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        pack = RECORD_HEADER.pack
+        flushed = time.monotonic()
+        while True:
+            try:
+                item = get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = ()
+            records = []
+            size = 0
+            while item is not None:
+                if item:
+                    received_ns, data = item
+                    if isinstance(data, str):
+                        data = data.encode()
+                    sequence = _SEQUENCE.search(data)
+                    record = pack(len(data), received_ns, int(sequence.group(1)) if sequence else 0) + data
+                    if self._file is None or self._file_size + size + len(record) > self.segment_size:
+                        self._write(records)
+                        records, size = [], 0
+                        self._open_segment(received_ns)
+                    records.append(record)
+                    size += len(record)
+                    if len(records) >= 1000:
+                        break
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+            self._write(records)
+            if self._file is not None and (item is None or time.monotonic() - flushed >= self.flush_interval):
+                self._file.flush()
+                flushed = time.monotonic()
+            if item is None:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _write(self, records):
+        if records:
+            data = b''.join(records)
+            self._file.write(data)
+            self._file_size += len(data)
+            self.written += len(records)
+
+    def _open_segment(self, received_ns):
+        if self._file is not None:
+            self._file.close()
+        path = os.path.join(self.directory, segment_name(received_ns))
+        self._file = open(path, 'ab')
+        self._file_size = self._file.tell()
+        logger.info("journal: writing {}".format(path))
+
+
+def read_segment(path, start=0):
+    """
+    iterate the records of one segment through a memory map, without copying the frames.
+    a record cut short (the writer stopped while writing it) ends the segment
+    :param start: offset of the first record to read, the record after a frame at offset
+            o starts at o + RECORD_HEADER.size + len(frame)
+    :return: a generator of (received_ns, sequence, memoryview of the frame); the
+            views stay valid as long as they are referenced
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    header_size = RECORD_HEADER.size
+    unpack_from = RECORD_HEADER.unpack_from
+    end = len(view)
+    offset = start
+    while offset + header_size <= end:
+        length, received_ns, sequence = unpack_from(view, offset)
+        start = offset + header_size
+        offset = start + length
+        if offset > end:
+            break
+        yield received_ns, sequence, view[start:offset]
+
+
+class JournalReader:
+    """
+    iterate the frames of all segments of a journal directory in the order they were received
+    """
+    def __init__(self, directory):
+        self.directory = directory
+
+    def segments(self):
+        return list_segments(self.directory)
+
+    def __iter__(self):
+        return self.read()
+
+    def read(self, after_sequence=None, since_ns=None):
+        """
+        :param after_sequence: skip frames whose sequence is not greater than this, frames without
+                a sequence are skipped too
+        :param since_ns: skip frames received before this time, and the segments which end before it
+        :return: a generator of (received_ns, sequence, memoryview of the frame)
+        """
+        segments = self.segments()
+        if since_ns is not None:
+            # the last segment starting at or before since_ns holds the first frame wanted
+            first = 0
+            for i, path in enumerate(segments):
+                if segment_start(path) <= since_ns:
+                    first = i
+            segments = segments[first:]
+        for path in segments:
+            for received_ns, sequence, frame in read_segment(path):
+                if since_ns is not None and received_ns < since_ns:
+                    continue
+                if after_sequence is not None and sequence <= after_sequence:
+                    continue
+                yield received_ns, sequence, frame
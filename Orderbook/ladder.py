@@ -0,0 +1,375 @@
+#######################################
+# one side of a fixed point order book as a dense price ladder: the price
+# levels within width ticks next to the best price sit in slots indexed by
+# their distance in ticks, so finding, adding and removing a level is an
+# index computation instead of a bisect over the sorted prices. the total
+# size and order count of every slot are kept in numpy arrays, which answer
+# the best levels, cumulative size and price bucket queries in vectorized
+# passes. levels beyond the band are kept in a SortedDict, and the band is
+# placed again around the best price when the best price drifts away
+#
+from sortedcontainers import SortedDict
+
+# numpy is optional, it is only needed by the ladder
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class _LadderKeys:
+    """
+    the prices of a PriceLadder, in the subset of the SortedDict keys view the book
+    uses: iteration, reversed() and indexing from either end
+    """
+    __slots__ = ('ladder',)
+
+    def __init__(self, ladder):
+        self.ladder = ladder
+
+    def __iter__(self):
+        return self.ladder.irange()
+
+    def __reversed__(self):
+        return self.ladder.irange(reverse=True)
+
+    def __len__(self):
+        return len(self.ladder)
+
+    def __getitem__(self, i):
+        return self.ladder.price_at(i)
+
+
+class PriceLadder:
+    """
+    price -> PriceLevel of one side, a drop-in replacement of the SortedDict of the
+    side for integer (fixed point) prices. the book calls update() with every level
+    it changed, which keeps the size and count arrays up to date.
+    slot i holds the level at price base + i; the band reaches margin ticks beyond
+    the best price, so the best price can improve a little without leaving it
+    """
+    def __init__(self, side, width=4096, levels=None, margin=None):
+        """
+        :param side: (String) 'buy' or 'sell'
+        :param width: how many ticks the band covers
+        :param levels: initial levels, a mapping of price -> PriceLevel
+        :param margin: how many ticks the band reaches beyond the best price, width / 8 by default
+        """
+        if numpy is None:
+            raise ImportError("the price ladder needs numpy, 'pip install numpy'")
+        self.side = side
+        self.width = width
+        self.margin = width // 8 if margin is None else margin
+        self.base = None
+        self.slots = [None] * width
+        self.occupied = numpy.zeros(width, dtype=bool)
+        self.sizes = numpy.zeros(width, dtype=numpy.int64)
+        self.counts = numpy.zeros(width, dtype=numpy.int32)
+        self.overflow = SortedDict()
+        # number of occupied slots, and the lowest and highest of them (None if there is none)
+        self._band = 0
+        self._lo = self._hi = None
+        # slots whose size and count changed since the arrays were last brought up to date,
+        # a change only records its slot and the next query writes them all at once
+        self._dirty = set()
+        if levels:
+            prices = sorted(levels)
+            self._place(prices[0] if side == 'sell' else prices[-1])
+            for price in prices:
+                self._insert(price, levels[price])
+
+    # -- band placement --
+
+    def _place(self, best):
+        if self.side == 'sell':
+            self.base = best - self.margin
+        else:
+            self.base = best + self.margin - (self.width - 1)
+
+    def _insert(self, price, level):
+        i = price - self.base
+        if 0 <= i < self.width:
+            self.slots[i] = level
+            self.occupied[i] = True
+            self._dirty.add(i)
+            self._band += 1
+            if self._lo is None or i < self._lo:
+                self._lo = i
+            if self._hi is None or i > self._hi:
+                self._hi = i
+        else:
+            self.overflow[price] = level
+
+    def recenter(self, best=None):
+        """
+        place the band around best, the best price of the side by default, moving the
+        levels between the band and the overflow
+        """
+        levels = list(self.items())
+        if best is None:
+            if not levels:
+                return
+            best = levels[0][0] if self.side == 'sell' else levels[-1][0]
+        self.slots = [None] * self.width
+        self.occupied[:] = False
+        self.sizes[:] = 0
+        self.counts[:] = 0
+        self.overflow = SortedDict()
+        self._band = 0
+        self._lo = self._hi = None
+        self._dirty.clear()
+        self._place(best)
+        for price, level in levels:
+            self._insert(price, level)
+
+    def _next_occupied(self, start, stop, reverse=False):
+        """
+        :return: the first (or last) occupied slot in [start, stop), None if there is none
+        """
+        if start >= stop:
+            return None
+        window = self.occupied[start:stop]
+        if reverse:
+            i = len(window) - 1 - int(window[::-1].argmax())
+        else:
+            i = int(window.argmax())
+        return start + i if window[i] else None
+
+    # -- mapping --
+
+    def __setitem__(self, price, level):
+        if self.base is None:
+            self._place(price)
+        if price in self:
+            del self[price]
+        i = price - self.base
+        if self.side == 'sell' and i < 0 or self.side == 'buy' and i >= self.width:
+            # a new best price beyond the band
+            self.recenter(price)
+        self._insert(price, level)
+
+    def __delitem__(self, price):
+        i = price - self.base if self.base is not None else -1
+        if not 0 <= i < self.width:
+            del self.overflow[price]
+            return
+        if self.slots[i] is None:
+            raise KeyError(price)
+        self.slots[i] = None
+        self.occupied[i] = False
+        self._dirty.add(i)
+        self._band -= 1
+        if not self._band:
+            self._lo = self._hi = None
+        else:
+            if i == self._lo:
+                self._lo = self._next_occupied(i + 1, self._hi + 1)
+            if i == self._hi:
+                self._hi = self._next_occupied(self._lo, i, reverse=True)
+        # place the band again when the best price drifted to its far half, so the
+        # levels next to the best price stay in the band
+        best = self._lo if self.side == 'sell' else self._hi
+        if best is None:
+            if self.overflow:
+                self.recenter()
+        elif (best > self.width // 2) if self.side == 'sell' else (best < self.width // 2):
+            self.recenter()
+
+    def update(self, level):
+        """
+        record that the size or order count of a level of this ladder changed
+        """
+        if self.base is None:
+            return
+        i = level.price - self.base
+        if 0 <= i < self.width and self.slots[i] is level:
+            self._dirty.add(i)
+
+    def flush(self):
+        """
+        bring the size and count arrays up to date with the changed levels
+        """
+        if not self._dirty:
+            return
+        dirty = list(self._dirty)
+        self._dirty.clear()
+        slots = self.slots
+        self.sizes[dirty] = [0 if slots[i] is None else slots[i].size for i in dirty]
+        self.counts[dirty] = [0 if slots[i] is None else len(slots[i].orders) for i in dirty]
+
+    def get(self, price, default=None):
+        if self.base is not None:
+            i = price - self.base
+            if 0 <= i < self.width:
+                level = self.slots[i]
+                return default if level is None else level
+        return self.overflow.get(price, default)
+
+    def __getitem__(self, price):
+        level = self.get(price)
+        if level is None:
+            raise KeyError(price)
+        return level
+
+    def __contains__(self, price):
+        return self.get(price) is not None
+
+    def __len__(self):
+        return self._band + len(self.overflow)
+
+    def __bool__(self):
+        return bool(self._band or self.overflow)
+
+    def __iter__(self):
+        return self.irange()
+
+    def keys(self):
+        return _LadderKeys(self)
+
+    def values(self):
+        return (self.get(price) for price in self.irange())
+
+    def items(self):
+        return ((price, self.get(price)) for price in self.irange())
+
+    def peekitem(self, index=-1):
+        price = self.price_at(index)
+        return price, self.get(price)
+
+    def _band_prices(self, lo, hi, reverse=False):
+        """
+        :return: the prices of the occupied slots in [lo, hi]
+        """
+        lo, hi = max(lo, 0), min(hi, self.width - 1)
+        if lo > hi or not self._band:
+            return []
+        slots = numpy.flatnonzero(self.occupied[lo:hi + 1]) + (self.base + lo)
+        return (slots[::-1] if reverse else slots).tolist()
+
+    def irange(self, minimum=None, maximum=None, reverse=False):
+        """
+        :return: an iterator of the prices from minimum to maximum, both included, as SortedDict.irange
+        """
+        if self.base is None:
+            return self.overflow.irange(minimum, maximum, reverse=reverse)
+        base, top = self.base, self.base + self.width - 1
+        lo = minimum - base if minimum is not None else 0
+        hi = maximum - base if maximum is not None else self.width - 1
+        below = self.overflow.irange(minimum, base - 1 if maximum is None else min(maximum, base - 1),
+                                     reverse=reverse)
+        above = self.overflow.irange(top + 1 if minimum is None else max(minimum, top + 1), maximum,
+                                     reverse=reverse)
+        band = self._band_prices(lo, hi, reverse)
+        parts = (above, band, below) if reverse else (below, band, above)
+        return (price for part in parts for price in part)
+
+    def price_at(self, i):
+        """
+        :return: the i-th lowest price, or the -i-th highest for a negative i
+        :raise IndexError: if there are not that many levels
+        """
+        count = len(self)
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError("price ladder index out of range")
+        below = self.overflow.bisect_left(self.base) if self.base is not None else len(self.overflow)
+        if i < below:
+            return self.overflow.keys()[i]
+        i -= below
+        if i < self._band:
+            if i == 0:
+                return self.base + self._lo
+            if i == self._band - 1:
+                return self.base + self._hi
+            return self.base + int(numpy.flatnonzero(self.occupied)[i])
+        return self.overflow.keys()[below + i - self._band]
+
+    # -- vectorized queries --
+
+    def _best_first(self, part):
+        """
+        :param part: 'better' for the overflow levels better than the band, 'band' or 'worse'
+        :return: (prices, sizes) arrays of the levels of part, best price first
+        """
+        sell = self.side == 'sell'
+        if part == 'band':
+            self.flush()
+            if not self._band:
+                return numpy.zeros(0, dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+            slots = numpy.flatnonzero(self.occupied[self._lo:self._hi + 1]) + self._lo
+            if not sell:
+                slots = slots[::-1]
+            return slots.astype(numpy.int64) + self.base, self.sizes[slots]
+        if self.base is None:
+            prices = list(self.overflow.irange(reverse=not sell)) if part == 'better' else []
+        elif (part == 'better') == sell:
+            prices = list(self.overflow.irange(maximum=self.base - 1, reverse=not sell))
+        else:
+            prices = list(self.overflow.irange(minimum=self.base + self.width, reverse=not sell))
+        return (numpy.array(prices, dtype=numpy.int64),
+                numpy.array([self.overflow[price].size for price in prices], dtype=numpy.int64))
+
+    def top(self, count, tick=None):
+        """
+        :param count: how many levels (or buckets)
+        :param tick: bucket width in ticks, None to not aggregate. bids are bucketed down and
+                asks up to a multiple of tick
+        :return: list of (price, size) of the best count levels or buckets, best first
+        """
+        parts = [self._best_first('better'), self._best_first('band')]
+        worse_added = False
+        while True:
+            prices = numpy.concatenate([prices for prices, _ in parts])
+            sizes = numpy.concatenate([sizes for _, sizes in parts])
+            if tick is None:
+                if len(prices) >= count or worse_added:
+                    return list(zip(prices[:count].tolist(), sizes[:count].tolist()))
+            else:
+                buckets = prices // tick * tick
+                if self.side == 'sell':
+                    buckets[buckets < prices] += tick
+                # where a new bucket starts, the first level always does
+                starts = numpy.flatnonzero(numpy.concatenate(([True], buckets[1:] != buckets[:-1])))
+                # the last bucket may go on among the worse levels, it is complete once
+                # another bucket follows it
+                if len(starts) > count or worse_added:
+                    if not len(prices):
+                        return []
+                    totals = numpy.add.reduceat(sizes, starts)
+                    return list(zip(buckets[starts][:count].tolist(), totals[:count].tolist()))
+            parts.append(self._best_first('worse'))
+            worse_added = True
+
+    def cumulative(self, count):
+        """
+        :return: (prices, cumulative sizes) arrays of the best count levels, best first: the
+                size a market order takes from the best price up to each price
+        """
+        levels = self.top(count)
+        prices = numpy.array([price for price, _ in levels], dtype=numpy.int64)
+        return prices, numpy.cumsum(numpy.array([size for _, size in levels], dtype=numpy.int64))
+
+    def check(self):
+        """
+        cross-check the arrays with the levels: raise AssertionError if a slot's size or count
+        is not that of its level, or a level is in the wrong place
+        """
+        self.flush()
+        band = 0
+        for i, level in enumerate(self.slots):
+            assert bool(self.occupied[i]) == (level is not None), "slot {} occupancy".format(i)
+            if level is None:
+                assert self.sizes[i] == 0 and self.counts[i] == 0, "empty slot {} has a size".format(i)
+                continue
+            band += 1
+            assert level.price == self.base + i, "level {} in slot {}".format(level.price, i)
+            assert self.sizes[i] == level.size and self.counts[i] == len(level.orders), \
+                "slot {} size {} count {}, level size {} count {}".format(
+                    i, self.sizes[i], self.counts[i], level.size, len(level.orders))
+        assert band == self._band, "{} occupied slots, {} counted".format(band, self._band)
+        occupied = numpy.flatnonzero(self.occupied)
+        if band:
+            assert (self._lo, self._hi) == (occupied[0], occupied[-1]), "lowest/highest slot"
+        for price in self.overflow:
+            assert not 0 <= price - self.base < self.width, "overflow level {} is in the band".format(price)
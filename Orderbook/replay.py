@@ -0,0 +1,203 @@
+#######################################
+# offline replay: build an OrderBook from a recorded level 3 snapshot and push
+# a recorded feed through OrderBook.on_message, as fast as possible or at a
+# scaled real-time pace, without any network access. the report holds the
+# message rate, the handler latency per message type and checksums of the
+# final book, which can be compared across code versions
+#
+# usage:
+#   python -m Orderbook.replay --snapshot book.json --feed journal_dir [--speed 1] [--fixed-point]
+#
+import argparse
+import decimal
+import hashlib
+import json
+import logging
+import os
+import time
+
+from Orderbook.journal import JournalReader
+from Orderbook.services import logger, OrderBook, parse_snapshot_stream
+
+
+def read_snapshot(path, chunk_size=1 << 16):
+    """
+    :param path: a level 3 snapshot saved from the REST API, e.g. by benchmarks/bench_snapshot.py --record
+    :return: the snapshot in the format of OrderBook.get_initial_OrderBook()
+    """
+    def chunks():
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    return parse_snapshot_stream(chunks())
+
+
+def read_feed(path):
+    """
+    :param path: a journal directory (see Orderbook.journal), or a file of one frame per line
+    :return: a generator of (received_ns, frame bytes), received_ns is None for a file of lines
+    """
+    if os.path.isdir(path):
+        for received_ns, sequence, frame in JournalReader(path):
+            yield received_ns, bytes(frame)
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield None, line
+
+
+class ReplayOrderBook(OrderBook):
+    """
+    an OrderBook whose level 3 snapshot is a recording: it is loaded on the
+    calling thread instead of being downloaded in the background. the recorded
+    feed cannot be resynced, so a later sequence gap is counted and the book
+    carries on from the message after the gap
+    """
+    def __init__(self, snapshot, product_ids=["BTC-USD"], **book_options):
+        """
+        :param snapshot: the recorded snapshot, see read_snapshot()
+        :param book_options: keyword arguments of OrderBook, in fixed point mode
+                quote_increment and base_increment must be given
+        """
+        super(ReplayOrderBook, self).__init__(product_ids, ["full"], **book_options)
+        self._snapshot = snapshot
+        self._loaded = False
+        self.gaps = 0
+
+    def get_initial_OrderBook(self):
+        return self._snapshot
+
+    def get_product_increments(self):
+        raise ValueError("a replay needs quote_increment and base_increment in fixed point mode")
+
+    def start_resync(self, buffered=()):
+        if self._loaded:
+            message = buffered[0]
+            logger.warning("replay: sequence gap before {}, continuing without a snapshot"
+                           .format(message['sequence']))
+            self.gaps += 1
+            self._sequence_id = message['sequence'] - 1
+        else:
+            self.reset_OrderBook()
+            self._loaded = True
+        for message in buffered:
+            self.process_message(message)
+
+
+def book_checksums(book):
+    """
+    :return: {'l2': ..., 'l3': ...} sha256 hex digests of the price levels and of the
+            resting orders (in queue order) of both sides. sizes and prices are
+            normalized, so a decimal and a fixed point book of the same state agree
+    """
+    codec = book._codec
+    l2, l3 = hashlib.sha256(), hashlib.sha256()
+
+    def normalized(text):
+        # '0.05000000' -> '0.05', '100.00' -> '100', '1.0E-7' -> '0.0000001'
+        return format(decimal.Decimal(text).normalize(), 'f')
+
+    for side in ('buy', 'sell'):
+        for price, level in book.get_orders(side).items():
+            price_text = normalized(codec.price_str(price))
+            l2.update('{} {} {}\n'.format(side, price_text, normalized(codec.size_str(level.size))).encode())
+            for order in level:
+                l3.update('{} {} {} {}\n'.format(side, price_text, order.order_id,
+                                                 normalized(codec.size_str(order.size))).encode())
+    return dict(l2=l2.hexdigest(), l3=l3.hexdigest())
+
+
+def _latency_summary(samples):
+    samples.sort()
+    count = len(samples)
+    return dict(count=count,
+                mean_us=sum(samples) / count / 1000,
+                p50_us=samples[count // 2] / 1000,
+                p99_us=samples[min(count - 1, count * 99 // 100)] / 1000,
+                max_us=samples[-1] / 1000)
+
+
+def replay(book, frames, speed=0):
+    """
+    push recorded frames through book.on_message
+    :param book: a ReplayOrderBook
+    :param frames: iterable of (received_ns, frame), see read_feed()
+    :param speed: 0 for as fast as possible, otherwise the recorded pace times speed,
+            e.g. 1 for real time or 10 for ten times faster
+    :return: the report, a dict in the format of
+        {
+        'messages': 1000000, 'seconds': 12.5, 'messages_per_second': 80000.0,
+        'sequence': 4816542102, 'gaps': 0,
+        'latency': {'open': {'count': .., 'mean_us': .., 'p50_us': .., 'p99_us': .., 'max_us': ..}, ...},
+        'checksum': {'l2': '...', 'l3': '...'}
+        }
+    """
+    if not book._loaded:
+        book.start_resync()
+    product_id = book.get_product_ids()[0]
+    decode = book.decoder.decode
+    on_message = book.on_message
+    clock = time.perf_counter_ns
+    latencies = {}
+    messages = 0
+    first_ns = None
+    start = clock()
+    for received_ns, frame in frames:
+        try:
+            message = decode(frame)
+        except ValueError:
+            continue
+        if message.get('product_id', product_id) != product_id:
+            continue
+        if speed and received_ns is not None:
+            if first_ns is None:
+                first_ns = received_ns
+            delay = (received_ns - first_ns) / speed - (clock() - start)
+            if delay > 0:
+                time.sleep(delay / 1e9)
+        message_type = message.get('type')
+        before = clock()
+        on_message(message)
+        elapsed = clock() - before
+        samples = latencies.get(message_type)
+        if samples is None:
+            samples = latencies[message_type] = []
+        samples.append(elapsed)
+        messages += 1
+    seconds = (clock() - start) / 1e9
+    return dict(messages=messages,
+                seconds=seconds,
+                messages_per_second=messages / seconds if seconds else 0.0,
+                sequence=book._sequence_id,
+                gaps=book.gaps,
+                latency={message_type: _latency_summary(samples) for message_type, samples in latencies.items()},
+                checksum=book_checksums(book))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='replay a recorded feed through the OrderBook')
+    parser.add_argument('--snapshot', required=True, help='path of a recorded level 3 snapshot (json)')
+    parser.add_argument('--feed', required=True, help='journal directory, or a file of one frame per line')
+    parser.add_argument('--product', default='BTC-USD')
+    parser.add_argument('--speed', type=float, default=0, help='0 for as fast as possible, 1 for real time')
+    parser.add_argument('--fixed-point', action='store_true')
+    parser.add_argument('--quote-increment', default='0.01')
+    parser.add_argument('--base-increment', default='0.00000001')
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    options = {}
+    if args.fixed_point:
+        options = dict(fixed_point=True, quote_increment=args.quote_increment, base_increment=args.base_increment)
+    book = ReplayOrderBook(read_snapshot(args.snapshot), [args.product], **options)
+    report = replay(book, read_feed(args.feed), args.speed)
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == '__main__':
+    main()
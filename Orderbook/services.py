@@ -5,15 +5,30 @@
 # Date : Sep-22-2022
 #
 import websocket
+import codecs
+import collections
 import json
 from sortedcontainers import SortedDict
 from websocket import WebSocketConnectionClosedException
 import decimal
+import itertools
+import queue
+import re
 import requests
+import threading
 import time
 from customFormatter import CustomFormatter
+from Orderbook.depth import SideDepth
+from Orderbook.ladder import PriceLadder
+from Orderbook.signals import BookSignals
 import logging
 
+# orjson is optional, it decodes feed messages several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # set a global logger for debugging/demo purpose,
 logger = logging.getLogger(__name__)
 # you can change logging level from logging.INFO to logging.DEBUG
@@ -27,6 +42,177 @@ logHandler.setFormatter(CustomFormatter(fmt))
 logger.addHandler(logHandler)
 
 
+class FeedDecoder:
+    """
+    decode raw websocket frames into message dicts.
+    when full_types is given, a frame whose type is not in it is not parsed:
+    only its type, sequence and product_id are read from the text, which is
+    enough for the sequence check of the order book
+    """
+    # feed messages are flat json objects, so these keys only appear at the top level
+    _patterns = {
+        str: (re.compile(r'"type"\s*:\s*"(\w+)"'),
+              re.compile(r'"sequence"\s*:\s*(\d+)'),
+              re.compile(r'"product_id"\s*:\s*"([^"]+)"')),
+        bytes: (re.compile(rb'"type"\s*:\s*"(\w+)"'),
+                re.compile(rb'"sequence"\s*:\s*(\d+)'),
+                re.compile(rb'"product_id"\s*:\s*"([^"]+)"')),
+    }
+
+    def __init__(self, full_types=None):
+        """
+        :param full_types: message types to decode completely, None to decode every message
+        """
+        self.full_types = None if full_types is None else frozenset(full_types) | {'error'}
+        self.loads = orjson.loads if orjson is not None else json.loads
+
+    def decode(self, data):
+        """
+        :param data: (String or bytes) one frame received from the websocket
+        :return: the message dict
+        :raise ValueError: if the frame is not valid json
+        """
+        if self.full_types is not None:
+            patterns = self._patterns.get(type(data))
+            match = patterns and patterns[0].search(data)
+            if match:
+                message_type = match.group(1)
+                if isinstance(message_type, bytes):
+                    message_type = message_type.decode()
+                if message_type not in self.full_types:
+                    message = {'type': message_type}
+                    sequence = patterns[1].search(data)
+                    if sequence:
+                        message['sequence'] = int(sequence.group(1))
+                    product_id = patterns[2].search(data)
+                    if product_id:
+                        product_id = product_id.group(1)
+                        message['product_id'] = product_id if isinstance(product_id, str) else product_id.decode()
+                    return message
+        return self.loads(data)
+
+
+class FeedPipeline:
+    """
+    the receive and apply stages of WebsocketClient.listen. the receive stage
+    only puts raw frames into a bounded queue, so the socket keeps being read
+    while a slow step (a reset, logging) holds up the apply stage, which runs
+    on its own thread and drains the queue in batches.
+    when the queue is full, the 'block' policy makes the receive stage wait,
+    the 'drop' policy drops the frame. a dropped frame is a sequence gap to the
+    OrderBook, which then resyncs from a snapshot
+    """
+    POLICIES = ('block', 'drop')
+    # seconds a blocked receive stage waits before checking the apply stage is still alive
+    BLOCK_TIMEOUT = 1
+
+    def __init__(self, client, queue_size=10000, backlog_policy='block', batch_size=500):
+        """
+        :param client: the WebsocketClient whose decoder and on_message apply the frames
+        :param queue_size: most frames waiting to be applied
+        :param backlog_policy: 'block' or 'drop', what to do with a frame when the queue is full
+        :param batch_size: most frames the apply stage takes from the queue at once
+        """
+        if backlog_policy not in self.POLICIES:
+            raise ValueError("backlog_policy must be one of {}".format(self.POLICIES))
+        self.client = client
+        self.queue = queue.Queue(queue_size)
+        self.queue_size = queue_size
+        self.backlog_policy = backlog_policy
+        self.batch_size = batch_size
+        self.received = 0
+        self.applied = 0
+        self.dropped = 0
+        self.high_water_mark = 0
+        self.error = None
+        self._thread = threading.Thread(name='feed_apply Thread', target=self.run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """
+        let the apply stage finish the frames already received, then end it
+        """
+        while self._thread.is_alive():
+            try:
+                self.queue.put(None, timeout=self.BLOCK_TIMEOUT)
+                break
+            except queue.Full:
+                # the apply stage failed and no longer drains the queue
+                pass
+        self._thread.join()
+
+    def receive(self, data):
+        """
+        the receive stage, called with every frame read from the websocket
+        :raise: the error which ended the apply stage, if any
+        """
+        if self.error is not None:
+            raise self.error
+        self.received += 1
+        if self.backlog_policy == 'drop':
+            try:
+                self.queue.put_nowait(data)
+            except queue.Full:
+                self.dropped += 1
+                if self.dropped & (self.dropped - 1) == 0:
+                    # log the 1st, 2nd, 4th, 8th... drop only
+                    logger.warning("apply stage behind, {} frames dropped".format(self.dropped))
+                return
+        else:
+            while True:
+                try:
+                    self.queue.put(data, timeout=self.BLOCK_TIMEOUT)
+                    break
+                except queue.Full:
+                    if self.error is not None:
+                        raise self.error
+        depth = self.queue.qsize()
+        if depth > self.high_water_mark:
+            self.high_water_mark = depth
+
+    def run(self):
+        """
+        the apply stage: decode the queued frames and pass them to on_message
+        """
+        decode = self.client.decoder.decode
+        on_message = self.client.on_message
+        get_nowait = self.queue.get_nowait
+        try:
+            while True:
+                batch = [self.queue.get()]
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(get_nowait())
+                except queue.Empty:
+                    pass
+                for data in batch:
+                    if data is None:
+                        return
+                    try:
+                        message = decode(data)
+                    except ValueError:
+                        logger.warning('one incomplete message, ignored')
+                        continue
+                    on_message(message)
+                    self.applied += 1
+        except Exception as e:
+            logger.error("apply stage failed: {!r}".format(e))
+            self.error = e
+
+    def get_metrics(self):
+        return {
+            'depth': self.queue.qsize(),
+            'high_water_mark': self.high_water_mark,
+            'queue_size': self.queue_size,
+            'backlog_policy': self.backlog_policy,
+            'received': self.received,
+            'applied': self.applied,
+            'dropped': self.dropped,
+        }
+
+
 class WebsocketClient:
     def __init__(self, product_ids=["BTC-USD"], channels=["full"], url='wss://ws-feed.exchange.coinbase.com'):
         #
@@ -35,6 +221,10 @@ class WebsocketClient:
         self.channels = channels
         self.ws = None
         self.stop_flag = True
+        self.decoder = FeedDecoder()
+        self.pipeline = None
+        # a FeedJournal which every received frame is appended to, see Orderbook.journal
+        self.journal = None
 
     def get_product_ids(self):
         return self.product_ids
@@ -47,11 +237,19 @@ class WebsocketClient:
         logger.info("### closed ###")
 
     def on_message(self, message):
-        logger.debug(json.dumps(message, indent=4, sort_keys=True))
+        # only pay for formatting the message when it is going to be shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(message, indent=4, sort_keys=True))
 
     def on_error(self, error):
         logger.error(error)
 
+    def on_message_error(self, message, error):
+        """
+        called when on_message(message) raised error, the feed goes on with the next message
+        """
+        logger.error("failed to apply a {} message: {!r}".format(message.get('type'), error))
+
     def subscribe(self):
         # connect to the websocket
         self.stop_flag = False
@@ -73,20 +271,47 @@ class WebsocketClient:
         message = json.loads(data)
         return message
 
-    def listen(self):
-        # keep receive message from websocket
+    def listen(self, queue_size=0, backlog_policy='block', batch_size=500):
+        """
+        keep receiving messages from the websocket until close() is called
+        :param queue_size: 0 to decode and apply every message on this thread, otherwise the
+                most received frames waiting for a FeedPipeline apply thread
+        :param backlog_policy: 'block' or 'drop', see FeedPipeline
+        :param batch_size: most frames applied at once, see FeedPipeline
+        """
+        journal = self.journal
+        if queue_size:
+            self.pipeline = FeedPipeline(self, queue_size, backlog_policy, batch_size)
+            self.pipeline.start()
+            try:
+                while not self.stop_flag:
+                    data = self.ws.recv()
+                    if journal is not None:
+                        journal.append(data)
+                    self.pipeline.receive(data)
+            finally:
+                self.pipeline.stop()
+            return
         while not self.stop_flag:
             data = self.ws.recv()
+            if journal is not None:
+                journal.append(data)
             try:
-                message = json.loads(data)
-            except json.decoder.JSONDecodeError:
+                message = self.decoder.decode(data)
+            except ValueError:
                 logger.warning('one incomplete message, ignored')
-                pass
+                continue
             # logger.debug("in listen: enter sleep")
             # time.sleep(0.1)
             # logger.debug("in listen: end sleep")
             self.on_message(message)
 
+    def get_feed_metrics(self):
+        """
+        :return: the queue metrics of the running FeedPipeline, None when listen() applies messages itself
+        """
+        return self.pipeline.get_metrics() if self.pipeline is not None else None
+
     def close(self):
         self.stop_flag = True
         try:
@@ -98,23 +323,381 @@ class WebsocketClient:
         self.on_close()
 
 
+class Order:
+    """
+    one resting order. __slots__ keeps every record far smaller than a dict,
+    which matters with tens of thousands of orders in a level 3 book.
+    side and price are not copied into every order, they are read from the
+    PriceLevel the order rests at
+    """
+    __slots__ = ('order_id', 'size', 'level')
+
+    def __init__(self, order_id, size):
+        self.order_id = order_id
+        self.size = size
+        self.level = None
+
+    def __repr__(self):
+        return 'Order(order_id={!r}, size={})'.format(self.order_id, self.size)
+
+
+class PriceLevel:
+    """
+    all resting orders of one side at one price.
+    orders are kept in a dict keyed by order_id, which preserves arrival
+    order and lets any order be removed in constant time. the total size
+    of the level is kept up to date by every change, so building L2 levels
+    never has to walk the orders
+    """
+    __slots__ = ('side', 'price', 'orders', 'size')
+
+    def __init__(self, side, price, orders=()):
+        self.side = side
+        self.price = price
+        self.orders = {}
+        # 0 adds up with both decimal.Decimal and fixed point integer sizes
+        self.size = 0
+        for order in orders:
+            self.add(order)
+
+    @property
+    def count(self):
+        return len(self.orders)
+
+    def add(self, order):
+        self.orders[order.order_id] = order
+        self.size += order.size
+        order.level = self
+
+    def remove(self, order_id):
+        """
+        :param order_id: (String) id of the order to remove
+        :return: the removed order, or None if it is not at this level
+        """
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            self.size -= order.size
+        return order
+
+    def resize(self, order_id, new_size):
+        """
+        change the remaining size of one order at this level
+        :param order_id: (String) id of the order
+        :param new_size: new remaining size of the order
+        """
+        order = self.orders[order_id]
+        self.size += new_size - order.size
+        order.size = new_size
+
+    def get(self, order_id):
+        return self.orders.get(order_id)
+
+    def __contains__(self, order_id):
+        return order_id in self.orders
+
+    def __iter__(self):
+        return iter(self.orders.values())
+
+    def __len__(self):
+        return len(self.orders)
+
+    def __repr__(self):
+        return 'PriceLevel(size={}, orders={})'.format(self.size, list(self.orders.values()))
+
+
+def _increment_places(increment):
+    """
+    :param increment: (decimal.Decimal) a power of ten, e.g. 0.01
+    :return: number of decimal places of the increment, e.g. 2
+    """
+    sign, digits, exponent = increment.normalize().as_tuple()
+    if sign or digits != (1,):
+        raise ValueError("increment {} is not a power of ten".format(increment))
+    return -exponent
+
+
+def _to_units(value, places):
+    """
+    convert a decimal string into an integer count of 10**-places units,
+    e.g. _to_units('19233.63', 2) == 1923363
+    :raise ValueError: if value is not a whole number of units
+    """
+    if isinstance(value, str) and 'e' not in value and 'E' not in value:
+        # fast path for the plain decimal strings of the feed and the REST API
+        whole, _, fraction = value.partition('.')
+        if len(fraction) > places:
+            if fraction[places:].strip('0'):
+                raise ValueError("{} has more than {} decimal places".format(value, places))
+            fraction = fraction[:places]
+        return int(whole + fraction.ljust(places, '0'))
+    units = decimal.Decimal(str(value)).scaleb(places)
+    if units != units.to_integral_value():
+        raise ValueError("{} has more than {} decimal places".format(value, places))
+    return int(units)
+
+
+def format_units(units, places):
+    """
+    convert an integer count of 10**-places units back into a decimal string with
+    string operations only, e.g. format_units(1923363, 2) == '19233.63'. zero is '0'
+    as in decimal mode
+    """
+    if not units:
+        return '0'
+    if not places:
+        return str(units)
+    if units < 0:
+        return '-' + format_units(-units, places)
+    digits = str(units).rjust(places + 1, '0')
+    return digits[:-places] + '.' + digits[-places:]
+
+
+def _check_positive(name, value):
+    """
+    :param value: a price or size of the book, decimal.Decimal or fixed point units
+    :raise ValueError: if value is not a finite number above zero
+    """
+    if isinstance(value, decimal.Decimal) and not value.is_finite():
+        # NaN would raise decimal.InvalidOperation when compared
+        raise ValueError("{} must be a finite number".format(name))
+    if value <= 0:
+        raise ValueError("{} must be positive".format(name))
+
+
+class DecimalCodec:
+    """
+    prices and sizes of the book are decimal.Decimal, the default
+    """
+    fixed_point = False
+
+    def price(self, value):
+        return decimal.Decimal(value)
+
+    def size(self, value):
+        return decimal.Decimal(value)
+
+    def price_str(self, price):
+        return str(price)
+
+    def size_str(self, size):
+        return str(size)
+
+    def notional_str(self, notional):
+        return str(notional)
+
+
+class FixedPointCodec:
+    """
+    prices of the book are integer ticks of the quote increment and sizes are
+    integer units of the base increment, so price keys compare and sizes add
+    as plain ints. they are converted back to decimal strings only for output
+    """
+    fixed_point = True
+    # most strings kept by price_str() and size_str(): the levels near the best prices are
+    # shown again and again, most of them with the same size as the last time
+    STR_CACHE_SIZE = 100000
+
+    def __init__(self, quote_increment, base_increment):
+        self.quote_increment = decimal.Decimal(quote_increment)
+        self.base_increment = decimal.Decimal(base_increment)
+        self._price_places = _increment_places(self.quote_increment)
+        self._size_places = _increment_places(self.base_increment)
+        self._price_strs = {}
+        self._size_strs = {}
+
+    def price(self, value):
+        return _to_units(value, self._price_places)
+
+    def size(self, value):
+        return _to_units(value, self._size_places)
+
+    def price_str(self, price):
+        text = self._price_strs.get(price)
+        if text is None:
+            text = self._cache(self._price_strs, price, self._price_places)
+        return text
+
+    def size_str(self, size):
+        text = self._size_strs.get(size)
+        if text is None:
+            text = self._cache(self._size_strs, size, self._size_places)
+        return text
+
+    def _cache(self, strs, units, places):
+        if len(strs) >= self.STR_CACHE_SIZE:
+            strs.clear()
+        text = strs[units] = format_units(units, places)
+        return text
+
+    def notional_str(self, notional):
+        # a price in ticks times a size in units
+        return format_units(notional, self._price_places + self._size_places)
+
+
+# patterns of parse_snapshot_stream, prices, sizes and order ids never contain
+# brackets, so the end of a bids/asks array is a ']' following a row's ']'
+_SNAPSHOT_KEY = re.compile(r'"(bids|asks|sequence)"\s*:\s*(?:(\[)|(\d+)\s*[,}])')
+_SNAPSHOT_ROW = re.compile(r'\[\s*"([^"]*)"\s*,\s*"([^"]*)"\s*,\s*"?([^",\]]*)"?\s*\]')
+_SNAPSHOT_SIDE_END = re.compile(r'\]\s*\]')
+_SNAPSHOT_EMPTY_END = re.compile(r'[\s,]*\]')
+
+
+def parse_snapshot_stream(chunks):
+    """
+    parse a level 3 book response of the REST API as its chunks arrive,
+    without building the whole json document first
+    :param chunks: iterable of bytes (or str) pieces of the response body
+    :return: {'sequence': int or None, 'bids': [(price, size, order_id), ...], 'asks': [...]}
+    """
+    snapshot = {'sequence': None, 'bids': [], 'asks': []}
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    rows = None  # rows of the side being parsed
+    buffer = ''
+    for chunk in chunks:
+        buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        pos = 0
+        while True:
+            if rows is None:
+                match = _SNAPSHOT_KEY.search(buffer, pos)
+                if match is None:
+                    # keep enough text for a key cut by the chunk boundary
+                    pos = max(pos, len(buffer) - 64)
+                    break
+                if match.group(1) == 'sequence':
+                    snapshot['sequence'] = int(match.group(3))
+                else:
+                    rows = snapshot[match.group(1)]
+                pos = match.end()
+                continue
+            end = _SNAPSHOT_EMPTY_END.match(buffer, pos)
+            if end is not None:
+                rows = None
+                pos = end.end()
+                continue
+            end = _SNAPSHOT_SIDE_END.search(buffer, pos)
+            if end is not None:
+                rows.extend(_SNAPSHOT_ROW.findall(buffer, pos, end.start() + 1))
+                rows = None
+                pos = end.end()
+                continue
+            # parse every complete row, the rest waits for the next chunk
+            limit = buffer.rfind(']', pos) + 1
+            if limit > pos:
+                rows.extend(_SNAPSHOT_ROW.findall(buffer, pos, limit))
+                pos = limit
+            break
+        buffer = buffer[pos:]
+    return snapshot
+
+
 class OrderBook(WebsocketClient):
-    def __init__(self, product_ids=["BTC-USD"], channels=["full"], url='wss://ws-feed.exchange.coinbase.com'):
+    # message types which change the book, every other type is only sequence checked
+    HANDLED_TYPES = ('open', 'done', 'match', 'change')
+    # how many level changes are kept for get_changes()
+    CHANGE_LOG_SIZE = 10000
+    # most (depth, tick) results kept by get_levels()
+    LEVEL_CACHE_SIZE = 64
+    # seconds to wait before downloading the snapshot again, after a failed download or a
+    # snapshot behind the feed. the wait doubles on every retry, up to RESYNC_MAX_DELAY
+    RESYNC_RETRY_DELAY = 1
+    RESYNC_MAX_DELAY = 60
+
+    def __init__(self, product_ids=["BTC-USD"], channels=["full"], url='wss://ws-feed.exchange.coinbase.com',
+                 fixed_point=False, quote_increment=None, base_increment=None, depth_window=0, signal_window=60,
+                 ladder_width=0):
+        """
+        :param fixed_point: keep prices and sizes as integer ticks/units instead of decimal.Decimal
+        :param quote_increment: price increment of the product, e.g. '0.01'. in fixed point mode
+                it is fetched from the REST API when not given, as is base_increment
+        :param base_increment: size increment of the product, e.g. '0.00000001'
+        :param depth_window: how many ticks from the best price of each side are indexed for
+                get_impact(), 0 to walk the levels on every query instead
+        :param signal_window: seconds of the rolling rates of get_signals(), 0 to not keep any signals
+        :param ladder_width: keep the levels within this many ticks of the best price of each side in
+                a dense PriceLadder (numpy is needed, fixed point mode only), 0 for a SortedDict
+        """
         super(OrderBook, self).__init__(product_ids, channels, url)
+        if ladder_width and not fixed_point:
+            raise ValueError("a price ladder needs fixed point prices")
+        self.decoder = FeedDecoder(self.HANDLED_TYPES)
+        if not fixed_point:
+            self._codec = DecimalCodec()
+        elif quote_increment is not None and base_increment is not None:
+            self._codec = FixedPointCodec(quote_increment, base_increment)
+        else:
+            # configured by reset_OrderBook, before any order is added
+            self._codec = None
         self._sequence_id = 0
         self._order_book = {}
+        # the book version increases on every change of any price level. the
+        # cached top of book (and its json bytes) is only rebuilt when a change
+        # touches one of the levels it shows, tracked by the top_dirty flag
+        self._version = 0
+        self._top_dirty = True
+        self._top_count = None
+        self._top_bounds = dict(buy=None, sell=None)
+        self._order_book_json = None
+        # (version, side, price) of the latest level changes, for get_changes().
+        # a change of the whole book (a reset or a swap) moves the floor version,
+        # clients of an older version get a full snapshot instead
+        self._changes = collections.deque(maxlen=self.CHANGE_LOG_SIZE)
+        self._change_floor = 0
+        # (depth, tick) -> (version, result) of get_levels()
+        self._level_cache = {}
+        # side -> SideDepth, the cumulative depth index of get_impact(). a side is
+        # (re)built by the next change after it was invalidated or the best price
+        # left its window. prices are indexed in ticks of the quote increment
+        self._depth_window = depth_window
+        self._depth = dict(buy=None, sell=None)
+        if fixed_point:
+            self._depth_tick = 1
+        elif quote_increment is not None:
+            self._depth_tick = decimal.Decimal(quote_increment)
+        else:
+            self._depth_tick = None
+        # best bid/ask derived signals and rolling rates, see Orderbook.signals
+        self._signals = BookSignals(self, signal_window) if signal_window else None
+        self._signal_listeners = []
+        # a BookCheckpointer which writes this book to disk, see Orderbook.checkpoint
+        self.checkpointer = None
 
+        # side -> SortedDict, or PriceLadder, of price -> PriceLevel
+        self._ladder_width = ladder_width
         self._orders = dict(buy=None, sell=None)
-        self._orders['buy'] = SortedDict()
-        self._orders['sell'] = SortedDict()
+        self._orders['buy'] = self._new_side('buy')
+        self._orders['sell'] = self._new_side('sell')
+        # order_id -> Order for every resting order, so handlers never need to
+        # search a price level or the whole book for an order
+        self._order_index = {}
+
+        # while a replacement book is built from a level 3 snapshot in the
+        # background, feed messages are queued in _resync_buffer. the current
+        # book is left untouched and served as stale until the swap
+        self._resyncing = False
+        self._resync_buffer = []
+        self._resync_lock = threading.Lock()
+        self._resync_done = threading.Event()
+        # the thread building the replacement book, None once it swapped the book in
+        self._resync_loader = None
 
     def on_open(self):
         logger.info("Welcome to the OrderBook! please Ctrl+C to stop running")
-        self.reset_OrderBook()
+        if self._sequence_id and not self._resyncing:
+            # a warm started (or reconnected) book goes on with the live feed, process_message
+            # starts a resync only if the first live message does not follow on from it
+            logger.info("resuming the order book at sequence={}".format(self._sequence_id))
+            return
+        # the feed keeps being read (and queued) while the first snapshot downloads
+        self.start_resync()
 
     def on_close(self):
         logger.info("The OrderBook is closed")
 
+    def on_message_error(self, message, error):
+        super().on_message_error(message, error)
+        # the message may be applied in part, only a new snapshot gives a consistent book again
+        self.start_resync()
+
     def on_message(self, message):
         # at first, call parent class' on_message method to
         # show the message for debugging purpose
@@ -126,18 +709,42 @@ class OrderBook(WebsocketClient):
         if message.get('sequence') is None:
             logger.debug("sequence is missing in the message,ignore it")
             return
+        if self._resyncing:
+            with self._resync_lock:
+                # check again, the replacement book may have been swapped in meanwhile
+                if self._resyncing:
+                    self._resync_buffer.append(message)
+                    return
+        self.process_message(message)
+
+    def process_message(self, message):
+        """
+        check the sequence of one feed message and apply it to the book
+        :param message: a message dict which has a sequence
+        """
         message_sequence = message['sequence']
-        logger.debug('sequence_id:{}'.format(message_sequence))
+        logger.debug('sequence_id:%s', message_sequence)
         if message_sequence <= self._sequence_id:
             # this is an out-of-date message, just ignore it
             logger.debug('out-of-date message')
             return
         # some messages got missed or this is the first message after subscription
         if message_sequence > self._sequence_id + 1:
-            self._sequence_id = message_sequence
-            self.reset_OrderBook()
+            logger.info("sequence gap: expected {}, got {}".format(self._sequence_id + 1, message_sequence))
+            self.start_resync([message])
             return
         self._sequence_id = message_sequence
+        self.apply_message(message)
+        checkpointer = self.checkpointer
+        if checkpointer is not None and checkpointer.requested:
+            # the book is consistent between two messages, copy a slice of it for the checkpoint writer
+            checkpointer.capture()
+
+    def apply_message(self, message):
+        """
+        apply one in-sequence feed message to the book
+        :param message: a message dict
+        """
         # handle different message types to update orders status
         message_type = message['type']
         if message_type == "open":
@@ -149,115 +756,57 @@ class OrderBook(WebsocketClient):
         elif message_type == "change":
             self.change(message)
         else:
-            logger.debug("unknown message type:[{}], ignore it".format(message_type))
+            logger.debug("unknown message type:[%s], ignore it", message_type)
             return
-        self.show_order_books()
+        if self._signals is not None:
+            self._signals.on_message(message)
+        # the live book is shown on the console by a ConsoleRenderer thread
 
     def open(self, message):
         logger.debug("in open handler")
         order_id = message['order_id']
         side = message["side"]
-        price = decimal.Decimal(message['price'])
-        size = decimal.Decimal(message['remaining_size'])
-        # time = message['time']
-        order = {
-            "order_id": order_id,
-            "size": size
-            # 'time': time
-        }
+        price = self._codec.price(message['price'])
+        size = self._codec.size(message['remaining_size'])
         # side is either "buy" or "sell"
-        # update self._order_book
-        existing_orders = self.get_orders(side)
-        if not existing_orders.get(price):
-            existing_orders[price] = [order]
-        else:
-            existing_orders[price].append(order)
-        self.set_orders(side, existing_orders)
-        return existing_orders
+        self.add_order(side, price, order_id, size)
+        return self.get_orders(side)
 
     def done(self, message):
         logger.debug("in done handler")
         order_id = message['order_id']
         side = message["side"]
-        price = None
-        # for some case, price is not included in message, probably we need to do search on the whole order book
-        try:
-            price = decimal.Decimal(message['price'])
-        except:
-            logger.warning("for some case, price is not included in message, probably we need to do search on the "
-                           "whole order book")
-        size = decimal.Decimal(message['remaining_size'])
-        # time = message['time']
-        order = {
-            "order_id": order_id,
-            "size": size
-            # 'time': time
-        }
-
-        # side can be either "buy" or "sell"
-        existing_orders = self.get_orders(side)
-        if not price:
-            for temp_price, orders in existing_orders.items():
-                for o in orders:
-                    if o['order_id'] == order['order_id']:  # found it
-                        orders.remove(o)  # remove the order completely
-                        break  # because order_id is unique, no need to try more
-            if not orders:
-                del existing_orders[temp_price]
-            self.set_orders(side, existing_orders)
-        try:
-            orders = existing_orders[price]
-            for o in orders:
-                if o['order_id'] == order['order_id']:
-                    orders.remove(o)
-                    break
-            if not orders:
-                del existing_orders[price]
-            self.set_orders(side, existing_orders)
-        except KeyError:
-            logger.debug("no {} order with this price for now".format(side))
-
-        return existing_orders
+        # price is not included in every done message, the order index
+        # locates the order without searching the whole side of the book
+        if self.remove_order(order_id) is None:
+            logger.debug("no %s order with this id for now", side)
+        return self.get_orders(side)
 
     def match(self, message):
         logger.debug("in match handler")
         maker_order_id = message['maker_order_id']
-        taker_order_id = message['taker_order_id']
-        trade_id = message['trade_id']
         side = message["side"]
-        price = decimal.Decimal(message['price'])
-        size = decimal.Decimal(message['size'])
-        time = message['time']
-        order = {
-            "maker_order_id": maker_order_id,
-            "taker_order_id": taker_order_id,
-            "size": size,
-            'time': time,
-        }
-        logger.debug("Parameters are parsed properly. Order: %s", extra=order)
+        price = self._codec.price(message['price'])
+        size = self._codec.size(message['size'])
+        logger.debug("Parameters are parsed properly. maker_order_id: %s", maker_order_id)
         # side can be either "buy" or "sell"
         existing_orders = self.get_orders(side)
-        if not existing_orders.get(price):
+        order = self._order_index.get(maker_order_id)
+        if order is None or order.level.side != side or order.level.price != price:
+            # the maker order is not resting at this price
             return existing_orders
-        for o in existing_orders[price]:
-            if o['order_id'] == order["maker_order_id"]:
-                if o["size"] == order["size"]:
-                    existing_orders[price].remove(o)
-                if not existing_orders[price]:
-                    del existing_orders[price]
-                else:
-                    o['size'] -= order['size']
-                break  # maker_order_id is unique, only one maker_order_id can be matched
-        self.set_orders(side, existing_orders)
+        if order.size <= size:
+            self.remove_order(maker_order_id)
+        else:
+            self.resize_order(maker_order_id, order.size - size)
         return existing_orders
 
     def change(self, message):
         logger.debug("in change handler")
-        old_size = decimal.Decimal(message["old_size"])
-        new_size = decimal.Decimal(message["new_size"])
+        old_size = self._codec.size(message["old_size"])
+        new_size = self._codec.size(message["new_size"])
         order_id = message["order_id"]
         side = message["side"]
-        time = message['time']
 
         # side can be either "buy" or "sell"
         existing_orders = self.get_orders(side)
@@ -267,74 +816,345 @@ class OrderBook(WebsocketClient):
             logger.warning("get no reason for change message")
             return
         if reason == "STP":
-            price = decimal.Decimal(message['price'])
-            if not existing_orders.get(price):
-                # not initialized or it is a change to received message
-                logger.warning("missing a previous price")
-                return existing_orders
-            else:
-                for o in existing_orders[price]:
-                    if o['order_id'] == order_id:
-                        assert o['size'] == old_size, f"the size {o['size']} to change is not same as " \
-                            f"old_size according to the server side {old_size}"
-                        o['size'] = new_size
-                        self.set_orders(side, existing_orders)
-                        return existing_orders
+            price = self._codec.price(message['price'])
         elif reason == "modify_order":
-            old_price = decimal.Decimal(message['old_price'])
-            new_price = decimal.Decimal(message['new_price'])
-            if not existing_orders.get(old_price):
-                # not initialized or it is a change to received message
-                logger.warning("missing an old_price")
-                return existing_orders
-            else:
-                for o in existing_orders[old_price]:
-                    if o['order_id'] == order_id:
-                        # switch to new size
-                        assert o['size'] == old_size, f"the size {o['size']} to change is not same as " \
-                            f"old_size according to the server side {old_size}"
-                        o['size'] = new_size
-                        # switch to new price
-                        if existing_orders.get(new_price):
-                            existing_orders[new_price].append(o)
-                        else:
-                            existing_orders[new_price] = [o]
-                        existing_orders[old_price].remove(o)
-                        if not existing_orders[old_price]:
-                            del existing_orders[old_price]
-                        self.set_orders(side, existing_orders)
-                        return existing_orders
+            price = self._codec.price(message['old_price'])
         else:
             logger.warning("get other reason for change message")
             return existing_orders
 
-    def reset_OrderBook(self):
-        logger.info("resetOrderBook")
+        order = self._order_index.get(order_id)
+        if order is None or order.level.side != side or order.level.price != price:
+            # not initialized or it is a change to received message
+            logger.warning("missing a previous price")
+            return existing_orders
+        assert order.size == old_size, f"the size {order.size} to change is not same as " \
+            f"old_size according to the server side {old_size}"
+        if reason == "STP":
+            self.resize_order(order_id, new_size)
+        else:
+            # switch to new price with the new size
+            self.remove_order(order_id)
+            self.add_order(side, self._codec.price(message['new_price']), order_id, new_size)
+        return existing_orders
 
-        self._orders.clear()
-        self._orders['buy'] = SortedDict()
-        self._orders['sell'] = SortedDict()
+    def add_order(self, side, price, order_id, size):
+        """
+        put one resting order at the back of its price level
+        :param side:  (String) : either 'buy' or 'sell'
+        :param price:  price of the order
+        :param order_id:  (String) id of the order
+        :param size:  remaining size of the order
+        :return: the new order
+        """
+        if order_id in self._order_index:
+            self.remove_order(order_id)
+        existing_orders = self.get_orders(side)
+        level = existing_orders.get(price)
+        if level is None:
+            level = existing_orders[price] = PriceLevel(side, price)
+        # the order_id string of the message is shared by the order, its level and the order index
+        order = Order(order_id, size)
+        level.add(order)
+        self._order_index[order.order_id] = order
+        self._touch(level)
+        return order
 
+    def remove_order(self, order_id):
+        """
+        remove one resting order from the book in constant time
+        :param order_id:  (String) id of the order
+        :return: the removed order, or None if the order is not in the book
+        """
+        order = self._order_index.pop(order_id, None)
+        if order is None:
+            return None
+        level = order.level
+        level.remove(order_id)
+        if not level:
+            del self._orders[level.side][level.price]
+        self._touch(level)
+        return order
+
+    def resize_order(self, order_id, new_size):
+        """
+        change the remaining size of one resting order
+        :param order_id:  (String) id of the order
+        :param new_size:  new remaining size of the order
+        :return: the changed order, or None if the order is not in the book
+        """
+        order = self._order_index.get(order_id)
+        if order is None:
+            return None
+        level = order.level
+        level.resize(order_id, new_size)
+        self._touch(level)
+        return order
+
+    def _touch(self, level):
+        """
+        record a change of a price level (its size is already the new one, 0 if the
+        level is gone), and mark the cached top of book dirty if this level is shown in it
+        """
+        side, price = level.side, level.price
+        self._version += 1
+        if self._ladder_width:
+            self._orders[side].update(level)
+        self._changes.append((self._version, side, price))
+        if self._depth_window:
+            depth = self._depth[side]
+            if depth is None or not depth.set(price, level.size):
+                self._build_depth(side)
+            elif not level.size:
+                # a level is gone, place the window again if the best price drifted
+                # to its far half, so the levels beyond the best stay indexed
+                levels = self.get_orders(side)
+                if levels and depth.index(levels.keys()[0 if side == 'sell' else -1]) > depth.width // 2:
+                    self._build_depth(side)
+        if self._signals is not None and self._signals.on_level(level) and self._signal_listeners:
+            self._notify_signal_listeners()
+        if not self._top_dirty:
+            bound = self._top_bounds[side]
+            # bound is None when the cached snapshot shows every level of this side
+            if bound is None or (price <= bound if side == 'sell' else price >= bound):
+                self._top_dirty = True
+
+    def _invalidate(self):
+        self._version += 1
+        self._top_dirty = True
+        self._change_floor = self._version
+        self._changes.clear()
+        self._depth = dict(buy=None, sell=None)
+        if self._signals is not None:
+            self._signals.invalidate()
+
+    def get_signals(self):
+        """
+        :return: spread, imbalance, microprice and the rolling rates, see BookSignals.get(),
+                or None if the book keeps no signals
+        """
+        return self._signals.get() if self._signals is not None else None
+
+    def add_signal_listener(self, callback):
+        """
+        call callback(signals) on the feed thread whenever the best bid or best ask
+        changed, signals is the dict of BookSignals.get_top(). keep it short, the
+        book is not updated while it runs
+        """
+        self._signal_listeners.append(callback)
+
+    def remove_signal_listener(self, callback):
+        self._signal_listeners.remove(callback)
+
+    def _notify_signal_listeners(self):
+        signals = self._signals.get_top()
+        for callback in self._signal_listeners:
+            try:
+                callback(signals)
+            except Exception as e:
+                logger.error("signal listener {} failed: {!r}".format(callback, e))
+
+    def _build_depth(self, side):
+        if self._depth_tick is not None:
+            self._depth[side] = SideDepth(side, self.get_orders(side), self._depth_tick, self._depth_window)
+
+    def get_version(self):
+        return self._version
+
+    def get_changes(self, since):
+        """
+        the price levels changed since version since, with their current size
+        :param since: (int) the version of the last get_changes() result the client applied, 0 for none
+        :return: a dict in the format of
+            {
+            'version': 1234,
+            'snapshot': False,
+            'asks': [['1.01', '300'], ['1.03', '0']],
+            'bids': [['0.99', '5']],
+            'stale': False
+            }
+            a size of '0' means the level is gone. when the changes since that version
+            are no longer kept, 'snapshot' is True and asks/bids hold every level of the book
+        """
+        version = self._version
+        # copied at once, the feed thread keeps appending
+        changes = list(self._changes)
+        oldest = changes[0][0] if changes else version + 1
+        codec = self._codec
+        result = dict(version=version, snapshot=False, asks=[], bids=[], stale=self._resyncing)
+        if since < self._change_floor or since < oldest - 1 or since > version:
+            result['snapshot'] = True
+            for side, key in (('sell', 'asks'), ('buy', 'bids')):
+                levels = self.get_orders(side)
+                prices = levels.keys() if side == 'sell' else reversed(levels.keys())
+                result[key] = [[codec.price_str(price), codec.size_str(levels[price].size)] for price in prices]
+            return result
+        changed = dict(buy=set(), sell=set())
+        # versions increase by one per change, so the entries after since start at since - oldest + 1
+        for change_version, side, price in changes[since - oldest + 1:]:
+            if change_version > version:
+                break
+            changed[side].add(price)
+        for side, key in (('sell', 'asks'), ('buy', 'bids')):
+            levels = self.get_orders(side)
+            for price in sorted(changed[side], reverse=side == 'buy'):
+                level = levels.get(price)
+                result[key].append([codec.price_str(price), codec.size_str(level.size if level else 0)])
+        return result
+
+    def start_resync(self, buffered=()):
+        """
+        build a replacement book from a level 3 snapshot in the background and
+        swap it in once it caught up with the feed. until then, on_message
+        queues feed messages and the current book is served as stale
+        :param buffered: feed messages already received which need the new book
+        """
+        with self._resync_lock:
+            self._resync_buffer = list(buffered)
+            self._resync_done.clear()
+            self._resyncing = True
+            loader = self._resync_loader
+            if loader is not None and loader.is_alive():
+                # e.g. a reconnect during the download: the running loader replays the new
+                # queue, and downloads a newer snapshot itself if it does not catch up
+                logger.info("resync: a level 3 snapshot is already being loaded")
+                return
+            logger.info("resync: downloading a level 3 snapshot")
+            loader = self._resync_loader = threading.Thread(name='snapshot_loader Thread',
+                                                            target=self._rebuild_book, daemon=True)
+        self._invalidate()
+        loader.start()
+
+    def _rebuild_book(self):
+        delay = self.RESYNC_RETRY_DELAY
+        while True:
+            snapshot = None
+            try:
+                self._configure_codec()
+                snapshot = self.get_initial_OrderBook()
+            except Exception as e:
+                logger.error("failed to download the level 3 snapshot: {}".format(e))
+            if not snapshot:
+                logger.error("resetOrderBook failed, retrying in {}s".format(delay))
+            else:
+                book = self._new_book()
+                book.load_snapshot(snapshot)
+                if self._catch_up(book):
+                    return
+                # a gap among the queued messages, they need a newer snapshot
+                logger.info("resync: the snapshot is behind the feed, retrying in {}s".format(delay))
+            time.sleep(delay)
+            delay = min(delay * 2, self.RESYNC_MAX_DELAY)
+
+    def _catch_up(self, book):
+        """
+        replay the queued feed messages into the replacement book until the queue
+        is empty, then swap the book in while holding the lock on_message queues under
+        :return: True if the book was swapped in, False if the queued messages have a gap
+        """
+        while True:
+            with self._resync_lock:
+                buffered = self._resync_buffer
+                self._resync_buffer = []
+                if not buffered:
+                    self._swap_in(book)
+                    self._resyncing = False
+                    self._resync_loader = None
+                    self._resync_done.set()
+                    logger.info("resync: order book swapped in at sequence={}".format(self._sequence_id))
+                    return True
+            logger.info("resync: replaying {} queued messages".format(len(buffered)))
+            for i, message in enumerate(buffered):
+                message_sequence = message['sequence']
+                if message_sequence <= book._sequence_id:
+                    continue
+                if message_sequence > book._sequence_id + 1:
+                    logger.info("sequence gap: expected {}, got {}".format(book._sequence_id + 1,
+                                                                           message_sequence))
+                    with self._resync_lock:
+                        self._resync_buffer[:0] = buffered[i:]
+                    return False
+                book._sequence_id = message_sequence
+                book.apply_message(message)
+
+    def _new_book(self):
+        """
+        :return: an empty OrderBook with the same product and codec, to be swapped in
+        """
+        book = OrderBook(self.product_ids, self.channels, self.url, fixed_point=self._codec.fixed_point,
+                         signal_window=0, ladder_width=self._ladder_width)
+        book._codec = self._codec
+        return book
+
+    def _swap_in(self, book):
+        self._orders = book._orders
+        self._order_index = book._order_index
+        self._sequence_id = book._sequence_id
+        self._invalidate()
+
+    def _configure_codec(self):
+        if self._codec is None:
+            self._codec = FixedPointCodec(*self.get_product_increments())
+        if self._depth_window and self._depth_tick is None:
+            self._depth_tick = decimal.Decimal(self.get_product_increments()[0])
+
+    def reset_OrderBook(self):
+        """
+        download a level 3 snapshot and load it, blocking until it is done
+        """
+        logger.info("resetOrderBook")
+        self._configure_codec()
         initial_book = self.get_initial_OrderBook()
-        # logger.info(initial_book)
         if initial_book:
-            logger.info("resetOrderBook: sequence={}".format(initial_book['sequence']))
-            self._sequence_id = initial_book['sequence']
-            for side in ('bids', 'asks'):
-                book_of_one_side = initial_book[side]
-                for o in book_of_one_side:
-                    message = {
-                        'price': decimal.Decimal(o[0]),
-                        'remaining_size': decimal.Decimal(o[1]),
-                        'order_id': o[2],
-                        'side': 'buy' if side == 'bids' else 'sell'
-                    }
-                    self.open(message)
-
-            logger.info("Order book initializes successfully")
+            self.load_snapshot(initial_book)
         else:
             logger.error("resetOrderBook failed")
 
+    def load_snapshot(self, initial_book):
+        """
+        replace the whole book with a level 3 snapshot
+        :param initial_book: the response of get_initial_OrderBook()
+        """
+        logger.info("resetOrderBook: sequence={}".format(initial_book['sequence']))
+        price, size = self._codec.price, self._codec.size
+        sides = {}
+        for side in ('bids', 'asks'):
+            order_side = 'buy' if side == 'bids' else 'sell'
+            # the rows come grouped by price, sorted from the best price, so the price
+            # of a level is parsed once and the SortedDict is built in one go
+            levels = {}
+            level = None
+            last_price = None
+            for o in initial_book[side]:
+                # o is [price, size, order_id]
+                if o[0] != last_price:
+                    last_price = o[0]
+                    level_price = price(last_price)
+                    level = levels.get(level_price)
+                    if level is None:
+                        level = levels[level_price] = PriceLevel(order_side, level_price)
+                level.add(Order(o[2], size(o[1])))
+            sides[order_side] = levels
+        self.load_levels(initial_book['sequence'], sides)
+
+        logger.info("Order book initializes successfully")
+
+    def load_levels(self, sequence, sides):
+        """
+        replace the whole book with ready built price levels
+        :param sequence: the feed sequence the levels are at
+        :param sides: {'buy': {price: PriceLevel, ...}, 'sell': {...}}
+        """
+        self._orders.clear()
+        self._order_index.clear()
+        self._invalidate()
+        self._sequence_id = sequence
+        for side in ('buy', 'sell'):
+            levels = sides[side]
+            for level in levels.values():
+                self._order_index.update(level.orders)
+            self._orders[side] = self._new_side(side, levels)
+
     def get_initial_OrderBook(self):
         # coinbase doc for product order books to initialize the status
         # https://docs.cloud.coinbase.com/exchange/reference/exchangerestapi_getproductbook-1
@@ -365,23 +1185,69 @@ class OrderBook(WebsocketClient):
         url = url + endpoint
         # we need level 3 book to initialize our order book
         params = {'level': 3}
-        response = requests.Session().get(url, params=params, auth=None, timeout=30)
-        return response.json()
+        # the book is parsed while it downloads, instead of after the whole body arrived
+        response = requests.Session().get(url, params=params, auth=None, timeout=30, stream=True)
+        if response.status_code != 200:
+            logger.error("level 3 book request failed: {} {}".format(response.status_code, response.text))
+            return None
+        initial_book = parse_snapshot_stream(response.iter_content(chunk_size=1 << 16))
+        if initial_book['sequence'] is None:
+            return None
+        return initial_book
+
+    def get_product_increments(self):
+        """
+        get the price and size increments of the product from the REST API
+        https://docs.cloud.coinbase.com/exchange/reference/exchangerestapi_getproduct
+        :return: (quote_increment, base_increment) as strings, e.g. ('0.01', '0.00000001')
+        """
+        url = 'https://api.exchange.coinbase.com/products/' + self.product_ids[0]
+        product = requests.Session().get(url, timeout=30).json()
+        logger.info("product increments: quote={} base={}".format(product['quote_increment'],
+                                                                   product['base_increment']))
+        return product['quote_increment'], product['base_increment']
+
+    def _new_side(self, side, levels=None):
+        """
+        :param levels: initial levels of the side, a mapping of price -> PriceLevel
+        :return: the container of the levels of one side, a PriceLadder if ladder_width is set
+        """
+        if self._ladder_width:
+            return PriceLadder(side, self._ladder_width, levels)
+        return SortedDict(levels) if levels else SortedDict()
 
     def get_orders(self, side):
         """
         retrieve current orders from either 'buy' or 'sell' side
         :param side:  (String) : either 'buy' or 'sell'
-        :return: a SortedDict() whose keys are prices, value is a list which
+        :return: a SortedDict() (or PriceLadder) whose keys are prices, value is a PriceLevel which
                 include all orders at this price from one side(either buy or sell)
         """
         assert (side in ('buy', 'sell'))
         return self._orders[side]
 
     def set_orders(self, side, new_orders):
+        """
+        replace all orders of one side and rebuild the order index
+        :param side:  (String) : either 'buy' or 'sell'
+        :param new_orders: a mapping whose keys are prices, value is a PriceLevel or
+                a list of Order (or {'order_id': ..., 'size': ...} dicts) at this price
+        :return: the new SortedDict() of this side
+        """
         assert (side in ('buy', 'sell'))
         # logger.debug('set_orders:' + str(new_orders))
-        self._orders[side] = new_orders
+        for order_id in [k for k, v in self._order_index.items() if v.level.side == side]:
+            del self._order_index[order_id]
+        existing_orders = self._new_side(side)
+        for price, orders in new_orders.items():
+            level = PriceLevel(side, price, (o if isinstance(o, Order) else Order(o['order_id'], o['size'])
+                                             for o in orders))
+            if not level:
+                continue
+            existing_orders[price] = level
+            self._order_index.update(level.orders)
+        self._orders[side] = existing_orders
+        self._invalidate()
         return self._orders[side]
 
     def show_order_books(self, count=5):
@@ -403,7 +1269,8 @@ class OrderBook(WebsocketClient):
     def update_order_books(self, count=5):
         """
         construct order book of the best count bids and asks
-        self._order_book is updated
+        self._order_book is replaced only when a change touched one of the
+        levels it shows (or count changed), otherwise the cached one is returned
         :param count:  how many best prices/quantity items to display
         :return: a dict of most updated order_book
         in the format of
@@ -417,28 +1284,306 @@ class OrderBook(WebsocketClient):
                 ['0.99', '5'],
                 ['0.98', '3'],
             ],
+            'stale': False
+            }
+        """
+        if not self._top_dirty and count == self._top_count:
+            return self._order_book
+        # clear the flag before reading the book: a change made by the feed thread
+        # while the snapshot is built marks it dirty again, as no bound is set
+        self._top_bounds = dict(buy=None, sell=None)
+        self._top_dirty = False
+        # stale is True while the book waits for a replacement built from a new snapshot
+        order_book = dict(asks=[], bids=[], stale=self._resyncing)
+        bounds = dict(buy=None, sell=None)
+        price_str, size_str = self._codec.price_str, self._codec.size_str
 
+        for side, key in (('sell', 'asks'), ('buy', 'bids')):
+            levels = self.get_orders(side)
+            if self._ladder_width:
+                # the best count levels from one pass over the arrays of the ladder
+                top = levels.top(count)
+                order_book[key] = [[price_str(price), size_str(size)] for price, size in top]
+                if count and len(top) == count:
+                    bounds[side] = top[-1][0]
+                continue
+            # the best(smallest) sell prices, or the best(largest) buy prices, first
+            prices = levels.keys() if side == 'sell' else reversed(levels.keys())
+            for price in itertools.islice(prices, count):
+                # the level keeps the summary quantity of all its orders
+                order_book[key].append([price_str(price), size_str(levels[price].size)])
+            if count and len(levels) >= count:
+                # a side with fewer levels keeps no bound, any change of it is shown
+                bounds[side] = levels.keys()[count - 1] if side == 'sell' else levels.keys()[-count]
+        # use the assert to find the lock/cross case, the best ask is the smallest
+        # sell price and the best bid is the largest buy price
+        if self.get_orders('sell') and self.get_orders('buy'):
+            assert self.get_orders('sell').peekitem(index=0)[0] > self.get_orders('buy').peekitem(index=-1)[0]
+        self._order_book = order_book
+        self._order_book_json = None
+        self._top_count = count
+        self._top_bounds = bounds
+        return self._order_book
+
+    def get_levels(self, depth=5, tick=None):
+        """
+        the best depth price levels of both sides, optionally aggregated into price
+        buckets of tick: bids are bucketed down and asks up to a multiple of tick,
+        so a bucket never shows a better price than its orders have. only the price
+        levels are walked, the size of a level is kept up to date by the level.
+        a result is cached until the book changes
+        :param depth:  (int) how many levels (or buckets) per side
+        :param tick:  (String) bucket width, e.g. '10', None to not aggregate
+        :return: a dict in the format of update_order_books()
+        :raise ValueError: if tick is not a positive number, or not a multiple of the price increment.
+                a decimal book only knows its increment when quote_increment was given (or fetched
+                for depth_window), without it any positive tick is accepted
         """
-        self._order_book['asks'] = []
-        self._order_book['bids'] = []
+        cache_key = (depth, tick)
+        cached = self._level_cache.get(cache_key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        version = self._version
+        codec = self._codec
+        if tick is not None:
+            try:
+                tick = codec.price(tick)
+            except decimal.InvalidOperation:
+                raise ValueError("{} is not a number".format(tick))
+            _check_positive('tick', tick)
+            # the price increment is known in fixed point mode, and in decimal mode once given or fetched
+            if self._depth_tick is not None and tick % self._depth_tick:
+                raise ValueError("tick must be a multiple of the price increment {}".format(self._depth_tick))
+        result = dict(asks=[], bids=[], stale=self._resyncing)
+        for side, key in (('sell', 'asks'), ('buy', 'bids')):
+            levels = self.get_orders(side)
+            rows = result[key]
+            if self._ladder_width:
+                # the ladder sums the levels and buckets in vectorized passes
+                rows.extend([codec.price_str(price), codec.size_str(size)] for price, size in levels.top(depth, tick))
+                continue
+            prices = levels.keys() if side == 'sell' else reversed(levels.keys())
+            if tick is None:
+                for price in itertools.islice(prices, depth):
+                    rows.append([codec.price_str(price), codec.size_str(levels[price].size)])
+                continue
+            bucket = size = None
+            for price in prices:
+                level_bucket = price // tick * tick
+                if side == 'sell' and level_bucket < price:
+                    level_bucket += tick
+                if level_bucket != bucket:
+                    if bucket is not None:
+                        rows.append([codec.price_str(bucket), codec.size_str(size)])
+                        if len(rows) == depth:
+                            bucket = None
+                            break
+                    bucket, size = level_bucket, 0
+                size += levels[price].size
+            if bucket is not None and len(rows) < depth:
+                rows.append([codec.price_str(bucket), codec.size_str(size)])
+        if len(self._level_cache) >= self.LEVEL_CACHE_SIZE:
+            self._level_cache.clear()
+        self._level_cache[cache_key] = (version, result)
+        return result
 
-        for side in ('sell', 'buy'):
-            for i in range(count):
-                # get i best(smallest) sell prices, or i best(largest) buy prices
-                if side == 'sell':
-                    temp_price, orders = self.get_orders(side).peekitem(index=i)
-                else:
-                    temp_price, orders = self.get_orders(side).peekitem(index=-1 * (i + 1))
-
-                item = [str(temp_price), decimal.Decimal(0.00000)]
-                # accumulates quantity of the same price order size to a summary
-                for o in orders:
-                    item[1] += o.get('size')
-                item[1] = str(item[1])
-                if side == 'sell':
-                    self._order_book['asks'].append(item)  # larger prices put in the front
-                else:
-                    self._order_book['bids'].append(item)  # larger prices put in the back
-        # use the assert to find the lock/cross case
-        assert self._order_book['asks'][0] > self._order_book['bids'][-1]
-        return self._order_book
\ No newline at end of file
+    def get_impact(self, side, size=None, price=None):
+        """
+        what a market order would take from the book: either the cost to fill size, or
+        everything it can take up to a limit price. the levels within the depth window
+        are summed by the depth index in log time, the levels beyond it are walked
+        :param side:  (String) side of the order, 'buy' takes the asks and 'sell' takes the bids
+        :param size:  size to fill, e.g. '25'
+        :param price:  limit price, e.g. '19300.00', when size is not given
+        :return: a dict in the format of
+            {
+            'side': 'buy',
+            'size': '25',              size filled, less than asked if the book is too thin
+            'cost': '480862.50',       sum of price * size over the filled levels
+            'vwap': '19234.5',         cost / size
+            'worst_price': '19240.00', price of the last level taken
+            'walked_levels': 0         levels summed one by one, beyond the depth window or
+            }                          without a depth index; 0 if the index answered it all
+            size and cost are '0', vwap and worst_price None, if nothing can be taken
+        :raise ValueError: if size or price is not a positive number of the product increments
+        """
+        assert (side in ('buy', 'sell'))
+        codec = self._codec
+        book_side = 'sell' if side == 'buy' else 'buy'
+        levels = self.get_orders(book_side)
+        try:
+            size_limit = codec.size(size) if size is not None else None
+            price_limit = codec.price(price) if price is not None else None
+        except decimal.InvalidOperation:
+            raise ValueError("{} is not a number".format(size if size is not None else price))
+        for name, limit in (('size', size_limit), ('price', price_limit)):
+            if limit is not None:
+                _check_positive(name, limit)
+        filled = cost = walked = 0
+        worst = None
+        # the walk starts at the best price, or beyond the window of the depth index
+        walk, walk_from = True, None
+        depth = self._depth[book_side]
+        if depth is not None and depth.start is not None:
+            if size_limit is not None:
+                i, filled, cost = depth.fill(size_limit)
+                if i < depth.width:
+                    worst = depth.price(i)
+                    cost += (size_limit - filled) * worst
+                    filled = size_limit
+            else:
+                i = depth.index(price_limit)
+                if i >= 0:
+                    filled, cost = depth.up_to(min(i, depth.width - 1))
+            walk, walk_from = i >= depth.width, depth.edge()
+        if walk:
+            if book_side == 'sell':
+                prices = levels.irange(minimum=walk_from, maximum=price_limit)
+            else:
+                prices = levels.irange(minimum=price_limit, maximum=walk_from, reverse=True)
+            for level_price in prices:
+                level_size = levels[level_price].size
+                worst = level_price
+                walked += 1
+                if size_limit is not None and filled + level_size >= size_limit:
+                    cost += (size_limit - filled) * level_price
+                    filled = size_limit
+                    break
+                filled += level_size
+                cost += level_size * level_price
+        if filled and worst is None:
+            # everything was taken from the window, the last level is the worst price
+            # within the limit price, or within the window
+            bound = price_limit if price_limit is not None else walk_from
+            if book_side == 'sell':
+                worst = next(iter(levels.irange(maximum=bound, reverse=True)))
+            else:
+                worst = next(iter(levels.irange(minimum=bound)))
+        if not filled:
+            # a decimal zero keeps the exponent of the sizes it was summed from
+            filled = cost = 0
+        result = dict(side=side, size=codec.size_str(filled), cost=codec.notional_str(cost), vwap=None,
+                      worst_price=None, walked_levels=walked)
+        if filled:
+            result['vwap'] = str(decimal.Decimal(result['cost']) / decimal.Decimal(result['size']))
+            result['worst_price'] = codec.price_str(worst)
+        return result
+
+    def get_order_book_json(self, count=5):
+        """
+        :param count:  how many best prices/quantity items to include
+        :return: the json bytes of update_order_books(count), serialized only
+                once per snapshot
+        """
+        order_book = self.update_order_books(count)
+        data = self._order_book_json
+        if data is None or data[0] is not order_book:
+            data = self._order_book_json = (order_book, json.dumps(order_book).encode())
+        return data[1]
+
+
+class OrderBookManager(WebsocketClient):
+    """
+    one websocket connection for several products, each feed message is routed
+    by its product_id to the OrderBook of that product, which keeps its own
+    sequence and resyncs on its own
+    """
+    book_class = OrderBook
+
+    def __init__(self, product_ids=["BTC-USD"], channels=["full"], url='wss://ws-feed.exchange.coinbase.com',
+                 **book_options):
+        """
+        :param book_options: keyword arguments of every OrderBook, e.g. fixed_point=True
+        """
+        super(OrderBookManager, self).__init__(product_ids, channels, url)
+        # the books ignore the same message types, so messages are decoded once for all of them
+        self.decoder = FeedDecoder(self.book_class.HANDLED_TYPES)
+        self._books = {}
+        for product_id in product_ids:
+            self._books[product_id] = self.book_class([product_id], channels, url, **book_options)
+
+    def get_book(self, product_id):
+        """
+        :return: the OrderBook of product_id, or None if it is not subscribed
+        """
+        return self._books.get(product_id)
+
+    def get_books(self):
+        return self._books
+
+    def on_open(self):
+        logger.info("Opened {} connection: product_ids = {}".format(self.channels, self.product_ids))
+        for book in self._books.values():
+            book.on_open()
+
+    def on_close(self):
+        for book in self._books.values():
+            book.on_close()
+
+    def on_message_error(self, message, error):
+        book = self._books.get(message.get('product_id'))
+        if book is None:
+            super().on_message_error(message, error)
+        else:
+            book.on_message_error(message, error)
+
+    def on_message(self, message):
+        book = self._books.get(message.get('product_id'))
+        if book is None:
+            # subscriptions and errors have no product
+            super().on_message(message)
+            if message.get('type') == 'error':
+                logger.error("feed error: {}".format(message))
+            return
+        book.on_message(message)
+
+
+class ConsoleRenderer(threading.Thread):
+    """
+    show the live order book on the console from its own thread, so the
+    feed thread never waits for the terminal. the top of book is sampled
+    refresh_rate times per second, and shown only when it changed (or, with
+    bbo_only, only when the best bid or the best ask changed)
+    """
+    def __init__(self, order_book, refresh_rate=1.0, bbo_only=False, count=5):
+        """
+        :param order_book: the OrderBook to show
+        :param refresh_rate: how many times per second the book is sampled
+        :param bbo_only: only show the book when the best bid or best ask changed
+        :param count: how many best prices/quantity items to display
+        """
+        super(ConsoleRenderer, self).__init__(name='console_renderer Thread', daemon=True)
+        self.order_book = order_book
+        self.interval = 1.0 / refresh_rate
+        self.bbo_only = bbo_only
+        self.count = count
+        self._stop_event = threading.Event()
+        self._last_book = None
+        self._last_bbo = None
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.render_once()
+            except (IndexError, KeyError, RuntimeError, AssertionError) as e:
+                # the book is empty while it is being reset, or it changed under us
+                logger.debug("skip rendering the order book: %r", e)
+
+    def render_once(self):
+        """
+        :return: True if the book was shown, False if nothing changed since last time
+        """
+        order_book = self.order_book.update_order_books(self.count)
+        if order_book is self._last_book:
+            return False
+        self._last_book = order_book
+        if self.bbo_only:
+            bbo = (order_book['bids'][0], order_book['asks'][0])
+            if bbo == self._last_bbo:
+                return False
+            self._last_bbo = bbo
+        self.order_book.show_order_books(self.count)
+        return True
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,236 @@
+#######################################
+# run the feed handler and OrderBook of every product in its own process.
+# each worker publishes its top of book into a shared memory segment, which
+# the web process reads directly, without asking the worker
+#
+import json
+import multiprocessing
+import struct
+import time
+from multiprocessing import shared_memory
+
+from Orderbook.services import logger, OrderBook, ConsoleRenderer
+
+# segment layout: header, best bid/ask, then the json bytes of the top of book.
+# generation is odd while the worker writes, so a reader retries when it is odd
+# or changed while it was reading (a seqlock)
+_HEADER = struct.Struct('<QQI')  # generation, book sequence, payload length
+_BBO = struct.Struct('<24s24s24s24s')  # bid price, bid size, ask price, ask size
+_PAYLOAD_OFFSET = _HEADER.size + _BBO.size
+_EMPTY_BOOK = json.dumps({'asks': [], 'bids': [], 'stale': True}).encode()
+# workers are forked: manage.py starts its threads at import time, so a spawned
+# worker re-importing it would start them again
+_context = multiprocessing.get_context('fork')
+
+
+def _attach(name):
+    """
+    attach to an existing segment, only the process which created it unlinks it
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # python < 3.13 has no track argument. the forked workers share the resource
+        # tracker of the creating process, where the segment is already registered
+        return shared_memory.SharedMemory(name=name)
+
+
+class TopOfBookSegment:
+    """
+    a shared memory segment holding the latest top of book of one product,
+    written by one worker process and read by any number of processes
+    """
+    def __init__(self, name=None, size=1 << 16, create=False):
+        """
+        :param name: name of the segment, a new name is chosen when creating without one
+        :param size: bytes of the segment, it must hold the json of the published levels
+        :param create: create the segment instead of attaching to an existing one
+        """
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._shm.buf[:_PAYLOAD_OFFSET] = bytes(_PAYLOAD_OFFSET)
+        else:
+            self._shm = _attach(name)
+        self.name = self._shm.name
+        self._created = create
+
+    def write(self, data, sequence, bbo):
+        """
+        :param data: (bytes) json of the top of book
+        :param sequence: feed sequence of the book
+        :param bbo: (bid price, bid size, ask price, ask size) strings, '' for an empty side
+        """
+        buf = self._shm.buf
+        if _PAYLOAD_OFFSET + len(data) > len(buf):
+            raise ValueError("top of book of {} bytes does not fit the segment".format(len(data)))
+        generation = _HEADER.unpack_from(buf)[0]
+        _HEADER.pack_into(buf, 0, generation + 1, sequence, len(data))
+        _BBO.pack_into(buf, _HEADER.size, *(value.encode() for value in bbo))
+        buf[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + len(data)] = data
+        _HEADER.pack_into(buf, 0, generation + 2, sequence, len(data))
+
+    def read(self):
+        """
+        :return: (generation, sequence, bbo, payload bytes), generation 0 means nothing was published yet
+        """
+        buf = self._shm.buf
+        while True:
+            generation, sequence, length = _HEADER.unpack_from(buf)
+            if generation & 1:
+                continue
+            bbo = tuple(value.rstrip(b'\0').decode() for value in _BBO.unpack_from(buf, _HEADER.size))
+            payload = bytes(buf[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + length])
+            if _HEADER.unpack_from(buf)[0] == generation:
+                return generation, sequence, bbo, payload
+
+    def close(self):
+        self._shm.close()
+        if self._created:
+            self._shm.unlink()
+
+
+class PublishingOrderBook(OrderBook):
+    """
+    an OrderBook which writes its top of book into a TopOfBookSegment whenever
+    a message changed one of the published levels
+    """
+    def __init__(self, product_ids, channels, url, segment, count=5, **book_options):
+        super(PublishingOrderBook, self).__init__(product_ids, channels, url, **book_options)
+        self.segment = segment
+        self.count = count
+
+    def on_message(self, message):
+        super().on_message(message)
+        if self._top_dirty:
+            self.publish()
+
+    def publish(self):
+        try:
+            data = self.get_order_book_json(self.count)
+        except IndexError:
+            # not enough levels yet, the book is still loading
+            return
+        order_book = self._order_book
+        bid = order_book['bids'][0] if order_book['bids'] else ('', '')
+        ask = order_book['asks'][0] if order_book['asks'] else ('', '')
+        self.segment.write(data, self._sequence_id, (bid[0], bid[1], ask[0], ask[1]))
+
+
+def run_product_worker(product_id, segment_name, channels=["full"], url='wss://ws-feed.exchange.coinbase.com',
+                       count=5, refresh_rate=None, book_options=None):
+    """
+    the target of a worker process: maintain the book of one product and publish it
+    :param refresh_rate: show the book on the console this many times per second, None to not show it
+    """
+    segment = TopOfBookSegment(segment_name)
+    book = PublishingOrderBook([product_id], channels, url, segment, count, **(book_options or {}))
+    if refresh_rate:
+        ConsoleRenderer(book, refresh_rate=refresh_rate, count=count).start()
+    while True:
+        try:
+            logger.info(book.subscribe())
+            book.listen()
+        except KeyboardInterrupt:
+            book.close()
+            return
+        except Exception as e:
+            logger.error("{} feed failed: {}, reconnecting".format(product_id, e))
+            book.close()
+            time.sleep(1)
+
+
+class SharedTopOfBook:
+    """
+    read side of the top of book of one product published by its worker,
+    it offers the read methods of OrderBook used by the views
+    """
+    def __init__(self, product_id, segment, count=5):
+        self.product_id = product_id
+        self.segment = segment
+        self.count = count
+        self._generation = None
+        self._order_book = None
+
+    def get_product_ids(self):
+        return [self.product_id]
+
+    def get_order_book_json(self, count=5):
+        generation, sequence, bbo, payload = self.segment.read()
+        if generation == 0:
+            return _EMPTY_BOOK
+        if count == self.count:
+            return payload
+        return json.dumps(self.update_order_books(count)).encode()
+
+    def update_order_books(self, count=5):
+        """
+        :return: the published top of book, cut to count levels (at most the published count)
+        """
+        generation, sequence, bbo, payload = self.segment.read()
+        if generation != self._generation:
+            self._generation = generation
+            self._order_book = json.loads(payload or _EMPTY_BOOK)
+        if count >= self.count:
+            return self._order_book
+        return dict(self._order_book, asks=self._order_book['asks'][:count], bids=self._order_book['bids'][:count])
+
+    def get_bbo(self):
+        """
+        :return: {'sequence': ..., 'bid': [price, size], 'ask': [price, size]}, without parsing the json
+        """
+        generation, sequence, bbo, payload = self.segment.read()
+        return {'sequence': sequence, 'bid': list(bbo[:2]), 'ask': list(bbo[2:])}
+
+
+class ShardedBookService:
+    """
+    one worker process per product, each with its own websocket connection and
+    OrderBook, so the products are spread over the cores instead of sharing one GIL.
+    get_book() returns the shared memory reader of a product
+    """
+    def __init__(self, product_ids=["BTC-USD"], channels=["full"], url='wss://ws-feed.exchange.coinbase.com',
+                 count=5, segment_size=1 << 16, refresh_rate=None, **book_options):
+        """
+        :param count: how many best levels per side the workers publish
+        :param refresh_rate: the worker of the first product shows its book on the console
+                this many times per second, None to not show it
+        :param book_options: keyword arguments of every OrderBook, e.g. fixed_point=True
+        """
+        self.product_ids = product_ids
+        self.channels = channels
+        self.url = url
+        self.count = count
+        self.refresh_rate = refresh_rate
+        self.book_options = book_options
+        self._segments = {product_id: TopOfBookSegment(size=segment_size, create=True)
+                          for product_id in product_ids}
+        self._books = {product_id: SharedTopOfBook(product_id, segment, count)
+                       for product_id, segment in self._segments.items()}
+        self._workers = {}
+
+    def get_product_ids(self):
+        return self.product_ids
+
+    def get_book(self, product_id):
+        return self._books.get(product_id)
+
+    def get_books(self):
+        return self._books
+
+    def start(self):
+        for i, product_id in enumerate(self.product_ids):
+            worker = _context.Process(
+                name='{} worker'.format(product_id), target=run_product_worker, daemon=True,
+                args=(product_id, self._segments[product_id].name, self.channels, self.url, self.count,
+                      self.refresh_rate if i == 0 else None, self.book_options))
+            worker.start()
+            self._workers[product_id] = worker
+            logger.info("{} has started, pid={}".format(worker.name, worker.pid))
+
+    def stop(self):
+        for worker in self._workers.values():
+            worker.terminate()
+            worker.join()
+        self._workers.clear()
+        for segment in self._segments.values():
+            segment.close()
@@ -0,0 +1,167 @@
+#######################################
+# microstructure signals of an OrderBook: the best bid/ask are kept up to date
+# by the level changes which touch them, spread, imbalance and microprice are
+# derived from them, and order add/cancel/trade rates are counted over a
+# rolling window
+#
+import time
+
+
+class RollingCounter:
+    """
+    count events over the last window seconds in one second buckets, adding
+    an event is constant time and reading the total visits window buckets
+    """
+    __slots__ = ('window', 'counts', 'stamps')
+
+    def __init__(self, window=60):
+        self.window = window
+        self.counts = [0] * window
+        self.stamps = [-1] * window
+
+    def add(self, now, amount=1):
+        second = int(now)
+        i = second % self.window
+        if self.stamps[i] != second:
+            self.stamps[i] = second
+            self.counts[i] = 0
+        self.counts[i] += amount
+
+    def total(self, now):
+        """
+        :return: the sum of the events of the last window seconds, the current second included
+        """
+        oldest = int(now) - self.window
+        return sum(count for count, stamp in zip(self.counts, self.stamps) if stamp > oldest)
+
+    def rate(self, now):
+        """
+        :return: events per second over the window
+        """
+        return self.total(now) / self.window
+
+
+class BookSignals:
+    """
+    signals of one OrderBook. on_level is called with every changed price level
+    and only looks at the book when the level is at or better than the known
+    best price of its side
+    """
+    def __init__(self, book, window=60, clock=time.monotonic):
+        """
+        :param book: the OrderBook
+        :param window: seconds of the rolling add/cancel/trade rates
+        :param clock: function returning the current time in seconds
+        """
+        self.book = book
+        self.window = window
+        self.clock = clock
+        self.adds = RollingCounter(window)
+        self.cancels = RollingCounter(window)
+        self.trades = RollingCounter(window)
+        self.traded_size = RollingCounter(window)
+        # best price and size of each side, None for an empty side
+        self._best = dict(buy=None, sell=None)
+        self._valid = False
+
+    def invalidate(self):
+        """
+        the whole book changed, the best prices are read again when needed
+        """
+        self._valid = False
+
+    def _refresh(self):
+        for side in ('buy', 'sell'):
+            self._read_best(side)
+        self._valid = True
+
+    def _read_best(self, side):
+        levels = self.book.get_orders(side)
+        if levels:
+            price, level = levels.peekitem(0 if side == 'sell' else -1)
+            self._best[side] = (price, level.size)
+        else:
+            self._best[side] = None
+
+    def on_level(self, level):
+        """
+        :param level: a PriceLevel which changed, its size is 0 if it is gone
+        :return: True if the best bid or the best ask changed
+        """
+        if not self._valid:
+            self._refresh()
+            return True
+        side = level.side
+        best = self._best[side]
+        if best is not None:
+            if side == 'sell' and level.price > best[0] or side == 'buy' and level.price < best[0]:
+                # a level behind the best price
+                return False
+            if level.price == best[0] and level.size:
+                self._best[side] = (best[0], level.size)
+                return best[1] != level.size
+        # a new best price, or the best level is gone
+        self._read_best(side)
+        return self._best[side] != best
+
+    def on_message(self, message):
+        """
+        count one applied feed message in the rolling rates
+        """
+        message_type = message['type']
+        now = self.clock()
+        if message_type == 'open':
+            self.adds.add(now)
+        elif message_type == 'done':
+            if message.get('reason') == 'canceled':
+                self.cancels.add(now)
+        elif message_type == 'match':
+            self.trades.add(now)
+            self.traded_size.add(now, float(message['size']))
+
+    def get_top(self):
+        """
+        :return: a dict in the format of
+            {
+            'bid': 19227.69, 'bid_size': 0.05, 'ask': 19233.62, 'ask_size': 0.0049,
+            'spread': 5.93, 'mid': 19230.655,
+            'imbalance': 0.82,        (bid_size - ask_size) / (bid_size + ask_size), from -1 to 1
+            'microprice': 19233.04    mid weighted by the size on the other side
+            }
+            the prices and sizes of an empty side, and the signals which need both sides, are None
+        """
+        if not self._valid:
+            self._refresh()
+        codec = self.book._codec
+        signals = dict(bid=None, bid_size=None, ask=None, ask_size=None, spread=None, mid=None,
+                       imbalance=None, microprice=None)
+        best_bid, best_ask = self._best['buy'], self._best['sell']
+        if best_bid is not None:
+            signals['bid'] = float(codec.price_str(best_bid[0]))
+            signals['bid_size'] = float(codec.size_str(best_bid[1]))
+        if best_ask is not None:
+            signals['ask'] = float(codec.price_str(best_ask[0]))
+            signals['ask_size'] = float(codec.size_str(best_ask[1]))
+        if best_bid is not None and best_ask is not None:
+            bid, bid_size, ask, ask_size = signals['bid'], signals['bid_size'], signals['ask'], signals['ask_size']
+            # subtracted before the conversion, so the spread is a whole number of ticks
+            signals['spread'] = float(codec.price_str(best_ask[0] - best_bid[0]))
+            signals['mid'] = (bid + ask) / 2
+            total = bid_size + ask_size
+            if total:
+                signals['imbalance'] = (bid_size - ask_size) / total
+                signals['microprice'] = (bid * ask_size + ask * bid_size) / total
+        return signals
+
+    def get(self):
+        """
+        :return: the dict of get_top(), with the rates per second over the window:
+            'add_rate', 'cancel_rate', 'trade_rate' and 'trade_volume_rate'
+        """
+        signals = self.get_top()
+        now = self.clock()
+        signals['add_rate'] = self.adds.rate(now)
+        signals['cancel_rate'] = self.cancels.rate(now)
+        signals['trade_rate'] = self.trades.rate(now)
+        signals['trade_volume_rate'] = self.traded_size.rate(now)
+        return signals
@@ -0,0 +1,159 @@
+#######################################
+# push the live order book to browsers with server-sent events. the top of
+# book of a product is read once per interval by one BookBroadcaster and the
+# same bytes are handed to every connected client, instead of every client
+# polling api/data
+#
+import asyncio
+from urllib.parse import parse_qs
+
+from Orderbook.services import logger
+
+
+class BookBroadcaster:
+    """
+    sample the top of book of one product every interval seconds while anyone
+    is subscribed, and hand it to every subscriber when it changed.
+    updates are coalesced: a subscriber only ever holds the latest one, so a
+    slow client skips updates instead of falling behind
+    """
+    def __init__(self, book, interval=0.25, count=5):
+        """
+        :param book: an OrderBook, or anything with its get_order_book_json method
+        :param interval: seconds between two samples, the most updates per second is 1 / interval
+        :param count: how many best levels per side are sent
+        """
+        self.book = book
+        self.interval = interval
+        self.count = count
+        self.updates = 0
+        self._subscribers = set()
+        self._last = None
+        self._task = None
+
+    def subscribe(self):
+        """
+        :return: an asyncio.Queue which receives the json bytes of every update,
+                starting with the current book
+        """
+        updates = asyncio.Queue(1)
+        if self._last is not None:
+            updates.put_nowait(self._last)
+        self._subscribers.add(updates)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return updates
+
+    def unsubscribe(self, updates):
+        self._subscribers.discard(updates)
+
+    async def run(self):
+        while self._subscribers:
+            try:
+                data = self.book.get_order_book_json(self.count)
+            except (IndexError, KeyError, RuntimeError, AssertionError) as e:
+                # the book is empty while it is being reset, or it changed under us
+                logger.debug("skip sampling the order book: %r", e)
+                data = self._last
+            if data is not None and data != self._last:
+                self._last = data
+                self.updates += 1
+                for updates in self._subscribers:
+                    if updates.full():
+                        updates.get_nowait()
+                    updates.put_nowait(data)
+            await asyncio.sleep(self.interval)
+        # sampling starts again with the next subscriber
+        self._last = None
+
+
+class BookStreamApp:
+    """
+    ASGI application serving the server-sent events stream of the order book at
+    path, e.g. /orderbook/api/stream?product_id=ETH-USD, and passing every other
+    request to app
+    """
+    def __init__(self, app, get_book, path='/orderbook/api/stream', interval=0.25, keepalive=15,
+                 on_startup=None):
+        """
+        :param app: the ASGI application of every other request
+        :param get_book: function returning the book of a product_id, or None if it is not subscribed
+        :param interval: seconds between two samples of a book, see BookBroadcaster
+        :param keepalive: seconds of silence after which a comment is sent to keep the connection open
+        :param on_startup: coroutine function awaited when the server starts, if it sends lifespan events
+        """
+        self.app = app
+        self.get_book = get_book
+        self.path = path
+        self.interval = interval
+        self.keepalive = keepalive
+        self.on_startup = on_startup
+        self._broadcasters = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http' and scope['path'] == self.path:
+            await self.stream(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            event = await receive()
+            if event['type'] == 'lifespan.startup':
+                if self.on_startup is not None:
+                    await self.on_startup()
+                await send({'type': 'lifespan.startup.complete'})
+            elif event['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def get_broadcaster(self, product_id):
+        """
+        :return: the BookBroadcaster of product_id, or None if the product is not subscribed
+        """
+        broadcaster = self._broadcasters.get(product_id)
+        if broadcaster is None:
+            book = self.get_book(product_id)
+            if book is None:
+                return None
+            broadcaster = self._broadcasters[product_id] = BookBroadcaster(book, self.interval)
+        return broadcaster
+
+    async def stream(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        product_id = query.get('product_id', ['BTC-USD'])[0]
+        broadcaster = self.get_broadcaster(product_id)
+        if broadcaster is None:
+            await send({'type': 'http.response.start', 'status': 404,
+                        'headers': [(b'content-type', b'text/plain')]})
+            await send({'type': 'http.response.body',
+                        'body': 'product {} is not subscribed'.format(product_id).encode()})
+            return
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/event-stream'),
+                                (b'cache-control', b'no-cache'),
+                                (b'x-accel-buffering', b'no')]})
+        updates = broadcaster.subscribe()
+        disconnected = asyncio.ensure_future(self._wait_disconnect(receive))
+        try:
+            while not disconnected.done():
+                update = asyncio.ensure_future(updates.get())
+                await asyncio.wait((update, disconnected), timeout=self.keepalive,
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if update.done():
+                    body = b'data: ' + update.result() + b'\n\n'
+                else:
+                    update.cancel()
+                    if disconnected.done():
+                        break
+                    body = b': keepalive\n\n'
+                await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+        finally:
+            broadcaster.unsubscribe(updates)
+            disconnected.cancel()
+
+    async def _wait_disconnect(self, receive):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
@@ -1,9 +1,27 @@
 from django.test import TestCase
 import unittest
-from Orderbook.services import OrderBook
+from Orderbook.services import OrderBook, OrderBookManager, FeedDecoder, FeedPipeline, ConsoleRenderer, \
+    parse_snapshot_stream
+from Orderbook.aio import AsyncWebsocketClient
+from Orderbook.depth import FenwickTree
+from Orderbook.checkpoint import BookCheckpointer, StateCapture, decode_state, encode_state, capture_state, \
+    list_checkpoints, sort_levels, warm_start, write_checkpoint
+from Orderbook.feedgen import FeedGenerator
+from Orderbook.history import BookHistory, to_ns
+from Orderbook.journal import FeedJournal, JournalReader
+from Orderbook.ladder import PriceLadder, numpy
+from Orderbook.replay import ReplayOrderBook, book_checksums, read_feed, replay
+from Orderbook.streaming import BookStreamApp
+from Orderbook.sharding import TopOfBookSegment, PublishingOrderBook, SharedTopOfBook
 from sortedcontainers import SortedDict
+from websocket import WebSocketConnectionClosedException
+import asyncio
 import decimal
 import json
+import os
+import tempfile
+import threading
+import time
 
 
 class TestOrderBook(unittest.TestCase):
@@ -62,7 +80,7 @@ class TestOrderBook(unittest.TestCase):
 
         # first open order received, verify 'order_id' is set correctly
         self.assertEqual(
-            one_order.get(decimal.Decimal(message_open1['price']))[0]['order_id'],
+            list(one_order.get(decimal.Decimal(message_open1['price'])))[0].order_id,
             message_open1['order_id'])
 
         # step 2: same price orders are put into the same key,
@@ -275,7 +293,7 @@ class TestOrderBook(unittest.TestCase):
         # test if the order mentioned in message_change1 has been changed accordingly
         new_orderlist_with_this_price = new_sell_orders.get(decimal.Decimal(message_change1['price']))
         self.assertEqual(len(new_orderlist_with_this_price), 2)
-        self.assertEqual(new_orderlist_with_this_price[0]['size'], decimal.Decimal(message_change1['new_size']))
+        self.assertEqual(list(new_orderlist_with_this_price)[0].size, decimal.Decimal(message_change1['new_size']))
 
 
 
@@ -304,9 +322,9 @@ class TestOrderBook(unittest.TestCase):
         found = False
         size_changed = False
         for o in new_orderlist_with_this_price:
-            if o['order_id'] == message_change2['order_id']:
+            if o.order_id == message_change2['order_id']:
                 found = True
-                if o['size'] == decimal.Decimal(message_change2['new_size']):
+                if o.size == decimal.Decimal(message_change2['new_size']):
                     size_changed = True
                 break
         self.assertEqual(found, True)
@@ -387,8 +405,8 @@ class TestOrderBook(unittest.TestCase):
         self.assertEqual(len(new_orderlist_with_this_price), 1)
 
         # test if the unmatched order still exist
-        self.assertEqual(new_orderlist_with_this_price[0]['order_id'], 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
-        self.assertEqual(new_orderlist_with_this_price[0]['size'], decimal.Decimal('20'))
+        self.assertEqual(list(new_orderlist_with_this_price)[0].order_id, 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
+        self.assertEqual(list(new_orderlist_with_this_price)[0].size, decimal.Decimal('20'))
         # self.assertEqual()
 
         message_match2 = {
@@ -411,9 +429,9 @@ class TestOrderBook(unittest.TestCase):
 
         new_orderlist_with_this_price = new_sell_orders.get(decimal.Decimal(message_match2['price']))
         # test if the partial matched order still exist
-        self.assertEqual(new_orderlist_with_this_price[0]['order_id'], 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
+        self.assertEqual(list(new_orderlist_with_this_price)[0].order_id, 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
         # test if the partial matched order's remaining size reduced
-        self.assertEqual(new_orderlist_with_this_price[0]['size'], decimal.Decimal('20')-decimal.Decimal('10.00'))
+        self.assertEqual(list(new_orderlist_with_this_price)[0].size, decimal.Decimal('20')-decimal.Decimal('10.00'))
 
         message_match3 = {
             "maker_order_id": 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb',
@@ -436,13 +454,1217 @@ class TestOrderBook(unittest.TestCase):
 
         new_orderlist_with_this_price = new_sell_orders.get(decimal.Decimal(message_match2['price']))
         # test if existing orders still exist
-        self.assertEqual(new_orderlist_with_this_price[0]['order_id'], 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
+        self.assertEqual(list(new_orderlist_with_this_price)[0].order_id, 'bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbb')
         # test if order's remaining size does not  change
-        self.assertEqual(new_orderlist_with_this_price[0]['size'], decimal.Decimal('20')-decimal.Decimal('10.00'))
+        self.assertEqual(list(new_orderlist_with_this_price)[0].size, decimal.Decimal('20')-decimal.Decimal('10.00'))
         print("test_match_order: pass")
 
 
 
+    def test_done_order_without_price(self):
+        """
+        initial state: 'buy' orders has 2 resting orders at different prices
+        test case:  1. one buy order with 'done' type message received, price is missing
+                    2. one 'modify_order' change moves the other order to a new price
+
+        test goal:  verify the order index finds orders without the price and
+                    follows orders which moved to another price
+        :return:
+        """
+        print("test_done_order_without_price")
+        ob = OrderBook(["BTC-USD"], ["full"])
+        ob.add_order('buy', decimal.Decimal('18599.99'), 'aaa', decimal.Decimal('1'))
+        ob.add_order('buy', decimal.Decimal('18599.98'), 'bbb', decimal.Decimal('2'))
+
+        new_buy_orders = ob.done({"order_id": "aaa", "side": "buy", "reason": "canceled"})
+        self.assertEqual(new_buy_orders.get(decimal.Decimal('18599.99')), None)
+        self.assertNotIn('aaa', ob._order_index)
+
+        ob.change({"type": "change", "reason": "modify_order", "order_id": "bbb", "side": "buy",
+                   "old_size": "2", "new_size": "3", "old_price": "18599.98", "new_price": "18599.97"})
+        self.assertEqual(ob._order_index['bbb'].level.price, decimal.Decimal('18599.97'))
+        ob.done({"order_id": "bbb", "side": "buy", "reason": "filled"})
+        self.assertDictEqual(ob.get_orders('buy'), SortedDict())
+        self.assertDictEqual(ob._order_index, {})
+        print("test_done_order_without_price: pass")
+
+    def test_level_aggregates(self):
+        """
+        test goal:  verify the total size and order count of a price level follow
+                    open, match, change and done, and that update_order_books
+                    reports them
+        :return:
+        """
+        print("test_level_aggregates")
+        ob = OrderBook(["BTC-USD"], ["full"])
+        for i in range(5):
+            ob.add_order('sell', decimal.Decimal('100.0{}'.format(i)), 's{}'.format(i), decimal.Decimal('1.5'))
+            ob.add_order('buy', decimal.Decimal('99.9{}'.format(i)), 'b{}'.format(i), decimal.Decimal('2.5'))
+        ob.open({"order_id": "s5", "side": "sell", "price": "100.00", "remaining_size": "0.25"})
+        level = ob.get_orders('sell')[decimal.Decimal('100.00')]
+        self.assertEqual((level.size, level.count), (decimal.Decimal('1.75'), 2))
+
+        ob.match({"maker_order_id": "s0", "taker_order_id": "t", "trade_id": 1, "side": "sell",
+                  "price": "100.00", "size": "0.5", "time": "2022-09-25T02:41:39.036906Z"})
+        self.assertEqual((level.size, level.count), (decimal.Decimal('1.25'), 2))
+        ob.change({"type": "change", "reason": "STP", "order_id": "s5", "side": "sell",
+                   "old_size": "0.25", "new_size": "0.10", "price": "100.00"})
+        self.assertEqual((level.size, level.count), (decimal.Decimal('1.1'), 2))
+        ob.done({"order_id": "s0", "side": "sell", "price": "100.00", "reason": "canceled"})
+        self.assertEqual((level.size, level.count), (decimal.Decimal('0.1'), 1))
+
+        book = ob.update_order_books()
+        self.assertEqual(book['asks'][0], ['100.00', '0.10'])
+        self.assertEqual(book['bids'][0], ['99.94', '2.5'])
+        print("test_level_aggregates: pass")
+
+    def test_cached_order_book_snapshot(self):
+        """
+        test goal:  verify update_order_books returns the cached snapshot until a
+                    change touches one of the shown levels, while the book version
+                    increases on every change
+        :return:
+        """
+        print("test_cached_order_book_snapshot")
+        ob = OrderBook(["BTC-USD"], ["full"])
+        for i in range(6):
+            ob.add_order('sell', decimal.Decimal('100.0{}'.format(i)), 's{}'.format(i), decimal.Decimal('1'))
+            ob.add_order('buy', decimal.Decimal('99.9{}'.format(i)), 'b{}'.format(i), decimal.Decimal('1'))
+        book = ob.update_order_books()
+        data = ob.get_order_book_json()
+        self.assertEqual(json.loads(data), book)
+        version = ob.get_version()
+
+        # the 6th best ask and the 6th best bid are not shown in the top 5
+        ob.add_order('sell', decimal.Decimal('100.05'), 's6', decimal.Decimal('2'))
+        ob.add_order('buy', decimal.Decimal('99.90'), 'b6', decimal.Decimal('2'))
+        self.assertGreater(ob.get_version(), version)
+        self.assertIs(ob.update_order_books(), book)
+        self.assertIs(ob.get_order_book_json(), data)
+
+        # a change at the best bid rebuilds the snapshot
+        ob.done({"order_id": "b5", "side": "buy", "reason": "canceled"})
+        new_book = ob.update_order_books()
+        self.assertIsNot(new_book, book)
+        self.assertEqual(new_book['bids'][0], ['99.94', '1'])
+        self.assertEqual(json.loads(ob.get_order_book_json()), new_book)
+        print("test_cached_order_book_snapshot: pass")
+
+    def test_fixed_point_matches_decimal(self):
+        """
+        test case:  the same open, match, change and done messages are handled by a
+                    decimal.Decimal book and by a fixed point book
+
+        test goal:  verify prices are integer ticks and sizes integer units in fixed
+                    point mode, and both books show exactly the same top of book
+        :return:
+        """
+        print("test_fixed_point_matches_decimal")
+        messages = []
+        for i in range(6):
+            messages.append({"type": "open", "order_id": "s{}".format(i), "side": "sell",
+                             "price": "19233.6{}".format(i), "remaining_size": "0.7177270{}".format(i)})
+            messages.append({"type": "open", "order_id": "b{}".format(i), "side": "buy",
+                             "price": "19227.6{}".format(i), "remaining_size": "1.{}0000000".format(i)})
+        messages += [
+            {"type": "match", "maker_order_id": "s0", "taker_order_id": "t", "trade_id": 1, "side": "sell",
+             "price": "19233.60", "size": "0.00000001", "time": "2022-09-25T02:41:39.036906Z"},
+            {"type": "change", "reason": "STP", "order_id": "b5", "side": "buy",
+             "old_size": "1.50000000", "new_size": "0.25", "price": "19227.65"},
+            {"type": "change", "reason": "modify_order", "order_id": "b4", "side": "buy",
+             "old_size": "1.40000000", "new_size": "0.12345678", "old_price": "19227.64", "new_price": "19227.7"},
+            {"type": "done", "order_id": "s1", "side": "sell", "reason": "canceled"},
+        ]
+        decimal_book = OrderBook(["BTC-USD"], ["full"])
+        fixed_book = OrderBook(["BTC-USD"], ["full"], fixed_point=True,
+                               quote_increment='0.01', base_increment='0.00000001')
+        for ob in (decimal_book, fixed_book):
+            for message in messages:
+                getattr(ob, message['type'])(message)
+        self.assertIn(1922770, fixed_book.get_orders('buy'))
+        self.assertEqual(fixed_book.get_orders('buy')[1922770].size, 12345678)
+
+        decimal_top = decimal_book.update_order_books()
+        fixed_top = fixed_book.update_order_books()
+        for side in ('asks', 'bids'):
+            self.assertEqual([[decimal.Decimal(p), decimal.Decimal(q)] for p, q in decimal_top[side]],
+                             [[decimal.Decimal(p), decimal.Decimal(q)] for p, q in fixed_top[side]])
+        self.assertEqual(fixed_top['asks'][0], ['19233.60', '0.71772699'])
+        self.assertEqual(fixed_top['bids'][0], ['19227.70', '0.12345678'])
+        # zero and the smallest units are plain decimal strings, never exponent notation
+        codec = fixed_book._codec
+        self.assertEqual([codec.size_str(0), codec.notional_str(0)], ['0', '0'])
+        self.assertEqual([codec.size_str(1), codec.notional_str(1)], ['0.00000001', '0.0000000001'])
+        impact = fixed_book.get_impact('buy', price='1')
+        self.assertEqual([impact['size'], impact['cost']], ['0', '0'])
+
+        with self.assertRaises(ValueError):
+            fixed_book.open({"order_id": "x", "side": "buy", "price": "19227.605", "remaining_size": "1"})
+        print("test_fixed_point_matches_decimal: pass")
+
+    def test_feed_decoder(self):
+        """
+        test goal:  verify message types the book ignores are not parsed but still
+                    sequence checked, and handled types are decoded completely
+        :return:
+        """
+        print("test_feed_decoder")
+        ob = OrderBook(["BTC-USD"], ["full"])
+        received = ob.decoder.decode('{"type":"received","order_id":"d50ec984-77a8-460a-b958-66f114b0de9b",'
+                                     '"order_type":"limit","size":"1.34","price":"502.1","side":"buy",'
+                                     '"product_id":"BTC-USD","sequence":10,"time":"2014-11-07T08:19:27.028459Z"}')
+        self.assertDictEqual(received, {'type': 'received', 'sequence': 10, 'product_id': 'BTC-USD'})
+        ob._sequence_id = 9
+        ob.on_message(received)
+        self.assertEqual(ob._sequence_id, 10)
+
+        done = ob.decoder.decode(b'{"type": "done", "order_id": "aaa", "side": "sell", "sequence": 11}')
+        self.assertDictEqual(done, {'type': 'done', 'order_id': 'aaa', 'side': 'sell', 'sequence': 11})
+        self.assertEqual(FeedDecoder().decode('{"type":"received","sequence":12}')['type'], 'received')
+        with self.assertRaises(ValueError):
+            ob.decoder.decode('{"type": "done", "order_id": "a')
+        print("test_feed_decoder: pass")
+
+    def test_console_renderer(self):
+        """
+        test goal:  verify the renderer only shows the book when the top of book
+                    changed, and with bbo_only only when the best bid/ask changed
+        :return:
+        """
+        print("test_console_renderer")
+        ob = OrderBook(["BTC-USD"], ["full"])
+        for i in range(5):
+            ob.add_order('sell', decimal.Decimal('100.0{}'.format(i)), 's{}'.format(i), decimal.Decimal('1'))
+            ob.add_order('buy', decimal.Decimal('99.9{}'.format(i)), 'b{}'.format(i), decimal.Decimal('1'))
+        renderer = ConsoleRenderer(ob, refresh_rate=10)
+        bbo_renderer = ConsoleRenderer(ob, refresh_rate=10, bbo_only=True)
+        self.assertTrue(renderer.render_once())
+        self.assertTrue(bbo_renderer.render_once())
+        self.assertFalse(renderer.render_once())
+
+        # the 3rd best ask changed, the best bid and the best ask did not
+        ob.resize_order('s2', decimal.Decimal('2'))
+        self.assertTrue(renderer.render_once())
+        self.assertFalse(bbo_renderer.render_once())
+        ob.resize_order('s0', decimal.Decimal('2'))
+        self.assertTrue(bbo_renderer.render_once())
+
+        renderer.start()
+        renderer.stop()
+        renderer.join(1)
+        self.assertFalse(renderer.is_alive())
+        print("test_console_renderer: pass")
+
+    def test_buffered_resync(self):
+        """
+        initial state: the book has one level per side, a new level 3 snapshot
+                    (sequence 100) is slow to download
+        test case:  feed messages 98 to 103 arrive while the snapshot downloads, the
+                    feed reconnects before message 100, and message 104 arrives after
+                    the new book is swapped in
+
+        test goal:  verify the messages are queued while the old book is served as
+                    stale, and only the ones after the snapshot sequence are applied
+                    to the new book, with a single download even when the feed
+                    reconnects meanwhile
+        :return:
+        """
+        print("test_buffered_resync")
+        release = threading.Event()
+        downloads = []
+
+        class SlowSnapshotOrderBook(OrderBook):
+            def get_initial_OrderBook(self):
+                downloads.append(1)
+                release.wait(5)
+                return {'sequence': 100,
+                        'bids': [['99.99', '1.0', 'b1']],
+                        'asks': [['100.01', '1.0', 's1'], ['100.02', '2.0', 's2']]}
+
+        ob = SlowSnapshotOrderBook(["BTC-USD"], ["full"])
+        ob.add_order('sell', decimal.Decimal('200.00'), 'old_s', decimal.Decimal('1'))
+        ob.add_order('buy', decimal.Decimal('10.00'), 'old_b', decimal.Decimal('1'))
+        ob.on_open()
+        for sequence in range(98, 104):
+            if sequence == 100:
+                # a reconnect during the download reuses the running loader
+                ob.on_open()
+            ob.on_message({"type": "open", "sequence": sequence, "order_id": "o{}".format(sequence),
+                           "side": "buy", "price": "99.9{}".format(sequence % 10), "remaining_size": "1"})
+        self.assertEqual([t.name for t in threading.enumerate()].count('snapshot_loader Thread'), 1)
+        # the old book is still served, marked as stale
+        book = ob.update_order_books(count=1)
+        self.assertEqual((book['asks'], book['stale']), ([['200.00', '1']], True))
+        release.set()
+        self.assertTrue(ob._resync_done.wait(5))
+        ob.on_message({"type": "done", "sequence": 104, "order_id": "s1", "side": "sell", "reason": "canceled"})
+
+        self.assertEqual(len(downloads), 1)
+        self.assertEqual(ob._sequence_id, 104)
+        self.assertEqual(sorted(ob._order_index), ['b1', 'o101', 'o102', 'o103', 's2'])
+        book = ob.update_order_books(count=1)
+        self.assertEqual((book['asks'], book['stale']), ([['100.02', '2.0']], False))
+        print("test_buffered_resync: pass")
+
+    def test_resync_backoff(self):
+        """
+        initial state: a book waiting for its first snapshot, the first two snapshots
+                    downloaded are behind the queued feed message
+        test case:  the loader downloads until a snapshot follows on from the queue
+
+        test goal:  verify the loader waits between the downloads, twice as long each time
+        :return:
+        """
+        print("test_resync_backoff")
+        queued = threading.Event()
+        downloads = []
+
+        class LaggingSnapshotOrderBook(OrderBook):
+            RESYNC_RETRY_DELAY = 0.05
+
+            def get_initial_OrderBook(self):
+                queued.wait(5)
+                downloads.append(time.monotonic())
+                return {'sequence': 100 + 2 * len(downloads), 'bids': [['99.99', '1.0', 'b1']], 'asks': []}
+
+        ob = LaggingSnapshotOrderBook(["BTC-USD"], ["full"])
+        ob.on_open()
+        ob.on_message({"type": "open", "sequence": 107, "order_id": "o107", "side": "buy",
+                       "price": "99.98", "remaining_size": "1"})
+        queued.set()
+        self.assertTrue(ob._resync_done.wait(5))
+        self.assertEqual(len(downloads), 3)
+        self.assertEqual(ob._sequence_id, 107)
+        self.assertGreaterEqual(downloads[1] - downloads[0], 0.05)
+        self.assertGreaterEqual(downloads[2] - downloads[1], 0.1)
+        print("test_resync_backoff: pass")
+
+    def test_snapshot_stream_and_bulk_load(self):
+        """
+        test case:  a level 3 snapshot arrives in small chunks which cut keys, numbers and rows
+
+        test goal:  verify parse_snapshot_stream gives the same rows and sequence as
+                    json.loads, and load_snapshot builds the levels and the order index
+        :return:
+        """
+        print("test_snapshot_stream_and_bulk_load")
+        initial_book = {
+            "bids": [["19227.69", "0.05", "b1"], ["19227.69", "0.02417", "b2"], ["19227.11", "0.04969543", "b3"]],
+            "asks": [["19233.62", "0.00488478", "s1"], ["19233.63", "0.71772706", "s2"]],
+            "sequence": 46662478161,
+            "auction_mode": False,
+            "auction": None,
+        }
+        data = json.dumps(initial_book).encode()
+        for chunk_size in (1, 5, 64, len(data)):
+            streamed = parse_snapshot_stream(data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+            self.assertEqual(streamed['sequence'], initial_book['sequence'])
+            for side in ('bids', 'asks'):
+                self.assertEqual([list(row) for row in streamed[side]], initial_book[side])
+        self.assertEqual(parse_snapshot_stream([b'{"bids":[],"asks":[],"sequence":7}']),
+                         {'sequence': 7, 'bids': [], 'asks': []})
+
+        ob = OrderBook(["BTC-USD"], ["full"])
+        ob.load_snapshot(streamed)
+        self.assertEqual(ob._sequence_id, 46662478161)
+        self.assertEqual(sorted(ob._order_index), ['b1', 'b2', 'b3', 's1', 's2'])
+        level = ob.get_orders('buy')[decimal.Decimal('19227.69')]
+        self.assertEqual((level.size, level.count), (decimal.Decimal('0.07417'), 2))
+        self.assertEqual(list(ob.get_orders('buy').keys()),
+                         [decimal.Decimal('19227.11'), decimal.Decimal('19227.69')])
+        print("test_snapshot_stream_and_bulk_load: pass")
+
+    def test_order_book_manager(self):
+        """
+        initial state: BTC-USD and ETH-USD books share one manager, both are at sequence 10
+        test case:  open messages of both products arrive on the same connection,
+                    then ETH-USD has a sequence gap
+
+        test goal:  verify messages are routed by product_id, sequences are tracked per
+                    product and only the product with the gap resyncs
+        :return:
+        """
+        print("test_order_book_manager")
+        resyncs = []
+
+        class RecordingOrderBook(OrderBook):
+            def start_resync(self, buffered=()):
+                resyncs.append(self.get_product_ids()[0])
+                self._resyncing = True
+
+        class RecordingManager(OrderBookManager):
+            book_class = RecordingOrderBook
+
+        manager = RecordingManager(["BTC-USD", "ETH-USD"], ["full"])
+        btc, eth = manager.get_book("BTC-USD"), manager.get_book("ETH-USD")
+        self.assertEqual(list(manager.get_books()), ["BTC-USD", "ETH-USD"])
+        btc._sequence_id = eth._sequence_id = 10
+        manager.on_message({"type": "open", "product_id": "BTC-USD", "sequence": 11, "order_id": "b1",
+                            "side": "buy", "price": "19227.69", "remaining_size": "1"})
+        manager.on_message(manager.decoder.decode('{"type":"received","product_id":"ETH-USD","sequence":11}'))
+        manager.on_message({"type": "open", "product_id": "ETH-USD", "sequence": 12, "order_id": "e1",
+                            "side": "sell", "price": "1333.33", "remaining_size": "2"})
+        manager.on_message({"type": "subscriptions", "channels": []})
+        self.assertEqual((btc._sequence_id, eth._sequence_id), (11, 12))
+        self.assertEqual(list(btc._order_index), ['b1'])
+        self.assertEqual(list(eth._order_index), ['e1'])
+
+        manager.on_message({"type": "done", "product_id": "ETH-USD", "sequence": 20, "order_id": "e1",
+                            "side": "sell", "reason": "canceled"})
+        manager.on_message({"type": "done", "product_id": "BTC-USD", "sequence": 12, "order_id": "b1",
+                            "side": "buy", "reason": "canceled"})
+        self.assertEqual(resyncs, ["ETH-USD"])
+        self.assertEqual(list(btc._order_index), [])
+        print("test_order_book_manager: pass")
+
+    def test_shared_memory_top_of_book(self):
+        """
+        test goal:  verify a PublishingOrderBook writes its top of book into shared memory
+                    when a message changes a published level, and a reader attached to
+                    the segment by name sees the same levels and best bid/ask
+        :return:
+        """
+        print("test_shared_memory_top_of_book")
+        segment = TopOfBookSegment(size=4096, create=True)
+        try:
+            reader = SharedTopOfBook("BTC-USD", TopOfBookSegment(segment.name), count=2)
+            self.assertEqual(json.loads(reader.get_order_book_json(2)), {'asks': [], 'bids': [], 'stale': True})
+
+            ob = PublishingOrderBook(["BTC-USD"], ["full"], 'wss://ws-feed.exchange.coinbase.com', segment, count=2)
+            for i in range(3):
+                ob.add_order('sell', decimal.Decimal('100.0{}'.format(i)), 's{}'.format(i), decimal.Decimal('1'))
+                ob.add_order('buy', decimal.Decimal('99.9{}'.format(i)), 'b{}'.format(i), decimal.Decimal('1'))
+            ob._sequence_id = 10
+            ob.on_message({"type": "done", "sequence": 11, "order_id": "s0", "side": "sell", "reason": "canceled"})
+
+            self.assertEqual(reader.get_order_book_json(2), ob.get_order_book_json(2))
+            self.assertEqual(reader.update_order_books(1)['asks'], [['100.01', '1']])
+            self.assertEqual(reader.get_bbo(), {'sequence': 11, 'bid': ['99.92', '1'], 'ask': ['100.01', '1']})
+        finally:
+            segment.close()
+        print("test_shared_memory_top_of_book: pass")
+
+    def test_async_websocket_client(self):
+        """
+        initial state: a local websocket server stands in for the feed, the book is at sequence 10
+        test case:  the server sends one open message and drops the connection, then
+                    sends an open and a done message on the second connection
+
+        test goal:  verify the async client subscribes, applies the frames in order
+                    through on_message and reconnects after the connection failed
+        :return:
+        """
+        print("test_async_websocket_client")
+        import websockets
+        feeds = [
+            [{"type": "open", "sequence": 11, "order_id": "a", "side": "buy", "price": "100.00", "remaining_size": "1"}],
+            [{"type": "open", "sequence": 12, "order_id": "b", "side": "sell", "price": "101.00", "remaining_size": "2"},
+             {"type": "done", "sequence": 13, "order_id": "a", "side": "buy", "reason": "canceled"}],
+        ]
+
+        class QuietOrderBook(OrderBook):
+            def on_open(self):
+                if not self._sequence_id:
+                    self._sequence_id = 10
+
+        async def feed(ws):
+            subscribe = json.loads(await ws.recv())
+            self.assertEqual(subscribe["product_ids"], ["BTC-USD"])
+            await ws.send(json.dumps({"type": "subscriptions", "channels": []}))
+            messages = feeds.pop(0)
+            for message in messages:
+                await ws.send(json.dumps(message))
+            if feeds:
+                await ws.close(1011)
+            else:
+                await asyncio.sleep(0.5)
+
+        async def run():
+            async with websockets.serve(feed, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                ob = QuietOrderBook(["BTC-USD"], ["full"], 'ws://127.0.0.1:{}'.format(port))
+                client = AsyncWebsocketClient(ob, recv_timeout=5, reconnect_delay=0.01)
+                task = asyncio.ensure_future(client.run())
+                while ob._sequence_id < 13:
+                    await asyncio.sleep(0.01)
+                client.stop()
+                await asyncio.wait_for(task, 5)
+                return ob, client
+
+        ob, client = asyncio.run(run())
+        self.assertEqual(client.connections, 2)
+        self.assertEqual(list(ob._order_index), ['b'])
+        self.assertEqual(list(ob.get_orders('buy')), [])
+        self.assertEqual(list(ob.get_orders('sell')), [decimal.Decimal('101.00')])
+        print("test_async_websocket_client: pass")
+
+    def test_async_client_message_error(self):
+        """
+        initial state: a local websocket server stands in for the feed, the book of an
+                    OrderBookManager is at sequence 10
+        test case:  the second of three open messages makes the handler raise
+
+        test goal:  verify the async client keeps the connection and applies the next
+                    message, and the book resyncs once
+        :return:
+        """
+        print("test_async_client_message_error")
+        import websockets
+        resyncs = []
+
+        class FailingOrderBook(OrderBook):
+            def on_open(self):
+                self._sequence_id = 10
+
+            def open(self, message):
+                if message['order_id'] == 'bad':
+                    raise KeyError(message['order_id'])
+                super().open(message)
+
+            def start_resync(self, buffered=()):
+                resyncs.append(self._sequence_id)
+
+        class FailingManager(OrderBookManager):
+            book_class = FailingOrderBook
+
+        async def feed(ws):
+            await ws.recv()
+            await ws.send(json.dumps({"type": "subscriptions", "channels": []}))
+            for sequence, order_id in ((11, 'a'), (12, 'bad'), (13, 'c')):
+                await ws.send(json.dumps({"type": "open", "product_id": "BTC-USD", "sequence": sequence,
+                                          "order_id": order_id, "side": "buy", "price": "100.00",
+                                          "remaining_size": "1"}))
+            await asyncio.sleep(0.5)
+
+        async def run():
+            async with websockets.serve(feed, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                manager = FailingManager(["BTC-USD"], ["full"], 'ws://127.0.0.1:{}'.format(port))
+                ob = manager.get_book("BTC-USD")
+                client = AsyncWebsocketClient(manager, recv_timeout=5, reconnect_delay=0.01)
+                task = asyncio.ensure_future(client.run())
+                for _ in range(300):
+                    if ob._sequence_id == 13:
+                        break
+                    await asyncio.sleep(0.01)
+                client.stop()
+                await asyncio.wait_for(task, 5)
+                return ob, client
+
+        ob, client = asyncio.run(run())
+        self.assertEqual(client.connections, 1)
+        self.assertEqual(resyncs, [12])
+        self.assertEqual(list(ob._order_index), ['a', 'c'])
+        print("test_async_client_message_error: pass")
+
+    def test_feed_pipeline(self):
+        """
+        initial state: the book is at sequence 10, its apply stage is held up
+        test case:  frames arrive faster than they are applied, first with the 'drop'
+                    policy and a queue of 2 frames, then through listen() with the
+                    'block' policy
+
+        test goal:  verify a full queue drops frames with 'drop', the dropped frames
+                    show up as a sequence gap, the metrics count them, and 'block'
+                    applies every frame in order
+        :return:
+        """
+        print("test_feed_pipeline")
+        resyncs = []
+        release = threading.Event()
+
+        class SlowOrderBook(OrderBook):
+            def on_message(self, message):
+                release.wait()
+                super().on_message(message)
+
+            def start_resync(self, buffered=()):
+                resyncs.append(buffered[0]['sequence'])
+                self._resyncing = True
+
+        def frame(sequence, order_id):
+            return json.dumps({"type": "open", "sequence": sequence, "order_id": order_id, "side": "buy",
+                               "price": "100.00", "remaining_size": "1"})
+
+        ob = SlowOrderBook()
+        ob._sequence_id = 10
+        pipeline = FeedPipeline(ob, queue_size=2, backlog_policy='drop', batch_size=1)
+        pipeline.start()
+        # the apply stage takes the first frame and waits, two more fill the queue
+        pipeline.receive(frame(11, 'a'))
+        while not pipeline.queue.empty():
+            time.sleep(0.001)
+        for sequence in range(12, 16):
+            pipeline.receive(frame(sequence, str(sequence)))
+        release.set()
+        while pipeline.applied < 3:
+            time.sleep(0.001)
+        pipeline.receive(frame(16, '16'))
+        pipeline.stop()
+        self.assertEqual(pipeline.get_metrics(), {'depth': 0, 'high_water_mark': 2, 'queue_size': 2,
+                                                  'backlog_policy': 'drop', 'received': 6, 'applied': 4,
+                                                  'dropped': 2})
+        self.assertEqual(list(ob._order_index), ['a', '12', '13'])
+        self.assertEqual(resyncs, [16])
+
+        class FakeWebsocket:
+            def __init__(self, frames):
+                self.frames = iter(frames)
+
+            def recv(self):
+                data = next(self.frames, None)
+                if data is None:
+                    raise WebSocketConnectionClosedException("closed")
+                return data
+
+        release.clear()
+        threading.Timer(0.05, release.set).start()
+        ob = SlowOrderBook()
+        ob._sequence_id = 10
+        ob.stop_flag = False
+        ob.ws = FakeWebsocket([frame(sequence, str(sequence)) for sequence in range(11, 21)])
+        with self.assertRaises(WebSocketConnectionClosedException):
+            ob.listen(queue_size=3, backlog_policy='block')
+        self.assertEqual(ob._sequence_id, 20)
+        self.assertEqual(ob.get_feed_metrics()['applied'], 10)
+        self.assertEqual(ob.get_feed_metrics()['high_water_mark'], 3)
+        self.assertEqual(resyncs, [16])
+        print("test_feed_pipeline: pass")
+
+    def test_book_stream(self):
+        """
+        initial state: an OrderBook with five bids and five asks, streamed every 10 ms
+        test case:  two clients connect to the stream, the book changes once, then
+                    both clients disconnect; an unknown product is requested
+
+        test goal:  verify both clients get the current book and then the update as
+                    server-sent events, the update is computed once for both, and an
+                    unknown product gets a 404
+        :return:
+        """
+        print("test_book_stream")
+        ob = OrderBook()
+        for i in range(5):
+            ob.add_order('buy', decimal.Decimal('99.00') - i, 'b{}'.format(i), decimal.Decimal('1'))
+            ob.add_order('sell', decimal.Decimal('101.00') + i, 's{}'.format(i), decimal.Decimal('1'))
+        async def django_app(scope, receive, send):
+            raise AssertionError("the stream must not reach django")
+
+        app = BookStreamApp(django_app, {"BTC-USD": ob}.get, interval=0.01)
+
+        async def client(query_string, events, disconnect):
+            sent = []
+
+            async def receive():
+                await disconnect.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                sent.append(message)
+                if message.get('body', b'').startswith(b'data: '):
+                    events.append(json.loads(message['body'][6:]))
+
+            await app({'type': 'http', 'path': '/orderbook/api/stream', 'query_string': query_string},
+                      receive, send)
+            return sent
+
+        async def run():
+            disconnect = asyncio.Event()
+            events = ([], [])
+            clients = asyncio.gather(client(b'', events[0], disconnect),
+                                     client(b'product_id=BTC-USD', events[1], disconnect))
+            while not all(events):
+                await asyncio.sleep(0.005)
+            ob.add_order('buy', decimal.Decimal('100.00'), 'b2', decimal.Decimal('2'))
+            while not all(len(e) == 2 for e in events):
+                await asyncio.sleep(0.005)
+            disconnect.set()
+            await clients
+            missing = await client(b'product_id=DOGE-USD', [], disconnect)
+            return events, missing
+
+        events, missing = asyncio.run(asyncio.wait_for(run(), 5))
+        for client_events in events:
+            self.assertEqual([e['bids'][0] for e in client_events], [['99.00', '1'], ['100.00', '2']])
+        self.assertEqual(app.get_broadcaster("BTC-USD").updates, 2)
+        self.assertEqual(missing[0]['status'], 404)
+        print("test_book_stream: pass")
+
+    def test_get_changes(self):
+        """
+        initial state: a book with a few levels per side, and a client which mirrors it
+                    from get_changes() results
+        test case:  orders are added, resized and removed between the client's requests,
+                    then the change log overflows, then the book is replaced
+
+        test goal:  verify each delta brings the mirror in line with the book, removed
+                    levels have size '0', and a full snapshot is sent when the client is
+                    behind the change log or the book was replaced
+        :return:
+        """
+        print("test_get_changes")
+        class SmallLogOrderBook(OrderBook):
+            CHANGE_LOG_SIZE = 8
+
+        ob = SmallLogOrderBook()
+        for i in range(3):
+            ob.add_order('sell', decimal.Decimal('101') + i, 's{}'.format(i), decimal.Decimal('1'))
+            ob.add_order('buy', decimal.Decimal('99') - i, 'b{}'.format(i), decimal.Decimal('1'))
+        mirror = dict(asks={}, bids={})
+
+        def sync(since):
+            changes = ob.get_changes(since)
+            if changes['snapshot']:
+                mirror['asks'].clear()
+                mirror['bids'].clear()
+            for key in ('asks', 'bids'):
+                for price, size in changes[key]:
+                    if size == '0':
+                        mirror[key].pop(price, None)
+                    else:
+                        mirror[key][price] = size
+            book = ob.get_changes(-1)
+            self.assertTrue(book['snapshot'])
+            self.assertEqual(mirror, {key: dict(book[key]) for key in ('asks', 'bids')})
+            return changes
+
+        changes = sync(0)
+        self.assertFalse(changes['snapshot'])
+        self.assertEqual(changes['version'], 6)
+
+        ob.add_order('buy', decimal.Decimal('99'), 'b3', decimal.Decimal('2'))
+        ob.resize_order('s0', decimal.Decimal('0.5'))
+        ob.remove_order('b2')
+        ob.remove_order('b3')
+        changes = sync(changes['version'])
+        self.assertFalse(changes['snapshot'])
+        self.assertEqual(changes['asks'], [['101', '0.5']])
+        self.assertEqual(changes['bids'], [['99', '1'], ['97', '0']])
+
+        for i in range(9):
+            ob.resize_order('s1', decimal.Decimal(i + 1))
+        changes = sync(changes['version'])
+        self.assertTrue(changes['snapshot'])
+        ob.resize_order('s2', decimal.Decimal('3'))
+        changes = sync(changes['version'])
+        self.assertEqual(changes['asks'], [['103', '3']])
+
+        ob.set_orders('sell', {decimal.Decimal('105'): [{'order_id': 'x', 'size': decimal.Decimal('4')}]})
+        changes = sync(changes['version'])
+        self.assertTrue(changes['snapshot'])
+        self.assertEqual(changes['asks'], [['105', '4']])
+
+        # a removed level has size '0' in both codec modes
+        for book in (OrderBook(), OrderBook(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')):
+            codec = book._codec
+            book.add_order('sell', codec.price('1.00'), 'a', codec.size('1'))
+            book.add_order('sell', codec.price('1.01'), 'b', codec.size('1'))
+            version = book.get_version()
+            book.remove_order('a')
+            self.assertEqual(book.get_changes(version)['asks'], [['1.00', '0']])
+        print("test_get_changes: pass")
+
+    def test_get_levels(self):
+        """
+        initial state: a decimal book and a fixed point book with the same orders,
+                    three ask levels and four bid levels
+        test case:  levels are requested deeper than the book, and bucketed by $1
+
+        test goal:  verify a side with fewer levels than requested does not fail,
+                    bids are bucketed down and asks up, both codecs agree, a result
+                    is cached until the book changes, and a tick which is not a positive
+                    multiple of the price increment is refused
+        :return:
+        """
+        print("test_get_levels")
+        ob = OrderBook()
+        fp = OrderBook(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')
+        orders = [('sell', '100.01', '1'), ('sell', '100.99', '2'), ('sell', '101.00', '3'),
+                  ('buy', '99.99', '1'), ('buy', '99.00', '2'), ('buy', '98.99', '3'), ('buy', '98.50', '4')]
+        for i, (side, price, size) in enumerate(orders):
+            for book in (ob, fp):
+                book.add_order(side, book._codec.price(price), str(i), book._codec.size(size))
+
+        self.assertEqual(ob.update_order_books(5)['asks'], [['100.01', '1'], ['100.99', '2'], ['101.00', '3']])
+        self.assertEqual(ob.get_levels(2), {'asks': [['100.01', '1'], ['100.99', '2']],
+                                            'bids': [['99.99', '1'], ['99.00', '2']], 'stale': False})
+        levels = ob.get_levels(10, '1')
+        self.assertEqual(levels, {'asks': [['101', '6']], 'bids': [['99', '3'], ['98', '7']], 'stale': False})
+        self.assertEqual(fp.get_levels(10, '1'), {'asks': [['101.00', '6.00000000']],
+                                                  'bids': [['99.00', '3.00000000'], ['98.00', '7.00000000']],
+                                                  'stale': False})
+        self.assertEqual(ob.get_levels(1, '1')['bids'], [['99', '3']])
+        self.assertIs(ob.get_levels(10, '1'), levels)
+        ob.remove_order('0')
+        self.assertEqual(ob.get_levels(10, '1')['asks'], [['101', '5']])
+        with self.assertRaises(ValueError):
+            fp.get_levels(5, '0.001')
+        for tick in ('0', '-1', 'NaN', 'sNaN', 'Infinity', 'abc'):
+            self.assertRaises(ValueError, ob.get_levels, 5, tick)
+            self.assertRaises(ValueError, fp.get_levels, 5, tick)
+        # a decimal book given its price increment enforces it too
+        self.assertRaises(ValueError, OrderBook(quote_increment='0.01').get_levels, 5, '0.001')
+        self.assertEqual(OrderBook(quote_increment='0.01').get_levels(5, '0.05')['asks'], [])
+        print("test_get_levels: pass")
+
+    def test_get_impact(self):
+        """
+        initial state: two books with the same asks from 100.00 to 100.29, one of them
+                    indexes 16 ticks next to the best price
+        test case:  fill costs and limit prices within and beyond the window are queried,
+                    then the best ask moves out of the window and back
+
+        test goal:  verify the prefix sums of the Fenwick tree, that the indexed book
+                    answers exactly as the one which walks its levels, and that a size
+                    or price which is not a positive number is refused
+        :return:
+        """
+        print("test_get_impact")
+        tree = FenwickTree([3, 0, 2, 5])
+        self.assertEqual([tree.prefix(i) for i in range(5)], [0, 3, 3, 5, 10])
+        self.assertEqual([tree.search(t) for t in (1, 3, 4, 10, 11)], [0, 0, 2, 3, 4])
+
+        indexed = OrderBook(quote_increment='0.01', depth_window=16)
+        walking = OrderBook()
+        fp = OrderBook(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')
+        for i in range(30):
+            for ob in (indexed, walking):
+                ob.add_order('sell', decimal.Decimal('100.00') + decimal.Decimal(i) / 100, str(i),
+                             decimal.Decimal(i % 3 + 1))
+        queries = [dict(size='1'), dict(size='4.5'), dict(size='40'), dict(size='100'),
+                   dict(price='99.99'), dict(price='100.05'), dict(price='100.25'), dict(price='200')]
+
+        def compare(query):
+            # the same answer, only the indexed book walks fewer levels
+            expected, result = walking.get_impact('buy', **query), indexed.get_impact('buy', **query)
+            self.assertLessEqual(result.pop('walked_levels'), expected.pop('walked_levels'))
+            self.assertEqual(result, expected)
+
+        for query in queries:
+            compare(query)
+        self.assertEqual(walking.get_impact('buy', size='4.5'),
+                         {'side': 'buy', 'size': '4.5', 'cost': '450.050', 'vwap': '100.0111111111111111111111111',
+                          'worst_price': '100.02', 'walked_levels': 3})
+        # within the window the index answers alone, beyond it the rest is walked
+        self.assertEqual(indexed.get_impact('buy', size='4.5')['walked_levels'], 0)
+        self.assertEqual(indexed.get_impact('buy', price='200')['walked_levels'], 16)
+        self.assertEqual(walking.get_impact('buy', price='99.99')['vwap'], None)
+        self.assertEqual(walking.get_impact('sell', size='1')['size'], '0')
+        for query in (dict(size='0'), dict(size='-1'), dict(price='-100'), dict(size='NaN'), dict(size='sNaN'),
+                      dict(price='Infinity'), dict(price='abc')):
+            self.assertRaises(ValueError, walking.get_impact, 'buy', **query)
+            self.assertRaises(ValueError, fp.get_impact, 'buy', **query)
+
+        # the best ask improves beyond the window, then the best levels are gone
+        for ob in (indexed, walking):
+            ob.add_order('sell', decimal.Decimal('99.50'), 'x', decimal.Decimal('1'))
+        for query in queries:
+            compare(query)
+        for i in ['x'] + [str(i) for i in range(20)]:
+            for ob in (indexed, walking):
+                ob.remove_order(i)
+        # the window followed the best ask
+        self.assertLessEqual(indexed._depth['sell'].index(decimal.Decimal('100.20')), 8)
+        for query in queries:
+            compare(query)
+        print("test_get_impact: pass")
+
+    def test_signals(self):
+        """
+        initial state: an empty book with a listener of its signals and a fake clock
+        test case:  orders are added, canceled and matched, at and behind the best prices
+
+        test goal:  verify spread, imbalance and microprice follow the best levels, the
+                    listener is only called when the best bid or ask changed, and the
+                    add/cancel/trade rates count the messages of the rolling window
+        :return:
+        """
+        print("test_signals")
+        ob = OrderBook(signal_window=10)
+        now = [1000.0]
+        ob._signals.clock = lambda: now[0]
+        calls = []
+        ob.add_signal_listener(calls.append)
+        ob._sequence_id = 1
+
+        def message(message_type, **fields):
+            fields.update(type=message_type, sequence=ob._sequence_id + 1)
+            ob.on_message(fields)
+
+        message('open', order_id='b1', side='buy', price='99.00', remaining_size='3')
+        message('open', order_id='s1', side='sell', price='101.00', remaining_size='1')
+        message('open', order_id='s2', side='sell', price='102.00', remaining_size='5')
+        self.assertEqual(len(calls), 2)
+        signals = ob.get_signals()
+        self.assertEqual((signals['bid'], signals['ask'], signals['spread'], signals['mid']), (99.0, 101.0, 2.0, 100.0))
+        self.assertEqual(signals['imbalance'], 0.5)
+        self.assertEqual(signals['microprice'], 100.5)
+        self.assertEqual(signals['add_rate'], 0.3)
+
+        now[0] += 5
+        message('match', maker_order_id='s1', side='sell', price='101.00', size='0.5')
+        self.assertEqual(calls[-1]['ask_size'], 0.5)
+        message('done', order_id='s1', side='sell', reason='canceled')
+        self.assertEqual(calls[-1]['ask'], 102.0)
+        message('done', order_id='s2', side='sell', reason='canceled')
+        self.assertEqual(calls[-1]['ask'], None)
+        self.assertEqual(len(calls), 5)
+        signals = ob.get_signals()
+        self.assertEqual((signals['spread'], signals['imbalance'], signals['microprice']), (None, None, None))
+        self.assertEqual((signals['cancel_rate'], signals['trade_rate'], signals['trade_volume_rate']),
+                         (0.2, 0.1, 0.05))
+        now[0] += 6
+        self.assertEqual((ob.get_signals()['add_rate'], ob.get_signals()['cancel_rate']), (0.0, 0.2))
+        print("test_signals: pass")
+
+    def test_feed_journal(self):
+        """
+        initial state: an empty journal directory with segments of 200 bytes
+        test case:  frames with and without a sequence are appended, the journal is closed,
+                    then the last record is cut short as by a crash
+
+        test goal:  verify the frames are read back in order with their receive time and
+                    sequence across segments, the filters skip older frames, and the cut
+                    record is ignored
+        :return:
+        """
+        print("test_feed_journal")
+        frames = ['{"type":"subscriptions","channels":[]}'] + \
+                 ['{{"type":"received","sequence":{}}}'.format(sequence) for sequence in range(11, 17)]
+        with tempfile.TemporaryDirectory() as directory:
+            journal = FeedJournal(directory, segment_size=200).start()
+            for i, frame in enumerate(frames):
+                journal.append(frame if i % 2 else frame.encode(), received_ns=1000 + i)
+            journal.close()
+            reader = JournalReader(directory)
+            self.assertEqual(len(reader.segments()), 3)
+            records = [(received_ns, sequence, bytes(frame).decode()) for received_ns, sequence, frame in reader]
+            self.assertEqual(records, [(1000 + i, i + 10 if i else 0, frame) for i, frame in enumerate(frames)])
+            self.assertEqual([sequence for _, sequence, _ in reader.read(after_sequence=14)], [15, 16])
+            self.assertEqual([received_ns for received_ns, _, _ in reader.read(since_ns=1005)], [1005, 1006])
+
+            last = reader.segments()[-1]
+            with open(last, 'r+b') as f:
+                f.truncate(os.path.getsize(last) - 3)
+            self.assertEqual([sequence for _, sequence, _ in reader][-1], 15)
+        print("test_feed_journal: pass")
+
+    def test_feed_journal_backlog(self):
+        """
+        initial state: a journal whose queue holds 3 frames, its writer thread not started yet
+        test case:  5 frames are appended, then the writer is started and the journal closed
+
+        test goal:  verify the frames past the bound are dropped and counted, and the metrics
+                    show the backlog before and the written frames after
+        :return:
+        """
+        print("test_feed_journal_backlog")
+        with tempfile.TemporaryDirectory() as directory:
+            journal = FeedJournal(directory, queue_size=3)
+            for sequence in range(1, 6):
+                journal.append('{{"type":"received","sequence":{}}}'.format(sequence), received_ns=1000 + sequence)
+            self.assertEqual(journal.get_metrics(), {'backlog': 3, 'high_water_mark': 3, 'queue_size': 3,
+                                                     'appended': 5, 'written': 0, 'dropped': 2})
+            journal.start().close()
+            self.assertEqual(journal.get_metrics(), {'backlog': 0, 'high_water_mark': 3, 'queue_size': 3,
+                                                     'appended': 5, 'written': 3, 'dropped': 2})
+            self.assertEqual([sequence for _, sequence, _ in JournalReader(directory)], [1, 2, 3])
+        print("test_feed_journal_backlog: pass")
+
+    def test_replay(self):
+        """
+        initial state: a recorded snapshot at sequence 10 and a journal of feed frames,
+                    with old frames, another product and a sequence gap in it
+        test case:  the feed is replayed into a decimal and a fixed point book, the
+                    second one at twice the recorded pace
+
+        test goal:  verify the final books are those the messages describe, the gap is
+                    counted, the report has a latency summary per message type, and both
+                    books have the same checksums
+        :return:
+        """
+        print("test_replay")
+        snapshot = {'sequence': 10,
+                    'bids': [('99.00', '1.5', 'b1'), ('99.00', '2', 'b2')],
+                    'asks': [('101.00', '3', 's1')]}
+        frames = [
+            {"type": "open", "sequence": 9, "order_id": "old", "side": "buy", "price": "1.00", "remaining_size": "1"},
+            {"type": "received", "sequence": 11},
+            {"type": "open", "sequence": 12, "order_id": "s2", "side": "sell", "price": "100.50",
+             "remaining_size": "0.5"},
+            {"type": "open", "sequence": 5, "product_id": "ETH-USD", "order_id": "e1", "side": "buy",
+             "price": "1000.00", "remaining_size": "1"},
+            {"type": "match", "sequence": 13, "maker_order_id": "b1", "side": "buy", "price": "99.00",
+             "size": "0.5"},
+            {"type": "done", "sequence": 20, "order_id": "s1", "side": "sell", "reason": "canceled"},
+            {"type": "change", "sequence": 21, "order_id": "b2", "side": "buy", "price": "99.00",
+             "old_size": "2", "new_size": "1.25", "reason": "STP"},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            journal = FeedJournal(directory).start()
+            for i, frame in enumerate(frames):
+                journal.append(json.dumps(frame), received_ns=1600000000000000000 + i * 2000000)
+            journal.close()
+            decimal_book = ReplayOrderBook(snapshot)
+            report = replay(decimal_book, read_feed(directory))
+            fixed_book = ReplayOrderBook(snapshot, fixed_point=True, quote_increment='0.01',
+                                         base_increment='0.00000001')
+            paced = replay(fixed_book, read_feed(directory), speed=2)
+
+        self.assertEqual(report['messages'], 6)
+        self.assertEqual((report['sequence'], report['gaps']), (21, 1))
+        self.assertEqual(sorted(report['latency']), ['change', 'done', 'match', 'open', 'received'])
+        self.assertEqual(report['latency']['open']['count'], 2)
+        self.assertEqual(decimal_book.get_levels(5), {'asks': [['100.50', '0.5']],
+                                                      'bids': [['99.00', '2.25']], 'stale': False})
+        self.assertEqual(paced['checksum'], report['checksum'])
+        self.assertGreaterEqual(paced['seconds'], 0.005)
+        print("test_replay: pass")
+
+    def test_feedgen(self):
+        """
+        initial state: a synthetic snapshot of 20 levels per side with 3 orders each
+        test case:  5000 generated messages are applied to a decimal and a fixed point book
+
+        test goal:  verify the same seed gives the same feed, every message type is in it,
+                    the sequence has no gap and both books end up as the generator's own book
+        :return:
+        """
+        print("test_feedgen")
+        snapshot = FeedGenerator(seed=7, depth=20, orders_per_level=3).snapshot()
+        self.assertEqual((len(snapshot['bids']), len(snapshot['asks'])), (60, 60))
+        self.assertEqual(snapshot['bids'][0][0], '19229.99')
+        self.assertEqual(snapshot['asks'][0][0], '19230.01')
+        self.assertEqual(list(FeedGenerator(seed=7).frames(50)), list(FeedGenerator(seed=7).frames(50)))
+
+        for options in ({}, dict(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')):
+            generator = FeedGenerator(seed=7, depth=20, orders_per_level=3)
+            book = ReplayOrderBook(generator.snapshot(), **options)
+            book.start_resync()
+            types = set()
+            for message in generator.messages(5000):
+                types.add(message['type'])
+                book.on_message(message)
+            self.assertEqual(types, {'received', 'open', 'done', 'match', 'change'})
+            self.assertEqual((book._sequence_id, book.gaps), (snapshot['sequence'] + 5000, 0))
+            self.assertEqual(book.get_levels(1000), generator.get_levels())
+        print("test_feedgen: pass")
+
+    def test_checkpoint(self):
+        """
+        initial state: a book loaded from a synthetic snapshot, its feed is journaled
+                    while it is applied and a BookCheckpointer writes a checkpoint every 10ms
+        test case:  a new book is warm started from the checkpoints and the journal, in
+                    decimal and fixed point mode; checkpoints of ids which are not uuids
+                    and a damaged checkpoint are decoded
+
+        test goal:  verify the warm started book is the same as the live one, the older
+                    checkpoints are deleted, checkpoints of another product or mode are
+                    not used, and a damaged checkpoint is refused
+        :return:
+        """
+        print("test_checkpoint")
+        fixed_point = dict(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')
+        for options in ({}, fixed_point):
+            with tempfile.TemporaryDirectory() as directory:
+                checkpoints, journal_directory = os.path.join(directory, 'checkpoints'), os.path.join(directory, 'journal')
+                generator = FeedGenerator(seed=3, depth=30, orders_per_level=4)
+                book = ReplayOrderBook(generator.snapshot(), **options)
+                book.start_resync()
+                checkpointer = BookCheckpointer(book, checkpoints, interval=0.01, keep=2).start()
+                journal = FeedJournal(journal_directory).start()
+                for i, frame in enumerate(generator.frames(3000)):
+                    journal.append(frame)
+                    book.on_message(book.decoder.decode(frame))
+                    if i % 500 == 0:
+                        # let the checkpointer take a few checkpoints along the way
+                        time.sleep(0.05)
+                checkpointer.close()
+                journal.close()
+                self.assertGreaterEqual(checkpointer.written, 2)
+                self.assertEqual(len(list_checkpoints(checkpoints, 'BTC-USD')), 2)
+                self.assertIsNone(book.checkpointer)
+
+                restarted = ReplayOrderBook(None, **options)
+                applied = warm_start(restarted, checkpoints, journal_directory)
+                self.assertGreater(applied, 0)
+                self.assertEqual(restarted._sequence_id, book._sequence_id)
+                self.assertEqual(book_checksums(restarted), book_checksums(book))
+                self.assertEqual(restarted.get_levels(100), book.get_levels(100))
+                self.assertIsNone(warm_start(ReplayOrderBook(None, product_ids=['ETH-USD']), checkpoints))
+                # checkpoints of the other mode are not used
+                self.assertIsNone(warm_start(ReplayOrderBook(None, **(fixed_point if not options else {})),
+                                             checkpoints))
+
+        # a copy taken a few levels at a time while messages are applied is the book after the last slice
+        class SmallLogReplayOrderBook(ReplayOrderBook):
+            CHANGE_LOG_SIZE = 4
+
+        for book_class, slice_levels in ((ReplayOrderBook, 5), (ReplayOrderBook, 1000), (SmallLogReplayOrderBook, 5)):
+            generator = FeedGenerator(seed=4, depth=30, orders_per_level=4)
+            book = book_class(generator.snapshot())
+            book.start_resync()
+            messages = generator.messages(1000)
+            capture = StateCapture(book, slice_levels)
+            state = None
+            while state is None and capture.restarts < 3:
+                book.on_message(next(messages))
+                state = capture.step()
+            if book_class is SmallLogReplayOrderBook:
+                # the changes during the copy overflow the change log, the copy keeps starting over
+                self.assertIsNone(state)
+                continue
+            expected = capture_state(book)
+            self.assertEqual((sort_levels(state)['buy'], state['sell'], state['sequence']),
+                             (expected['buy'], expected['sell'], expected['sequence']))
+
+        snapshot = {'sequence': 10,
+                    'bids': [('99.00', '1.5', 'b1'), ('99.00', '2', 'b2')],
+                    'asks': [('101.00', '3', 's1')]}
+        book = ReplayOrderBook(snapshot)
+        book.start_resync()
+        data = encode_state(capture_state(book))
+        state = decode_state(data)
+        self.assertEqual(list(state['buy'][decimal.Decimal('99.00')].orders), ['b1', 'b2'])
+        self.assertEqual(str(state['buy'][decimal.Decimal('99.00')].size), '3.5')
+        self.assertEqual(state['sequence'], 10)
+        self.assertRaises(ValueError, decode_state, data[:-1] + bytes([data[-1] ^ 1]))
+        self.assertRaises(ValueError, decode_state, b'{"sequence": 10}')
+        print("test_checkpoint: pass")
+
+    def test_warm_restart(self):
+        """
+        initial state: a checkpoint of a book, taken before the last messages of its feed
+        test case:  a book is warm started from the checkpoint and the feed connects, its
+                    first message follows on from the checkpoint; then a message is missed
+
+        test goal:  verify the warm started book applies the live feed without downloading
+                    a level 3 snapshot, and only a sequence gap starts a resync
+        :return:
+        """
+        print("test_warm_restart")
+        downloads, resyncs = [], []
+
+        class RestartedOrderBook(OrderBook):
+            def get_initial_OrderBook(self):
+                downloads.append(1)
+
+            def start_resync(self, buffered=()):
+                resyncs.append([message['sequence'] for message in buffered])
+
+        generator = FeedGenerator(seed=5, depth=20, orders_per_level=3)
+        live = ReplayOrderBook(generator.snapshot())
+        live.start_resync()
+        messages = list(generator.messages(600))
+        for message in messages[:300]:
+            live.on_message(message)
+        with tempfile.TemporaryDirectory() as directory:
+            write_checkpoint(directory, capture_state(live))
+            book = RestartedOrderBook(["BTC-USD"], ["full"])
+            self.assertEqual(warm_start(book, directory), 0)
+        book.on_open()
+        for message in messages[300:599]:
+            live.on_message(message)
+            book.on_message(message)
+        self.assertEqual((downloads, resyncs), ([], []))
+        self.assertFalse(book.update_order_books()['stale'])
+        self.assertEqual(book_checksums(book), book_checksums(live))
+        # the last message is missed, the next one starts the resync
+        book.on_message(dict(messages[599], sequence=messages[599]['sequence'] + 1))
+        self.assertEqual((downloads, resyncs), ([], [[messages[599]['sequence'] + 1]]))
+        print("test_warm_restart: pass")
+
+    def test_history(self):
+        """
+        initial state: a journal of 1200 generated frames received 1ms apart in small
+                    segments, and checkpoints of the book before the first frame and
+                    after every 400 frames
+        test case:  the book is queried at times moving forward, then at an earlier time,
+                    then before the first checkpoint
+
+        test goal:  verify the levels are those of the live book at each time, moving forward
+                    only applies the frames in between, going back starts from the latest
+                    checkpoint before the time, and a time without checkpoint is refused
+        :return:
+        """
+        print("test_history")
+        start_ns = to_ns('2022-09-22T14:03:27Z')
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoints, journal_directory = os.path.join(directory, 'checkpoints'), os.path.join(directory, 'journal')
+            generator = FeedGenerator(seed=11, depth=10, orders_per_level=3)
+            book = ReplayOrderBook(generator.snapshot())
+            book.start_resync()
+            state = capture_state(book)
+            state['captured_ns'] = start_ns - 1
+            write_checkpoint(checkpoints, state)
+            journal = FeedJournal(journal_directory, segment_size=20000).start()
+            expected = []
+            for i, frame in enumerate(generator.frames(1200)):
+                received_ns = start_ns + i * 1000000
+                journal.append(frame, received_ns=received_ns)
+                book.on_message(book.decoder.decode(frame))
+                expected.append(dict(book.get_levels(5), sequence=book._sequence_id, time_ns=received_ns))
+                if i % 400 == 399:
+                    state = capture_state(book)
+                    state['captured_ns'] = received_ns
+                    write_checkpoint(checkpoints, state)
+            journal.close()
+
+            history = BookHistory(checkpoints, journal_directory, index_interval=0.05)
+            self.assertGreater(len(history._segments), 3)
+            self.assertEqual(history.sequence_at('2022-09-22T14:03:27.512Z'), expected[500]['sequence'])
+            for i in range(0, 1200, 50):
+                self.assertEqual(history.get_levels(start_ns + i * 1000000, 5), expected[i])
+            self.assertEqual(history.applied, 1151)
+            # the frame at 14:03:27.512 is the 113th after the checkpoint taken at frame 399
+            self.assertEqual(history.get_levels('2022-09-22T14:03:27.512Z', 5), expected[512])
+            self.assertEqual(history.applied, 1151 + 113)
+            self.assertEqual(history.get_book(start_ns - 1)._sequence_id, expected[0]['sequence'] - 1)
+            self.assertRaises(ValueError, history.get_levels, start_ns - 2)
+        print("test_history: pass")
+
+    def test_price_ladder(self):
+        """
+        initial state: a fixed point book on SortedDict sides, and the same book on PriceLadder
+                    sides of a narrow band (most levels in the overflow) and of a wide one
+        test case:  a generated feed moving the best prices around is applied to every book
+
+        test goal:  verify the ladder books give the same levels, buckets, impact, price order
+                    and checksums as the SortedDict one, and keep their arrays consistent
+        :return:
+        """
+        print("test_price_ladder")
+        if numpy is None:
+            self.skipTest("numpy is not installed")
+        options = dict(fixed_point=True, quote_increment='0.01', base_increment='0.00000001')
+        self.assertRaises(ValueError, OrderBook, ["BTC-USD"], ["full"], ladder_width=64)
+        generator = FeedGenerator(seed=2, depth=30, orders_per_level=2)
+        snapshot = generator.snapshot()
+        books = []
+        for width in (0, 8, 4096):
+            book = ReplayOrderBook(snapshot, ladder_width=width, **options)
+            book.start_resync()
+            books.append(book)
+        expected, narrow, wide = books
+        self.assertIsInstance(wide.get_orders('buy'), PriceLadder)
+        for i, message in enumerate(generator.messages(3000)):
+            for book in books:
+                book.on_message(message)
+            if i % 50:
+                continue
+            for book in (narrow, wide):
+                for side in ('buy', 'sell'):
+                    book.get_orders(side).check()
+                    self.assertEqual(list(book.get_orders(side).keys()), list(expected.get_orders(side).keys()))
+                    self.assertEqual(book.get_impact(side, size='0.5'), expected.get_impact(side, size='0.5'))
+                for depth, tick in ((5, None), (100, None), (10, '0.10'), (3, '1')):
+                    self.assertEqual(book.get_levels(depth, tick), expected.get_levels(depth, tick))
+                self.assertEqual(book.update_order_books(10), expected.update_order_books(10))
+        self.assertGreater(len(narrow.get_orders('buy').overflow), 0)
+        self.assertEqual(book_checksums(narrow), book_checksums(expected))
+        self.assertEqual(book_checksums(wide), book_checksums(expected))
+        print("test_price_ladder: pass")
+
     def test_get_orders_side(self):
         print('test_get_orders_side')
         ob = OrderBook(["BTC-USD", "ETC-USD"], ["full"])
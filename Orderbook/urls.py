@@ -4,4 +4,9 @@ from . import views
 
 urlpatterns = [
     path('data', views.index, name='get_data'),
+    path('products', views.products, name='get_products'),
+    path('metrics', views.feed_metrics, name='get_metrics'),
+    path('journal', views.journal_metrics, name='get_journal_metrics'),
+    path('impact', views.impact, name='get_impact'),
+    path('signals', views.signals, name='get_signals'),
 ]
\ No newline at end of file
@@ -4,6 +4,20 @@ from django.http import HttpResponse
 from Orderbook.services import logger
 import config
 
+
+def get_order_book(request):
+    """
+    :param request: its product_id query parameter selects the product, BTC-USD by default
+    :return: the OrderBook of the product, or None if the product is not subscribed
+    """
+    return config.BOOK_MANAGER.get_book(request.GET.get('product_id', 'BTC-USD'))
+
+
+def not_found(request):
+    data = json.dumps({'message': 'product {} is not subscribed'.format(request.GET.get('product_id'))})
+    return HttpResponse(data, content_type='application/json', status=404)
+
+
 def index(request):
     """
     this function is called whenever client visit http://serverip/data/
@@ -12,9 +26,107 @@ def index(request):
     """
     # delay importing this object until the thread of Orderbook.apps.background_task has started
     # to create the object inside it.
+    order_book = get_order_book(request)
+    if order_book is None:
+        return not_found(request)
+
+    since = request.GET.get('since')
+    if since is not None:
+        # delta mode: only the levels changed since the version of the client's last response
+        if not hasattr(order_book, 'get_changes'):
+            data = json.dumps({'message': 'delta mode is not available for this book'})
+            return HttpResponse(data, content_type='application/json', status=400)
+        if not since.isdigit():
+            data = json.dumps({'message': 'since must be the version of a previous response'})
+            return HttpResponse(data, content_type='application/json', status=400)
+        data = json.dumps(order_book.get_changes(int(since)))
+        return HttpResponse(data, content_type='application/json')
+
+    depth, tick = request.GET.get('depth'), request.GET.get('tick')
+    if depth is not None or tick is not None:
+        # e.g. ?depth=50&tick=10 for the best 50 buckets of $10 per side
+        if not hasattr(order_book, 'get_levels'):
+            data = json.dumps({'message': 'depth and tick are not available for this book'})
+            return HttpResponse(data, content_type='application/json', status=400)
+        try:
+            depth = int(depth or 5)
+            if depth < 1:
+                raise ValueError("depth must be positive")
+            data = json.dumps(order_book.get_levels(depth, tick))
+        except (ValueError, ArithmeticError) as e:
+            data = json.dumps({'message': str(e)})
+            return HttpResponse(data, content_type='application/json', status=400)
+        return HttpResponse(data, content_type='application/json')
 
-    data = json.dumps(config.BTC_OrderBook.update_order_books())
-    logger.info(data)
+    # the json bytes are cached by the order book until one of the shown levels changes
+    data = order_book.get_order_book_json()
+    logger.debug(data)
     return HttpResponse(data, content_type='application/json')
     pass
 
+
+def products(request):
+    """
+    this function is called whenever client visit http://serverip/products
+    :return: the list of subscribed product ids
+    """
+    data = json.dumps(list(config.BOOK_MANAGER.get_books()))
+    return HttpResponse(data, content_type='application/json')
+
+
+def feed_metrics(request):
+    """
+    this function is called whenever client visit http://serverip/metrics
+    :return: queue depth, high water mark and frame counters of the feed, null when
+            the feed is applied without a queue
+    """
+    get_feed_metrics = getattr(config.BOOK_MANAGER, 'get_feed_metrics', None)
+    data = json.dumps(get_feed_metrics() if get_feed_metrics else None)
+    return HttpResponse(data, content_type='application/json')
+
+
+def journal_metrics(request):
+    """
+    this function is called whenever client visit http://serverip/journal
+    :return: backlog, high water mark and frame counters of the feed journal, null when
+            the feed is not journaled
+    """
+    journal = getattr(config.BOOK_MANAGER, 'journal', None)
+    data = json.dumps(journal.get_metrics() if journal is not None else None)
+    return HttpResponse(data, content_type='application/json')
+
+
+def impact(request):
+    """
+    this function is called whenever client visit http://serverip/impact
+    e.g. impact?side=buy&size=25 for the cost of buying 25 BTC now, or
+    impact?side=buy&price=19300 for what can be bought up to $19300
+    :return: size, cost, vwap and worst price of the market order
+    """
+    order_book = get_order_book(request)
+    if order_book is None:
+        return not_found(request)
+    side, size, price = request.GET.get('side'), request.GET.get('size'), request.GET.get('price')
+    if side not in ('buy', 'sell') or (size is None) == (price is None) or not hasattr(order_book, 'get_impact'):
+        data = json.dumps({'message': 'side must be buy or sell, with either size or price'})
+        return HttpResponse(data, content_type='application/json', status=400)
+    try:
+        data = json.dumps(order_book.get_impact(side, size=size, price=price))
+    except (ValueError, ArithmeticError):
+        data = json.dumps({'message': 'size and price must be positive numbers of the product increments'})
+        return HttpResponse(data, content_type='application/json', status=400)
+    return HttpResponse(data, content_type='application/json')
+
+
+def signals(request):
+    """
+    this function is called whenever client visit http://serverip/signals
+    :return: best bid/ask, spread, imbalance, microprice and the rolling add/cancel/trade
+            rates of the book, kept up to date by the book itself
+    """
+    order_book = get_order_book(request)
+    if order_book is None:
+        return not_found(request)
+    get_signals = getattr(order_book, 'get_signals', None)
+    data = json.dumps(get_signals() if get_signals else None)
+    return HttpResponse(data, content_type='application/json')
@@ -35,11 +35,33 @@ function httpGet(theUrl)
 function pool(){
     //get book
     book = JSON.parse(httpGet('api/data'))
-    console.log(book)
     root.render(CoinbaseOrderBook(book))
     // console.log(book)
 }
-setInterval(pool, 1000);
+
+// the server pushes the book whenever it changes (api/stream, served by the ASGI app).
+// fall back to polling api/data every second when the stream is not available
+function stream(){
+    let streaming = false
+    const source = new EventSource('api/stream')
+    source.onmessage = (event) => {
+        streaming = true
+        book = JSON.parse(event.data)
+        root.render(CoinbaseOrderBook(book))
+    }
+    source.onerror = () => {
+        if (!streaming) {
+            source.close()
+            setInterval(pool, 1000);
+        }
+    }
+}
+
+if (typeof EventSource !== 'undefined') {
+    stream()
+} else {
+    setInterval(pool, 1000);
+}
 
 const root = ReactDOM.createRoot(
   document.getElementById('root')
@@ -0,0 +1,96 @@
+#######################################
+# warm restart benchmark: time to rebuild the book from a level 3 snapshot
+# (json parse + bulk load, the download not included) versus from a binary
+# checkpoint, and what taking a checkpoint costs the feed thread: the whole
+# copy at once, or the longest slice of a StateCapture
+#
+# usage:
+#   python benchmarks/bench_checkpoint.py                       # synthetic BTC-USD sized book, 100k orders
+#   python benchmarks/bench_checkpoint.py --snapshot book.json  # a recorded level 3 snapshot
+#   python benchmarks/bench_checkpoint.py --fixed-point
+#
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Orderbook.checkpoint import capture_state, encode_state, load_state, read_checkpoint, StateCapture, \
+    write_checkpoint
+from Orderbook.services import OrderBook, parse_snapshot_stream
+from bench_memory import synthetic_snapshot
+from bench_snapshot import best_of, read_chunks
+
+
+def new_book(fixed_point):
+    if fixed_point:
+        return OrderBook(["BTC-USD"], ["full"], fixed_point=True,
+                         quote_increment='0.01', base_increment='0.00000001')
+    return OrderBook(["BTC-USD"], ["full"])
+
+
+def load_from_snapshot(path, fixed_point):
+    book = new_book(fixed_point)
+    book.load_snapshot(parse_snapshot_stream(read_chunks(path)))
+    return book
+
+
+def load_from_checkpoint(path, fixed_point):
+    book = new_book(fixed_point)
+    load_state(book, read_checkpoint(path))
+    return book
+
+
+def sliced_capture(book):
+    """
+    :return: (the longest step of a StateCapture of book, the number of steps)
+    """
+    capture = StateCapture(book)
+    longest, steps, state = 0, 0, None
+    while state is None:
+        start = time.perf_counter()
+        state = capture.step()
+        longest = max(longest, time.perf_counter() - start)
+        steps += 1
+    return longest, steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description='level 3 snapshot versus checkpoint restart benchmark')
+    parser.add_argument('--snapshot', help='path of a recorded level 3 snapshot (json)')
+    parser.add_argument('--fixed-point', action='store_true')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger('Orderbook.services').setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.snapshot
+        if path is None:
+            path = os.path.join(directory, 'book.json')
+            with open(path, 'w') as f:
+                json.dump(synthetic_snapshot(), f)
+        snapshot_time, book = best_of(args.repeat, load_from_snapshot, path, args.fixed_point)
+        capture_time, state = best_of(args.repeat, capture_state, book)
+        slice_time, steps = sliced_capture(book)
+        encode_time, data = best_of(args.repeat, encode_state, state)
+        checkpoint = write_checkpoint(directory, state)
+        checkpoint_time, restored = best_of(args.repeat, load_from_checkpoint, checkpoint, args.fixed_point)
+        snapshot_bytes = os.path.getsize(path)
+    assert restored.update_order_books(50) == book.update_order_books(50)
+
+    n_orders = sum(len(level) for side in ('buy', 'sell') for level in book.get_orders(side).values())
+    print('orders: {}, snapshot: {} bytes, checkpoint: {} bytes'.format(n_orders, snapshot_bytes, len(data)))
+    print('{:<46}{:>12}'.format('step', 'seconds'))
+    print('{:<46}{:>12.3f}'.format('snapshot: parse_snapshot_stream + load', snapshot_time))
+    print('{:<46}{:>12.3f}'.format('checkpoint: read + load', checkpoint_time))
+    print('{:<46}{:>12.3f}'.format('capture_state, the whole book at once', capture_time))
+    print('{:<46}{:>12.3f}'.format('longest of {} StateCapture steps (feed thread)'.format(steps), slice_time))
+    print('{:<46}{:>12.3f}'.format('encode_state (on the checkpoint thread)', encode_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#######################################
+# memory benchmark: bytes per resting order of a full level 3 book, stored
+# as the old per-order dicts in lists versus the OrderBook order records
+#
+# usage:
+#   python benchmarks/bench_memory.py                       # synthetic BTC-USD sized book
+#   python benchmarks/bench_memory.py --snapshot book.json  # a recorded level 3 snapshot
+#
+import argparse
+import decimal
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sortedcontainers import SortedDict
+from Orderbook.services import Order, OrderBook
+
+
+def synthetic_snapshot(orders_per_side=50000, levels_per_side=10000, mid='19230.00', seed=1):
+    """
+    build a level 3 snapshot shaped like the REST response of BTC-USD
+    :return: {'sequence': ..., 'bids': [[price, size, order_id], ...], 'asks': [...]}
+    """
+    rng = random.Random(seed)
+    mid = decimal.Decimal(mid)
+    tick = decimal.Decimal('0.01')
+    snapshot = {'sequence': 1, 'bids': [], 'asks': []}
+    for side, direction in (('bids', -1), ('asks', 1)):
+        rows = snapshot[side]
+        for level in range(levels_per_side):
+            price = str(mid + direction * (level + 1) * tick)
+            for _ in range(orders_per_side // levels_per_side):
+                size = '{:.8f}'.format(rng.uniform(0.0001, 2))
+                rows.append([price, size, str(uuid.UUID(int=rng.getrandbits(128)))])
+    return snapshot
+
+
+def build_dict_book(snapshot):
+    # the representation before OrderBook kept Order records: a list of dicts per price
+    orders = dict(buy=SortedDict(), sell=SortedDict())
+    for side in ('bids', 'asks'):
+        book_of_one_side = orders['buy' if side == 'bids' else 'sell']
+        for o in snapshot[side]:
+            price = decimal.Decimal(o[0])
+            order = {'order_id': o[2], 'size': decimal.Decimal(o[1])}
+            if price in book_of_one_side:
+                book_of_one_side[price].append(order)
+            else:
+                book_of_one_side[price] = [order]
+    return orders
+
+
+def build_order_book(snapshot, fixed_point=False):
+    ob = OrderBook(["BTC-USD"], ["full"], fixed_point=fixed_point,
+                   quote_increment='0.01', base_increment='0.00000001')
+    price, size = ob._codec.price, ob._codec.size
+    for side in ('bids', 'asks'):
+        order_side = 'buy' if side == 'bids' else 'sell'
+        for o in snapshot[side]:
+            ob.add_order(order_side, price(o[0]), o[2], size(o[1]))
+    return ob
+
+
+def build_fixed_point_order_book(snapshot):
+    return build_order_book(snapshot, fixed_point=True)
+
+
+def measure(build, snapshot):
+    """
+    :return: (bytes allocated by build(snapshot) and kept alive, the built object)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(snapshot)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--snapshot', help='path of a recorded level 3 snapshot (json)')
+    parser.add_argument('--orders-per-side', type=int, default=50000)
+    parser.add_argument('--levels-per-side', type=int, default=10000)
+    args = parser.parse_args()
+
+    if args.snapshot:
+        with open(args.snapshot) as f:
+            snapshot = json.load(f)
+    else:
+        snapshot = synthetic_snapshot(args.orders_per_side, args.levels_per_side)
+    n_orders = len(snapshot['bids']) + len(snapshot['asks'])
+
+    dict_bytes, dict_book = measure(build_dict_book, snapshot)
+    del dict_book
+    slots_bytes, order_book = measure(build_order_book, snapshot)
+    del order_book
+    fixed_bytes, order_book = measure(build_fixed_point_order_book, snapshot)
+    del order_book
+
+    print('resting orders: {}'.format(n_orders))
+    print('{:<40}{:>14}{:>18}'.format('representation', 'total bytes', 'bytes per order'))
+    print('{:<40}{:>14}{:>18.1f}'.format('list of dicts per price', dict_bytes, dict_bytes / n_orders))
+    print('{:<40}{:>14}{:>18.1f}'.format('PriceLevel of Order + order index', slots_bytes, slots_bytes / n_orders))
+    print('{:<40}{:>14}{:>18.1f}'.format('same, fixed point sizes', fixed_bytes, fixed_bytes / n_orders))
+    # the record itself, without the shared order_id string and size object
+    print('order record: dict {} bytes, Order {} bytes'.format(
+        sys.getsizeof({'order_id': '', 'size': 0}), sys.getsizeof(Order('', 0))))
+
+
+if __name__ == '__main__':
+    main()
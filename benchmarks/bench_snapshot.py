@@ -0,0 +1,127 @@
+#######################################
+# startup/resync benchmark: time to parse a recorded level 3 snapshot and to
+# build the book from it, per-order open() calls versus the bulk loader
+#
+# usage:
+#   python benchmarks/bench_snapshot.py --record book.json   # save the live BTC-USD level 3 book
+#   python benchmarks/bench_snapshot.py --snapshot book.json # benchmark with a recorded snapshot
+#   python benchmarks/bench_snapshot.py                      # benchmark with a synthetic snapshot
+#
+import argparse
+import decimal
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from Orderbook.services import OrderBook, parse_snapshot_stream
+from bench_memory import synthetic_snapshot
+
+
+def record_snapshot(path, product_id='BTC-USD'):
+    url = 'https://api.exchange.coinbase.com/products/{}/book'.format(product_id)
+    response = requests.get(url, params={'level': 3}, timeout=60)
+    response.raise_for_status()
+    with open(path, 'wb') as f:
+        f.write(response.content)
+
+
+def read_chunks(path, chunk_size=1 << 16):
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def parse_json(path):
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def parse_stream(path):
+    return parse_snapshot_stream(read_chunks(path))
+
+
+def load_per_order(snapshot):
+    # how reset_OrderBook built the book before the bulk loader: one open() per order
+    ob = OrderBook(["BTC-USD"], ["full"])
+    ob._sequence_id = snapshot['sequence']
+    for side in ('bids', 'asks'):
+        for o in snapshot[side]:
+            ob.open({
+                'price': decimal.Decimal(o[0]),
+                'remaining_size': decimal.Decimal(o[1]),
+                'order_id': o[2],
+                'side': 'buy' if side == 'bids' else 'sell'
+            })
+    return ob
+
+
+def load_bulk(snapshot):
+    ob = OrderBook(["BTC-USD"], ["full"])
+    ob.load_snapshot(snapshot)
+    return ob
+
+
+def best_of(repeat, func, *args):
+    """
+    :return: (fastest wall time in seconds, result of the last call)
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='level 3 snapshot parse and load benchmark')
+    parser.add_argument('--snapshot', help='path of a recorded level 3 snapshot (json)')
+    parser.add_argument('--record', help='download the live level 3 book to this path and exit')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.record:
+        record_snapshot(args.record)
+        print('saved {}'.format(args.record))
+        return
+    path = args.snapshot
+    if path is None:
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(synthetic_snapshot(), f)
+
+    logging.getLogger('Orderbook.services').setLevel(logging.WARNING)
+    try:
+        parse_json_time, snapshot = best_of(args.repeat, parse_json, path)
+        parse_stream_time, streamed = best_of(args.repeat, parse_stream, path)
+        per_order_time, per_order_book = best_of(args.repeat, load_per_order, snapshot)
+        bulk_time, bulk_book = best_of(args.repeat, load_bulk, streamed)
+    finally:
+        if args.snapshot is None:
+            os.remove(path)
+    assert per_order_book.update_order_books(50) == bulk_book.update_order_books(50)
+
+    n_orders = len(snapshot['bids']) + len(snapshot['asks'])
+    print('orders: {}, price levels: {}'.format(
+        n_orders, len(bulk_book.get_orders('buy')) + len(bulk_book.get_orders('sell'))))
+    print('{:<42}{:>12}'.format('step', 'seconds'))
+    print('{:<42}{:>12.3f}'.format('json.loads', parse_json_time))
+    print('{:<42}{:>12.3f}'.format('parse_snapshot_stream', parse_stream_time))
+    print('{:<42}{:>12.3f}'.format('per-order open()', per_order_time))
+    print('{:<42}{:>12.3f}'.format('bulk load_snapshot()', bulk_time))
+    print('{:<42}{:>12.3f}'.format('startup before (json.loads + open())', parse_json_time + per_order_time))
+    print('{:<42}{:>12.3f}'.format('startup now (stream + bulk)', parse_stream_time + bulk_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+#######################################
+# throughput benchmark suite of the OrderBook on a synthetic full channel feed
+# (see Orderbook.feedgen): each message handler, update_order_books,
+# reset_OrderBook and the end-to-end decode + on_message path, in decimal and
+# fixed point mode, and with the price ladder. results are written as json,
+# and compared against a saved baseline run to flag regressions
+#
+# usage:
+#   python benchmarks/run_benchmarks.py --output baseline.json         # save a baseline
+#   python benchmarks/run_benchmarks.py --baseline baseline.json       # compare, exit 1 on a regression
+#   python benchmarks/run_benchmarks.py --quick                        # small book and feed, for a smoke run
+#
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Orderbook.feedgen import FeedGenerator
+from Orderbook.replay import ReplayOrderBook
+from Orderbook.services import logger
+
+MODES = {
+    'decimal': {},
+    'fixed': dict(fixed_point=True, quote_increment='0.01', base_increment='0.00000001'),
+    # the dense PriceLadder sides, needs numpy
+    'ladder': dict(fixed_point=True, quote_increment='0.01', base_increment='0.00000001', ladder_width=4096),
+}
+
+
+def make_feed(args):
+    """
+    :return: (snapshot, list of message dicts, list of json frames) of one seeded run
+    """
+    generator = FeedGenerator(seed=args.seed, depth=args.depth, orders_per_level=args.orders_per_level)
+    snapshot = generator.snapshot()
+    messages = list(generator.messages(args.messages))
+    frames = [json.dumps(message).encode() for message in messages]
+    return snapshot, messages, frames
+
+
+def loaded_book(snapshot, options):
+    book = ReplayOrderBook(snapshot, **options)
+    book.start_resync()
+    return book
+
+
+def bench_handlers(snapshot, messages, options):
+    """
+    apply the feed through the handlers, timing every call
+    :return: {message type: ns per call}, the types not changing the book are left out
+    """
+    book = loaded_book(snapshot, options)
+    handlers = dict(open=book.open, done=book.done, match=book.match, change=book.change)
+    clock = time.perf_counter_ns
+    totals = dict.fromkeys(handlers, 0)
+    counts = dict.fromkeys(handlers, 0)
+    for message in messages:
+        handler = handlers.get(message['type'])
+        if handler is None:
+            continue
+        before = clock()
+        handler(message)
+        totals[message['type']] += clock() - before
+        counts[message['type']] += 1
+    return {message_type: totals[message_type] / counts[message_type]
+            for message_type in handlers if counts[message_type]}
+
+
+def bench_update_order_books(snapshot, messages, options, count=50):
+    """
+    :return: ns per update_order_books(count) call after a message changed the top of book,
+            and ns per call served from the cache
+    """
+    book = loaded_book(snapshot, options)
+    calls = min(len(messages), 20000)
+    total = 0
+    clock = time.perf_counter_ns
+    for _ in range(calls):
+        book._top_dirty = True
+        before = clock()
+        book.update_order_books(count)
+        total += clock() - before
+    start = clock()
+    for _ in range(calls):
+        book.update_order_books(count)
+    cached = clock() - start
+    return dict(rebuilt=total / calls, cached=cached / calls)
+
+
+def bench_reset(snapshot, options):
+    """
+    :return: ns per resting order of reset_OrderBook() loading the snapshot
+    """
+    book = ReplayOrderBook(snapshot, **options)
+    start = time.perf_counter_ns()
+    book.reset_OrderBook()
+    elapsed = time.perf_counter_ns() - start
+    return elapsed / (len(snapshot['bids']) + len(snapshot['asks']))
+
+
+def bench_on_message(snapshot, frames, options):
+    """
+    :return: ns per frame of decoding it and passing it to on_message, sequence checks included
+    """
+    book = loaded_book(snapshot, options)
+    decode = book.decoder.decode
+    on_message = book.on_message
+    start = time.perf_counter_ns()
+    for frame in frames:
+        on_message(decode(frame))
+    elapsed = time.perf_counter_ns() - start
+    assert book.gaps == 0
+    return elapsed / len(frames)
+
+
+def run_once(snapshot, messages, frames):
+    """
+    :return: {benchmark name: ns per operation}
+    """
+    results = {}
+    for mode, options in MODES.items():
+        for message_type, value in bench_handlers(snapshot, messages, options).items():
+            results['{}.handler.{}'.format(mode, message_type)] = value
+        for name, value in bench_update_order_books(snapshot, messages, options).items():
+            results['{}.update_order_books.{}'.format(mode, name)] = value
+        results['{}.reset_OrderBook.per_order'.format(mode)] = bench_reset(snapshot, options)
+        results['{}.on_message'.format(mode)] = bench_on_message(snapshot, frames, options)
+    return results
+
+
+def run(args):
+    """
+    :return: the report, a dict in the format of
+        {
+        'meta': {'python': '3.11.4', 'platform': ..., 'seed': 1, 'depth': 1000, ...},
+        'results': {'decimal.handler.open': {'ns_per_op': 2100.5, 'ops_per_second': 476077.0}, ...}
+        }
+        every value is the best of args.repeat runs
+    """
+    snapshot, messages, frames = make_feed(args)
+    best = {}
+    for _ in range(args.repeat):
+        for name, value in run_once(snapshot, messages, frames).items():
+            best[name] = min(value, best.get(name, value))
+    meta = dict(python=platform.python_version(), implementation=platform.python_implementation(),
+                platform=platform.platform(), seed=args.seed, depth=args.depth,
+                orders_per_level=args.orders_per_level, messages=args.messages, repeat=args.repeat,
+                time=time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()))
+    results = {name: dict(ns_per_op=value, ops_per_second=1e9 / value if value else 0.0)
+               for name, value in sorted(best.items())}
+    return dict(meta=meta, results=results)
+
+
+def compare(report, baseline, threshold):
+    """
+    :param threshold: the largest slowdown which is not a regression, e.g. 0.1 for 10%
+    :return: (rows of (name, baseline ns, current ns, change), names of the regressions)
+    """
+    rows = []
+    regressions = []
+    for name, result in report['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            rows.append((name, None, result['ns_per_op'], None))
+            continue
+        change = result['ns_per_op'] / previous['ns_per_op'] - 1
+        rows.append((name, previous['ns_per_op'], result['ns_per_op'], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='OrderBook benchmark suite on a synthetic feed')
+    parser.add_argument('--output', help='write the results to this json file')
+    parser.add_argument('--baseline', help='json results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='slowdown flagged as a regression, 0.10 for 10%% (default)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--depth', type=int, default=1000, help='price levels per side of the snapshot')
+    parser.add_argument('--orders-per-level', type=int, default=5)
+    parser.add_argument('--messages', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--quick', action='store_true', help='depth 100 and 20000 messages, one run')
+    args = parser.parse_args()
+    if args.quick:
+        args.depth, args.messages, args.repeat = 100, 20000, 1
+
+    logger.setLevel(logging.WARNING)
+    report = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+        print('saved {}'.format(args.output))
+
+    if not args.baseline:
+        print('{:<44}{:>14}{:>16}'.format('benchmark', 'ns/op', 'ops/s'))
+        for name, result in report['results'].items():
+            print('{:<44}{:>14.1f}{:>16.0f}'.format(name, result['ns_per_op'], result['ops_per_second']))
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows, regressions = compare(report, baseline, args.threshold)
+    print('{:<44}{:>14}{:>14}{:>10}'.format('benchmark', 'baseline ns', 'now ns', 'change'))
+    for name, previous, current, change in rows:
+        if change is None:
+            print('{:<44}{:>14}{:>14.1f}{:>10}'.format(name, '-', current, 'new'))
+        else:
+            flag = '  REGRESSION' if name in regressions else ''
+            print('{:<44}{:>14.1f}{:>14.1f}{:>+9.1f}%{}'.format(name, previous, current, change * 100, flag))
+    if regressions:
+        print('{} regression(s) over {:.0f}%'.format(len(regressions), args.threshold * 100))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,8 +23,11 @@ class CustomFormatter(logging.Formatter):
             logging.ERROR: self.red + self.fmt + self.reset,
             logging.CRITICAL: self.bold_red + self.fmt + self.reset
         }
+        # build the formatter of every level once, not once per record
+        self.FORMATTERS = {level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()}
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self.FORMATTERS.get(record.levelno)
+        if formatter is None:
+            formatter = logging.Formatter(self.FORMATS.get(record.levelno))
         return formatter.format(record)
@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 """Django's command-line utility for administrative tasks."""
+import asyncio
 import os
 import sys
 import threading
 from Orderbook.services import logger
-from Orderbook.services import OrderBook
+from Orderbook.services import OrderBookManager
+from Orderbook.services import ConsoleRenderer
+from Orderbook.sharding import ShardedBookService
+from Orderbook.aio import AsyncWebsocketClient
+from Orderbook.journal import FeedJournal
+from Orderbook.checkpoint import BookCheckpointer, warm_start
 
 
 def main():
@@ -21,27 +27,68 @@ def main():
     execute_from_command_line(sys.argv)
 
 
-# global BTC_OrderBook
+# global BOOK_MANAGER, one order book per product of ORDERBOOK_PRODUCTS (comma separated)
 import config
-config.BTC_OrderBook = OrderBook(["BTC-USD"], ["full"])
+product_ids = os.environ.get('ORDERBOOK_PRODUCTS', 'BTC-USD').split(',')
+# console refresh rate, see ConsoleRenderer
+refresh_rate = float(os.environ.get('ORDERBOOK_REFRESH_RATE', 1.0))
+# frames received but not applied yet, 0 (the default) to apply them on the receiving thread.
+# ORDERBOOK_BACKLOG_POLICY=drop drops frames instead of waiting when it is full
+queue_size = int(os.environ.get('ORDERBOOK_QUEUE_SIZE', 0))
+backlog_policy = os.environ.get('ORDERBOOK_BACKLOG_POLICY', 'block')
 
+if os.environ.get('ORDERBOOK_MODE') == 'sharded':
+    # one worker process per product, publishing its top of book into shared memory.
+    # they are forked before any other thread of this process starts
+    config.BOOK_MANAGER = ShardedBookService(product_ids, ["full"], refresh_rate=refresh_rate)
+    config.BOOK_MANAGER.start()
+    config.BTC_OrderBook = config.BOOK_MANAGER.get_book(product_ids[0])
+else:
+    # ORDERBOOK_DEPTH_WINDOW ticks next to the best prices are indexed for api/impact, 0 to walk the levels
+    config.BOOK_MANAGER = OrderBookManager(product_ids, ["full"],
+                                           depth_window=int(os.environ.get('ORDERBOOK_DEPTH_WINDOW', 2000)))
+    config.BTC_OrderBook = config.BOOK_MANAGER.get_book(config.BOOK_MANAGER.get_product_ids()[0])
+    # restore the books from their latest checkpoint in ORDERBOOK_CHECKPOINT_DIR and the journal
+    # after it, then write a checkpoint every ORDERBOOK_CHECKPOINT_INTERVAL seconds, see Orderbook/checkpoint.py.
+    # the latest ORDERBOOK_CHECKPOINT_KEEP are kept, how far back Orderbook/history.py can rebuild the book
+    if os.environ.get('ORDERBOOK_CHECKPOINT_DIR'):
+        for book in config.BOOK_MANAGER.get_books().values():
+            warm_start(book, os.environ['ORDERBOOK_CHECKPOINT_DIR'], os.environ.get('ORDERBOOK_JOURNAL_DIR'))
+            BookCheckpointer(book, os.environ['ORDERBOOK_CHECKPOINT_DIR'],
+                             interval=float(os.environ.get('ORDERBOOK_CHECKPOINT_INTERVAL', 60)),
+                             keep=int(os.environ.get('ORDERBOOK_CHECKPOINT_KEEP', 3))).start()
+    # keep every received frame in ORDERBOOK_JOURNAL_DIR, see Orderbook/journal.py
+    if os.environ.get('ORDERBOOK_JOURNAL_DIR'):
+        config.BOOK_MANAGER.journal = FeedJournal(os.environ['ORDERBOOK_JOURNAL_DIR']).start()
 
-def background_task():
-    # coinbase_url = 'wss://ws-feed.exchange.coinbase.com'
-    response = config.BTC_OrderBook.subscribe()
-    logger.info(response)
-    try:
-        config.BTC_OrderBook.listen()
+    def background_task():
+        if os.environ.get('ORDERBOOK_MODE') == 'async':
+            # read the feed from an event loop, reconnecting when it fails
+            asyncio.run(AsyncWebsocketClient(config.BOOK_MANAGER).run())
+            return
+        # coinbase_url = 'wss://ws-feed.exchange.coinbase.com'
+        response = config.BOOK_MANAGER.subscribe()
         logger.info(response)
-    except KeyboardInterrupt:
-        config.BTC_OrderBook.close()
+        try:
+            config.BOOK_MANAGER.listen(queue_size, backlog_policy)
+            logger.info(response)
+        except KeyboardInterrupt:
+            config.BOOK_MANAGER.close()
 
+    # start daemon serve thread that does actual heavy-lifting to construct order_book
+    serve_thread = threading.Thread(name='coinbase_data_collector Thread', target=background_task)
+    serve_thread.setDaemon(True)
+    serve_thread.start()
+    logger.info(serve_thread.getName() + " has started")
 
-# start daemon serve thread that does actual heavy-lifting to construct order_book
-serve_thread = threading.Thread(name='coinbase_data_collector Thread', target=background_task)
-serve_thread.setDaemon(True)
-serve_thread.start()
-logger.info(serve_thread.getName() + " has started")
+    # show the live order book on the console from its own thread, at most
+    # ORDERBOOK_REFRESH_RATE times per second, or only when the best bid/ask
+    # changed if ORDERBOOK_RENDER_BBO_ONLY is set
+    render_thread = ConsoleRenderer(config.BTC_OrderBook,
+                                    refresh_rate=refresh_rate,
+                                    bbo_only=bool(os.environ.get('ORDERBOOK_RENDER_BBO_ONLY')))
+    render_thread.start()
+    logger.info(render_thread.getName() + " has started")
 
 
 django_thread = threading.Thread(name='Django Thread', target=main)
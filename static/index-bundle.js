@@ -1,2 +1,2 @@
 /*! For license information please see index-bundle.js.LICENSE.txt */
-(()=>{var e={302:function(e,n,t){var r;!function(l){"use strict";var a,o=1e6,i="[big.js] ",u=i+"Invalid ",s=u+"decimal places",c=u+"rounding mode",f=i+"Division by zero",d={},p=void 0,h=/^-?(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i;function m(e,n,t,r){var l=e.c,a=e.e+n+1;if(a<l.length){if(1===t)r=l[a]>=5;else if(2===t)r=l[a]>5||5==l[a]&&(r||a<0||l[a+1]!==p||1&l[a-1]);else if(3===t)r=r||!!l[0];else if(r=!1,0!==t)throw Error(c);if(a<1)l.length=1,r?(e.e=-n,l[0]=1):l[0]=e.e=0;else{if(l.length=a--,r)for(;++l[a]>9;)l[a]=0,a--||(++e.e,l.unshift(1));for(a=l.length;!l[--a];)l.pop()}}else if(t<0||t>3||t!==~~t)throw Error(c);return e}function g(e,n,t,r){var l,a,i=e.constructor,c=!e.c[0];if(t!==p){if(t!==~~t||t<(3==n)||t>o)throw Error(3==n?u+"precision":s);for(t=r-(e=new i(e)).e,e.c.length>++r&&m(e,t,i.RM),2==n&&(r=e.e+t+1);e.c.length<r;)e.c.push(0)}if(l=e.e,t=(a=e.c.join("")).length,2!=n&&(1==n||3==n&&r<=l||l<=i.NE||l>=i.PE))a=a.charAt(0)+(t>1?"."+a.slice(1):"")+(l<0?"e":"e+")+l;else if(l<0){for(;++l;)a="0"+a;a="0."+a}else if(l>0)if(++l>t)for(l-=t;l--;)a+="0";else l<t&&(a=a.slice(0,l)+"."+a.slice(l));else t>1&&(a=a.charAt(0)+"."+a.slice(1));return e.s<0&&(!c||4==n)?"-"+a:a}d.abs=function(){var e=new this.constructor(this);return e.s=1,e},d.cmp=function(e){var n,t=this,r=t.c,l=(e=new t.constructor(e)).c,a=t.s,o=e.s,i=t.e,u=e.e;if(!r[0]||!l[0])return r[0]?a:l[0]?-o:0;if(a!=o)return a;if(n=a<0,i!=u)return i>u^n?1:-1;for(o=(i=r.length)<(u=l.length)?i:u,a=-1;++a<o;)if(r[a]!=l[a])return r[a]>l[a]^n?1:-1;return i==u?0:i>u^n?1:-1},d.div=function(e){var n=this,t=n.constructor,r=n.c,l=(e=new t(e)).c,a=n.s==e.s?1:-1,i=t.DP;if(i!==~~i||i<0||i>o)throw Error(s);if(!l[0])throw Error(f);if(!r[0])return new t(0*a);var u,c,d,h,g,v=l.slice(),y=u=l.length,b=r.length,k=r.slice(0,u),w=k.length,S=e,x=S.c=[],E=0,_=i+(S.e=n.e-e.e)+1;for(S.s=a,a=_<0?0:_,v.unshift(0);w++<u;)k.push(0);do{for(d=0;d<10;d++){if(u!=(w=k.length))h=u>w?1:-1;else for(g=-1,h=0;++g<u;)if(l[g]!=k[g]){h=l[g]>k[g]?1:-1;break}if(!(h<0))break;for(c=w==u?l:v;w;){if(k[--w]<c[w]){for(g=w;g&&!k[--g];)k[g]=9;--k[g],k[w]+=10}k[w]-=c[w]}for(;!k[0];)k.shift()}x[E++]=h?d:++d,k[0]&&h?k[w]=r[y]||0:k=[r[y]]}while((y++<b||k[0]!==p)&&a--);return x[0]||1==E||(x.shift(),S.e--),E>_&&m(S,i,t.RM,k[0]!==p),S},d.eq=function(e){return!this.cmp(e)},d.gt=function(e){return this.cmp(e)>0},d.gte=function(e){return this.cmp(e)>-1},d.lt=function(e){return this.cmp(e)<0},d.lte=function(e){return this.cmp(e)<1},d.minus=d.sub=function(e){var n,t,r,l,a=this,o=a.constructor,i=a.s,u=(e=new o(e)).s;if(i!=u)return e.s=-u,a.plus(e);var s=a.c.slice(),c=a.e,f=e.c,d=e.e;if(!s[0]||!f[0])return f[0]?(e.s=-u,e):new o(s[0]?a:0);if(i=c-d){for((l=i<0)?(i=-i,r=s):(d=c,r=f),r.reverse(),u=i;u--;)r.push(0);r.reverse()}else for(t=((l=s.length<f.length)?s:f).length,i=u=0;u<t;u++)if(s[u]!=f[u]){l=s[u]<f[u];break}if(l&&(r=s,s=f,f=r,e.s=-e.s),(u=(t=f.length)-(n=s.length))>0)for(;u--;)s[n++]=0;for(u=n;t>i;){if(s[--t]<f[t]){for(n=t;n&&!s[--n];)s[n]=9;--s[n],s[t]+=10}s[t]-=f[t]}for(;0===s[--u];)s.pop();for(;0===s[0];)s.shift(),--d;return s[0]||(e.s=1,s=[d=0]),e.c=s,e.e=d,e},d.mod=function(e){var n,t=this,r=t.constructor,l=t.s,a=(e=new r(e)).s;if(!e.c[0])throw Error(f);return t.s=e.s=1,n=1==e.cmp(t),t.s=l,e.s=a,n?new r(t):(l=r.DP,a=r.RM,r.DP=r.RM=0,t=t.div(e),r.DP=l,r.RM=a,this.minus(t.times(e)))},d.plus=d.add=function(e){var n,t=this,r=t.constructor,l=t.s,a=(e=new r(e)).s;if(l!=a)return e.s=-a,t.minus(e);var o=t.e,i=t.c,u=e.e,s=e.c;if(!i[0]||!s[0])return s[0]?e:new r(i[0]?t:0*l);if(i=i.slice(),l=o-u){for(l>0?(u=o,n=s):(l=-l,n=i),n.reverse();l--;)n.push(0);n.reverse()}for(i.length-s.length<0&&(n=s,s=i,i=n),l=s.length,a=0;l;i[l]%=10)a=(i[--l]=i[l]+s[l]+a)/10|0;for(a&&(i.unshift(a),++u),l=i.length;0===i[--l];)i.pop();return e.c=i,e.e=u,e},d.pow=function(e){var n=this,t=new n.constructor(1),r=t,l=e<0;if(e!==~~e||e<-1e6||e>1e6)throw Error(u+"exponent");for(l&&(e=-e);1&e&&(r=r.times(n)),e>>=1;)n=n.times(n);return l?t.div(r):r},d.round=function(e,n){var t=this.constructor;if(e===p)e=0;else if(e!==~~e||e<-o||e>o)throw Error(s);return m(new t(this),e,n===p?t.RM:n)},d.sqrt=function(){var e,n,t,r=this,l=r.constructor,a=r.s,o=r.e,u=new l(.5);if(!r.c[0])return new l(r);if(a<0)throw Error(i+"No square root");0===(a=Math.sqrt(r+""))||a===1/0?((n=r.c.join("")).length+o&1||(n+="0"),o=((o+1)/2|0)-(o<0||1&o),e=new l(((a=Math.sqrt(n))==1/0?"1e":(a=a.toExponential()).slice(0,a.indexOf("e")+1))+o)):e=new l(a),o=e.e+(l.DP+=4);do{t=e,e=u.times(t.plus(r.div(t)))}while(t.c.slice(0,o).join("")!==e.c.slice(0,o).join(""));return m(e,l.DP-=4,l.RM)},d.times=d.mul=function(e){var n,t=this,r=t.constructor,l=t.c,a=(e=new r(e)).c,o=l.length,i=a.length,u=t.e,s=e.e;if(e.s=t.s==e.s?1:-1,!l[0]||!a[0])return new r(0*e.s);for(e.e=u+s,o<i&&(n=l,l=a,a=n,s=o,o=i,i=s),n=new Array(s=o+i);s--;)n[s]=0;for(u=i;u--;){for(i=0,s=o+u;s>u;)i=n[s]+a[u]*l[s-u-1]+i,n[s--]=i%10,i=i/10|0;n[s]=(n[s]+i)%10}for(i?++e.e:n.shift(),u=n.length;!n[--u];)n.pop();return e.c=n,e},d.toExponential=function(e){return g(this,1,e,e)},d.toFixed=function(e){return g(this,2,e,this.e+e)},d.toPrecision=function(e){return g(this,3,e,e-1)},d.toString=function(){return g(this)},d.valueOf=d.toJSON=function(){return g(this,4)},(a=function e(){function n(t){var r=this;if(!(r instanceof n))return t===p?e():new n(t);t instanceof n?(r.s=t.s,r.e=t.e,r.c=t.c.slice()):function(e,n){var t,r,l;if(0===n&&1/n<0)n="-0";else if(!h.test(n+=""))throw Error(u+"number");for(e.s="-"==n.charAt(0)?(n=n.slice(1),-1):1,(t=n.indexOf("."))>-1&&(n=n.replace(".","")),(r=n.search(/e/i))>0?(t<0&&(t=r),t+=+n.slice(r+1),n=n.substring(0,r)):t<0&&(t=n.length),l=n.length,r=0;r<l&&"0"==n.charAt(r);)++r;if(r==l)e.c=[e.e=0];else{for(;l>0&&"0"==n.charAt(--l););for(e.e=t-r-1,e.c=[],t=0;r<=l;)e.c[t++]=+n.charAt(r++)}}(r,t),r.constructor=n}return n.prototype=d,n.DP=20,n.RM=1,n.NE=-7,n.PE=21,n.version="5.2.2",n}()).default=a.Big=a,void 0===(r=function(){return a}.call(n,t,n,e))||(e.exports=r)}()},184:(e,n)=>{var t;!function(){"use strict";var r={}.hasOwnProperty;function l(){for(var e=[],n=0;n<arguments.length;n++){var t=arguments[n];if(t){var a=typeof t;if("string"===a||"number"===a)e.push(t);else if(Array.isArray(t)){if(t.length){var o=l.apply(null,t);o&&e.push(o)}}else if("object"===a){if(t.toString!==Object.prototype.toString&&!t.toString.toString().includes("[native code]")){e.push(t.toString());continue}for(var i in t)r.call(t,i)&&t[i]&&e.push(i)}}}return e.join(" ")}e.exports?(l.default=l,e.exports=l):void 0===(t=function(){return l}.apply(n,[]))||(e.exports=t)}()},448:(e,n,t)=>{"use strict";var r=t(294),l=t(840);function a(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o=new Set,i={};function u(e,n){s(e,n),s(e+"Capture",n)}function s(e,n){for(i[e]=n,e=0;e<n.length;e++)o.add(n[e])}var c=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p={},h={};function m(e,n,t,r,l,a,o){this.acceptsBooleans=2===n||3===n||4===n,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=a,this.removeEmptyString=o}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new m(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var n=e[0];g[n]=new m(n,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new m(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new m(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new m(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new m(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new m(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new m(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new m(e,5,!1,e.toLowerCase(),null,!1,!1)}));var v=/[\-:]([a-z])/g;function y(e){return e[1].toUpperCase()}function b(e,n,t,r){var l=g.hasOwnProperty(n)?g[n]:null;(null!==l?0!==l.type:r||!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&(function(e,n,t,r){if(null==n||function(e,n,t,r){if(null!==t&&0===t.type)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==t?!t.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,n,t,r))return!0;if(r)return!1;if(null!==t)switch(t.type){case 3:return!n;case 4:return!1===n;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}(n,t,l,r)&&(t=null),r||null===l?function(e){return!!f.call(h,e)||!f.call(p,e)&&(d.test(e)?h[e]=!0:(p[e]=!0,!1))}(n)&&(null===t?e.removeAttribute(n):e.setAttribute(n,""+t)):l.mustUseProperty?e[l.propertyName]=null===t?3!==l.type&&"":t:(n=l.attributeName,r=l.attributeNamespace,null===t?e.removeAttribute(n):(t=3===(l=l.type)||4===l&&!0===t?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new m("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!0,!0)}));var k=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),S=Symbol.for("react.portal"),x=Symbol.for("react.fragment"),E=Symbol.for("react.strict_mode"),_=Symbol.for("react.profiler"),C=Symbol.for("react.provider"),N=Symbol.for("react.context"),P=Symbol.for("react.forward_ref"),z=Symbol.for("react.suspense"),T=Symbol.for("react.suspense_list"),L=Symbol.for("react.memo"),M=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var R=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var O=Symbol.iterator;function I(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=O&&e[O]||e["@@iterator"])?e:null}var F,D=Object.assign;function U(e){if(void 0===F)try{throw Error()}catch(e){var n=e.stack.trim().match(/\n( *(at )?)/);F=n&&n[1]||""}return"\n"+F+e}var A=!1;function j(e,n){if(!e||A)return"";A=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(e){var r=e}Reflect.construct(e,[],n)}else{try{n.call()}catch(e){r=e}e.call(n.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(n){if(n&&r&&"string"==typeof n.stack){for(var l=n.stack.split("\n"),a=r.stack.split("\n"),o=l.length-1,i=a.length-1;1<=o&&0<=i&&l[o]!==a[i];)i--;for(;1<=o&&0<=i;o--,i--)if(l[o]!==a[i]){if(1!==o||1!==i)do{if(o--,0>--i||l[o]!==a[i]){var u="\n"+l[o].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=o&&0<=i);break}}}finally{A=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?U(e):""}function V(e){switch(e.tag){case 5:return U(e.type);case 16:return U("Lazy");case 13:return U("Suspense");case 19:return U("SuspenseList");case 0:case 2:case 15:return j(e.type,!1);case 11:return j(e.type.render,!1);case 1:return j(e.type,!0);default:return""}}function B(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case x:return"Fragment";case S:return"Portal";case _:return"Profiler";case E:return"StrictMode";case z:return"Suspense";case T:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case N:return(e.displayName||"Context")+".Consumer";case C:return(e._context.displayName||"Context")+".Provider";case P:var n=e.render;return(e=e.displayName)||(e=""!==(e=n.displayName||n.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case L:return null!==(n=e.displayName||null)?n:B(e.type)||"Memo";case M:n=e._payload,e=e._init;try{return B(e(n))}catch(e){}}return null}function $(e){var n=e.type;switch(e.tag){case 24:return"Cache";case 9:return(n.displayName||"Context")+".Consumer";case 10:return(n._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=n.render).displayName||e.name||"",n.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return n;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return B(n);case 8:return n===E?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof n)return n.displayName||n.name||null;if("string"==typeof n)return n}return null}function H(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function W(e){var n=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===n||"radio"===n)}function Q(e){e._valueTracker||(e._valueTracker=function(e){var n=W(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&void 0!==t&&"function"==typeof t.get&&"function"==typeof t.set){var l=t.get,a=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return l.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}(e))}function q(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=W(e)?e.checked?"true":"false":e.value),(e=r)!==t&&(n.setValue(e),!0)}function K(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(n){return e.body}}function Y(e,n){var t=n.checked;return D({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=t?t:e._wrapperState.initialChecked})}function X(e,n){var t=null==n.defaultValue?"":n.defaultValue,r=null!=n.checked?n.checked:n.defaultChecked;t=H(null!=n.value?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:"checkbox"===n.type||"radio"===n.type?null!=n.checked:null!=n.value}}function G(e,n){null!=(n=n.checked)&&b(e,"checked",n,!1)}function J(e,n){G(e,n);var t=H(n.value),r=n.type;if(null!=t)"number"===r?(0===t&&""===e.value||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");n.hasOwnProperty("value")?ee(e,n.type,t):n.hasOwnProperty("defaultValue")&&ee(e,n.type,H(n.defaultValue)),null==n.checked&&null!=n.defaultChecked&&(e.defaultChecked=!!n.defaultChecked)}function Z(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!("submit"!==r&&"reset"!==r||void 0!==n.value&&null!==n.value))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}""!==(t=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==t&&(e.name=t)}function ee(e,n,t){"number"===n&&K(e.ownerDocument)===e||(null==t?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}var ne=Array.isArray;function te(e,n,t,r){if(e=e.options,n){n={};for(var l=0;l<t.length;l++)n["$"+t[l]]=!0;for(t=0;t<e.length;t++)l=n.hasOwnProperty("$"+e[t].value),e[t].selected!==l&&(e[t].selected=l),l&&r&&(e[t].defaultSelected=!0)}else{for(t=""+H(t),n=null,l=0;l<e.length;l++){if(e[l].value===t)return e[l].selected=!0,void(r&&(e[l].defaultSelected=!0));null!==n||e[l].disabled||(n=e[l])}null!==n&&(n.selected=!0)}}function re(e,n){if(null!=n.dangerouslySetInnerHTML)throw Error(a(91));return D({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function le(e,n){var t=n.value;if(null==t){if(t=n.children,n=n.defaultValue,null!=t){if(null!=n)throw Error(a(92));if(ne(t)){if(1<t.length)throw Error(a(93));t=t[0]}n=t}null==n&&(n=""),t=n}e._wrapperState={initialValue:H(t)}}function ae(e,n){var t=H(n.value),r=H(n.defaultValue);null!=t&&((t=""+t)!==e.value&&(e.value=t),null==n.defaultValue&&e.defaultValue!==t&&(e.defaultValue=t)),null!=r&&(e.defaultValue=""+r)}function oe(e){var n=e.textContent;n===e._wrapperState.initialValue&&""!==n&&null!==n&&(e.value=n)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ue(e,n){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(n):"http://www.w3.org/2000/svg"===e&&"foreignObject"===n?"http://www.w3.org/1999/xhtml":e}var se,ce,fe=(ce=function(e,n){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=n;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,n,t,r){MSApp.execUnsafeLocalFunction((function(){return ce(e,n)}))}:ce);function de(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&3===t.nodeType)return void(t.nodeValue=n)}e.textContent=n}var pe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},he=["Webkit","ms","Moz","O"];function me(e,n,t){return null==n||"boolean"==typeof n||""===n?"":t||"number"!=typeof n||0===n||pe.hasOwnProperty(e)&&pe[e]?(""+n).trim():n+"px"}function ge(e,n){for(var t in e=e.style,n)if(n.hasOwnProperty(t)){var r=0===t.indexOf("--"),l=me(t,n[t],r);"float"===t&&(t="cssFloat"),r?e.setProperty(t,l):e[t]=l}}Object.keys(pe).forEach((function(e){he.forEach((function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),pe[n]=pe[e]}))}));var ve=D({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ye(e,n){if(n){if(ve[e]&&(null!=n.children||null!=n.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=n.dangerouslySetInnerHTML){if(null!=n.children)throw Error(a(60));if("object"!=typeof n.dangerouslySetInnerHTML||!("__html"in n.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=n.style&&"object"!=typeof n.style)throw Error(a(62))}}function be(e,n){if(-1===e.indexOf("-"))return"string"==typeof n.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ke=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,xe=null,Ee=null;function _e(e){if(e=bl(e)){if("function"!=typeof Se)throw Error(a(280));var n=e.stateNode;n&&(n=wl(n),Se(e.stateNode,e.type,n))}}function Ce(e){xe?Ee?Ee.push(e):Ee=[e]:xe=e}function Ne(){if(xe){var e=xe,n=Ee;if(Ee=xe=null,_e(e),n)for(e=0;e<n.length;e++)_e(n[e])}}function Pe(e,n){return e(n)}function ze(){}var Te=!1;function Le(e,n,t){if(Te)return e(n,t);Te=!0;try{return Pe(e,n,t)}finally{Te=!1,(null!==xe||null!==Ee)&&(ze(),Ne())}}function Me(e,n){var t=e.stateNode;if(null===t)return null;var r=wl(t);if(null===r)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(t&&"function"!=typeof t)throw Error(a(231,n,typeof t));return t}var Re=!1;if(c)try{var Oe={};Object.defineProperty(Oe,"passive",{get:function(){Re=!0}}),window.addEventListener("test",Oe,Oe),window.removeEventListener("test",Oe,Oe)}catch(ce){Re=!1}function Ie(e,n,t,r,l,a,o,i,u){var s=Array.prototype.slice.call(arguments,3);try{n.apply(t,s)}catch(e){this.onError(e)}}var Fe=!1,De=null,Ue=!1,Ae=null,je={onError:function(e){Fe=!0,De=e}};function Ve(e,n,t,r,l,a,o,i,u){Fe=!1,De=null,Ie.apply(je,arguments)}function Be(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do{0!=(4098&(n=e).flags)&&(t=n.return),e=n.return}while(e)}return 3===n.tag?t:null}function $e(e){if(13===e.tag){var n=e.memoizedState;if(null===n&&null!==(e=e.alternate)&&(n=e.memoizedState),null!==n)return n.dehydrated}return null}function He(e){if(Be(e)!==e)throw Error(a(188))}function We(e){return null!==(e=function(e){var n=e.alternate;if(!n){if(null===(n=Be(e)))throw Error(a(188));return n!==e?null:e}for(var t=e,r=n;;){var l=t.return;if(null===l)break;var o=l.alternate;if(null===o){if(null!==(r=l.return)){t=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===t)return He(l),e;if(o===r)return He(l),n;o=o.sibling}throw Error(a(188))}if(t.return!==r.return)t=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===t){i=!0,t=l,r=o;break}if(u===r){i=!0,r=l,t=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===t){i=!0,t=o,r=l;break}if(u===r){i=!0,r=o,t=l;break}u=u.sibling}if(!i)throw Error(a(189))}}if(t.alternate!==r)throw Error(a(190))}if(3!==t.tag)throw Error(a(188));return t.stateNode.current===t?e:n}(e))?Qe(e):null}function Qe(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var n=Qe(e);if(null!==n)return n;e=e.sibling}return null}var qe=l.unstable_scheduleCallback,Ke=l.unstable_cancelCallback,Ye=l.unstable_shouldYield,Xe=l.unstable_requestPaint,Ge=l.unstable_now,Je=l.unstable_getCurrentPriorityLevel,Ze=l.unstable_ImmediatePriority,en=l.unstable_UserBlockingPriority,nn=l.unstable_NormalPriority,tn=l.unstable_LowPriority,rn=l.unstable_IdlePriority,ln=null,an=null,on=Math.clz32?Math.clz32:function(e){return 0==(e>>>=0)?32:31-(un(e)/sn|0)|0},un=Math.log,sn=Math.LN2,cn=64,fn=4194304;function dn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function pn(e,n){var t=e.pendingLanes;if(0===t)return 0;var r=0,l=e.suspendedLanes,a=e.pingedLanes,o=268435455&t;if(0!==o){var i=o&~l;0!==i?r=dn(i):0!=(a&=o)&&(r=dn(a))}else 0!=(o=t&~l)?r=dn(o):0!==a&&(r=dn(a));if(0===r)return 0;if(0!==n&&n!==r&&0==(n&l)&&((l=r&-r)>=(a=n&-n)||16===l&&0!=(4194240&a)))return n;if(0!=(4&r)&&(r|=16&t),0!==(n=e.entangledLanes))for(e=e.entanglements,n&=r;0<n;)l=1<<(t=31-on(n)),r|=e[t],n&=~l;return r}function hn(e,n){switch(e){case 1:case 2:case 4:return n+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n+5e3;default:return-1}}function mn(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function gn(){var e=cn;return 0==(4194240&(cn<<=1))&&(cn=64),e}function vn(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function yn(e,n,t){e.pendingLanes|=n,536870912!==n&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[n=31-on(n)]=t}function bn(e,n){var t=e.entangledLanes|=n;for(e=e.entanglements;t;){var r=31-on(t),l=1<<r;l&n|e[r]&n&&(e[r]|=n),t&=~l}}var kn=0;function wn(e){return 1<(e&=-e)?4<e?0!=(268435455&e)?16:536870912:4:1}var Sn,xn,En,_n,Cn,Nn=!1,Pn=[],zn=null,Tn=null,Ln=null,Mn=new Map,Rn=new Map,On=[],In="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Fn(e,n){switch(e){case"focusin":case"focusout":zn=null;break;case"dragenter":case"dragleave":Tn=null;break;case"mouseover":case"mouseout":Ln=null;break;case"pointerover":case"pointerout":Mn.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":Rn.delete(n.pointerId)}}function Dn(e,n,t,r,l,a){return null===e||e.nativeEvent!==a?(e={blockedOn:n,domEventName:t,eventSystemFlags:r,nativeEvent:a,targetContainers:[l]},null!==n&&null!==(n=bl(n))&&xn(n),e):(e.eventSystemFlags|=r,n=e.targetContainers,null!==l&&-1===n.indexOf(l)&&n.push(l),e)}function Un(e){var n=yl(e.target);if(null!==n){var t=Be(n);if(null!==t)if(13===(n=t.tag)){if(null!==(n=$e(t)))return e.blockedOn=n,void Cn(e.priority,(function(){En(t)}))}else if(3===n&&t.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===t.tag?t.stateNode.containerInfo:null)}e.blockedOn=null}function An(e){if(null!==e.blockedOn)return!1;for(var n=e.targetContainers;0<n.length;){var t=Xn(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t)return null!==(n=bl(t))&&xn(n),e.blockedOn=t,!1;var r=new(t=e.nativeEvent).constructor(t.type,t);ke=r,t.target.dispatchEvent(r),ke=null,n.shift()}return!0}function jn(e,n,t){An(e)&&t.delete(n)}function Vn(){Nn=!1,null!==zn&&An(zn)&&(zn=null),null!==Tn&&An(Tn)&&(Tn=null),null!==Ln&&An(Ln)&&(Ln=null),Mn.forEach(jn),Rn.forEach(jn)}function Bn(e,n){e.blockedOn===n&&(e.blockedOn=null,Nn||(Nn=!0,l.unstable_scheduleCallback(l.unstable_NormalPriority,Vn)))}function $n(e){function n(n){return Bn(n,e)}if(0<Pn.length){Bn(Pn[0],e);for(var t=1;t<Pn.length;t++){var r=Pn[t];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==zn&&Bn(zn,e),null!==Tn&&Bn(Tn,e),null!==Ln&&Bn(Ln,e),Mn.forEach(n),Rn.forEach(n),t=0;t<On.length;t++)(r=On[t]).blockedOn===e&&(r.blockedOn=null);for(;0<On.length&&null===(t=On[0]).blockedOn;)Un(t),null===t.blockedOn&&On.shift()}var Hn=k.ReactCurrentBatchConfig,Wn=!0;function Qn(e,n,t,r){var l=kn,a=Hn.transition;Hn.transition=null;try{kn=1,Kn(e,n,t,r)}finally{kn=l,Hn.transition=a}}function qn(e,n,t,r){var l=kn,a=Hn.transition;Hn.transition=null;try{kn=4,Kn(e,n,t,r)}finally{kn=l,Hn.transition=a}}function Kn(e,n,t,r){if(Wn){var l=Xn(e,n,t,r);if(null===l)Hr(e,n,r,Yn,t),Fn(e,r);else if(function(e,n,t,r,l){switch(n){case"focusin":return zn=Dn(zn,e,n,t,r,l),!0;case"dragenter":return Tn=Dn(Tn,e,n,t,r,l),!0;case"mouseover":return Ln=Dn(Ln,e,n,t,r,l),!0;case"pointerover":var a=l.pointerId;return Mn.set(a,Dn(Mn.get(a)||null,e,n,t,r,l)),!0;case"gotpointercapture":return a=l.pointerId,Rn.set(a,Dn(Rn.get(a)||null,e,n,t,r,l)),!0}return!1}(l,e,n,t,r))r.stopPropagation();else if(Fn(e,r),4&n&&-1<In.indexOf(e)){for(;null!==l;){var a=bl(l);if(null!==a&&Sn(a),null===(a=Xn(e,n,t,r))&&Hr(e,n,r,Yn,t),a===l)break;l=a}null!==l&&r.stopPropagation()}else Hr(e,n,r,null,t)}}var Yn=null;function Xn(e,n,t,r){if(Yn=null,null!==(e=yl(e=we(r))))if(null===(n=Be(e)))e=null;else if(13===(t=n.tag)){if(null!==(e=$e(n)))return e;e=null}else if(3===t){if(n.stateNode.current.memoizedState.isDehydrated)return 3===n.tag?n.stateNode.containerInfo:null;e=null}else n!==e&&(e=null);return Yn=e,null}function Gn(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Je()){case Ze:return 1;case en:return 4;case nn:case tn:return 16;case rn:return 536870912;default:return 16}default:return 16}}var Jn=null,Zn=null,et=null;function nt(){if(et)return et;var e,n,t=Zn,r=t.length,l="value"in Jn?Jn.value:Jn.textContent,a=l.length;for(e=0;e<r&&t[e]===l[e];e++);var o=r-e;for(n=1;n<=o&&t[r-n]===l[a-n];n++);return et=l.slice(e,1<n?1-n:void 0)}function tt(e){var n=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===n&&(e=13):e=n,10===e&&(e=13),32<=e||13===e?e:0}function rt(){return!0}function lt(){return!1}function at(e){function n(n,t,r,l,a){for(var o in this._reactName=n,this._targetInst=r,this.type=t,this.nativeEvent=l,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(o)&&(n=e[o],this[o]=n?n(l):l[o]);return this.isDefaultPrevented=(null!=l.defaultPrevented?l.defaultPrevented:!1===l.returnValue)?rt:lt,this.isPropagationStopped=lt,this}return D(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=rt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=rt)},persist:function(){},isPersistent:rt}),n}var ot,it,ut,st={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ct=at(st),ft=D({},st,{view:0,detail:0}),dt=at(ft),pt=D({},ft,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:_t,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ut&&(ut&&"mousemove"===e.type?(ot=e.screenX-ut.screenX,it=e.screenY-ut.screenY):it=ot=0,ut=e),ot)},movementY:function(e){return"movementY"in e?e.movementY:it}}),ht=at(pt),mt=at(D({},pt,{dataTransfer:0})),gt=at(D({},ft,{relatedTarget:0})),vt=at(D({},st,{animationName:0,elapsedTime:0,pseudoElement:0})),yt=D({},st,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bt=at(yt),kt=at(D({},st,{data:0})),wt={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},St={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},xt={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Et(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):!!(e=xt[e])&&!!n[e]}function _t(){return Et}var Ct=D({},ft,{key:function(e){if(e.key){var n=wt[e.key]||e.key;if("Unidentified"!==n)return n}return"keypress"===e.type?13===(e=tt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?St[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:_t,charCode:function(e){return"keypress"===e.type?tt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Nt=at(Ct),Pt=at(D({},pt,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),zt=at(D({},ft,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:_t})),Tt=at(D({},st,{propertyName:0,elapsedTime:0,pseudoElement:0})),Lt=D({},pt,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Mt=at(Lt),Rt=[9,13,27,32],Ot=c&&"CompositionEvent"in window,It=null;c&&"documentMode"in document&&(It=document.documentMode);var Ft=c&&"TextEvent"in window&&!It,Dt=c&&(!Ot||It&&8<It&&11>=It),Ut=String.fromCharCode(32),At=!1;function jt(e,n){switch(e){case"keyup":return-1!==Rt.indexOf(n.keyCode);case"keydown":return 229!==n.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vt(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Bt=!1,$t={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ht(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===n?!!$t[e.type]:"textarea"===n}function Wt(e,n,t,r){Ce(r),0<(n=Qr(n,"onChange")).length&&(t=new ct("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Qt=null,qt=null;function Kt(e){Ur(e,0)}function Yt(e){if(q(kl(e)))return e}function Xt(e,n){if("change"===e)return n}var Gt=!1;if(c){var Jt;if(c){var Zt="oninput"in document;if(!Zt){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zt="function"==typeof er.oninput}Jt=Zt}else Jt=!1;Gt=Jt&&(!document.documentMode||9<document.documentMode)}function nr(){Qt&&(Qt.detachEvent("onpropertychange",tr),qt=Qt=null)}function tr(e){if("value"===e.propertyName&&Yt(qt)){var n=[];Wt(n,qt,e,we(e)),Le(Kt,n)}}function rr(e,n,t){"focusin"===e?(nr(),qt=t,(Qt=n).attachEvent("onpropertychange",tr)):"focusout"===e&&nr()}function lr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yt(qt)}function ar(e,n){if("click"===e)return Yt(n)}function or(e,n){if("input"===e||"change"===e)return Yt(n)}var ir="function"==typeof Object.is?Object.is:function(e,n){return e===n&&(0!==e||1/e==1/n)||e!=e&&n!=n};function ur(e,n){if(ir(e,n))return!0;if("object"!=typeof e||null===e||"object"!=typeof n||null===n)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++){var l=t[r];if(!f.call(n,l)||!ir(e[l],n[l]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,n){var t,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(t=e+r.textContent.length,e<=n&&t>=n)return{node:r,offset:n-e};e=t}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function fr(e,n){return!(!e||!n)&&(e===n||(!e||3!==e.nodeType)&&(n&&3===n.nodeType?fr(e,n.parentNode):"contains"in e?e.contains(n):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(n))))}function dr(){for(var e=window,n=K();n instanceof e.HTMLIFrameElement;){try{var t="string"==typeof n.contentWindow.location.href}catch(e){t=!1}if(!t)break;n=K((e=n.contentWindow).document)}return n}function pr(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&("input"===n&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===n||"true"===e.contentEditable)}function hr(e){var n=dr(),t=e.focusedElem,r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&fr(t.ownerDocument.documentElement,t)){if(null!==r&&pr(t))if(n=r.start,void 0===(e=r.end)&&(e=n),"selectionStart"in t)t.selectionStart=n,t.selectionEnd=Math.min(e,t.value.length);else if((e=(n=t.ownerDocument||document)&&n.defaultView||window).getSelection){e=e.getSelection();var l=t.textContent.length,a=Math.min(r.start,l);r=void 0===r.end?a:Math.min(r.end,l),!e.extend&&a>r&&(l=r,r=a,a=l),l=cr(t,a);var o=cr(t,r);l&&o&&(1!==e.rangeCount||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&((n=n.createRange()).setStart(l.node,l.offset),e.removeAllRanges(),a>r?(e.addRange(n),e.extend(o.node,o.offset)):(n.setEnd(o.node,o.offset),e.addRange(n)))}for(n=[],e=t;e=e.parentNode;)1===e.nodeType&&n.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"==typeof t.focus&&t.focus(),t=0;t<n.length;t++)(e=n[t]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var mr=c&&"documentMode"in document&&11>=document.documentMode,gr=null,vr=null,yr=null,br=!1;function kr(e,n,t){var r=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;br||null==gr||gr!==K(r)||(r="selectionStart"in(r=gr)&&pr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},yr&&ur(yr,r)||(yr=r,0<(r=Qr(vr,"onSelect")).length&&(n=new ct("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=gr)))}function wr(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var Sr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},xr={},Er={};function _r(e){if(xr[e])return xr[e];if(!Sr[e])return e;var n,t=Sr[e];for(n in t)if(t.hasOwnProperty(n)&&n in Er)return xr[e]=t[n];return e}c&&(Er=document.createElement("div").style,"AnimationEvent"in window||(delete Sr.animationend.animation,delete Sr.animationiteration.animation,delete Sr.animationstart.animation),"TransitionEvent"in window||delete Sr.transitionend.transition);var Cr=_r("animationend"),Nr=_r("animationiteration"),Pr=_r("animationstart"),zr=_r("transitionend"),Tr=new Map,Lr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Mr(e,n){Tr.set(e,n),u(n,[e])}for(var Rr=0;Rr<Lr.length;Rr++){var Or=Lr[Rr];Mr(Or.toLowerCase(),"on"+(Or[0].toUpperCase()+Or.slice(1)))}Mr(Cr,"onAnimationEnd"),Mr(Nr,"onAnimationIteration"),Mr(Pr,"onAnimationStart"),Mr("dblclick","onDoubleClick"),Mr("focusin","onFocus"),Mr("focusout","onBlur"),Mr(zr,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ir="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Fr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ir));function Dr(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,function(e,n,t,r,l,o,i,u,s){if(Ve.apply(this,arguments),Fe){if(!Fe)throw Error(a(198));var c=De;Fe=!1,De=null,Ue||(Ue=!0,Ae=c)}}(r,n,void 0,e),e.currentTarget=null}function Ur(e,n){n=0!=(4&n);for(var t=0;t<e.length;t++){var r=e[t],l=r.event;r=r.listeners;e:{var a=void 0;if(n)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==a&&l.isPropagationStopped())break e;Dr(l,i,s),a=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==a&&l.isPropagationStopped())break e;Dr(l,i,s),a=u}}}if(Ue)throw e=Ae,Ue=!1,Ae=null,e}function Ar(e,n){var t=n[ml];void 0===t&&(t=n[ml]=new Set);var r=e+"__bubble";t.has(r)||($r(n,e,2,!1),t.add(r))}function jr(e,n,t){var r=0;n&&(r|=4),$r(t,e,r,n)}var Vr="_reactListening"+Math.random().toString(36).slice(2);function Br(e){if(!e[Vr]){e[Vr]=!0,o.forEach((function(n){"selectionchange"!==n&&(Fr.has(n)||jr(n,!1,e),jr(n,!0,e))}));var n=9===e.nodeType?e:e.ownerDocument;null===n||n[Vr]||(n[Vr]=!0,jr("selectionchange",!1,n))}}function $r(e,n,t,r){switch(Gn(n)){case 1:var l=Qn;break;case 4:l=qn;break;default:l=Kn}t=l.bind(null,n,t,e),l=void 0,!Re||"touchstart"!==n&&"touchmove"!==n&&"wheel"!==n||(l=!0),r?void 0!==l?e.addEventListener(n,t,{capture:!0,passive:l}):e.addEventListener(n,t,!0):void 0!==l?e.addEventListener(n,t,{passive:l}):e.addEventListener(n,t,!1)}function Hr(e,n,t,r,l){var a=r;if(0==(1&n)&&0==(2&n)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===l||8===i.nodeType&&i.parentNode===l)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===l||8===u.nodeType&&u.parentNode===l))return;o=o.return}for(;null!==i;){if(null===(o=yl(i)))return;if(5===(u=o.tag)||6===u){r=a=o;continue e}i=i.parentNode}}r=r.return}Le((function(){var r=a,l=we(t),o=[];e:{var i=Tr.get(e);if(void 0!==i){var u=ct,s=e;switch(e){case"keypress":if(0===tt(t))break e;case"keydown":case"keyup":u=Nt;break;case"focusin":s="focus",u=gt;break;case"focusout":s="blur",u=gt;break;case"beforeblur":case"afterblur":u=gt;break;case"click":if(2===t.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=ht;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=mt;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=zt;break;case Cr:case Nr:case Pr:u=vt;break;case zr:u=Tt;break;case"scroll":u=dt;break;case"wheel":u=Mt;break;case"copy":case"cut":case"paste":u=bt;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=Pt}var c=0!=(4&n),f=!c&&"scroll"===e,d=c?null!==i?i+"Capture":null:i;c=[];for(var p,h=r;null!==h;){var m=(p=h).stateNode;if(5===p.tag&&null!==m&&(p=m,null!==d&&null!=(m=Me(h,d))&&c.push(Wr(h,m,p))),f)break;h=h.return}0<c.length&&(i=new u(i,s,null,t,l),o.push({event:i,listeners:c}))}}if(0==(7&n)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||t===ke||!(s=t.relatedTarget||t.fromElement)||!yl(s)&&!s[hl])&&(u||i)&&(i=l.window===l?l:(i=l.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=t.relatedTarget||t.toElement)?yl(s):null)&&(s!==(f=Be(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(u=null,s=r),u!==s)){if(c=ht,m="onMouseLeave",d="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=Pt,m="onPointerLeave",d="onPointerEnter",h="pointer"),f=null==u?i:kl(u),p=null==s?i:kl(s),(i=new c(m,h+"leave",u,t,l)).target=f,i.relatedTarget=p,m=null,yl(l)===r&&((c=new c(d,h+"enter",s,t,l)).target=p,c.relatedTarget=f,m=c),f=m,u&&s)e:{for(d=s,h=0,p=c=u;p;p=qr(p))h++;for(p=0,m=d;m;m=qr(m))p++;for(;0<h-p;)c=qr(c),h--;for(;0<p-h;)d=qr(d),p--;for(;h--;){if(c===d||null!==d&&c===d.alternate)break e;c=qr(c),d=qr(d)}c=null}else c=null;null!==u&&Kr(o,i,u,c,!1),null!==s&&null!==f&&Kr(o,f,s,c,!0)}if("select"===(u=(i=r?kl(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=Xt;else if(Ht(i))if(Gt)g=or;else{g=lr;var v=rr}else(u=i.nodeName)&&"input"===u.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(g=ar);switch(g&&(g=g(e,r))?Wt(o,g,t,l):(v&&v(e,i,r),"focusout"===e&&(v=i._wrapperState)&&v.controlled&&"number"===i.type&&ee(i,"number",i.value)),v=r?kl(r):window,e){case"focusin":(Ht(v)||"true"===v.contentEditable)&&(gr=v,vr=r,yr=null);break;case"focusout":yr=vr=gr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,kr(o,t,l);break;case"selectionchange":if(mr)break;case"keydown":case"keyup":kr(o,t,l)}var y;if(Ot)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Bt?jt(e,t)&&(b="onCompositionEnd"):"keydown"===e&&229===t.keyCode&&(b="onCompositionStart");b&&(Dt&&"ko"!==t.locale&&(Bt||"onCompositionStart"!==b?"onCompositionEnd"===b&&Bt&&(y=nt()):(Zn="value"in(Jn=l)?Jn.value:Jn.textContent,Bt=!0)),0<(v=Qr(r,b)).length&&(b=new kt(b,e,null,t,l),o.push({event:b,listeners:v}),(y||null!==(y=Vt(t)))&&(b.data=y))),(y=Ft?function(e,n){switch(e){case"compositionend":return Vt(n);case"keypress":return 32!==n.which?null:(At=!0,Ut);case"textInput":return(e=n.data)===Ut&&At?null:e;default:return null}}(e,t):function(e,n){if(Bt)return"compositionend"===e||!Ot&&jt(e,n)?(e=nt(),et=Zn=Jn=null,Bt=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Dt&&"ko"!==n.locale?null:n.data}}(e,t))&&0<(r=Qr(r,"onBeforeInput")).length&&(l=new kt("onBeforeInput","beforeinput",null,t,l),o.push({event:l,listeners:r}),l.data=y)}Ur(o,n)}))}function Wr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Qr(e,n){for(var t=n+"Capture",r=[];null!==e;){var l=e,a=l.stateNode;5===l.tag&&null!==a&&(l=a,null!=(a=Me(e,t))&&r.unshift(Wr(e,a,l)),null!=(a=Me(e,n))&&r.push(Wr(e,a,l))),e=e.return}return r}function qr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Kr(e,n,t,r,l){for(var a=n._reactName,o=[];null!==t&&t!==r;){var i=t,u=i.alternate,s=i.stateNode;if(null!==u&&u===r)break;5===i.tag&&null!==s&&(i=s,l?null!=(u=Me(t,a))&&o.unshift(Wr(t,u,i)):l||null!=(u=Me(t,a))&&o.push(Wr(t,u,i))),t=t.return}0!==o.length&&e.push({event:n,listeners:o})}var Yr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Gr(e){return("string"==typeof e?e:""+e).replace(Yr,"\n").replace(Xr,"")}function Jr(e,n,t){if(n=Gr(n),Gr(e)!==n&&t)throw Error(a(425))}function Zr(){}var el=null,nl=null;function tl(e,n){return"textarea"===e||"noscript"===e||"string"==typeof n.children||"number"==typeof n.children||"object"==typeof n.dangerouslySetInnerHTML&&null!==n.dangerouslySetInnerHTML&&null!=n.dangerouslySetInnerHTML.__html}var rl="function"==typeof setTimeout?setTimeout:void 0,ll="function"==typeof clearTimeout?clearTimeout:void 0,al="function"==typeof Promise?Promise:void 0,ol="function"==typeof queueMicrotask?queueMicrotask:void 0!==al?function(e){return al.resolve(null).then(e).catch(il)}:rl;function il(e){setTimeout((function(){throw e}))}function ul(e,n){var t=n,r=0;do{var l=t.nextSibling;if(e.removeChild(t),l&&8===l.nodeType)if("/$"===(t=l.data)){if(0===r)return e.removeChild(l),void $n(n);r--}else"$"!==t&&"$?"!==t&&"$!"!==t||r++;t=l}while(t);$n(n)}function sl(e){for(;null!=e;e=e.nextSibling){var n=e.nodeType;if(1===n||3===n)break;if(8===n){if("$"===(n=e.data)||"$!"===n||"$?"===n)break;if("/$"===n)return null}}return e}function cl(e){e=e.previousSibling;for(var n=0;e;){if(8===e.nodeType){var t=e.data;if("$"===t||"$!"===t||"$?"===t){if(0===n)return e;n--}else"/$"===t&&n++}e=e.previousSibling}return null}var fl=Math.random().toString(36).slice(2),dl="__reactFiber$"+fl,pl="__reactProps$"+fl,hl="__reactContainer$"+fl,ml="__reactEvents$"+fl,gl="__reactListeners$"+fl,vl="__reactHandles$"+fl;function yl(e){var n=e[dl];if(n)return n;for(var t=e.parentNode;t;){if(n=t[hl]||t[dl]){if(t=n.alternate,null!==n.child||null!==t&&null!==t.child)for(e=cl(e);null!==e;){if(t=e[dl])return t;e=cl(e)}return n}t=(e=t).parentNode}return null}function bl(e){return!(e=e[dl]||e[hl])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function kl(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function wl(e){return e[pl]||null}var Sl=[],xl=-1;function El(e){return{current:e}}function _l(e){0>xl||(e.current=Sl[xl],Sl[xl]=null,xl--)}function Cl(e,n){xl++,Sl[xl]=e.current,e.current=n}var Nl={},Pl=El(Nl),zl=El(!1),Tl=Nl;function Ll(e,n){var t=e.type.contextTypes;if(!t)return Nl;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var l,a={};for(l in t)a[l]=n[l];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=a),a}function Ml(e){return null!=e.childContextTypes}function Rl(){_l(zl),_l(Pl)}function Ol(e,n,t){if(Pl.current!==Nl)throw Error(a(168));Cl(Pl,n),Cl(zl,t)}function Il(e,n,t){var r=e.stateNode;if(n=n.childContextTypes,"function"!=typeof r.getChildContext)return t;for(var l in r=r.getChildContext())if(!(l in n))throw Error(a(108,$(e)||"Unknown",l));return D({},t,r)}function Fl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Nl,Tl=Pl.current,Cl(Pl,e),Cl(zl,zl.current),!0}function Dl(e,n,t){var r=e.stateNode;if(!r)throw Error(a(169));t?(e=Il(e,n,Tl),r.__reactInternalMemoizedMergedChildContext=e,_l(zl),_l(Pl),Cl(Pl,e)):_l(zl),Cl(zl,t)}var Ul=null,Al=!1,jl=!1;function Vl(e){null===Ul?Ul=[e]:Ul.push(e)}function Bl(){if(!jl&&null!==Ul){jl=!0;var e=0,n=kn;try{var t=Ul;for(kn=1;e<t.length;e++){var r=t[e];do{r=r(!0)}while(null!==r)}Ul=null,Al=!1}catch(n){throw null!==Ul&&(Ul=Ul.slice(e+1)),qe(Ze,Bl),n}finally{kn=n,jl=!1}}return null}var $l=[],Hl=0,Wl=null,Ql=0,ql=[],Kl=0,Yl=null,Xl=1,Gl="";function Jl(e,n){$l[Hl++]=Ql,$l[Hl++]=Wl,Wl=e,Ql=n}function Zl(e,n,t){ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Yl=e;var r=Xl;e=Gl;var l=32-on(r)-1;r&=~(1<<l),t+=1;var a=32-on(n)+l;if(30<a){var o=l-l%5;a=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Xl=1<<32-on(n)+l|t<<l|r,Gl=a+e}else Xl=1<<a|t<<l|r,Gl=e}function ea(e){null!==e.return&&(Jl(e,1),Zl(e,1,0))}function na(e){for(;e===Wl;)Wl=$l[--Hl],$l[Hl]=null,Ql=$l[--Hl],$l[Hl]=null;for(;e===Yl;)Yl=ql[--Kl],ql[Kl]=null,Gl=ql[--Kl],ql[Kl]=null,Xl=ql[--Kl],ql[Kl]=null}var ta=null,ra=null,la=!1,aa=null;function oa(e,n){var t=Ls(5,null,null,0);t.elementType="DELETED",t.stateNode=n,t.return=e,null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)}function ia(e,n){switch(e.tag){case 5:var t=e.type;return null!==(n=1!==n.nodeType||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n)&&(e.stateNode=n,ta=e,ra=sl(n.firstChild),!0);case 6:return null!==(n=""===e.pendingProps||3!==n.nodeType?null:n)&&(e.stateNode=n,ta=e,ra=null,!0);case 13:return null!==(n=8!==n.nodeType?null:n)&&(t=null!==Yl?{id:Xl,overflow:Gl}:null,e.memoizedState={dehydrated:n,treeContext:t,retryLane:1073741824},(t=Ls(18,null,null,0)).stateNode=n,t.return=e,e.child=t,ta=e,ra=null,!0);default:return!1}}function ua(e){return 0!=(1&e.mode)&&0==(128&e.flags)}function sa(e){if(la){var n=ra;if(n){var t=n;if(!ia(e,n)){if(ua(e))throw Error(a(418));n=sl(t.nextSibling);var r=ta;n&&ia(e,n)?oa(r,t):(e.flags=-4097&e.flags|2,la=!1,ta=e)}}else{if(ua(e))throw Error(a(418));e.flags=-4097&e.flags|2,la=!1,ta=e}}}function ca(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ta=e}function fa(e){if(e!==ta)return!1;if(!la)return ca(e),la=!0,!1;var n;if((n=3!==e.tag)&&!(n=5!==e.tag)&&(n="head"!==(n=e.type)&&"body"!==n&&!tl(e.type,e.memoizedProps)),n&&(n=ra)){if(ua(e))throw da(),Error(a(418));for(;n;)oa(e,n),n=sl(n.nextSibling)}if(ca(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType){var t=e.data;if("/$"===t){if(0===n){ra=sl(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++}e=e.nextSibling}ra=null}}else ra=ta?sl(e.stateNode.nextSibling):null;return!0}function da(){for(var e=ra;e;)e=sl(e.nextSibling)}function pa(){ra=ta=null,la=!1}function ha(e){null===aa?aa=[e]:aa.push(e)}var ma=k.ReactCurrentBatchConfig;function ga(e,n){if(e&&e.defaultProps){for(var t in n=D({},n),e=e.defaultProps)void 0===n[t]&&(n[t]=e[t]);return n}return n}var va=El(null),ya=null,ba=null,ka=null;function wa(){ka=ba=ya=null}function Sa(e){var n=va.current;_l(va),e._currentValue=n}function xa(e,n,t){for(;null!==e;){var r=e.alternate;if((e.childLanes&n)!==n?(e.childLanes|=n,null!==r&&(r.childLanes|=n)):null!==r&&(r.childLanes&n)!==n&&(r.childLanes|=n),e===t)break;e=e.return}}function Ea(e,n){ya=e,ka=ba=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!=(e.lanes&n)&&(ki=!0),e.firstContext=null)}function _a(e){var n=e._currentValue;if(ka!==e)if(e={context:e,memoizedValue:n,next:null},null===ba){if(null===ya)throw Error(a(308));ba=e,ya.dependencies={lanes:0,firstContext:e}}else ba=ba.next=e;return n}var Ca=null;function Na(e){null===Ca?Ca=[e]:Ca.push(e)}function Pa(e,n,t,r){var l=n.interleaved;return null===l?(t.next=t,Na(n)):(t.next=l.next,l.next=t),n.interleaved=t,za(e,r)}function za(e,n){e.lanes|=n;var t=e.alternate;for(null!==t&&(t.lanes|=n),t=e,e=e.return;null!==e;)e.childLanes|=n,null!==(t=e.alternate)&&(t.childLanes|=n),t=e,e=e.return;return 3===t.tag?t.stateNode:null}var Ta=!1;function La(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Ma(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ra(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function Oa(e,n,t){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!=(2&Pu)){var l=r.pending;return null===l?n.next=n:(n.next=l.next,l.next=n),r.pending=n,za(e,t)}return null===(l=r.interleaved)?(n.next=n,Na(r)):(n.next=l.next,l.next=n),r.interleaved=n,za(e,t)}function Ia(e,n,t){if(null!==(n=n.updateQueue)&&(n=n.shared,0!=(4194240&t))){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}function Fa(e,n){var t=e.updateQueue,r=e.alternate;if(null!==r&&t===(r=r.updateQueue)){var l=null,a=null;if(null!==(t=t.firstBaseUpdate)){do{var o={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};null===a?l=a=o:a=a.next=o,t=t.next}while(null!==t);null===a?l=a=n:a=a.next=n}else l=a=n;return t={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=t)}null===(e=t.lastBaseUpdate)?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function Da(e,n,t,r){var l=e.updateQueue;Ta=!1;var a=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(null!==i){l.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?a=s:o.next=s,o=u;var c=e.alternate;null!==c&&(i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u)}if(null!==a){var f=l.baseState;for(o=0,c=s=u=null,i=a;;){var d=i.lane,p=i.eventTime;if((r&d)===d){null!==c&&(c=c.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var h=e,m=i;switch(d=n,p=t,m.tag){case 1:if("function"==typeof(h=m.payload)){f=h.call(p,f,d);break e}f=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null==(d="function"==typeof(h=m.payload)?h.call(p,f,d):h))break e;f=D({},f,d);break e;case 2:Ta=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(d=l.effects)?l.effects=[i]:d.push(i))}else p={eventTime:p,lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=f):c=c.next=p,o|=d;if(null===(i=i.next)){if(null===(i=l.shared.pending))break;i=(d=i).next,d.next=null,l.lastBaseUpdate=d,l.shared.pending=null}}if(null===c&&(u=f),l.baseState=u,l.firstBaseUpdate=s,l.lastBaseUpdate=c,null!==(n=l.shared.interleaved)){l=n;do{o|=l.lane,l=l.next}while(l!==n)}else null===a&&(l.shared.lanes=0);Fu|=o,e.lanes=o,e.memoizedState=f}}function Ua(e,n,t){if(e=n.effects,n.effects=null,null!==e)for(n=0;n<e.length;n++){var r=e[n],l=r.callback;if(null!==l){if(r.callback=null,r=t,"function"!=typeof l)throw Error(a(191,l));l.call(r)}}}var Aa=(new r.Component).refs;function ja(e,n,t,r){t=null==(t=t(r,n=e.memoizedState))?n:D({},n,t),e.memoizedState=t,0===e.lanes&&(e.updateQueue.baseState=t)}var Va={isMounted:function(e){return!!(e=e._reactInternals)&&Be(e)===e},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ra(r,l);a.payload=n,null!=t&&(a.callback=t),null!==(n=Oa(e,a,l))&&(ts(n,e,l,r),Ia(n,e,l))},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ra(r,l);a.tag=1,a.payload=n,null!=t&&(a.callback=t),null!==(n=Oa(e,a,l))&&(ts(n,e,l,r),Ia(n,e,l))},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=es(),r=ns(e),l=Ra(t,r);l.tag=2,null!=n&&(l.callback=n),null!==(n=Oa(e,l,r))&&(ts(n,e,r,t),Ia(n,e,r))}};function Ba(e,n,t,r,l,a,o){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!(n.prototype&&n.prototype.isPureReactComponent&&ur(t,r)&&ur(l,a))}function $a(e,n,t){var r=!1,l=Nl,a=n.contextType;return"object"==typeof a&&null!==a?a=_a(a):(l=Ml(n)?Tl:Pl.current,a=(r=null!=(r=n.contextTypes))?Ll(e,l):Nl),n=new n(t,a),e.memoizedState=null!==n.state&&void 0!==n.state?n.state:null,n.updater=Va,e.stateNode=n,n._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=a),n}function Ha(e,n,t,r){e=n.state,"function"==typeof n.componentWillReceiveProps&&n.componentWillReceiveProps(t,r),"function"==typeof n.UNSAFE_componentWillReceiveProps&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&Va.enqueueReplaceState(n,n.state,null)}function Wa(e,n,t,r){var l=e.stateNode;l.props=t,l.state=e.memoizedState,l.refs=Aa,La(e);var a=n.contextType;"object"==typeof a&&null!==a?l.context=_a(a):(a=Ml(n)?Tl:Pl.current,l.context=Ll(e,a)),l.state=e.memoizedState,"function"==typeof(a=n.getDerivedStateFromProps)&&(ja(e,n,a,t),l.state=e.memoizedState),"function"==typeof n.getDerivedStateFromProps||"function"==typeof l.getSnapshotBeforeUpdate||"function"!=typeof l.UNSAFE_componentWillMount&&"function"!=typeof l.componentWillMount||(n=l.state,"function"==typeof l.componentWillMount&&l.componentWillMount(),"function"==typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),n!==l.state&&Va.enqueueReplaceState(l,l.state,null),Da(e,t,l,r),l.state=e.memoizedState),"function"==typeof l.componentDidMount&&(e.flags|=4194308)}function Qa(e,n,t){if(null!==(e=t.ref)&&"function"!=typeof e&&"object"!=typeof e){if(t._owner){if(t=t._owner){if(1!==t.tag)throw Error(a(309));var r=t.stateNode}if(!r)throw Error(a(147,e));var l=r,o=""+e;return null!==n&&null!==n.ref&&"function"==typeof n.ref&&n.ref._stringRef===o?n.ref:(n=function(e){var n=l.refs;n===Aa&&(n=l.refs={}),null===e?delete n[o]:n[o]=e},n._stringRef=o,n)}if("string"!=typeof e)throw Error(a(284));if(!t._owner)throw Error(a(290,e))}return e}function qa(e,n){throw e=Object.prototype.toString.call(n),Error(a(31,"[object Object]"===e?"object with keys {"+Object.keys(n).join(", ")+"}":e))}function Ka(e){return(0,e._init)(e._payload)}function Ya(e){function n(n,t){if(e){var r=n.deletions;null===r?(n.deletions=[t],n.flags|=16):r.push(t)}}function t(t,r){if(!e)return null;for(;null!==r;)n(t,r),r=r.sibling;return null}function r(e,n){for(e=new Map;null!==n;)null!==n.key?e.set(n.key,n):e.set(n.index,n),n=n.sibling;return e}function l(e,n){return(e=Rs(e,n)).index=0,e.sibling=null,e}function o(n,t,r){return n.index=r,e?null!==(r=n.alternate)?(r=r.index)<t?(n.flags|=2,t):r:(n.flags|=2,t):(n.flags|=1048576,t)}function i(n){return e&&null===n.alternate&&(n.flags|=2),n}function u(e,n,t,r){return null===n||6!==n.tag?((n=Ds(t,e.mode,r)).return=e,n):((n=l(n,t)).return=e,n)}function s(e,n,t,r){var a=t.type;return a===x?f(e,n,t.props.children,r,t.key):null!==n&&(n.elementType===a||"object"==typeof a&&null!==a&&a.$$typeof===M&&Ka(a)===n.type)?((r=l(n,t.props)).ref=Qa(e,n,t),r.return=e,r):((r=Os(t.type,t.key,t.props,null,e.mode,r)).ref=Qa(e,n,t),r.return=e,r)}function c(e,n,t,r){return null===n||4!==n.tag||n.stateNode.containerInfo!==t.containerInfo||n.stateNode.implementation!==t.implementation?((n=Us(t,e.mode,r)).return=e,n):((n=l(n,t.children||[])).return=e,n)}function f(e,n,t,r,a){return null===n||7!==n.tag?((n=Is(t,e.mode,r,a)).return=e,n):((n=l(n,t)).return=e,n)}function d(e,n,t){if("string"==typeof n&&""!==n||"number"==typeof n)return(n=Ds(""+n,e.mode,t)).return=e,n;if("object"==typeof n&&null!==n){switch(n.$$typeof){case w:return(t=Os(n.type,n.key,n.props,null,e.mode,t)).ref=Qa(e,null,n),t.return=e,t;case S:return(n=Us(n,e.mode,t)).return=e,n;case M:return d(e,(0,n._init)(n._payload),t)}if(ne(n)||I(n))return(n=Is(n,e.mode,t,null)).return=e,n;qa(e,n)}return null}function p(e,n,t,r){var l=null!==n?n.key:null;if("string"==typeof t&&""!==t||"number"==typeof t)return null!==l?null:u(e,n,""+t,r);if("object"==typeof t&&null!==t){switch(t.$$typeof){case w:return t.key===l?s(e,n,t,r):null;case S:return t.key===l?c(e,n,t,r):null;case M:return p(e,n,(l=t._init)(t._payload),r)}if(ne(t)||I(t))return null!==l?null:f(e,n,t,r,null);qa(e,t)}return null}function h(e,n,t,r,l){if("string"==typeof r&&""!==r||"number"==typeof r)return u(n,e=e.get(t)||null,""+r,l);if("object"==typeof r&&null!==r){switch(r.$$typeof){case w:return s(n,e=e.get(null===r.key?t:r.key)||null,r,l);case S:return c(n,e=e.get(null===r.key?t:r.key)||null,r,l);case M:return h(e,n,t,(0,r._init)(r._payload),l)}if(ne(r)||I(r))return f(n,e=e.get(t)||null,r,l,null);qa(n,r)}return null}function m(l,a,i,u){for(var s=null,c=null,f=a,m=a=0,g=null;null!==f&&m<i.length;m++){f.index>m?(g=f,f=null):g=f.sibling;var v=p(l,f,i[m],u);if(null===v){null===f&&(f=g);break}e&&f&&null===v.alternate&&n(l,f),a=o(v,a,m),null===c?s=v:c.sibling=v,c=v,f=g}if(m===i.length)return t(l,f),la&&Jl(l,m),s;if(null===f){for(;m<i.length;m++)null!==(f=d(l,i[m],u))&&(a=o(f,a,m),null===c?s=f:c.sibling=f,c=f);return la&&Jl(l,m),s}for(f=r(l,f);m<i.length;m++)null!==(g=h(f,l,m,i[m],u))&&(e&&null!==g.alternate&&f.delete(null===g.key?m:g.key),a=o(g,a,m),null===c?s=g:c.sibling=g,c=g);return e&&f.forEach((function(e){return n(l,e)})),la&&Jl(l,m),s}function g(l,i,u,s){var c=I(u);if("function"!=typeof c)throw Error(a(150));if(null==(u=c.call(u)))throw Error(a(151));for(var f=c=null,m=i,g=i=0,v=null,y=u.next();null!==m&&!y.done;g++,y=u.next()){m.index>g?(v=m,m=null):v=m.sibling;var b=p(l,m,y.value,s);if(null===b){null===m&&(m=v);break}e&&m&&null===b.alternate&&n(l,m),i=o(b,i,g),null===f?c=b:f.sibling=b,f=b,m=v}if(y.done)return t(l,m),la&&Jl(l,g),c;if(null===m){for(;!y.done;g++,y=u.next())null!==(y=d(l,y.value,s))&&(i=o(y,i,g),null===f?c=y:f.sibling=y,f=y);return la&&Jl(l,g),c}for(m=r(l,m);!y.done;g++,y=u.next())null!==(y=h(m,l,g,y.value,s))&&(e&&null!==y.alternate&&m.delete(null===y.key?g:y.key),i=o(y,i,g),null===f?c=y:f.sibling=y,f=y);return e&&m.forEach((function(e){return n(l,e)})),la&&Jl(l,g),c}return function e(r,a,o,u){if("object"==typeof o&&null!==o&&o.type===x&&null===o.key&&(o=o.props.children),"object"==typeof o&&null!==o){switch(o.$$typeof){case w:e:{for(var s=o.key,c=a;null!==c;){if(c.key===s){if((s=o.type)===x){if(7===c.tag){t(r,c.sibling),(a=l(c,o.props.children)).return=r,r=a;break e}}else if(c.elementType===s||"object"==typeof s&&null!==s&&s.$$typeof===M&&Ka(s)===c.type){t(r,c.sibling),(a=l(c,o.props)).ref=Qa(r,c,o),a.return=r,r=a;break e}t(r,c);break}n(r,c),c=c.sibling}o.type===x?((a=Is(o.props.children,r.mode,u,o.key)).return=r,r=a):((u=Os(o.type,o.key,o.props,null,r.mode,u)).ref=Qa(r,a,o),u.return=r,r=u)}return i(r);case S:e:{for(c=o.key;null!==a;){if(a.key===c){if(4===a.tag&&a.stateNode.containerInfo===o.containerInfo&&a.stateNode.implementation===o.implementation){t(r,a.sibling),(a=l(a,o.children||[])).return=r,r=a;break e}t(r,a);break}n(r,a),a=a.sibling}(a=Us(o,r.mode,u)).return=r,r=a}return i(r);case M:return e(r,a,(c=o._init)(o._payload),u)}if(ne(o))return m(r,a,o,u);if(I(o))return g(r,a,o,u);qa(r,o)}return"string"==typeof o&&""!==o||"number"==typeof o?(o=""+o,null!==a&&6===a.tag?(t(r,a.sibling),(a=l(a,o)).return=r,r=a):(t(r,a),(a=Ds(o,r.mode,u)).return=r,r=a),i(r)):t(r,a)}}var Xa=Ya(!0),Ga=Ya(!1),Ja={},Za=El(Ja),eo=El(Ja),no=El(Ja);function to(e){if(e===Ja)throw Error(a(174));return e}function ro(e,n){switch(Cl(no,n),Cl(eo,e),Cl(Za,Ja),e=n.nodeType){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:ue(null,"");break;default:n=ue(n=(e=8===e?n.parentNode:n).namespaceURI||null,e=e.tagName)}_l(Za),Cl(Za,n)}function lo(){_l(Za),_l(eo),_l(no)}function ao(e){to(no.current);var n=to(Za.current),t=ue(n,e.type);n!==t&&(Cl(eo,e),Cl(Za,t))}function oo(e){eo.current===e&&(_l(Za),_l(eo))}var io=El(0);function uo(e){for(var n=e;null!==n;){if(13===n.tag){var t=n.memoizedState;if(null!==t&&(null===(t=t.dehydrated)||"$?"===t.data||"$!"===t.data))return n}else if(19===n.tag&&void 0!==n.memoizedProps.revealOrder){if(0!=(128&n.flags))return n}else if(null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var so=[];function co(){for(var e=0;e<so.length;e++)so[e]._workInProgressVersionPrimary=null;so.length=0}var fo=k.ReactCurrentDispatcher,po=k.ReactCurrentBatchConfig,ho=0,mo=null,go=null,vo=null,yo=!1,bo=!1,ko=0,wo=0;function So(){throw Error(a(321))}function xo(e,n){if(null===n)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!ir(e[t],n[t]))return!1;return!0}function Eo(e,n,t,r,l,o){if(ho=o,mo=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,fo.current=null===e||null===e.memoizedState?ii:ui,e=t(r,l),bo){o=0;do{if(bo=!1,ko=0,25<=o)throw Error(a(301));o+=1,vo=go=null,n.updateQueue=null,fo.current=si,e=t(r,l)}while(bo)}if(fo.current=oi,n=null!==go&&null!==go.next,ho=0,vo=go=mo=null,yo=!1,n)throw Error(a(300));return e}function _o(){var e=0!==ko;return ko=0,e}function Co(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===vo?mo.memoizedState=vo=e:vo=vo.next=e,vo}function No(){if(null===go){var e=mo.alternate;e=null!==e?e.memoizedState:null}else e=go.next;var n=null===vo?mo.memoizedState:vo.next;if(null!==n)vo=n,go=e;else{if(null===e)throw Error(a(310));e={memoizedState:(go=e).memoizedState,baseState:go.baseState,baseQueue:go.baseQueue,queue:go.queue,next:null},null===vo?mo.memoizedState=vo=e:vo=vo.next=e}return vo}function Po(e,n){return"function"==typeof n?n(e):n}function zo(e){var n=No(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=go,l=r.baseQueue,o=t.pending;if(null!==o){if(null!==l){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,t.pending=null}if(null!==l){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var f=c.lane;if((ho&f)===f)null!==s&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var d={lane:f,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===s?(u=s=d,i=r):s=s.next=d,mo.lanes|=f,Fu|=f}c=c.next}while(null!==c&&c!==o);null===s?i=r:s.next=u,ir(r,n.memoizedState)||(ki=!0),n.memoizedState=r,n.baseState=i,n.baseQueue=s,t.lastRenderedState=r}if(null!==(e=t.interleaved)){l=e;do{o=l.lane,mo.lanes|=o,Fu|=o,l=l.next}while(l!==e)}else null===l&&(t.lanes=0);return[n.memoizedState,t.dispatch]}function To(e){var n=No(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=t.dispatch,l=t.pending,o=n.memoizedState;if(null!==l){t.pending=null;var i=l=l.next;do{o=e(o,i.action),i=i.next}while(i!==l);ir(o,n.memoizedState)||(ki=!0),n.memoizedState=o,null===n.baseQueue&&(n.baseState=o),t.lastRenderedState=o}return[o,r]}function Lo(){}function Mo(e,n){var t=mo,r=No(),l=n(),o=!ir(r.memoizedState,l);if(o&&(r.memoizedState=l,ki=!0),r=r.queue,Ho(Io.bind(null,t,r,e),[e]),r.getSnapshot!==n||o||null!==vo&&1&vo.memoizedState.tag){if(t.flags|=2048,Ao(9,Oo.bind(null,t,r,l,n),void 0,null),null===zu)throw Error(a(349));0!=(30&ho)||Ro(t,n,l)}return l}function Ro(e,n,t){e.flags|=16384,e={getSnapshot:n,value:t},null===(n=mo.updateQueue)?(n={lastEffect:null,stores:null},mo.updateQueue=n,n.stores=[e]):null===(t=n.stores)?n.stores=[e]:t.push(e)}function Oo(e,n,t,r){n.value=t,n.getSnapshot=r,Fo(n)&&Do(e)}function Io(e,n,t){return t((function(){Fo(n)&&Do(e)}))}function Fo(e){var n=e.getSnapshot;e=e.value;try{var t=n();return!ir(e,t)}catch(e){return!0}}function Do(e){var n=za(e,1);null!==n&&ts(n,e,1,-1)}function Uo(e){var n=Co();return"function"==typeof e&&(e=e()),n.memoizedState=n.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Po,lastRenderedState:e},n.queue=e,e=e.dispatch=ti.bind(null,mo,e),[n.memoizedState,e]}function Ao(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},null===(n=mo.updateQueue)?(n={lastEffect:null,stores:null},mo.updateQueue=n,n.lastEffect=e.next=e):null===(t=n.lastEffect)?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e),e}function jo(){return No().memoizedState}function Vo(e,n,t,r){var l=Co();mo.flags|=e,l.memoizedState=Ao(1|n,t,void 0,void 0===r?null:r)}function Bo(e,n,t,r){var l=No();r=void 0===r?null:r;var a=void 0;if(null!==go){var o=go.memoizedState;if(a=o.destroy,null!==r&&xo(r,o.deps))return void(l.memoizedState=Ao(n,t,a,r))}mo.flags|=e,l.memoizedState=Ao(1|n,t,a,r)}function $o(e,n){return Vo(8390656,8,e,n)}function Ho(e,n){return Bo(2048,8,e,n)}function Wo(e,n){return Bo(4,2,e,n)}function Qo(e,n){return Bo(4,4,e,n)}function qo(e,n){return"function"==typeof n?(e=e(),n(e),function(){n(null)}):null!=n?(e=e(),n.current=e,function(){n.current=null}):void 0}function Ko(e,n,t){return t=null!=t?t.concat([e]):null,Bo(4,4,qo.bind(null,n,e),t)}function Yo(){}function Xo(e,n){var t=No();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&xo(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function Go(e,n){var t=No();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&xo(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function Jo(e,n,t){return 0==(21&ho)?(e.baseState&&(e.baseState=!1,ki=!0),e.memoizedState=t):(ir(t,n)||(t=gn(),mo.lanes|=t,Fu|=t,e.baseState=!0),n)}function Zo(e,n){var t=kn;kn=0!==t&&4>t?t:4,e(!0);var r=po.transition;po.transition={};try{e(!1),n()}finally{kn=t,po.transition=r}}function ei(){return No().memoizedState}function ni(e,n,t){var r=ns(e);t={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null},ri(e)?li(n,t):null!==(t=Pa(e,n,t,r))&&(ts(t,e,r,es()),ai(t,n,r))}function ti(e,n,t){var r=ns(e),l={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null};if(ri(e))li(n,l);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=n.lastRenderedReducer))try{var o=n.lastRenderedState,i=a(o,t);if(l.hasEagerState=!0,l.eagerState=i,ir(i,o)){var u=n.interleaved;return null===u?(l.next=l,Na(n)):(l.next=u.next,u.next=l),void(n.interleaved=l)}}catch(e){}null!==(t=Pa(e,n,l,r))&&(ts(t,e,r,l=es()),ai(t,n,r))}}function ri(e){var n=e.alternate;return e===mo||null!==n&&n===mo}function li(e,n){bo=yo=!0;var t=e.pending;null===t?n.next=n:(n.next=t.next,t.next=n),e.pending=n}function ai(e,n,t){if(0!=(4194240&t)){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}var oi={readContext:_a,useCallback:So,useContext:So,useEffect:So,useImperativeHandle:So,useInsertionEffect:So,useLayoutEffect:So,useMemo:So,useReducer:So,useRef:So,useState:So,useDebugValue:So,useDeferredValue:So,useTransition:So,useMutableSource:So,useSyncExternalStore:So,useId:So,unstable_isNewReconciler:!1},ii={readContext:_a,useCallback:function(e,n){return Co().memoizedState=[e,void 0===n?null:n],e},useContext:_a,useEffect:$o,useImperativeHandle:function(e,n,t){return t=null!=t?t.concat([e]):null,Vo(4194308,4,qo.bind(null,n,e),t)},useLayoutEffect:function(e,n){return Vo(4194308,4,e,n)},useInsertionEffect:function(e,n){return Vo(4,2,e,n)},useMemo:function(e,n){var t=Co();return n=void 0===n?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=Co();return n=void 0!==t?t(n):n,r.memoizedState=r.baseState=n,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},r.queue=e,e=e.dispatch=ni.bind(null,mo,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Co().memoizedState=e},useState:Uo,useDebugValue:Yo,useDeferredValue:function(e){return Co().memoizedState=e},useTransition:function(){var e=Uo(!1),n=e[0];return e=Zo.bind(null,e[1]),Co().memoizedState=e,[n,e]},useMutableSource:function(){},useSyncExternalStore:function(e,n,t){var r=mo,l=Co();if(la){if(void 0===t)throw Error(a(407));t=t()}else{if(t=n(),null===zu)throw Error(a(349));0!=(30&ho)||Ro(r,n,t)}l.memoizedState=t;var o={value:t,getSnapshot:n};return l.queue=o,$o(Io.bind(null,r,o,e),[e]),r.flags|=2048,Ao(9,Oo.bind(null,r,o,t,n),void 0,null),t},useId:function(){var e=Co(),n=zu.identifierPrefix;if(la){var t=Gl;n=":"+n+"R"+(t=(Xl&~(1<<32-on(Xl)-1)).toString(32)+t),0<(t=ko++)&&(n+="H"+t.toString(32)),n+=":"}else n=":"+n+"r"+(t=wo++).toString(32)+":";return e.memoizedState=n},unstable_isNewReconciler:!1},ui={readContext:_a,useCallback:Xo,useContext:_a,useEffect:Ho,useImperativeHandle:Ko,useInsertionEffect:Wo,useLayoutEffect:Qo,useMemo:Go,useReducer:zo,useRef:jo,useState:function(){return zo(Po)},useDebugValue:Yo,useDeferredValue:function(e){return Jo(No(),go.memoizedState,e)},useTransition:function(){return[zo(Po)[0],No().memoizedState]},useMutableSource:Lo,useSyncExternalStore:Mo,useId:ei,unstable_isNewReconciler:!1},si={readContext:_a,useCallback:Xo,useContext:_a,useEffect:Ho,useImperativeHandle:Ko,useInsertionEffect:Wo,useLayoutEffect:Qo,useMemo:Go,useReducer:To,useRef:jo,useState:function(){return To(Po)},useDebugValue:Yo,useDeferredValue:function(e){var n=No();return null===go?n.memoizedState=e:Jo(n,go.memoizedState,e)},useTransition:function(){return[To(Po)[0],No().memoizedState]},useMutableSource:Lo,useSyncExternalStore:Mo,useId:ei,unstable_isNewReconciler:!1};function ci(e,n){try{var t="",r=n;do{t+=V(r),r=r.return}while(r);var l=t}catch(e){l="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:n,stack:l,digest:null}}function fi(e,n,t){return{value:e,source:null,stack:null!=t?t:null,digest:null!=n?n:null}}function di(e,n){try{console.error(n.value)}catch(e){setTimeout((function(){throw e}))}}var pi="function"==typeof WeakMap?WeakMap:Map;function hi(e,n,t){(t=Ra(-1,t)).tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){Hu||(Hu=!0,Wu=r),di(0,n)},t}function mi(e,n,t){(t=Ra(-1,t)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var l=n.value;t.payload=function(){return r(l)},t.callback=function(){di(0,n)}}var a=e.stateNode;return null!==a&&"function"==typeof a.componentDidCatch&&(t.callback=function(){di(0,n),"function"!=typeof r&&(null===Qu?Qu=new Set([this]):Qu.add(this));var e=n.stack;this.componentDidCatch(n.value,{componentStack:null!==e?e:""})}),t}function gi(e,n,t){var r=e.pingCache;if(null===r){r=e.pingCache=new pi;var l=new Set;r.set(n,l)}else void 0===(l=r.get(n))&&(l=new Set,r.set(n,l));l.has(t)||(l.add(t),e=_s.bind(null,e,n,t),n.then(e,e))}function vi(e){do{var n;if((n=13===e.tag)&&(n=null===(n=e.memoizedState)||null!==n.dehydrated),n)return e;e=e.return}while(null!==e);return null}function yi(e,n,t,r,l){return 0==(1&e.mode)?(e===n?e.flags|=65536:(e.flags|=128,t.flags|=131072,t.flags&=-52805,1===t.tag&&(null===t.alternate?t.tag=17:((n=Ra(-1,1)).tag=2,Oa(t,n,1))),t.lanes|=1),e):(e.flags|=65536,e.lanes=l,e)}var bi=k.ReactCurrentOwner,ki=!1;function wi(e,n,t,r){n.child=null===e?Ga(n,null,t,r):Xa(n,e.child,t,r)}function Si(e,n,t,r,l){t=t.render;var a=n.ref;return Ea(n,l),r=Eo(e,n,t,r,a,l),t=_o(),null===e||ki?(la&&t&&ea(n),n.flags|=1,wi(e,n,r,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Hi(e,n,l))}function xi(e,n,t,r,l){if(null===e){var a=t.type;return"function"!=typeof a||Ms(a)||void 0!==a.defaultProps||null!==t.compare||void 0!==t.defaultProps?((e=Os(t.type,null,r,n,n.mode,l)).ref=n.ref,e.return=n,n.child=e):(n.tag=15,n.type=a,Ei(e,n,a,r,l))}if(a=e.child,0==(e.lanes&l)){var o=a.memoizedProps;if((t=null!==(t=t.compare)?t:ur)(o,r)&&e.ref===n.ref)return Hi(e,n,l)}return n.flags|=1,(e=Rs(a,r)).ref=n.ref,e.return=n,n.child=e}function Ei(e,n,t,r,l){if(null!==e){var a=e.memoizedProps;if(ur(a,r)&&e.ref===n.ref){if(ki=!1,n.pendingProps=r=a,0==(e.lanes&l))return n.lanes=e.lanes,Hi(e,n,l);0!=(131072&e.flags)&&(ki=!0)}}return Ni(e,n,t,r,l)}function _i(e,n,t){var r=n.pendingProps,l=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0==(1&n.mode))n.memoizedState={baseLanes:0,cachePool:null,transitions:null},Cl(Ru,Mu),Mu|=t;else{if(0==(1073741824&t))return e=null!==a?a.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e,cachePool:null,transitions:null},n.updateQueue=null,Cl(Ru,Mu),Mu|=e,null;n.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==a?a.baseLanes:t,Cl(Ru,Mu),Mu|=r}else null!==a?(r=a.baseLanes|t,n.memoizedState=null):r=t,Cl(Ru,Mu),Mu|=r;return wi(e,n,l,t),n.child}function Ci(e,n){var t=n.ref;(null===e&&null!==t||null!==e&&e.ref!==t)&&(n.flags|=512,n.flags|=2097152)}function Ni(e,n,t,r,l){var a=Ml(t)?Tl:Pl.current;return a=Ll(n,a),Ea(n,l),t=Eo(e,n,t,r,a,l),r=_o(),null===e||ki?(la&&r&&ea(n),n.flags|=1,wi(e,n,t,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Hi(e,n,l))}function Pi(e,n,t,r,l){if(Ml(t)){var a=!0;Fl(n)}else a=!1;if(Ea(n,l),null===n.stateNode)$i(e,n),$a(n,t,r),Wa(n,t,r,l),r=!0;else if(null===e){var o=n.stateNode,i=n.memoizedProps;o.props=i;var u=o.context,s=t.contextType;s="object"==typeof s&&null!==s?_a(s):Ll(n,s=Ml(t)?Tl:Pl.current);var c=t.getDerivedStateFromProps,f="function"==typeof c||"function"==typeof o.getSnapshotBeforeUpdate;f||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==r||u!==s)&&Ha(n,o,r,s),Ta=!1;var d=n.memoizedState;o.state=d,Da(n,r,o,l),u=n.memoizedState,i!==r||d!==u||zl.current||Ta?("function"==typeof c&&(ja(n,t,c,r),u=n.memoizedState),(i=Ta||Ba(n,t,i,r,d,u,s))?(f||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||("function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"==typeof o.componentDidMount&&(n.flags|=4194308)):("function"==typeof o.componentDidMount&&(n.flags|=4194308),n.memoizedProps=r,n.memoizedState=u),o.props=r,o.state=u,o.context=s,r=i):("function"==typeof o.componentDidMount&&(n.flags|=4194308),r=!1)}else{o=n.stateNode,Ma(e,n),i=n.memoizedProps,s=n.type===n.elementType?i:ga(n.type,i),o.props=s,f=n.pendingProps,d=o.context,u="object"==typeof(u=t.contextType)&&null!==u?_a(u):Ll(n,u=Ml(t)?Tl:Pl.current);var p=t.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof o.getSnapshotBeforeUpdate)||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==f||d!==u)&&Ha(n,o,r,u),Ta=!1,d=n.memoizedState,o.state=d,Da(n,r,o,l);var h=n.memoizedState;i!==f||d!==h||zl.current||Ta?("function"==typeof p&&(ja(n,t,p,r),h=n.memoizedState),(s=Ta||Ba(n,t,s,r,d,h,u)||!1)?(c||"function"!=typeof o.UNSAFE_componentWillUpdate&&"function"!=typeof o.componentWillUpdate||("function"==typeof o.componentWillUpdate&&o.componentWillUpdate(r,h,u),"function"==typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,h,u)),"function"==typeof o.componentDidUpdate&&(n.flags|=4),"function"==typeof o.getSnapshotBeforeUpdate&&(n.flags|=1024)):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),n.memoizedProps=r,n.memoizedState=h),o.props=r,o.state=h,o.context=u,r=s):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),r=!1)}return zi(e,n,t,r,a,l)}function zi(e,n,t,r,l,a){Ci(e,n);var o=0!=(128&n.flags);if(!r&&!o)return l&&Dl(n,t,!1),Hi(e,n,a);r=n.stateNode,bi.current=n;var i=o&&"function"!=typeof t.getDerivedStateFromError?null:r.render();return n.flags|=1,null!==e&&o?(n.child=Xa(n,e.child,null,a),n.child=Xa(n,null,i,a)):wi(e,n,i,a),n.memoizedState=r.state,l&&Dl(n,t,!0),n.child}function Ti(e){var n=e.stateNode;n.pendingContext?Ol(0,n.pendingContext,n.pendingContext!==n.context):n.context&&Ol(0,n.context,!1),ro(e,n.containerInfo)}function Li(e,n,t,r,l){return pa(),ha(l),n.flags|=256,wi(e,n,t,r),n.child}var Mi,Ri,Oi,Ii={dehydrated:null,treeContext:null,retryLane:0};function Fi(e){return{baseLanes:e,cachePool:null,transitions:null}}function Di(e,n,t){var r,l=n.pendingProps,o=io.current,i=!1,u=0!=(128&n.flags);if((r=u)||(r=(null===e||null!==e.memoizedState)&&0!=(2&o)),r?(i=!0,n.flags&=-129):null!==e&&null===e.memoizedState||(o|=1),Cl(io,1&o),null===e)return sa(n),null!==(e=n.memoizedState)&&null!==(e=e.dehydrated)?(0==(1&n.mode)?n.lanes=1:"$!"===e.data?n.lanes=8:n.lanes=1073741824,null):(u=l.children,e=l.fallback,i?(l=n.mode,i=n.child,u={mode:"hidden",children:u},0==(1&l)&&null!==i?(i.childLanes=0,i.pendingProps=u):i=Fs(u,l,0,null),e=Is(e,l,t,null),i.return=n,e.return=n,i.sibling=e,n.child=i,n.child.memoizedState=Fi(t),n.memoizedState=Ii,e):Ui(n,u));if(null!==(o=e.memoizedState)&&null!==(r=o.dehydrated))return function(e,n,t,r,l,o,i){if(t)return 256&n.flags?(n.flags&=-257,Ai(e,n,i,r=fi(Error(a(422))))):null!==n.memoizedState?(n.child=e.child,n.flags|=128,null):(o=r.fallback,l=n.mode,r=Fs({mode:"visible",children:r.children},l,0,null),(o=Is(o,l,i,null)).flags|=2,r.return=n,o.return=n,r.sibling=o,n.child=r,0!=(1&n.mode)&&Xa(n,e.child,null,i),n.child.memoizedState=Fi(i),n.memoizedState=Ii,o);if(0==(1&n.mode))return Ai(e,n,i,null);if("$!"===l.data){if(r=l.nextSibling&&l.nextSibling.dataset)var u=r.dgst;return r=u,Ai(e,n,i,r=fi(o=Error(a(419)),r,void 0))}if(u=0!=(i&e.childLanes),ki||u){if(null!==(r=zu)){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}0!==(l=0!=(l&(r.suspendedLanes|i))?0:l)&&l!==o.retryLane&&(o.retryLane=l,za(e,l),ts(r,e,l,-1))}return ms(),Ai(e,n,i,r=fi(Error(a(421))))}return"$?"===l.data?(n.flags|=128,n.child=e.child,n=Ns.bind(null,e),l._reactRetry=n,null):(e=o.treeContext,ra=sl(l.nextSibling),ta=n,la=!0,aa=null,null!==e&&(ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Xl=e.id,Gl=e.overflow,Yl=n),(n=Ui(n,r.children)).flags|=4096,n)}(e,n,u,l,r,o,t);if(i){i=l.fallback,u=n.mode,r=(o=e.child).sibling;var s={mode:"hidden",children:l.children};return 0==(1&u)&&n.child!==o?((l=n.child).childLanes=0,l.pendingProps=s,n.deletions=null):(l=Rs(o,s)).subtreeFlags=14680064&o.subtreeFlags,null!==r?i=Rs(r,i):(i=Is(i,u,t,null)).flags|=2,i.return=n,l.return=n,l.sibling=i,n.child=l,l=i,i=n.child,u=null===(u=e.child.memoizedState)?Fi(t):{baseLanes:u.baseLanes|t,cachePool:null,transitions:u.transitions},i.memoizedState=u,i.childLanes=e.childLanes&~t,n.memoizedState=Ii,l}return e=(i=e.child).sibling,l=Rs(i,{mode:"visible",children:l.children}),0==(1&n.mode)&&(l.lanes=t),l.return=n,l.sibling=null,null!==e&&(null===(t=n.deletions)?(n.deletions=[e],n.flags|=16):t.push(e)),n.child=l,n.memoizedState=null,l}function Ui(e,n){return(n=Fs({mode:"visible",children:n},e.mode,0,null)).return=e,e.child=n}function Ai(e,n,t,r){return null!==r&&ha(r),Xa(n,e.child,null,t),(e=Ui(n,n.pendingProps.children)).flags|=2,n.memoizedState=null,e}function ji(e,n,t){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n),xa(e.return,n,t)}function Vi(e,n,t,r,l){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:l}:(a.isBackwards=n,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=t,a.tailMode=l)}function Bi(e,n,t){var r=n.pendingProps,l=r.revealOrder,a=r.tail;if(wi(e,n,r.children,t),0!=(2&(r=io.current)))r=1&r|2,n.flags|=128;else{if(null!==e&&0!=(128&e.flags))e:for(e=n.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&ji(e,t,n);else if(19===e.tag)ji(e,t,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Cl(io,r),0==(1&n.mode))n.memoizedState=null;else switch(l){case"forwards":for(t=n.child,l=null;null!==t;)null!==(e=t.alternate)&&null===uo(e)&&(l=t),t=t.sibling;null===(t=l)?(l=n.child,n.child=null):(l=t.sibling,t.sibling=null),Vi(n,!1,l,t,a);break;case"backwards":for(t=null,l=n.child,n.child=null;null!==l;){if(null!==(e=l.alternate)&&null===uo(e)){n.child=l;break}e=l.sibling,l.sibling=t,t=l,l=e}Vi(n,!0,t,null,a);break;case"together":Vi(n,!1,null,null,void 0);break;default:n.memoizedState=null}return n.child}function $i(e,n){0==(1&n.mode)&&null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2)}function Hi(e,n,t){if(null!==e&&(n.dependencies=e.dependencies),Fu|=n.lanes,0==(t&n.childLanes))return null;if(null!==e&&n.child!==e.child)throw Error(a(153));if(null!==n.child){for(t=Rs(e=n.child,e.pendingProps),n.child=t,t.return=n;null!==e.sibling;)e=e.sibling,(t=t.sibling=Rs(e,e.pendingProps)).return=n;t.sibling=null}return n.child}function Wi(e,n){if(!la)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;null!==n;)null!==n.alternate&&(t=n),n=n.sibling;null===t?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;null!==t;)null!==t.alternate&&(r=t),t=t.sibling;null===r?n||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Qi(e){var n=null!==e.alternate&&e.alternate.child===e.child,t=0,r=0;if(n)for(var l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=14680064&l.subtreeFlags,r|=14680064&l.flags,l.return=e,l=l.sibling;else for(l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=t,n}function qi(e,n,t){var r=n.pendingProps;switch(na(n),n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Qi(n),null;case 1:case 17:return Ml(n.type)&&Rl(),Qi(n),null;case 3:return r=n.stateNode,lo(),_l(zl),_l(Pl),co(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fa(n)?n.flags|=4:null===e||e.memoizedState.isDehydrated&&0==(256&n.flags)||(n.flags|=1024,null!==aa&&(os(aa),aa=null))),Qi(n),null;case 5:oo(n);var l=to(no.current);if(t=n.type,null!==e&&null!=n.stateNode)Ri(e,n,t,r),e.ref!==n.ref&&(n.flags|=512,n.flags|=2097152);else{if(!r){if(null===n.stateNode)throw Error(a(166));return Qi(n),null}if(e=to(Za.current),fa(n)){r=n.stateNode,t=n.type;var o=n.memoizedProps;switch(r[dl]=n,r[pl]=o,e=0!=(1&n.mode),t){case"dialog":Ar("cancel",r),Ar("close",r);break;case"iframe":case"object":case"embed":Ar("load",r);break;case"video":case"audio":for(l=0;l<Ir.length;l++)Ar(Ir[l],r);break;case"source":Ar("error",r);break;case"img":case"image":case"link":Ar("error",r),Ar("load",r);break;case"details":Ar("toggle",r);break;case"input":X(r,o),Ar("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Ar("invalid",r);break;case"textarea":le(r,o),Ar("invalid",r)}for(var u in ye(t,o),l=null,o)if(o.hasOwnProperty(u)){var s=o[u];"children"===u?"string"==typeof s?r.textContent!==s&&(!0!==o.suppressHydrationWarning&&Jr(r.textContent,s,e),l=["children",s]):"number"==typeof s&&r.textContent!==""+s&&(!0!==o.suppressHydrationWarning&&Jr(r.textContent,s,e),l=["children",""+s]):i.hasOwnProperty(u)&&null!=s&&"onScroll"===u&&Ar("scroll",r)}switch(t){case"input":Q(r),Z(r,o,!0);break;case"textarea":Q(r),oe(r);break;case"select":case"option":break;default:"function"==typeof o.onClick&&(r.onclick=Zr)}r=l,n.updateQueue=r,null!==r&&(n.flags|=4)}else{u=9===l.nodeType?l:l.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(t)),"http://www.w3.org/1999/xhtml"===e?"script"===t?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(t,{is:r.is}):(e=u.createElement(t),"select"===t&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,t),e[dl]=n,e[pl]=r,Mi(e,n),n.stateNode=e;e:{switch(u=be(t,r),t){case"dialog":Ar("cancel",e),Ar("close",e),l=r;break;case"iframe":case"object":case"embed":Ar("load",e),l=r;break;case"video":case"audio":for(l=0;l<Ir.length;l++)Ar(Ir[l],e);l=r;break;case"source":Ar("error",e),l=r;break;case"img":case"image":case"link":Ar("error",e),Ar("load",e),l=r;break;case"details":Ar("toggle",e),l=r;break;case"input":X(e,r),l=Y(e,r),Ar("invalid",e);break;case"option":default:l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=D({},r,{value:void 0}),Ar("invalid",e);break;case"textarea":le(e,r),l=re(e,r),Ar("invalid",e)}for(o in ye(t,l),s=l)if(s.hasOwnProperty(o)){var c=s[o];"style"===o?ge(e,c):"dangerouslySetInnerHTML"===o?null!=(c=c?c.__html:void 0)&&fe(e,c):"children"===o?"string"==typeof c?("textarea"!==t||""!==c)&&de(e,c):"number"==typeof c&&de(e,""+c):"suppressContentEditableWarning"!==o&&"suppressHydrationWarning"!==o&&"autoFocus"!==o&&(i.hasOwnProperty(o)?null!=c&&"onScroll"===o&&Ar("scroll",e):null!=c&&b(e,o,c,u))}switch(t){case"input":Q(e),Z(e,r,!1);break;case"textarea":Q(e),oe(e);break;case"option":null!=r.value&&e.setAttribute("value",""+H(r.value));break;case"select":e.multiple=!!r.multiple,null!=(o=r.value)?te(e,!!r.multiple,o,!1):null!=r.defaultValue&&te(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof l.onClick&&(e.onclick=Zr)}switch(t){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(n.flags|=4)}null!==n.ref&&(n.flags|=512,n.flags|=2097152)}return Qi(n),null;case 6:if(e&&null!=n.stateNode)Oi(0,n,e.memoizedProps,r);else{if("string"!=typeof r&&null===n.stateNode)throw Error(a(166));if(t=to(no.current),to(Za.current),fa(n)){if(r=n.stateNode,t=n.memoizedProps,r[dl]=n,(o=r.nodeValue!==t)&&null!==(e=ta))switch(e.tag){case 3:Jr(r.nodeValue,t,0!=(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Jr(r.nodeValue,t,0!=(1&e.mode))}o&&(n.flags|=4)}else(r=(9===t.nodeType?t:t.ownerDocument).createTextNode(r))[dl]=n,n.stateNode=r}return Qi(n),null;case 13:if(_l(io),r=n.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(la&&null!==ra&&0!=(1&n.mode)&&0==(128&n.flags))da(),pa(),n.flags|=98560,o=!1;else if(o=fa(n),null!==r&&null!==r.dehydrated){if(null===e){if(!o)throw Error(a(318));if(!(o=null!==(o=n.memoizedState)?o.dehydrated:null))throw Error(a(317));o[dl]=n}else pa(),0==(128&n.flags)&&(n.memoizedState=null),n.flags|=4;Qi(n),o=!1}else null!==aa&&(os(aa),aa=null),o=!0;if(!o)return 65536&n.flags?n:null}return 0!=(128&n.flags)?(n.lanes=t,n):((r=null!==r)!=(null!==e&&null!==e.memoizedState)&&r&&(n.child.flags|=8192,0!=(1&n.mode)&&(null===e||0!=(1&io.current)?0===Ou&&(Ou=3):ms())),null!==n.updateQueue&&(n.flags|=4),Qi(n),null);case 4:return lo(),null===e&&Br(n.stateNode.containerInfo),Qi(n),null;case 10:return Sa(n.type._context),Qi(n),null;case 19:if(_l(io),null===(o=n.memoizedState))return Qi(n),null;if(r=0!=(128&n.flags),null===(u=o.rendering))if(r)Wi(o,!1);else{if(0!==Ou||null!==e&&0!=(128&e.flags))for(e=n.child;null!==e;){if(null!==(u=uo(e))){for(n.flags|=128,Wi(o,!1),null!==(r=u.updateQueue)&&(n.updateQueue=r,n.flags|=4),n.subtreeFlags=0,r=t,t=n.child;null!==t;)e=r,(o=t).flags&=14680066,null===(u=o.alternate)?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=u.childLanes,o.lanes=u.lanes,o.child=u.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=u.memoizedProps,o.memoizedState=u.memoizedState,o.updateQueue=u.updateQueue,o.type=u.type,e=u.dependencies,o.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return Cl(io,1&io.current|2),n.child}e=e.sibling}null!==o.tail&&Ge()>Bu&&(n.flags|=128,r=!0,Wi(o,!1),n.lanes=4194304)}else{if(!r)if(null!==(e=uo(u))){if(n.flags|=128,r=!0,null!==(t=e.updateQueue)&&(n.updateQueue=t,n.flags|=4),Wi(o,!0),null===o.tail&&"hidden"===o.tailMode&&!u.alternate&&!la)return Qi(n),null}else 2*Ge()-o.renderingStartTime>Bu&&1073741824!==t&&(n.flags|=128,r=!0,Wi(o,!1),n.lanes=4194304);o.isBackwards?(u.sibling=n.child,n.child=u):(null!==(t=o.last)?t.sibling=u:n.child=u,o.last=u)}return null!==o.tail?(n=o.tail,o.rendering=n,o.tail=n.sibling,o.renderingStartTime=Ge(),n.sibling=null,t=io.current,Cl(io,r?1&t|2:1&t),n):(Qi(n),null);case 22:case 23:return fs(),r=null!==n.memoizedState,null!==e&&null!==e.memoizedState!==r&&(n.flags|=8192),r&&0!=(1&n.mode)?0!=(1073741824&Mu)&&(Qi(n),6&n.subtreeFlags&&(n.flags|=8192)):Qi(n),null;case 24:case 25:return null}throw Error(a(156,n.tag))}function Ki(e,n){switch(na(n),n.tag){case 1:return Ml(n.type)&&Rl(),65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 3:return lo(),_l(zl),_l(Pl),co(),0!=(65536&(e=n.flags))&&0==(128&e)?(n.flags=-65537&e|128,n):null;case 5:return oo(n),null;case 13:if(_l(io),null!==(e=n.memoizedState)&&null!==e.dehydrated){if(null===n.alternate)throw Error(a(340));pa()}return 65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 19:return _l(io),null;case 4:return lo(),null;case 10:return Sa(n.type._context),null;case 22:case 23:return fs(),null;default:return null}}Mi=function(e,n){for(var t=n.child;null!==t;){if(5===t.tag||6===t.tag)e.appendChild(t.stateNode);else if(4!==t.tag&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===n)break;for(;null===t.sibling;){if(null===t.return||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}},Ri=function(e,n,t,r){var l=e.memoizedProps;if(l!==r){e=n.stateNode,to(Za.current);var a,o=null;switch(t){case"input":l=Y(e,l),r=Y(e,r),o=[];break;case"select":l=D({},l,{value:void 0}),r=D({},r,{value:void 0}),o=[];break;case"textarea":l=re(e,l),r=re(e,r),o=[];break;default:"function"!=typeof l.onClick&&"function"==typeof r.onClick&&(e.onclick=Zr)}for(c in ye(t,r),t=null,l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&null!=l[c])if("style"===c){var u=l[c];for(a in u)u.hasOwnProperty(a)&&(t||(t={}),t[a]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(i.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=null!=l?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(null!=s||null!=u))if("style"===c)if(u){for(a in u)!u.hasOwnProperty(a)||s&&s.hasOwnProperty(a)||(t||(t={}),t[a]="");for(a in s)s.hasOwnProperty(a)&&u[a]!==s[a]&&(t||(t={}),t[a]=s[a])}else t||(o||(o=[]),o.push(c,t)),t=s;else"dangerouslySetInnerHTML"===c?(s=s?s.__html:void 0,u=u?u.__html:void 0,null!=s&&u!==s&&(o=o||[]).push(c,s)):"children"===c?"string"!=typeof s&&"number"!=typeof s||(o=o||[]).push(c,""+s):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(i.hasOwnProperty(c)?(null!=s&&"onScroll"===c&&Ar("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}t&&(o=o||[]).push("style",t);var c=o;(n.updateQueue=c)&&(n.flags|=4)}},Oi=function(e,n,t,r){t!==r&&(n.flags|=4)};var Yi=!1,Xi=!1,Gi="function"==typeof WeakSet?WeakSet:Set,Ji=null;function Zi(e,n){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Es(e,n,t)}else t.current=null}function eu(e,n,t){try{t()}catch(t){Es(e,n,t)}}var nu=!1;function tu(e,n,t){var r=n.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var l=r=r.next;do{if((l.tag&e)===e){var a=l.destroy;l.destroy=void 0,void 0!==a&&eu(n,t,a)}l=l.next}while(l!==r)}}function ru(e,n){if(null!==(n=null!==(n=n.updateQueue)?n.lastEffect:null)){var t=n=n.next;do{if((t.tag&e)===e){var r=t.create;t.destroy=r()}t=t.next}while(t!==n)}}function lu(e){var n=e.ref;if(null!==n){var t=e.stateNode;e.tag,e=t,"function"==typeof n?n(e):n.current=e}}function au(e){var n=e.alternate;null!==n&&(e.alternate=null,au(n)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&null!==(n=e.stateNode)&&(delete n[dl],delete n[pl],delete n[ml],delete n[gl],delete n[vl]),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ou(e){return 5===e.tag||3===e.tag||4===e.tag}function iu(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ou(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function uu(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?8===t.nodeType?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(8===t.nodeType?(n=t.parentNode).insertBefore(e,t):(n=t).appendChild(e),null!=(t=t._reactRootContainer)||null!==n.onclick||(n.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(uu(e,n,t),e=e.sibling;null!==e;)uu(e,n,t),e=e.sibling}function su(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?t.insertBefore(e,n):t.appendChild(e);else if(4!==r&&null!==(e=e.child))for(su(e,n,t),e=e.sibling;null!==e;)su(e,n,t),e=e.sibling}var cu=null,fu=!1;function du(e,n,t){for(t=t.child;null!==t;)pu(e,n,t),t=t.sibling}function pu(e,n,t){if(an&&"function"==typeof an.onCommitFiberUnmount)try{an.onCommitFiberUnmount(ln,t)}catch(e){}switch(t.tag){case 5:Xi||Zi(t,n);case 6:var r=cu,l=fu;cu=null,du(e,n,t),fu=l,null!==(cu=r)&&(fu?(e=cu,t=t.stateNode,8===e.nodeType?e.parentNode.removeChild(t):e.removeChild(t)):cu.removeChild(t.stateNode));break;case 18:null!==cu&&(fu?(e=cu,t=t.stateNode,8===e.nodeType?ul(e.parentNode,t):1===e.nodeType&&ul(e,t),$n(e)):ul(cu,t.stateNode));break;case 4:r=cu,l=fu,cu=t.stateNode.containerInfo,fu=!0,du(e,n,t),cu=r,fu=l;break;case 0:case 11:case 14:case 15:if(!Xi&&null!==(r=t.updateQueue)&&null!==(r=r.lastEffect)){l=r=r.next;do{var a=l,o=a.destroy;a=a.tag,void 0!==o&&(0!=(2&a)||0!=(4&a))&&eu(t,n,o),l=l.next}while(l!==r)}du(e,n,t);break;case 1:if(!Xi&&(Zi(t,n),"function"==typeof(r=t.stateNode).componentWillUnmount))try{r.props=t.memoizedProps,r.state=t.memoizedState,r.componentWillUnmount()}catch(e){Es(t,n,e)}du(e,n,t);break;case 21:du(e,n,t);break;case 22:1&t.mode?(Xi=(r=Xi)||null!==t.memoizedState,du(e,n,t),Xi=r):du(e,n,t);break;default:du(e,n,t)}}function hu(e){var n=e.updateQueue;if(null!==n){e.updateQueue=null;var t=e.stateNode;null===t&&(t=e.stateNode=new Gi),n.forEach((function(n){var r=Ps.bind(null,e,n);t.has(n)||(t.add(n),n.then(r,r))}))}}function mu(e,n){var t=n.deletions;if(null!==t)for(var r=0;r<t.length;r++){var l=t[r];try{var o=e,i=n,u=i;e:for(;null!==u;){switch(u.tag){case 5:cu=u.stateNode,fu=!1;break e;case 3:case 4:cu=u.stateNode.containerInfo,fu=!0;break e}u=u.return}if(null===cu)throw Error(a(160));pu(o,i,l),cu=null,fu=!1;var s=l.alternate;null!==s&&(s.return=null),l.return=null}catch(e){Es(l,n,e)}}if(12854&n.subtreeFlags)for(n=n.child;null!==n;)gu(n,e),n=n.sibling}function gu(e,n){var t=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(mu(n,e),vu(e),4&r){try{tu(3,e,e.return),ru(3,e)}catch(n){Es(e,e.return,n)}try{tu(5,e,e.return)}catch(n){Es(e,e.return,n)}}break;case 1:mu(n,e),vu(e),512&r&&null!==t&&Zi(t,t.return);break;case 5:if(mu(n,e),vu(e),512&r&&null!==t&&Zi(t,t.return),32&e.flags){var l=e.stateNode;try{de(l,"")}catch(n){Es(e,e.return,n)}}if(4&r&&null!=(l=e.stateNode)){var o=e.memoizedProps,i=null!==t?t.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===u&&"radio"===o.type&&null!=o.name&&G(l,o),be(u,i);var c=be(u,o);for(i=0;i<s.length;i+=2){var f=s[i],d=s[i+1];"style"===f?ge(l,d):"dangerouslySetInnerHTML"===f?fe(l,d):"children"===f?de(l,d):b(l,f,d,c)}switch(u){case"input":J(l,o);break;case"textarea":ae(l,o);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var h=o.value;null!=h?te(l,!!o.multiple,h,!1):p!==!!o.multiple&&(null!=o.defaultValue?te(l,!!o.multiple,o.defaultValue,!0):te(l,!!o.multiple,o.multiple?[]:"",!1))}l[pl]=o}catch(n){Es(e,e.return,n)}}break;case 6:if(mu(n,e),vu(e),4&r){if(null===e.stateNode)throw Error(a(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(n){Es(e,e.return,n)}}break;case 3:if(mu(n,e),vu(e),4&r&&null!==t&&t.memoizedState.isDehydrated)try{$n(n.containerInfo)}catch(n){Es(e,e.return,n)}break;case 4:default:mu(n,e),vu(e);break;case 13:mu(n,e),vu(e),8192&(l=e.child).flags&&(o=null!==l.memoizedState,l.stateNode.isHidden=o,!o||null!==l.alternate&&null!==l.alternate.memoizedState||(Vu=Ge())),4&r&&hu(e);break;case 22:if(f=null!==t&&null!==t.memoizedState,1&e.mode?(Xi=(c=Xi)||f,mu(n,e),Xi=c):mu(n,e),vu(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!f&&0!=(1&e.mode))for(Ji=e,f=e.child;null!==f;){for(d=Ji=f;null!==Ji;){switch(h=(p=Ji).child,p.tag){case 0:case 11:case 14:case 15:tu(4,p,p.return);break;case 1:Zi(p,p.return);var m=p.stateNode;if("function"==typeof m.componentWillUnmount){r=p,t=p.return;try{n=r,m.props=n.memoizedProps,m.state=n.memoizedState,m.componentWillUnmount()}catch(e){Es(r,t,e)}}break;case 5:Zi(p,p.return);break;case 22:if(null!==p.memoizedState){wu(d);continue}}null!==h?(h.return=p,Ji=h):wu(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{l=d.stateNode,c?"function"==typeof(o=l.style).setProperty?o.setProperty("display","none","important"):o.display="none":(u=d.stateNode,i=null!=(s=d.memoizedProps.style)&&s.hasOwnProperty("display")?s.display:null,u.style.display=me("display",i))}catch(n){Es(e,e.return,n)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=c?"":d.memoizedProps}catch(n){Es(e,e.return,n)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:mu(n,e),vu(e),4&r&&hu(e);case 21:}}function vu(e){var n=e.flags;if(2&n){try{e:{for(var t=e.return;null!==t;){if(ou(t)){var r=t;break e}t=t.return}throw Error(a(160))}switch(r.tag){case 5:var l=r.stateNode;32&r.flags&&(de(l,""),r.flags&=-33),su(e,iu(e),l);break;case 3:case 4:var o=r.stateNode.containerInfo;uu(e,iu(e),o);break;default:throw Error(a(161))}}catch(n){Es(e,e.return,n)}e.flags&=-3}4096&n&&(e.flags&=-4097)}function yu(e,n,t){Ji=e,bu(e,n,t)}function bu(e,n,t){for(var r=0!=(1&e.mode);null!==Ji;){var l=Ji,a=l.child;if(22===l.tag&&r){var o=null!==l.memoizedState||Yi;if(!o){var i=l.alternate,u=null!==i&&null!==i.memoizedState||Xi;i=Yi;var s=Xi;if(Yi=o,(Xi=u)&&!s)for(Ji=l;null!==Ji;)u=(o=Ji).child,22===o.tag&&null!==o.memoizedState?Su(l):null!==u?(u.return=o,Ji=u):Su(l);for(;null!==a;)Ji=a,bu(a,n,t),a=a.sibling;Ji=l,Yi=i,Xi=s}ku(e)}else 0!=(8772&l.subtreeFlags)&&null!==a?(a.return=l,Ji=a):ku(e)}}function ku(e){for(;null!==Ji;){var n=Ji;if(0!=(8772&n.flags)){var t=n.alternate;try{if(0!=(8772&n.flags))switch(n.tag){case 0:case 11:case 15:Xi||ru(5,n);break;case 1:var r=n.stateNode;if(4&n.flags&&!Xi)if(null===t)r.componentDidMount();else{var l=n.elementType===n.type?t.memoizedProps:ga(n.type,t.memoizedProps);r.componentDidUpdate(l,t.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=n.updateQueue;null!==o&&Ua(n,o,r);break;case 3:var i=n.updateQueue;if(null!==i){if(t=null,null!==n.child)switch(n.child.tag){case 5:case 1:t=n.child.stateNode}Ua(n,i,t)}break;case 5:var u=n.stateNode;if(null===t&&4&n.flags){t=u;var s=n.memoizedProps;switch(n.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&t.focus();break;case"img":s.src&&(t.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===n.memoizedState){var c=n.alternate;if(null!==c){var f=c.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&$n(d)}}}break;default:throw Error(a(163))}Xi||512&n.flags&&lu(n)}catch(e){Es(n,n.return,e)}}if(n===e){Ji=null;break}if(null!==(t=n.sibling)){t.return=n.return,Ji=t;break}Ji=n.return}}function wu(e){for(;null!==Ji;){var n=Ji;if(n===e){Ji=null;break}var t=n.sibling;if(null!==t){t.return=n.return,Ji=t;break}Ji=n.return}}function Su(e){for(;null!==Ji;){var n=Ji;try{switch(n.tag){case 0:case 11:case 15:var t=n.return;try{ru(4,n)}catch(e){Es(n,t,e)}break;case 1:var r=n.stateNode;if("function"==typeof r.componentDidMount){var l=n.return;try{r.componentDidMount()}catch(e){Es(n,l,e)}}var a=n.return;try{lu(n)}catch(e){Es(n,a,e)}break;case 5:var o=n.return;try{lu(n)}catch(e){Es(n,o,e)}}}catch(e){Es(n,n.return,e)}if(n===e){Ji=null;break}var i=n.sibling;if(null!==i){i.return=n.return,Ji=i;break}Ji=n.return}}var xu,Eu=Math.ceil,_u=k.ReactCurrentDispatcher,Cu=k.ReactCurrentOwner,Nu=k.ReactCurrentBatchConfig,Pu=0,zu=null,Tu=null,Lu=0,Mu=0,Ru=El(0),Ou=0,Iu=null,Fu=0,Du=0,Uu=0,Au=null,ju=null,Vu=0,Bu=1/0,$u=null,Hu=!1,Wu=null,Qu=null,qu=!1,Ku=null,Yu=0,Xu=0,Gu=null,Ju=-1,Zu=0;function es(){return 0!=(6&Pu)?Ge():-1!==Ju?Ju:Ju=Ge()}function ns(e){return 0==(1&e.mode)?1:0!=(2&Pu)&&0!==Lu?Lu&-Lu:null!==ma.transition?(0===Zu&&(Zu=gn()),Zu):0!==(e=kn)?e:e=void 0===(e=window.event)?16:Gn(e.type)}function ts(e,n,t,r){if(50<Xu)throw Xu=0,Gu=null,Error(a(185));yn(e,t,r),0!=(2&Pu)&&e===zu||(e===zu&&(0==(2&Pu)&&(Du|=t),4===Ou&&is(e,Lu)),rs(e,r),1===t&&0===Pu&&0==(1&n.mode)&&(Bu=Ge()+500,Al&&Bl()))}function rs(e,n){var t=e.callbackNode;!function(e,n){for(var t=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,a=e.pendingLanes;0<a;){var o=31-on(a),i=1<<o,u=l[o];-1===u?0!=(i&t)&&0==(i&r)||(l[o]=hn(i,n)):u<=n&&(e.expiredLanes|=i),a&=~i}}(e,n);var r=pn(e,e===zu?Lu:0);if(0===r)null!==t&&Ke(t),e.callbackNode=null,e.callbackPriority=0;else if(n=r&-r,e.callbackPriority!==n){if(null!=t&&Ke(t),1===n)0===e.tag?function(e){Al=!0,Vl(e)}(us.bind(null,e)):Vl(us.bind(null,e)),ol((function(){0==(6&Pu)&&Bl()})),t=null;else{switch(wn(r)){case 1:t=Ze;break;case 4:t=en;break;case 16:default:t=nn;break;case 536870912:t=rn}t=zs(t,ls.bind(null,e))}e.callbackPriority=n,e.callbackNode=t}}function ls(e,n){if(Ju=-1,Zu=0,0!=(6&Pu))throw Error(a(327));var t=e.callbackNode;if(Ss()&&e.callbackNode!==t)return null;var r=pn(e,e===zu?Lu:0);if(0===r)return null;if(0!=(30&r)||0!=(r&e.expiredLanes)||n)n=gs(e,r);else{n=r;var l=Pu;Pu|=2;var o=hs();for(zu===e&&Lu===n||($u=null,Bu=Ge()+500,ds(e,n));;)try{ys();break}catch(n){ps(e,n)}wa(),_u.current=o,Pu=l,null!==Tu?n=0:(zu=null,Lu=0,n=Ou)}if(0!==n){if(2===n&&0!==(l=mn(e))&&(r=l,n=as(e,l)),1===n)throw t=Iu,ds(e,0),is(e,r),rs(e,Ge()),t;if(6===n)is(e,r);else{if(l=e.current.alternate,0==(30&r)&&!function(e){for(var n=e;;){if(16384&n.flags){var t=n.updateQueue;if(null!==t&&null!==(t=t.stores))for(var r=0;r<t.length;r++){var l=t[r],a=l.getSnapshot;l=l.value;try{if(!ir(a(),l))return!1}catch(e){return!1}}}if(t=n.child,16384&n.subtreeFlags&&null!==t)t.return=n,n=t;else{if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return!0;n=n.return}n.sibling.return=n.return,n=n.sibling}}return!0}(l)&&(2===(n=gs(e,r))&&0!==(o=mn(e))&&(r=o,n=as(e,o)),1===n))throw t=Iu,ds(e,0),is(e,r),rs(e,Ge()),t;switch(e.finishedWork=l,e.finishedLanes=r,n){case 0:case 1:throw Error(a(345));case 2:case 5:ws(e,ju,$u);break;case 3:if(is(e,r),(130023424&r)===r&&10<(n=Vu+500-Ge())){if(0!==pn(e,0))break;if(((l=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=rl(ws.bind(null,e,ju,$u),n);break}ws(e,ju,$u);break;case 4:if(is(e,r),(4194240&r)===r)break;for(n=e.eventTimes,l=-1;0<r;){var i=31-on(r);o=1<<i,(i=n[i])>l&&(l=i),r&=~o}if(r=l,10<(r=(120>(r=Ge()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Eu(r/1960))-r)){e.timeoutHandle=rl(ws.bind(null,e,ju,$u),r);break}ws(e,ju,$u);break;default:throw Error(a(329))}}}return rs(e,Ge()),e.callbackNode===t?ls.bind(null,e):null}function as(e,n){var t=Au;return e.current.memoizedState.isDehydrated&&(ds(e,n).flags|=256),2!==(e=gs(e,n))&&(n=ju,ju=t,null!==n&&os(n)),e}function os(e){null===ju?ju=e:ju.push.apply(ju,e)}function is(e,n){for(n&=~Uu,n&=~Du,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-on(n),r=1<<t;e[t]=-1,n&=~r}}function us(e){if(0!=(6&Pu))throw Error(a(327));Ss();var n=pn(e,0);if(0==(1&n))return rs(e,Ge()),null;var t=gs(e,n);if(0!==e.tag&&2===t){var r=mn(e);0!==r&&(n=r,t=as(e,r))}if(1===t)throw t=Iu,ds(e,0),is(e,n),rs(e,Ge()),t;if(6===t)throw Error(a(345));return e.finishedWork=e.current.alternate,e.finishedLanes=n,ws(e,ju,$u),rs(e,Ge()),null}function ss(e,n){var t=Pu;Pu|=1;try{return e(n)}finally{0===(Pu=t)&&(Bu=Ge()+500,Al&&Bl())}}function cs(e){null!==Ku&&0===Ku.tag&&0==(6&Pu)&&Ss();var n=Pu;Pu|=1;var t=Nu.transition,r=kn;try{if(Nu.transition=null,kn=1,e)return e()}finally{kn=r,Nu.transition=t,0==(6&(Pu=n))&&Bl()}}function fs(){Mu=Ru.current,_l(Ru)}function ds(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(-1!==t&&(e.timeoutHandle=-1,ll(t)),null!==Tu)for(t=Tu.return;null!==t;){var r=t;switch(na(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Rl();break;case 3:lo(),_l(zl),_l(Pl),co();break;case 5:oo(r);break;case 4:lo();break;case 13:case 19:_l(io);break;case 10:Sa(r.type._context);break;case 22:case 23:fs()}t=t.return}if(zu=e,Tu=e=Rs(e.current,null),Lu=Mu=n,Ou=0,Iu=null,Uu=Du=Fu=0,ju=Au=null,null!==Ca){for(n=0;n<Ca.length;n++)if(null!==(r=(t=Ca[n]).interleaved)){t.interleaved=null;var l=r.next,a=t.pending;if(null!==a){var o=a.next;a.next=l,r.next=o}t.pending=r}Ca=null}return e}function ps(e,n){for(;;){var t=Tu;try{if(wa(),fo.current=oi,yo){for(var r=mo.memoizedState;null!==r;){var l=r.queue;null!==l&&(l.pending=null),r=r.next}yo=!1}if(ho=0,vo=go=mo=null,bo=!1,ko=0,Cu.current=null,null===t||null===t.return){Ou=1,Iu=n,Tu=null;break}e:{var o=e,i=t.return,u=t,s=n;if(n=Lu,u.flags|=32768,null!==s&&"object"==typeof s&&"function"==typeof s.then){var c=s,f=u,d=f.tag;if(0==(1&f.mode)&&(0===d||11===d||15===d)){var p=f.alternate;p?(f.updateQueue=p.updateQueue,f.memoizedState=p.memoizedState,f.lanes=p.lanes):(f.updateQueue=null,f.memoizedState=null)}var h=vi(i);if(null!==h){h.flags&=-257,yi(h,i,u,0,n),1&h.mode&&gi(o,c,n),s=c;var m=(n=h).updateQueue;if(null===m){var g=new Set;g.add(s),n.updateQueue=g}else m.add(s);break e}if(0==(1&n)){gi(o,c,n),ms();break e}s=Error(a(426))}else if(la&&1&u.mode){var v=vi(i);if(null!==v){0==(65536&v.flags)&&(v.flags|=256),yi(v,i,u,0,n),ha(ci(s,u));break e}}o=s=ci(s,u),4!==Ou&&(Ou=2),null===Au?Au=[o]:Au.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,n&=-n,o.lanes|=n,Fa(o,hi(0,s,n));break e;case 1:u=s;var y=o.type,b=o.stateNode;if(0==(128&o.flags)&&("function"==typeof y.getDerivedStateFromError||null!==b&&"function"==typeof b.componentDidCatch&&(null===Qu||!Qu.has(b)))){o.flags|=65536,n&=-n,o.lanes|=n,Fa(o,mi(o,u,n));break e}}o=o.return}while(null!==o)}ks(t)}catch(e){n=e,Tu===t&&null!==t&&(Tu=t=t.return);continue}break}}function hs(){var e=_u.current;return _u.current=oi,null===e?oi:e}function ms(){0!==Ou&&3!==Ou&&2!==Ou||(Ou=4),null===zu||0==(268435455&Fu)&&0==(268435455&Du)||is(zu,Lu)}function gs(e,n){var t=Pu;Pu|=2;var r=hs();for(zu===e&&Lu===n||($u=null,ds(e,n));;)try{vs();break}catch(n){ps(e,n)}if(wa(),Pu=t,_u.current=r,null!==Tu)throw Error(a(261));return zu=null,Lu=0,Ou}function vs(){for(;null!==Tu;)bs(Tu)}function ys(){for(;null!==Tu&&!Ye();)bs(Tu)}function bs(e){var n=xu(e.alternate,e,Mu);e.memoizedProps=e.pendingProps,null===n?ks(e):Tu=n,Cu.current=null}function ks(e){var n=e;do{var t=n.alternate;if(e=n.return,0==(32768&n.flags)){if(null!==(t=qi(t,n,Mu)))return void(Tu=t)}else{if(null!==(t=Ki(t,n)))return t.flags&=32767,void(Tu=t);if(null===e)return Ou=6,void(Tu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(n=n.sibling))return void(Tu=n);Tu=n=e}while(null!==n);0===Ou&&(Ou=5)}function ws(e,n,t){var r=kn,l=Nu.transition;try{Nu.transition=null,kn=1,function(e,n,t,r){do{Ss()}while(null!==Ku);if(0!=(6&Pu))throw Error(a(327));t=e.finishedWork;var l=e.finishedLanes;if(null===t)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(a(177));e.callbackNode=null,e.callbackPriority=0;var o=t.lanes|t.childLanes;if(function(e,n){var t=e.pendingLanes&~n;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=n,e.mutableReadLanes&=n,e.entangledLanes&=n,n=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<t;){var l=31-on(t),a=1<<l;n[l]=0,r[l]=-1,e[l]=-1,t&=~a}}(e,o),e===zu&&(Tu=zu=null,Lu=0),0==(2064&t.subtreeFlags)&&0==(2064&t.flags)||qu||(qu=!0,zs(nn,(function(){return Ss(),null}))),o=0!=(15990&t.flags),0!=(15990&t.subtreeFlags)||o){o=Nu.transition,Nu.transition=null;var i=kn;kn=1;var u=Pu;Pu|=4,Cu.current=null,function(e,n){if(el=Wn,pr(e=dr())){if("selectionStart"in e)var t={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(t=(t=e.ownerDocument)&&t.defaultView||window).getSelection&&t.getSelection();if(r&&0!==r.rangeCount){t=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{t.nodeType,o.nodeType}catch(e){t=null;break e}var i=0,u=-1,s=-1,c=0,f=0,d=e,p=null;n:for(;;){for(var h;d!==t||0!==l&&3!==d.nodeType||(u=i+l),d!==o||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(h=d.firstChild);)p=d,d=h;for(;;){if(d===e)break n;if(p===t&&++c===l&&(u=i),p===o&&++f===r&&(s=i),null!==(h=d.nextSibling))break;p=(d=p).parentNode}d=h}t=-1===u||-1===s?null:{start:u,end:s}}else t=null}t=t||{start:0,end:0}}else t=null;for(nl={focusedElem:e,selectionRange:t},Wn=!1,Ji=n;null!==Ji;)if(e=(n=Ji).child,0!=(1028&n.subtreeFlags)&&null!==e)e.return=n,Ji=e;else for(;null!==Ji;){n=Ji;try{var m=n.alternate;if(0!=(1024&n.flags))switch(n.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==m){var g=m.memoizedProps,v=m.memoizedState,y=n.stateNode,b=y.getSnapshotBeforeUpdate(n.elementType===n.type?g:ga(n.type,g),v);y.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var k=n.stateNode.containerInfo;1===k.nodeType?k.textContent="":9===k.nodeType&&k.documentElement&&k.removeChild(k.documentElement);break;default:throw Error(a(163))}}catch(e){Es(n,n.return,e)}if(null!==(e=n.sibling)){e.return=n.return,Ji=e;break}Ji=n.return}m=nu,nu=!1}(e,t),gu(t,e),hr(nl),Wn=!!el,nl=el=null,e.current=t,yu(t,e,l),Xe(),Pu=u,kn=i,Nu.transition=o}else e.current=t;if(qu&&(qu=!1,Ku=e,Yu=l),0===(o=e.pendingLanes)&&(Qu=null),function(e){if(an&&"function"==typeof an.onCommitFiberRoot)try{an.onCommitFiberRoot(ln,e,void 0,128==(128&e.current.flags))}catch(e){}}(t.stateNode),rs(e,Ge()),null!==n)for(r=e.onRecoverableError,t=0;t<n.length;t++)r((l=n[t]).value,{componentStack:l.stack,digest:l.digest});if(Hu)throw Hu=!1,e=Wu,Wu=null,e;0!=(1&Yu)&&0!==e.tag&&Ss(),0!=(1&(o=e.pendingLanes))?e===Gu?Xu++:(Xu=0,Gu=e):Xu=0,Bl()}(e,n,t,r)}finally{Nu.transition=l,kn=r}return null}function Ss(){if(null!==Ku){var e=wn(Yu),n=Nu.transition,t=kn;try{if(Nu.transition=null,kn=16>e?16:e,null===Ku)var r=!1;else{if(e=Ku,Ku=null,Yu=0,0!=(6&Pu))throw Error(a(331));var l=Pu;for(Pu|=4,Ji=e.current;null!==Ji;){var o=Ji,i=o.child;if(0!=(16&Ji.flags)){var u=o.deletions;if(null!==u){for(var s=0;s<u.length;s++){var c=u[s];for(Ji=c;null!==Ji;){var f=Ji;switch(f.tag){case 0:case 11:case 15:tu(8,f,o)}var d=f.child;if(null!==d)d.return=f,Ji=d;else for(;null!==Ji;){var p=(f=Ji).sibling,h=f.return;if(au(f),f===c){Ji=null;break}if(null!==p){p.return=h,Ji=p;break}Ji=h}}}var m=o.alternate;if(null!==m){var g=m.child;if(null!==g){m.child=null;do{var v=g.sibling;g.sibling=null,g=v}while(null!==g)}}Ji=o}}if(0!=(2064&o.subtreeFlags)&&null!==i)i.return=o,Ji=i;else e:for(;null!==Ji;){if(0!=(2048&(o=Ji).flags))switch(o.tag){case 0:case 11:case 15:tu(9,o,o.return)}var y=o.sibling;if(null!==y){y.return=o.return,Ji=y;break e}Ji=o.return}}var b=e.current;for(Ji=b;null!==Ji;){var k=(i=Ji).child;if(0!=(2064&i.subtreeFlags)&&null!==k)k.return=i,Ji=k;else e:for(i=b;null!==Ji;){if(0!=(2048&(u=Ji).flags))try{switch(u.tag){case 0:case 11:case 15:ru(9,u)}}catch(e){Es(u,u.return,e)}if(u===i){Ji=null;break e}var w=u.sibling;if(null!==w){w.return=u.return,Ji=w;break e}Ji=u.return}}if(Pu=l,Bl(),an&&"function"==typeof an.onPostCommitFiberRoot)try{an.onPostCommitFiberRoot(ln,e)}catch(e){}r=!0}return r}finally{kn=t,Nu.transition=n}}return!1}function xs(e,n,t){e=Oa(e,n=hi(0,n=ci(t,n),1),1),n=es(),null!==e&&(yn(e,1,n),rs(e,n))}function Es(e,n,t){if(3===e.tag)xs(e,e,t);else for(;null!==n;){if(3===n.tag){xs(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Qu||!Qu.has(r))){n=Oa(n,e=mi(n,e=ci(t,e),1),1),e=es(),null!==n&&(yn(n,1,e),rs(n,e));break}}n=n.return}}function _s(e,n,t){var r=e.pingCache;null!==r&&r.delete(n),n=es(),e.pingedLanes|=e.suspendedLanes&t,zu===e&&(Lu&t)===t&&(4===Ou||3===Ou&&(130023424&Lu)===Lu&&500>Ge()-Vu?ds(e,0):Uu|=t),rs(e,n)}function Cs(e,n){0===n&&(0==(1&e.mode)?n=1:(n=fn,0==(130023424&(fn<<=1))&&(fn=4194304)));var t=es();null!==(e=za(e,n))&&(yn(e,n,t),rs(e,t))}function Ns(e){var n=e.memoizedState,t=0;null!==n&&(t=n.retryLane),Cs(e,t)}function Ps(e,n){var t=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;null!==l&&(t=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(n),Cs(e,t)}function zs(e,n){return qe(e,n)}function Ts(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ls(e,n,t,r){return new Ts(e,n,t,r)}function Ms(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Rs(e,n){var t=e.alternate;return null===t?((t=Ls(e.tag,n,e.key,e.mode)).elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.subtreeFlags=0,t.deletions=null),t.flags=14680064&e.flags,t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=null===n?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function Os(e,n,t,r,l,o){var i=2;if(r=e,"function"==typeof e)Ms(e)&&(i=1);else if("string"==typeof e)i=5;else e:switch(e){case x:return Is(t.children,l,o,n);case E:i=8,l|=8;break;case _:return(e=Ls(12,t,n,2|l)).elementType=_,e.lanes=o,e;case z:return(e=Ls(13,t,n,l)).elementType=z,e.lanes=o,e;case T:return(e=Ls(19,t,n,l)).elementType=T,e.lanes=o,e;case R:return Fs(t,l,o,n);default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case C:i=10;break e;case N:i=9;break e;case P:i=11;break e;case L:i=14;break e;case M:i=16,r=null;break e}throw Error(a(130,null==e?e:typeof e,""))}return(n=Ls(i,t,n,l)).elementType=e,n.type=r,n.lanes=o,n}function Is(e,n,t,r){return(e=Ls(7,e,r,n)).lanes=t,e}function Fs(e,n,t,r){return(e=Ls(22,e,r,n)).elementType=R,e.lanes=t,e.stateNode={isHidden:!1},e}function Ds(e,n,t){return(e=Ls(6,e,null,n)).lanes=t,e}function Us(e,n,t){return(n=Ls(4,null!==e.children?e.children:[],e.key,n)).lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function As(e,n,t,r,l){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vn(0),this.expirationTimes=vn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vn(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function js(e,n,t,r,l,a,o,i,u){return e=new As(e,n,t,i,u),1===n?(n=1,!0===a&&(n|=8)):n=0,a=Ls(3,null,null,n),e.current=a,a.stateNode=e,a.memoizedState={element:r,isDehydrated:t,cache:null,transitions:null,pendingSuspenseBoundaries:null},La(a),e}function Vs(e,n,t){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:S,key:null==r?null:""+r,children:e,containerInfo:n,implementation:t}}function Bs(e){if(!e)return Nl;e:{if(Be(e=e._reactInternals)!==e||1!==e.tag)throw Error(a(170));var n=e;do{switch(n.tag){case 3:n=n.stateNode.context;break e;case 1:if(Ml(n.type)){n=n.stateNode.__reactInternalMemoizedMergedChildContext;break e}}n=n.return}while(null!==n);throw Error(a(171))}if(1===e.tag){var t=e.type;if(Ml(t))return Il(e,t,n)}return n}function $s(e,n,t,r,l,a,o,i,u){return(e=js(t,r,!0,e,0,a,0,i,u)).context=Bs(null),t=e.current,(a=Ra(r=es(),l=ns(t))).callback=null!=n?n:null,Oa(t,a,l),e.current.lanes=l,yn(e,l,r),rs(e,r),e}function Hs(e,n,t,r){var l=n.current,a=es(),o=ns(l);return t=Bs(t),null===n.context?n.context=t:n.pendingContext=t,(n=Ra(a,o)).payload={element:e},null!==(r=void 0===r?null:r)&&(n.callback=r),null!==(e=Oa(l,n,o))&&(ts(e,l,o,a),Ia(e,l,o)),o}function Ws(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Qs(e,n){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var t=e.retryLane;e.retryLane=0!==t&&t<n?t:n}}function qs(e,n){Qs(e,n),(e=e.alternate)&&Qs(e,n)}xu=function(e,n,t){if(null!==e)if(e.memoizedProps!==n.pendingProps||zl.current)ki=!0;else{if(0==(e.lanes&t)&&0==(128&n.flags))return ki=!1,function(e,n,t){switch(n.tag){case 3:Ti(n),pa();break;case 5:ao(n);break;case 1:Ml(n.type)&&Fl(n);break;case 4:ro(n,n.stateNode.containerInfo);break;case 10:var r=n.type._context,l=n.memoizedProps.value;Cl(va,r._currentValue),r._currentValue=l;break;case 13:if(null!==(r=n.memoizedState))return null!==r.dehydrated?(Cl(io,1&io.current),n.flags|=128,null):0!=(t&n.child.childLanes)?Di(e,n,t):(Cl(io,1&io.current),null!==(e=Hi(e,n,t))?e.sibling:null);Cl(io,1&io.current);break;case 19:if(r=0!=(t&n.childLanes),0!=(128&e.flags)){if(r)return Bi(e,n,t);n.flags|=128}if(null!==(l=n.memoizedState)&&(l.rendering=null,l.tail=null,l.lastEffect=null),Cl(io,io.current),r)break;return null;case 22:case 23:return n.lanes=0,_i(e,n,t)}return Hi(e,n,t)}(e,n,t);ki=0!=(131072&e.flags)}else ki=!1,la&&0!=(1048576&n.flags)&&Zl(n,Ql,n.index);switch(n.lanes=0,n.tag){case 2:var r=n.type;$i(e,n),e=n.pendingProps;var l=Ll(n,Pl.current);Ea(n,t),l=Eo(null,n,r,e,l,t);var o=_o();return n.flags|=1,"object"==typeof l&&null!==l&&"function"==typeof l.render&&void 0===l.$$typeof?(n.tag=1,n.memoizedState=null,n.updateQueue=null,Ml(r)?(o=!0,Fl(n)):o=!1,n.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,La(n),l.updater=Va,n.stateNode=l,l._reactInternals=n,Wa(n,r,e,t),n=zi(null,n,r,!0,o,t)):(n.tag=0,la&&o&&ea(n),wi(null,n,l,t),n=n.child),n;case 16:r=n.elementType;e:{switch($i(e,n),e=n.pendingProps,r=(l=r._init)(r._payload),n.type=r,l=n.tag=function(e){if("function"==typeof e)return Ms(e)?1:0;if(null!=e){if((e=e.$$typeof)===P)return 11;if(e===L)return 14}return 2}(r),e=ga(r,e),l){case 0:n=Ni(null,n,r,e,t);break e;case 1:n=Pi(null,n,r,e,t);break e;case 11:n=Si(null,n,r,e,t);break e;case 14:n=xi(null,n,r,ga(r.type,e),t);break e}throw Error(a(306,r,""))}return n;case 0:return r=n.type,l=n.pendingProps,Ni(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 1:return r=n.type,l=n.pendingProps,Pi(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 3:e:{if(Ti(n),null===e)throw Error(a(387));r=n.pendingProps,l=(o=n.memoizedState).element,Ma(e,n),Da(n,r,null,t);var i=n.memoizedState;if(r=i.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},n.updateQueue.baseState=o,n.memoizedState=o,256&n.flags){n=Li(e,n,r,t,l=ci(Error(a(423)),n));break e}if(r!==l){n=Li(e,n,r,t,l=ci(Error(a(424)),n));break e}for(ra=sl(n.stateNode.containerInfo.firstChild),ta=n,la=!0,aa=null,t=Ga(n,null,r,t),n.child=t;t;)t.flags=-3&t.flags|4096,t=t.sibling}else{if(pa(),r===l){n=Hi(e,n,t);break e}wi(e,n,r,t)}n=n.child}return n;case 5:return ao(n),null===e&&sa(n),r=n.type,l=n.pendingProps,o=null!==e?e.memoizedProps:null,i=l.children,tl(r,l)?i=null:null!==o&&tl(r,o)&&(n.flags|=32),Ci(e,n),wi(e,n,i,t),n.child;case 6:return null===e&&sa(n),null;case 13:return Di(e,n,t);case 4:return ro(n,n.stateNode.containerInfo),r=n.pendingProps,null===e?n.child=Xa(n,null,r,t):wi(e,n,r,t),n.child;case 11:return r=n.type,l=n.pendingProps,Si(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 7:return wi(e,n,n.pendingProps,t),n.child;case 8:case 12:return wi(e,n,n.pendingProps.children,t),n.child;case 10:e:{if(r=n.type._context,l=n.pendingProps,o=n.memoizedProps,i=l.value,Cl(va,r._currentValue),r._currentValue=i,null!==o)if(ir(o.value,i)){if(o.children===l.children&&!zl.current){n=Hi(e,n,t);break e}}else for(null!==(o=n.child)&&(o.return=n);null!==o;){var u=o.dependencies;if(null!==u){i=o.child;for(var s=u.firstContext;null!==s;){if(s.context===r){if(1===o.tag){(s=Ra(-1,t&-t)).tag=2;var c=o.updateQueue;if(null!==c){var f=(c=c.shared).pending;null===f?s.next=s:(s.next=f.next,f.next=s),c.pending=s}}o.lanes|=t,null!==(s=o.alternate)&&(s.lanes|=t),xa(o.return,t,n),u.lanes|=t;break}s=s.next}}else if(10===o.tag)i=o.type===n.type?null:o.child;else if(18===o.tag){if(null===(i=o.return))throw Error(a(341));i.lanes|=t,null!==(u=i.alternate)&&(u.lanes|=t),xa(i,t,n),i=o.sibling}else i=o.child;if(null!==i)i.return=o;else for(i=o;null!==i;){if(i===n){i=null;break}if(null!==(o=i.sibling)){o.return=i.return,i=o;break}i=i.return}o=i}wi(e,n,l.children,t),n=n.child}return n;case 9:return l=n.type,r=n.pendingProps.children,Ea(n,t),r=r(l=_a(l)),n.flags|=1,wi(e,n,r,t),n.child;case 14:return l=ga(r=n.type,n.pendingProps),xi(e,n,r,l=ga(r.type,l),t);case 15:return Ei(e,n,n.type,n.pendingProps,t);case 17:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:ga(r,l),$i(e,n),n.tag=1,Ml(r)?(e=!0,Fl(n)):e=!1,Ea(n,t),$a(n,r,l),Wa(n,r,l,t),zi(null,n,r,!0,e,t);case 19:return Bi(e,n,t);case 22:return _i(e,n,t)}throw Error(a(156,n.tag))};var Ks="function"==typeof reportError?reportError:function(e){console.error(e)};function Ys(e){this._internalRoot=e}function Xs(e){this._internalRoot=e}function Gs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Js(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Zs(){}function ec(e,n,t,r,l){var a=t._reactRootContainer;if(a){var o=a;if("function"==typeof l){var i=l;l=function(){var e=Ws(o);i.call(e)}}Hs(n,o,e,l)}else o=function(e,n,t,r,l){if(l){if("function"==typeof r){var a=r;r=function(){var e=Ws(o);a.call(e)}}var o=$s(n,r,e,0,null,!1,0,"",Zs);return e._reactRootContainer=o,e[hl]=o.current,Br(8===e.nodeType?e.parentNode:e),cs(),o}for(;l=e.lastChild;)e.removeChild(l);if("function"==typeof r){var i=r;r=function(){var e=Ws(u);i.call(e)}}var u=js(e,0,!1,null,0,!1,0,"",Zs);return e._reactRootContainer=u,e[hl]=u.current,Br(8===e.nodeType?e.parentNode:e),cs((function(){Hs(n,u,t,r)})),u}(t,n,e,l,r);return Ws(o)}Xs.prototype.render=Ys.prototype.render=function(e){var n=this._internalRoot;if(null===n)throw Error(a(409));Hs(e,n,null,null)},Xs.prototype.unmount=Ys.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var n=e.containerInfo;cs((function(){Hs(null,e,null,null)})),n[hl]=null}},Xs.prototype.unstable_scheduleHydration=function(e){if(e){var n=_n();e={blockedOn:null,target:e,priority:n};for(var t=0;t<On.length&&0!==n&&n<On[t].priority;t++);On.splice(t,0,e),0===t&&Un(e)}},Sn=function(e){switch(e.tag){case 3:var n=e.stateNode;if(n.current.memoizedState.isDehydrated){var t=dn(n.pendingLanes);0!==t&&(bn(n,1|t),rs(n,Ge()),0==(6&Pu)&&(Bu=Ge()+500,Bl()))}break;case 13:cs((function(){var n=za(e,1);if(null!==n){var t=es();ts(n,e,1,t)}})),qs(e,1)}},xn=function(e){if(13===e.tag){var n=za(e,134217728);null!==n&&ts(n,e,134217728,es()),qs(e,134217728)}},En=function(e){if(13===e.tag){var n=ns(e),t=za(e,n);null!==t&&ts(t,e,n,es()),qs(e,n)}},_n=function(){return kn},Cn=function(e,n){var t=kn;try{return kn=e,n()}finally{kn=t}},Se=function(e,n,t){switch(n){case"input":if(J(e,t),n=t.name,"radio"===t.type&&null!=n){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var l=wl(r);if(!l)throw Error(a(90));q(r),J(r,l)}}}break;case"textarea":ae(e,t);break;case"select":null!=(n=t.value)&&te(e,!!t.multiple,n,!1)}},Pe=ss,ze=cs;var nc={usingClientEntryPoint:!1,Events:[bl,kl,wl,Ce,Ne,ss]},tc={findFiberByHostInstance:yl,bundleType:0,version:"18.2.0",rendererPackageName:"react-dom"},rc={bundleType:tc.bundleType,version:tc.version,rendererPackageName:tc.rendererPackageName,rendererConfig:tc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:k.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=We(e))?null:e.stateNode},findFiberByHostInstance:tc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.2.0-next-9e3b772b8-20220608"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var lc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!lc.isDisabled&&lc.supportsFiber)try{ln=lc.inject(rc),an=lc}catch(ce){}}n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nc,n.createPortal=function(e,n){var t=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Gs(n))throw Error(a(200));return Vs(e,n,null,t)},n.createRoot=function(e,n){if(!Gs(e))throw Error(a(299));var t=!1,r="",l=Ks;return null!=n&&(!0===n.unstable_strictMode&&(t=!0),void 0!==n.identifierPrefix&&(r=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),n=js(e,1,!1,null,0,t,0,r,l),e[hl]=n.current,Br(8===e.nodeType?e.parentNode:e),new Ys(n)},n.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var n=e._reactInternals;if(void 0===n){if("function"==typeof e.render)throw Error(a(188));throw e=Object.keys(e).join(","),Error(a(268,e))}return null===(e=We(n))?null:e.stateNode},n.flushSync=function(e){return cs(e)},n.hydrate=function(e,n,t){if(!Js(n))throw Error(a(200));return ec(null,e,n,!0,t)},n.hydrateRoot=function(e,n,t){if(!Gs(e))throw Error(a(405));var r=null!=t&&t.hydratedSources||null,l=!1,o="",i=Ks;if(null!=t&&(!0===t.unstable_strictMode&&(l=!0),void 0!==t.identifierPrefix&&(o=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),n=$s(n,null,e,1,null!=t?t:null,l,0,o,i),e[hl]=n.current,Br(e),r)for(e=0;e<r.length;e++)l=(l=(t=r[e])._getVersion)(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,l]:n.mutableSourceEagerHydrationData.push(t,l);return new Xs(n)},n.render=function(e,n,t){if(!Js(n))throw Error(a(200));return ec(null,e,n,!1,t)},n.unmountComponentAtNode=function(e){if(!Js(e))throw Error(a(40));return!!e._reactRootContainer&&(cs((function(){ec(null,null,e,!1,(function(){e._reactRootContainer=null,e[hl]=null}))})),!0)},n.unstable_batchedUpdates=ss,n.unstable_renderSubtreeIntoContainer=function(e,n,t,r){if(!Js(t))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return ec(e,n,t,!1,r)},n.version="18.2.0-next-9e3b772b8-20220608"},935:(e,n,t)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=t(448)},408:(e,n)=>{"use strict";var t=Symbol.for("react.element"),r=Symbol.for("react.portal"),l=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),p=Symbol.iterator,h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function v(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}function y(){}function b(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}v.prototype.isReactComponent={},v.prototype.setState=function(e,n){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,n,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},y.prototype=v.prototype;var k=b.prototype=new y;k.constructor=b,m(k,v.prototype),k.isPureReactComponent=!0;var w=Array.isArray,S=Object.prototype.hasOwnProperty,x={current:null},E={key:!0,ref:!0,__self:!0,__source:!0};function _(e,n,r){var l,a={},o=null,i=null;if(null!=n)for(l in void 0!==n.ref&&(i=n.ref),void 0!==n.key&&(o=""+n.key),n)S.call(n,l)&&!E.hasOwnProperty(l)&&(a[l]=n[l]);var u=arguments.length-2;if(1===u)a.children=r;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];a.children=s}if(e&&e.defaultProps)for(l in u=e.defaultProps)void 0===a[l]&&(a[l]=u[l]);return{$$typeof:t,type:e,key:o,ref:i,props:a,_owner:x.current}}function C(e){return"object"==typeof e&&null!==e&&e.$$typeof===t}var N=/\/+/g;function P(e,n){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return n[e]}))}(""+e.key):n.toString(36)}function z(e,n,l,a,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u=!1;if(null===e)u=!0;else switch(i){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case t:case r:u=!0}}if(u)return o=o(u=e),e=""===a?"."+P(u,0):a,w(o)?(l="",null!=e&&(l=e.replace(N,"$&/")+"/"),z(o,n,l,"",(function(e){return e}))):null!=o&&(C(o)&&(o=function(e,n){return{$$typeof:t,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}(o,l+(!o.key||u&&u.key===o.key?"":(""+o.key).replace(N,"$&/")+"/")+e)),n.push(o)),1;if(u=0,a=""===a?".":a+":",w(e))for(var s=0;s<e.length;s++){var c=a+P(i=e[s],s);u+=z(i,n,l,c,o)}else if(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"==typeof c)for(e=c.call(e),s=0;!(i=e.next()).done;)u+=z(i=i.value,n,l,c=a+P(i,s++),o);else if("object"===i)throw n=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n)+"). If you meant to render a collection of children, use an array instead.");return u}function T(e,n,t){if(null==e)return e;var r=[],l=0;return z(e,r,"","",(function(e){return n.call(t,e,l++)})),r}function L(e){if(-1===e._status){var n=e._result;(n=n()).then((function(n){0!==e._status&&-1!==e._status||(e._status=1,e._result=n)}),(function(n){0!==e._status&&-1!==e._status||(e._status=2,e._result=n)})),-1===e._status&&(e._status=0,e._result=n)}if(1===e._status)return e._result.default;throw e._result}var M={current:null},R={transition:null},O={ReactCurrentDispatcher:M,ReactCurrentBatchConfig:R,ReactCurrentOwner:x};n.Children={map:T,forEach:function(e,n,t){T(e,(function(){n.apply(this,arguments)}),t)},count:function(e){var n=0;return T(e,(function(){n++})),n},toArray:function(e){return T(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},n.Component=v,n.Fragment=l,n.Profiler=o,n.PureComponent=b,n.StrictMode=a,n.Suspense=c,n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=O,n.cloneElement=function(e,n,r){if(null==e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var l=m({},e.props),a=e.key,o=e.ref,i=e._owner;if(null!=n){if(void 0!==n.ref&&(o=n.ref,i=x.current),void 0!==n.key&&(a=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)S.call(n,s)&&!E.hasOwnProperty(s)&&(l[s]=void 0===n[s]&&void 0!==u?u[s]:n[s])}var s=arguments.length-2;if(1===s)l.children=r;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];l.children=u}return{$$typeof:t,type:e.type,key:a,ref:o,props:l,_owner:i}},n.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},n.createElement=_,n.createFactory=function(e){var n=_.bind(null,e);return n.type=e,n},n.createRef=function(){return{current:null}},n.forwardRef=function(e){return{$$typeof:s,render:e}},n.isValidElement=C,n.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:L}},n.memo=function(e,n){return{$$typeof:f,type:e,compare:void 0===n?null:n}},n.startTransition=function(e){var n=R.transition;R.transition={};try{e()}finally{R.transition=n}},n.unstable_act=function(){throw Error("act(...) is not supported in production builds of React.")},n.useCallback=function(e,n){return M.current.useCallback(e,n)},n.useContext=function(e){return M.current.useContext(e)},n.useDebugValue=function(){},n.useDeferredValue=function(e){return M.current.useDeferredValue(e)},n.useEffect=function(e,n){return M.current.useEffect(e,n)},n.useId=function(){return M.current.useId()},n.useImperativeHandle=function(e,n,t){return M.current.useImperativeHandle(e,n,t)},n.useInsertionEffect=function(e,n){return M.current.useInsertionEffect(e,n)},n.useLayoutEffect=function(e,n){return M.current.useLayoutEffect(e,n)},n.useMemo=function(e,n){return M.current.useMemo(e,n)},n.useReducer=function(e,n,t){return M.current.useReducer(e,n,t)},n.useRef=function(e){return M.current.useRef(e)},n.useState=function(e){return M.current.useState(e)},n.useSyncExternalStore=function(e,n,t){return M.current.useSyncExternalStore(e,n,t)},n.useTransition=function(){return M.current.useTransition()},n.version="18.2.0"},294:(e,n,t)=>{"use strict";e.exports=t(408)},53:(e,n)=>{"use strict";function t(e,n){var t=e.length;e.push(n);e:for(;0<t;){var r=t-1>>>1,l=e[r];if(!(0<a(l,n)))break e;e[r]=n,e[t]=l,t=r}}function r(e){return 0===e.length?null:e[0]}function l(e){if(0===e.length)return null;var n=e[0],t=e.pop();if(t!==n){e[0]=t;e:for(var r=0,l=e.length,o=l>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>a(u,t))s<l&&0>a(c,u)?(e[r]=c,e[s]=t,r=s):(e[r]=u,e[i]=t,r=i);else{if(!(s<l&&0>a(c,t)))break e;e[r]=c,e[s]=t,r=s}}}return n}function a(e,n){var t=e.sortIndex-n.sortIndex;return 0!==t?t:e.id-n.id}if("object"==typeof performance&&"function"==typeof performance.now){var o=performance;n.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();n.unstable_now=function(){return i.now()-u}}var s=[],c=[],f=1,d=null,p=3,h=!1,m=!1,g=!1,v="function"==typeof setTimeout?setTimeout:null,y="function"==typeof clearTimeout?clearTimeout:null,b="undefined"!=typeof setImmediate?setImmediate:null;function k(e){for(var n=r(c);null!==n;){if(null===n.callback)l(c);else{if(!(n.startTime<=e))break;l(c),n.sortIndex=n.expirationTime,t(s,n)}n=r(c)}}function w(e){if(g=!1,k(e),!m)if(null!==r(s))m=!0,R(S);else{var n=r(c);null!==n&&O(w,n.startTime-e)}}function S(e,t){m=!1,g&&(g=!1,y(C),C=-1),h=!0;var a=p;try{for(k(t),d=r(s);null!==d&&(!(d.expirationTime>t)||e&&!z());){var o=d.callback;if("function"==typeof o){d.callback=null,p=d.priorityLevel;var i=o(d.expirationTime<=t);t=n.unstable_now(),"function"==typeof i?d.callback=i:d===r(s)&&l(s),k(t)}else l(s);d=r(s)}if(null!==d)var u=!0;else{var f=r(c);null!==f&&O(w,f.startTime-t),u=!1}return u}finally{d=null,p=a,h=!1}}"undefined"!=typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var x,E=!1,_=null,C=-1,N=5,P=-1;function z(){return!(n.unstable_now()-P<N)}function T(){if(null!==_){var e=n.unstable_now();P=e;var t=!0;try{t=_(!0,e)}finally{t?x():(E=!1,_=null)}}else E=!1}if("function"==typeof b)x=function(){b(T)};else if("undefined"!=typeof MessageChannel){var L=new MessageChannel,M=L.port2;L.port1.onmessage=T,x=function(){M.postMessage(null)}}else x=function(){v(T,0)};function R(e){_=e,E||(E=!0,x())}function O(e,t){C=v((function(){e(n.unstable_now())}),t)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(e){e.callback=null},n.unstable_continueExecution=function(){m||h||(m=!0,R(S))},n.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):N=0<e?Math.floor(1e3/e):5},n.unstable_getCurrentPriorityLevel=function(){return p},n.unstable_getFirstCallbackNode=function(){return r(s)},n.unstable_next=function(e){switch(p){case 1:case 2:case 3:var n=3;break;default:n=p}var t=p;p=n;try{return e()}finally{p=t}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(e,n){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var t=p;p=e;try{return n()}finally{p=t}},n.unstable_scheduleCallback=function(e,l,a){var o=n.unstable_now();switch(a="object"==typeof a&&null!==a&&"number"==typeof(a=a.delay)&&0<a?o+a:o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:l,priorityLevel:e,startTime:a,expirationTime:i=a+i,sortIndex:-1},a>o?(e.sortIndex=a,t(c,e),null===r(s)&&e===r(c)&&(g?(y(C),C=-1):g=!0,O(w,a-o))):(e.sortIndex=i,t(s,e),m||h||(m=!0,R(S))),e},n.unstable_shouldYield=z,n.unstable_wrapCallback=function(e){var n=p;return function(){var t=p;p=n;try{return e.apply(this,arguments)}finally{p=t}}}},840:(e,n,t)=>{"use strict";e.exports=t(53)}},n={};function t(r){var l=n[r];if(void 0!==l)return l.exports;var a=n[r]={exports:{}};return e[r].call(a.exports,a,a.exports,t),a.exports}t.n=e=>{var n=e&&e.__esModule?()=>e.default:()=>e;return t.d(n,{a:n}),n},t.d=(e,n)=>{for(var r in n)t.o(n,r)&&!t.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:n[r]})},t.o=(e,n)=>Object.prototype.hasOwnProperty.call(e,n),(()=>{"use strict";var e,n=t(294),r=t(935),l=t(302),a=t.n(l),o=t(184),i=t.n(o);!function(e){e.Row="row",e.Column="column"}(e||(e={}));var u=function(e,n,t){return void 0===t&&(t=.5),e.map((function(r,l){return Math.round(r+t*(n[l]-e[l]))}))},s={applyBackgroundColor:!1,askColor:[235,64,52],bidColor:[0,216,101],fullOpacity:!1,interpolateColor:u,layout:e.Column,listLength:10,showHeaders:!1,showSpread:!0,spread:void 0,stylePrefix:"rob_OrderBook"},c=function(e,t){var r=t.applyBackgroundColor,l=t.color,a=t.fullOpacity,o=t.interpolateColor,i=t.reverse,u=t.stylePrefix,s={display:"flex",flexDirection:i?"column-reverse":"column"};return n.createElement("ol",{style:s,className:u+"__list"},e.map((function(t,i){var s=t[0],c=t[1],f=i/(e.length-1),d="rgba("+o(l,[255,255,255],f).join()+", "+(a?1:1-f)+")",p={backgroundColor:r?d:void 0,"--row-color":d};return n.createElement("li",{className:u+"__list-item",key:s,style:p},n.createElement("span",{className:u+"__price"},s),n.createElement("span",{className:u+"__size"},c))})))},f=function(t){var r=t.applyBackgroundColor,l=t.askColor,o=t.bidColor,f=t.book,d=t.fullOpacity,p=t.interpolateColor,h=t.layout,m=t.listLength,g=t.showHeaders,v=t.showSpread,y=t.spread,b=t.stylePrefix,k=f.bids,w=f.asks,S=null!=y?y:new(a())(w[0][0]).minus(new(a())(k[0][0])).toString(),x=i()(b),E=w.slice(0,m),_=k.slice(0,m),C=h!==e.Row,N={display:"flex",flexDirection:h===e.Row?"row-reverse":"column"};return n.createElement("div",{style:N,className:x},n.createElement("div",{className:b+"__side "+b+"__side--asks"},g&&n.createElement("p",{className:b+"__side-header"},"Ask"),c(E,{applyBackgroundColor:r,color:null!=l?l:s.askColor,fullOpacity:d,interpolateColor:null!=p?p:u,reverse:C,stylePrefix:b})),v&&n.createElement("div",{className:b+"__spread"},n.createElement("p",{className:b+"__spread-header"},"Spread"),n.createElement("span",{className:b+"__spread-value"},S)),n.createElement("div",{className:b+"__side "+b+"__side--bids"},g&&n.createElement("p",{className:b+"__side-header"},"Bid"),c(_,{applyBackgroundColor:r,color:null!=o?o:s.bidColor,fullOpacity:d,interpolateColor:null!=p?p:u,stylePrefix:b})))};f.defaultProps=s;var d={asks:[["19233.63","0.71772706"],["19233.62","0.00488478"],["19232.77","0.07"],["19231.43","0.14"],["19231.42","0.0921495"]],bids:[["19227.69","0.05"],["19227.48","0.02417"],["19227.11","0.04969543"],["19226.99","0.19"],["19226.97","0.001"]]};setInterval((function(){var e;d=JSON.parse(("api/data",(e=new XMLHttpRequest).open("GET","api/data",!1),e.send(null),e.responseText)),console.log(d),p.render(h(d))}),1e3);var p=r.createRoot(document.getElementById("root")),h=function(e){return n.createElement(n.Fragment,null,n.createElement("style",{dangerouslySetInnerHTML:{__html:"\n            .MakeItNiceAgain {\n              background-color: #151825;\n              color: rgba(255, 255, 255, 0.6);\n              display: inline-block;\n              font-family: -apple-system, BlinkMacSystemFont, sans-serif;\n              font-size: 13px;\n              font-variant-numeric: tabular-nums;\n              padding: 50px 0;\n            }\n            .MakeItNiceAgain__side-header {\n              font-weight: 700;\n              margin: 0 0 5px 0;\n              text-align: right;\n            }\n            .MakeItNiceAgain__list {\n              list-style-type: none;\n              margin: 0;\n              padding: 0;\n            }\n            .MakeItNiceAgain__list-item {\n              border-top: 1px solid rgba(255, 255, 255, 0.1);\n              cursor: pointer;\n              display: flex;\n              justify-content: flex-end;\n            }\n            .MakeItNiceAgain__list-item:before {\n              content: '';\n              flex: 1 1;\n              padding: 3px 5px;\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__list-item {\n              flex-direction: row-reverse;\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__list-item:last-child {\n              border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__size {\n              text-align: right;\n            }\n            .MakeItNiceAgain__list-item:hover {\n              background: #262935;\n            }\n            .MakeItNiceAgain__price {\n              border-left: 1px solid rgba(255, 255, 255, 0.1);\n              border-right: 1px solid rgba(255, 255, 255, 0.1);\n              color: #b7bdc1;\n              display: inline-block;\n              flex: 0 0 50px;\n              margin: 0;\n              padding: 3px 5px;\n              text-align: center;\n            }\n            .MakeItNiceAgain__size {\n              flex: 1 1;\n              margin: 0;\n              padding: 3px 5px;\n              position: relative;\n            }\n            .MakeItNiceAgain__size:before {\n              background-color: var(--row-color);\n              content: '';\n              height: 100%;\n              left: 0;\n              opacity: 0.08;\n              position: absolute;\n              top: 0;\n              width: 100%;\n            }\n          "}}),n.createElement(f,{book:{bids:e.bids,asks:e.asks},fullOpacity:!0,interpolateColor:function(e){return e},listLength:5,stylePrefix:"MakeItNiceAgain",showSpread:!1}))}})()})();
\ No newline at end of file
+(()=>{var e={302:function(e,n,t){var r;!function(l){"use strict";var a,o=1e6,i="[big.js] ",u=i+"Invalid ",s=u+"decimal places",c=u+"rounding mode",f=i+"Division by zero",d={},p=void 0,h=/^-?(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i;function m(e,n,t,r){var l=e.c,a=e.e+n+1;if(a<l.length){if(1===t)r=l[a]>=5;else if(2===t)r=l[a]>5||5==l[a]&&(r||a<0||l[a+1]!==p||1&l[a-1]);else if(3===t)r=r||!!l[0];else if(r=!1,0!==t)throw Error(c);if(a<1)l.length=1,r?(e.e=-n,l[0]=1):l[0]=e.e=0;else{if(l.length=a--,r)for(;++l[a]>9;)l[a]=0,a--||(++e.e,l.unshift(1));for(a=l.length;!l[--a];)l.pop()}}else if(t<0||t>3||t!==~~t)throw Error(c);return e}function g(e,n,t,r){var l,a,i=e.constructor,c=!e.c[0];if(t!==p){if(t!==~~t||t<(3==n)||t>o)throw Error(3==n?u+"precision":s);for(t=r-(e=new i(e)).e,e.c.length>++r&&m(e,t,i.RM),2==n&&(r=e.e+t+1);e.c.length<r;)e.c.push(0)}if(l=e.e,t=(a=e.c.join("")).length,2!=n&&(1==n||3==n&&r<=l||l<=i.NE||l>=i.PE))a=a.charAt(0)+(t>1?"."+a.slice(1):"")+(l<0?"e":"e+")+l;else if(l<0){for(;++l;)a="0"+a;a="0."+a}else if(l>0)if(++l>t)for(l-=t;l--;)a+="0";else l<t&&(a=a.slice(0,l)+"."+a.slice(l));else t>1&&(a=a.charAt(0)+"."+a.slice(1));return e.s<0&&(!c||4==n)?"-"+a:a}d.abs=function(){var e=new this.constructor(this);return e.s=1,e},d.cmp=function(e){var n,t=this,r=t.c,l=(e=new t.constructor(e)).c,a=t.s,o=e.s,i=t.e,u=e.e;if(!r[0]||!l[0])return r[0]?a:l[0]?-o:0;if(a!=o)return a;if(n=a<0,i!=u)return i>u^n?1:-1;for(o=(i=r.length)<(u=l.length)?i:u,a=-1;++a<o;)if(r[a]!=l[a])return r[a]>l[a]^n?1:-1;return i==u?0:i>u^n?1:-1},d.div=function(e){var n=this,t=n.constructor,r=n.c,l=(e=new t(e)).c,a=n.s==e.s?1:-1,i=t.DP;if(i!==~~i||i<0||i>o)throw Error(s);if(!l[0])throw Error(f);if(!r[0])return new t(0*a);var u,c,d,h,g,v=l.slice(),y=u=l.length,b=r.length,k=r.slice(0,u),w=k.length,S=e,x=S.c=[],E=0,_=i+(S.e=n.e-e.e)+1;for(S.s=a,a=_<0?0:_,v.unshift(0);w++<u;)k.push(0);do{for(d=0;d<10;d++){if(u!=(w=k.length))h=u>w?1:-1;else for(g=-1,h=0;++g<u;)if(l[g]!=k[g]){h=l[g]>k[g]?1:-1;break}if(!(h<0))break;for(c=w==u?l:v;w;){if(k[--w]<c[w]){for(g=w;g&&!k[--g];)k[g]=9;--k[g],k[w]+=10}k[w]-=c[w]}for(;!k[0];)k.shift()}x[E++]=h?d:++d,k[0]&&h?k[w]=r[y]||0:k=[r[y]]}while((y++<b||k[0]!==p)&&a--);return x[0]||1==E||(x.shift(),S.e--),E>_&&m(S,i,t.RM,k[0]!==p),S},d.eq=function(e){return!this.cmp(e)},d.gt=function(e){return this.cmp(e)>0},d.gte=function(e){return this.cmp(e)>-1},d.lt=function(e){return this.cmp(e)<0},d.lte=function(e){return this.cmp(e)<1},d.minus=d.sub=function(e){var n,t,r,l,a=this,o=a.constructor,i=a.s,u=(e=new o(e)).s;if(i!=u)return e.s=-u,a.plus(e);var s=a.c.slice(),c=a.e,f=e.c,d=e.e;if(!s[0]||!f[0])return f[0]?(e.s=-u,e):new o(s[0]?a:0);if(i=c-d){for((l=i<0)?(i=-i,r=s):(d=c,r=f),r.reverse(),u=i;u--;)r.push(0);r.reverse()}else for(t=((l=s.length<f.length)?s:f).length,i=u=0;u<t;u++)if(s[u]!=f[u]){l=s[u]<f[u];break}if(l&&(r=s,s=f,f=r,e.s=-e.s),(u=(t=f.length)-(n=s.length))>0)for(;u--;)s[n++]=0;for(u=n;t>i;){if(s[--t]<f[t]){for(n=t;n&&!s[--n];)s[n]=9;--s[n],s[t]+=10}s[t]-=f[t]}for(;0===s[--u];)s.pop();for(;0===s[0];)s.shift(),--d;return s[0]||(e.s=1,s=[d=0]),e.c=s,e.e=d,e},d.mod=function(e){var n,t=this,r=t.constructor,l=t.s,a=(e=new r(e)).s;if(!e.c[0])throw Error(f);return t.s=e.s=1,n=1==e.cmp(t),t.s=l,e.s=a,n?new r(t):(l=r.DP,a=r.RM,r.DP=r.RM=0,t=t.div(e),r.DP=l,r.RM=a,this.minus(t.times(e)))},d.plus=d.add=function(e){var n,t=this,r=t.constructor,l=t.s,a=(e=new r(e)).s;if(l!=a)return e.s=-a,t.minus(e);var o=t.e,i=t.c,u=e.e,s=e.c;if(!i[0]||!s[0])return s[0]?e:new r(i[0]?t:0*l);if(i=i.slice(),l=o-u){for(l>0?(u=o,n=s):(l=-l,n=i),n.reverse();l--;)n.push(0);n.reverse()}for(i.length-s.length<0&&(n=s,s=i,i=n),l=s.length,a=0;l;i[l]%=10)a=(i[--l]=i[l]+s[l]+a)/10|0;for(a&&(i.unshift(a),++u),l=i.length;0===i[--l];)i.pop();return e.c=i,e.e=u,e},d.pow=function(e){var n=this,t=new n.constructor(1),r=t,l=e<0;if(e!==~~e||e<-1e6||e>1e6)throw Error(u+"exponent");for(l&&(e=-e);1&e&&(r=r.times(n)),e>>=1;)n=n.times(n);return l?t.div(r):r},d.round=function(e,n){var t=this.constructor;if(e===p)e=0;else if(e!==~~e||e<-o||e>o)throw Error(s);return m(new t(this),e,n===p?t.RM:n)},d.sqrt=function(){var e,n,t,r=this,l=r.constructor,a=r.s,o=r.e,u=new l(.5);if(!r.c[0])return new l(r);if(a<0)throw Error(i+"No square root");0===(a=Math.sqrt(r+""))||a===1/0?((n=r.c.join("")).length+o&1||(n+="0"),o=((o+1)/2|0)-(o<0||1&o),e=new l(((a=Math.sqrt(n))==1/0?"1e":(a=a.toExponential()).slice(0,a.indexOf("e")+1))+o)):e=new l(a),o=e.e+(l.DP+=4);do{t=e,e=u.times(t.plus(r.div(t)))}while(t.c.slice(0,o).join("")!==e.c.slice(0,o).join(""));return m(e,l.DP-=4,l.RM)},d.times=d.mul=function(e){var n,t=this,r=t.constructor,l=t.c,a=(e=new r(e)).c,o=l.length,i=a.length,u=t.e,s=e.e;if(e.s=t.s==e.s?1:-1,!l[0]||!a[0])return new r(0*e.s);for(e.e=u+s,o<i&&(n=l,l=a,a=n,s=o,o=i,i=s),n=new Array(s=o+i);s--;)n[s]=0;for(u=i;u--;){for(i=0,s=o+u;s>u;)i=n[s]+a[u]*l[s-u-1]+i,n[s--]=i%10,i=i/10|0;n[s]=(n[s]+i)%10}for(i?++e.e:n.shift(),u=n.length;!n[--u];)n.pop();return e.c=n,e},d.toExponential=function(e){return g(this,1,e,e)},d.toFixed=function(e){return g(this,2,e,this.e+e)},d.toPrecision=function(e){return g(this,3,e,e-1)},d.toString=function(){return g(this)},d.valueOf=d.toJSON=function(){return g(this,4)},(a=function e(){function n(t){var r=this;if(!(r instanceof n))return t===p?e():new n(t);t instanceof n?(r.s=t.s,r.e=t.e,r.c=t.c.slice()):function(e,n){var t,r,l;if(0===n&&1/n<0)n="-0";else if(!h.test(n+=""))throw Error(u+"number");for(e.s="-"==n.charAt(0)?(n=n.slice(1),-1):1,(t=n.indexOf("."))>-1&&(n=n.replace(".","")),(r=n.search(/e/i))>0?(t<0&&(t=r),t+=+n.slice(r+1),n=n.substring(0,r)):t<0&&(t=n.length),l=n.length,r=0;r<l&&"0"==n.charAt(r);)++r;if(r==l)e.c=[e.e=0];else{for(;l>0&&"0"==n.charAt(--l););for(e.e=t-r-1,e.c=[],t=0;r<=l;)e.c[t++]=+n.charAt(r++)}}(r,t),r.constructor=n}return n.prototype=d,n.DP=20,n.RM=1,n.NE=-7,n.PE=21,n.version="5.2.2",n}()).default=a.Big=a,void 0===(r=function(){return a}.call(n,t,n,e))||(e.exports=r)}()},184:(e,n)=>{var t;!function(){"use strict";var r={}.hasOwnProperty;function l(){for(var e=[],n=0;n<arguments.length;n++){var t=arguments[n];if(t){var a=typeof t;if("string"===a||"number"===a)e.push(t);else if(Array.isArray(t)){if(t.length){var o=l.apply(null,t);o&&e.push(o)}}else if("object"===a){if(t.toString!==Object.prototype.toString&&!t.toString.toString().includes("[native code]")){e.push(t.toString());continue}for(var i in t)r.call(t,i)&&t[i]&&e.push(i)}}}return e.join(" ")}e.exports?(l.default=l,e.exports=l):void 0===(t=function(){return l}.apply(n,[]))||(e.exports=t)}()},448:(e,n,t)=>{"use strict";var r=t(294),l=t(840);function a(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o=new Set,i={};function u(e,n){s(e,n),s(e+"Capture",n)}function s(e,n){for(i[e]=n,e=0;e<n.length;e++)o.add(n[e])}var c=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p={},h={};function m(e,n,t,r,l,a,o){this.acceptsBooleans=2===n||3===n||4===n,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=a,this.removeEmptyString=o}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new m(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var n=e[0];g[n]=new m(n,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new m(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new m(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new m(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new m(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new m(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new m(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new m(e,5,!1,e.toLowerCase(),null,!1,!1)}));var v=/[\-:]([a-z])/g;function y(e){return e[1].toUpperCase()}function b(e,n,t,r){var l=g.hasOwnProperty(n)?g[n]:null;(null!==l?0!==l.type:r||!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&(function(e,n,t,r){if(null==n||function(e,n,t,r){if(null!==t&&0===t.type)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==t?!t.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,n,t,r))return!0;if(r)return!1;if(null!==t)switch(t.type){case 3:return!n;case 4:return!1===n;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}(n,t,l,r)&&(t=null),r||null===l?function(e){return!!f.call(h,e)||!f.call(p,e)&&(d.test(e)?h[e]=!0:(p[e]=!0,!1))}(n)&&(null===t?e.removeAttribute(n):e.setAttribute(n,""+t)):l.mustUseProperty?e[l.propertyName]=null===t?3!==l.type&&"":t:(n=l.attributeName,r=l.attributeNamespace,null===t?e.removeAttribute(n):(t=3===(l=l.type)||4===l&&!0===t?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var n=e.replace(v,y);g[n]=new m(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new m("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new m(e,1,!1,e.toLowerCase(),null,!0,!0)}));var k=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),S=Symbol.for("react.portal"),x=Symbol.for("react.fragment"),E=Symbol.for("react.strict_mode"),_=Symbol.for("react.profiler"),C=Symbol.for("react.provider"),N=Symbol.for("react.context"),P=Symbol.for("react.forward_ref"),z=Symbol.for("react.suspense"),T=Symbol.for("react.suspense_list"),L=Symbol.for("react.memo"),M=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var R=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var O=Symbol.iterator;function I(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=O&&e[O]||e["@@iterator"])?e:null}var F,D=Object.assign;function U(e){if(void 0===F)try{throw Error()}catch(e){var n=e.stack.trim().match(/\n( *(at )?)/);F=n&&n[1]||""}return"\n"+F+e}var A=!1;function j(e,n){if(!e||A)return"";A=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(e){var r=e}Reflect.construct(e,[],n)}else{try{n.call()}catch(e){r=e}e.call(n.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(n){if(n&&r&&"string"==typeof n.stack){for(var l=n.stack.split("\n"),a=r.stack.split("\n"),o=l.length-1,i=a.length-1;1<=o&&0<=i&&l[o]!==a[i];)i--;for(;1<=o&&0<=i;o--,i--)if(l[o]!==a[i]){if(1!==o||1!==i)do{if(o--,0>--i||l[o]!==a[i]){var u="\n"+l[o].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=o&&0<=i);break}}}finally{A=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?U(e):""}function V(e){switch(e.tag){case 5:return U(e.type);case 16:return U("Lazy");case 13:return U("Suspense");case 19:return U("SuspenseList");case 0:case 2:case 15:return j(e.type,!1);case 11:return j(e.type.render,!1);case 1:return j(e.type,!0);default:return""}}function B(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case x:return"Fragment";case S:return"Portal";case _:return"Profiler";case E:return"StrictMode";case z:return"Suspense";case T:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case N:return(e.displayName||"Context")+".Consumer";case C:return(e._context.displayName||"Context")+".Provider";case P:var n=e.render;return(e=e.displayName)||(e=""!==(e=n.displayName||n.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case L:return null!==(n=e.displayName||null)?n:B(e.type)||"Memo";case M:n=e._payload,e=e._init;try{return B(e(n))}catch(e){}}return null}function $(e){var n=e.type;switch(e.tag){case 24:return"Cache";case 9:return(n.displayName||"Context")+".Consumer";case 10:return(n._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=n.render).displayName||e.name||"",n.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return n;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return B(n);case 8:return n===E?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"==typeof n)return n.displayName||n.name||null;if("string"==typeof n)return n}return null}function H(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function W(e){var n=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===n||"radio"===n)}function Q(e){e._valueTracker||(e._valueTracker=function(e){var n=W(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&void 0!==t&&"function"==typeof t.get&&"function"==typeof t.set){var l=t.get,a=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return l.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}(e))}function q(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=W(e)?e.checked?"true":"false":e.value),(e=r)!==t&&(n.setValue(e),!0)}function K(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(n){return e.body}}function Y(e,n){var t=n.checked;return D({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=t?t:e._wrapperState.initialChecked})}function X(e,n){var t=null==n.defaultValue?"":n.defaultValue,r=null!=n.checked?n.checked:n.defaultChecked;t=H(null!=n.value?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:"checkbox"===n.type||"radio"===n.type?null!=n.checked:null!=n.value}}function G(e,n){null!=(n=n.checked)&&b(e,"checked",n,!1)}function J(e,n){G(e,n);var t=H(n.value),r=n.type;if(null!=t)"number"===r?(0===t&&""===e.value||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");n.hasOwnProperty("value")?ee(e,n.type,t):n.hasOwnProperty("defaultValue")&&ee(e,n.type,H(n.defaultValue)),null==n.checked&&null!=n.defaultChecked&&(e.defaultChecked=!!n.defaultChecked)}function Z(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!("submit"!==r&&"reset"!==r||void 0!==n.value&&null!==n.value))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}""!==(t=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==t&&(e.name=t)}function ee(e,n,t){"number"===n&&K(e.ownerDocument)===e||(null==t?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}var ne=Array.isArray;function te(e,n,t,r){if(e=e.options,n){n={};for(var l=0;l<t.length;l++)n["$"+t[l]]=!0;for(t=0;t<e.length;t++)l=n.hasOwnProperty("$"+e[t].value),e[t].selected!==l&&(e[t].selected=l),l&&r&&(e[t].defaultSelected=!0)}else{for(t=""+H(t),n=null,l=0;l<e.length;l++){if(e[l].value===t)return e[l].selected=!0,void(r&&(e[l].defaultSelected=!0));null!==n||e[l].disabled||(n=e[l])}null!==n&&(n.selected=!0)}}function re(e,n){if(null!=n.dangerouslySetInnerHTML)throw Error(a(91));return D({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function le(e,n){var t=n.value;if(null==t){if(t=n.children,n=n.defaultValue,null!=t){if(null!=n)throw Error(a(92));if(ne(t)){if(1<t.length)throw Error(a(93));t=t[0]}n=t}null==n&&(n=""),t=n}e._wrapperState={initialValue:H(t)}}function ae(e,n){var t=H(n.value),r=H(n.defaultValue);null!=t&&((t=""+t)!==e.value&&(e.value=t),null==n.defaultValue&&e.defaultValue!==t&&(e.defaultValue=t)),null!=r&&(e.defaultValue=""+r)}function oe(e){var n=e.textContent;n===e._wrapperState.initialValue&&""!==n&&null!==n&&(e.value=n)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ue(e,n){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(n):"http://www.w3.org/2000/svg"===e&&"foreignObject"===n?"http://www.w3.org/1999/xhtml":e}var se,ce,fe=(ce=function(e,n){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=n;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,n,t,r){MSApp.execUnsafeLocalFunction((function(){return ce(e,n)}))}:ce);function de(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&3===t.nodeType)return void(t.nodeValue=n)}e.textContent=n}var pe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},he=["Webkit","ms","Moz","O"];function me(e,n,t){return null==n||"boolean"==typeof n||""===n?"":t||"number"!=typeof n||0===n||pe.hasOwnProperty(e)&&pe[e]?(""+n).trim():n+"px"}function ge(e,n){for(var t in e=e.style,n)if(n.hasOwnProperty(t)){var r=0===t.indexOf("--"),l=me(t,n[t],r);"float"===t&&(t="cssFloat"),r?e.setProperty(t,l):e[t]=l}}Object.keys(pe).forEach((function(e){he.forEach((function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),pe[n]=pe[e]}))}));var ve=D({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ye(e,n){if(n){if(ve[e]&&(null!=n.children||null!=n.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=n.dangerouslySetInnerHTML){if(null!=n.children)throw Error(a(60));if("object"!=typeof n.dangerouslySetInnerHTML||!("__html"in n.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=n.style&&"object"!=typeof n.style)throw Error(a(62))}}function be(e,n){if(-1===e.indexOf("-"))return"string"==typeof n.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ke=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,xe=null,Ee=null;function _e(e){if(e=bl(e)){if("function"!=typeof Se)throw Error(a(280));var n=e.stateNode;n&&(n=wl(n),Se(e.stateNode,e.type,n))}}function Ce(e){xe?Ee?Ee.push(e):Ee=[e]:xe=e}function Ne(){if(xe){var e=xe,n=Ee;if(Ee=xe=null,_e(e),n)for(e=0;e<n.length;e++)_e(n[e])}}function Pe(e,n){return e(n)}function ze(){}var Te=!1;function Le(e,n,t){if(Te)return e(n,t);Te=!0;try{return Pe(e,n,t)}finally{Te=!1,(null!==xe||null!==Ee)&&(ze(),Ne())}}function Me(e,n){var t=e.stateNode;if(null===t)return null;var r=wl(t);if(null===r)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(t&&"function"!=typeof t)throw Error(a(231,n,typeof t));return t}var Re=!1;if(c)try{var Oe={};Object.defineProperty(Oe,"passive",{get:function(){Re=!0}}),window.addEventListener("test",Oe,Oe),window.removeEventListener("test",Oe,Oe)}catch(ce){Re=!1}function Ie(e,n,t,r,l,a,o,i,u){var s=Array.prototype.slice.call(arguments,3);try{n.apply(t,s)}catch(e){this.onError(e)}}var Fe=!1,De=null,Ue=!1,Ae=null,je={onError:function(e){Fe=!0,De=e}};function Ve(e,n,t,r,l,a,o,i,u){Fe=!1,De=null,Ie.apply(je,arguments)}function Be(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do{0!=(4098&(n=e).flags)&&(t=n.return),e=n.return}while(e)}return 3===n.tag?t:null}function $e(e){if(13===e.tag){var n=e.memoizedState;if(null===n&&null!==(e=e.alternate)&&(n=e.memoizedState),null!==n)return n.dehydrated}return null}function He(e){if(Be(e)!==e)throw Error(a(188))}function We(e){return null!==(e=function(e){var n=e.alternate;if(!n){if(null===(n=Be(e)))throw Error(a(188));return n!==e?null:e}for(var t=e,r=n;;){var l=t.return;if(null===l)break;var o=l.alternate;if(null===o){if(null!==(r=l.return)){t=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===t)return He(l),e;if(o===r)return He(l),n;o=o.sibling}throw Error(a(188))}if(t.return!==r.return)t=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===t){i=!0,t=l,r=o;break}if(u===r){i=!0,r=l,t=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===t){i=!0,t=o,r=l;break}if(u===r){i=!0,r=o,t=l;break}u=u.sibling}if(!i)throw Error(a(189))}}if(t.alternate!==r)throw Error(a(190))}if(3!==t.tag)throw Error(a(188));return t.stateNode.current===t?e:n}(e))?Qe(e):null}function Qe(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var n=Qe(e);if(null!==n)return n;e=e.sibling}return null}var qe=l.unstable_scheduleCallback,Ke=l.unstable_cancelCallback,Ye=l.unstable_shouldYield,Xe=l.unstable_requestPaint,Ge=l.unstable_now,Je=l.unstable_getCurrentPriorityLevel,Ze=l.unstable_ImmediatePriority,en=l.unstable_UserBlockingPriority,nn=l.unstable_NormalPriority,tn=l.unstable_LowPriority,rn=l.unstable_IdlePriority,ln=null,an=null,on=Math.clz32?Math.clz32:function(e){return 0==(e>>>=0)?32:31-(un(e)/sn|0)|0},un=Math.log,sn=Math.LN2,cn=64,fn=4194304;function dn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function pn(e,n){var t=e.pendingLanes;if(0===t)return 0;var r=0,l=e.suspendedLanes,a=e.pingedLanes,o=268435455&t;if(0!==o){var i=o&~l;0!==i?r=dn(i):0!=(a&=o)&&(r=dn(a))}else 0!=(o=t&~l)?r=dn(o):0!==a&&(r=dn(a));if(0===r)return 0;if(0!==n&&n!==r&&0==(n&l)&&((l=r&-r)>=(a=n&-n)||16===l&&0!=(4194240&a)))return n;if(0!=(4&r)&&(r|=16&t),0!==(n=e.entangledLanes))for(e=e.entanglements,n&=r;0<n;)l=1<<(t=31-on(n)),r|=e[t],n&=~l;return r}function hn(e,n){switch(e){case 1:case 2:case 4:return n+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n+5e3;default:return-1}}function mn(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function gn(){var e=cn;return 0==(4194240&(cn<<=1))&&(cn=64),e}function vn(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function yn(e,n,t){e.pendingLanes|=n,536870912!==n&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[n=31-on(n)]=t}function bn(e,n){var t=e.entangledLanes|=n;for(e=e.entanglements;t;){var r=31-on(t),l=1<<r;l&n|e[r]&n&&(e[r]|=n),t&=~l}}var kn=0;function wn(e){return 1<(e&=-e)?4<e?0!=(268435455&e)?16:536870912:4:1}var Sn,xn,En,_n,Cn,Nn=!1,Pn=[],zn=null,Tn=null,Ln=null,Mn=new Map,Rn=new Map,On=[],In="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Fn(e,n){switch(e){case"focusin":case"focusout":zn=null;break;case"dragenter":case"dragleave":Tn=null;break;case"mouseover":case"mouseout":Ln=null;break;case"pointerover":case"pointerout":Mn.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":Rn.delete(n.pointerId)}}function Dn(e,n,t,r,l,a){return null===e||e.nativeEvent!==a?(e={blockedOn:n,domEventName:t,eventSystemFlags:r,nativeEvent:a,targetContainers:[l]},null!==n&&null!==(n=bl(n))&&xn(n),e):(e.eventSystemFlags|=r,n=e.targetContainers,null!==l&&-1===n.indexOf(l)&&n.push(l),e)}function Un(e){var n=yl(e.target);if(null!==n){var t=Be(n);if(null!==t)if(13===(n=t.tag)){if(null!==(n=$e(t)))return e.blockedOn=n,void Cn(e.priority,(function(){En(t)}))}else if(3===n&&t.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===t.tag?t.stateNode.containerInfo:null)}e.blockedOn=null}function An(e){if(null!==e.blockedOn)return!1;for(var n=e.targetContainers;0<n.length;){var t=Xn(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t)return null!==(n=bl(t))&&xn(n),e.blockedOn=t,!1;var r=new(t=e.nativeEvent).constructor(t.type,t);ke=r,t.target.dispatchEvent(r),ke=null,n.shift()}return!0}function jn(e,n,t){An(e)&&t.delete(n)}function Vn(){Nn=!1,null!==zn&&An(zn)&&(zn=null),null!==Tn&&An(Tn)&&(Tn=null),null!==Ln&&An(Ln)&&(Ln=null),Mn.forEach(jn),Rn.forEach(jn)}function Bn(e,n){e.blockedOn===n&&(e.blockedOn=null,Nn||(Nn=!0,l.unstable_scheduleCallback(l.unstable_NormalPriority,Vn)))}function $n(e){function n(n){return Bn(n,e)}if(0<Pn.length){Bn(Pn[0],e);for(var t=1;t<Pn.length;t++){var r=Pn[t];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==zn&&Bn(zn,e),null!==Tn&&Bn(Tn,e),null!==Ln&&Bn(Ln,e),Mn.forEach(n),Rn.forEach(n),t=0;t<On.length;t++)(r=On[t]).blockedOn===e&&(r.blockedOn=null);for(;0<On.length&&null===(t=On[0]).blockedOn;)Un(t),null===t.blockedOn&&On.shift()}var Hn=k.ReactCurrentBatchConfig,Wn=!0;function Qn(e,n,t,r){var l=kn,a=Hn.transition;Hn.transition=null;try{kn=1,Kn(e,n,t,r)}finally{kn=l,Hn.transition=a}}function qn(e,n,t,r){var l=kn,a=Hn.transition;Hn.transition=null;try{kn=4,Kn(e,n,t,r)}finally{kn=l,Hn.transition=a}}function Kn(e,n,t,r){if(Wn){var l=Xn(e,n,t,r);if(null===l)Hr(e,n,r,Yn,t),Fn(e,r);else if(function(e,n,t,r,l){switch(n){case"focusin":return zn=Dn(zn,e,n,t,r,l),!0;case"dragenter":return Tn=Dn(Tn,e,n,t,r,l),!0;case"mouseover":return Ln=Dn(Ln,e,n,t,r,l),!0;case"pointerover":var a=l.pointerId;return Mn.set(a,Dn(Mn.get(a)||null,e,n,t,r,l)),!0;case"gotpointercapture":return a=l.pointerId,Rn.set(a,Dn(Rn.get(a)||null,e,n,t,r,l)),!0}return!1}(l,e,n,t,r))r.stopPropagation();else if(Fn(e,r),4&n&&-1<In.indexOf(e)){for(;null!==l;){var a=bl(l);if(null!==a&&Sn(a),null===(a=Xn(e,n,t,r))&&Hr(e,n,r,Yn,t),a===l)break;l=a}null!==l&&r.stopPropagation()}else Hr(e,n,r,null,t)}}var Yn=null;function Xn(e,n,t,r){if(Yn=null,null!==(e=yl(e=we(r))))if(null===(n=Be(e)))e=null;else if(13===(t=n.tag)){if(null!==(e=$e(n)))return e;e=null}else if(3===t){if(n.stateNode.current.memoizedState.isDehydrated)return 3===n.tag?n.stateNode.containerInfo:null;e=null}else n!==e&&(e=null);return Yn=e,null}function Gn(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Je()){case Ze:return 1;case en:return 4;case nn:case tn:return 16;case rn:return 536870912;default:return 16}default:return 16}}var Jn=null,Zn=null,et=null;function nt(){if(et)return et;var e,n,t=Zn,r=t.length,l="value"in Jn?Jn.value:Jn.textContent,a=l.length;for(e=0;e<r&&t[e]===l[e];e++);var o=r-e;for(n=1;n<=o&&t[r-n]===l[a-n];n++);return et=l.slice(e,1<n?1-n:void 0)}function tt(e){var n=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===n&&(e=13):e=n,10===e&&(e=13),32<=e||13===e?e:0}function rt(){return!0}function lt(){return!1}function at(e){function n(n,t,r,l,a){for(var o in this._reactName=n,this._targetInst=r,this.type=t,this.nativeEvent=l,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(o)&&(n=e[o],this[o]=n?n(l):l[o]);return this.isDefaultPrevented=(null!=l.defaultPrevented?l.defaultPrevented:!1===l.returnValue)?rt:lt,this.isPropagationStopped=lt,this}return D(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=rt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=rt)},persist:function(){},isPersistent:rt}),n}var ot,it,ut,st={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ct=at(st),ft=D({},st,{view:0,detail:0}),dt=at(ft),pt=D({},ft,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:_t,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ut&&(ut&&"mousemove"===e.type?(ot=e.screenX-ut.screenX,it=e.screenY-ut.screenY):it=ot=0,ut=e),ot)},movementY:function(e){return"movementY"in e?e.movementY:it}}),ht=at(pt),mt=at(D({},pt,{dataTransfer:0})),gt=at(D({},ft,{relatedTarget:0})),vt=at(D({},st,{animationName:0,elapsedTime:0,pseudoElement:0})),yt=D({},st,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bt=at(yt),kt=at(D({},st,{data:0})),wt={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},St={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},xt={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Et(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):!!(e=xt[e])&&!!n[e]}function _t(){return Et}var Ct=D({},ft,{key:function(e){if(e.key){var n=wt[e.key]||e.key;if("Unidentified"!==n)return n}return"keypress"===e.type?13===(e=tt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?St[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:_t,charCode:function(e){return"keypress"===e.type?tt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Nt=at(Ct),Pt=at(D({},pt,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),zt=at(D({},ft,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:_t})),Tt=at(D({},st,{propertyName:0,elapsedTime:0,pseudoElement:0})),Lt=D({},pt,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Mt=at(Lt),Rt=[9,13,27,32],Ot=c&&"CompositionEvent"in window,It=null;c&&"documentMode"in document&&(It=document.documentMode);var Ft=c&&"TextEvent"in window&&!It,Dt=c&&(!Ot||It&&8<It&&11>=It),Ut=String.fromCharCode(32),At=!1;function jt(e,n){switch(e){case"keyup":return-1!==Rt.indexOf(n.keyCode);case"keydown":return 229!==n.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vt(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Bt=!1,$t={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ht(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===n?!!$t[e.type]:"textarea"===n}function Wt(e,n,t,r){Ce(r),0<(n=Qr(n,"onChange")).length&&(t=new ct("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Qt=null,qt=null;function Kt(e){Ur(e,0)}function Yt(e){if(q(kl(e)))return e}function Xt(e,n){if("change"===e)return n}var Gt=!1;if(c){var Jt;if(c){var Zt="oninput"in document;if(!Zt){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zt="function"==typeof er.oninput}Jt=Zt}else Jt=!1;Gt=Jt&&(!document.documentMode||9<document.documentMode)}function nr(){Qt&&(Qt.detachEvent("onpropertychange",tr),qt=Qt=null)}function tr(e){if("value"===e.propertyName&&Yt(qt)){var n=[];Wt(n,qt,e,we(e)),Le(Kt,n)}}function rr(e,n,t){"focusin"===e?(nr(),qt=t,(Qt=n).attachEvent("onpropertychange",tr)):"focusout"===e&&nr()}function lr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yt(qt)}function ar(e,n){if("click"===e)return Yt(n)}function or(e,n){if("input"===e||"change"===e)return Yt(n)}var ir="function"==typeof Object.is?Object.is:function(e,n){return e===n&&(0!==e||1/e==1/n)||e!=e&&n!=n};function ur(e,n){if(ir(e,n))return!0;if("object"!=typeof e||null===e||"object"!=typeof n||null===n)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++){var l=t[r];if(!f.call(n,l)||!ir(e[l],n[l]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,n){var t,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(t=e+r.textContent.length,e<=n&&t>=n)return{node:r,offset:n-e};e=t}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function fr(e,n){return!(!e||!n)&&(e===n||(!e||3!==e.nodeType)&&(n&&3===n.nodeType?fr(e,n.parentNode):"contains"in e?e.contains(n):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(n))))}function dr(){for(var e=window,n=K();n instanceof e.HTMLIFrameElement;){try{var t="string"==typeof n.contentWindow.location.href}catch(e){t=!1}if(!t)break;n=K((e=n.contentWindow).document)}return n}function pr(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&("input"===n&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===n||"true"===e.contentEditable)}function hr(e){var n=dr(),t=e.focusedElem,r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&fr(t.ownerDocument.documentElement,t)){if(null!==r&&pr(t))if(n=r.start,void 0===(e=r.end)&&(e=n),"selectionStart"in t)t.selectionStart=n,t.selectionEnd=Math.min(e,t.value.length);else if((e=(n=t.ownerDocument||document)&&n.defaultView||window).getSelection){e=e.getSelection();var l=t.textContent.length,a=Math.min(r.start,l);r=void 0===r.end?a:Math.min(r.end,l),!e.extend&&a>r&&(l=r,r=a,a=l),l=cr(t,a);var o=cr(t,r);l&&o&&(1!==e.rangeCount||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&((n=n.createRange()).setStart(l.node,l.offset),e.removeAllRanges(),a>r?(e.addRange(n),e.extend(o.node,o.offset)):(n.setEnd(o.node,o.offset),e.addRange(n)))}for(n=[],e=t;e=e.parentNode;)1===e.nodeType&&n.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"==typeof t.focus&&t.focus(),t=0;t<n.length;t++)(e=n[t]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var mr=c&&"documentMode"in document&&11>=document.documentMode,gr=null,vr=null,yr=null,br=!1;function kr(e,n,t){var r=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;br||null==gr||gr!==K(r)||(r="selectionStart"in(r=gr)&&pr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},yr&&ur(yr,r)||(yr=r,0<(r=Qr(vr,"onSelect")).length&&(n=new ct("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=gr)))}function wr(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var Sr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},xr={},Er={};function _r(e){if(xr[e])return xr[e];if(!Sr[e])return e;var n,t=Sr[e];for(n in t)if(t.hasOwnProperty(n)&&n in Er)return xr[e]=t[n];return e}c&&(Er=document.createElement("div").style,"AnimationEvent"in window||(delete Sr.animationend.animation,delete Sr.animationiteration.animation,delete Sr.animationstart.animation),"TransitionEvent"in window||delete Sr.transitionend.transition);var Cr=_r("animationend"),Nr=_r("animationiteration"),Pr=_r("animationstart"),zr=_r("transitionend"),Tr=new Map,Lr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Mr(e,n){Tr.set(e,n),u(n,[e])}for(var Rr=0;Rr<Lr.length;Rr++){var Or=Lr[Rr];Mr(Or.toLowerCase(),"on"+(Or[0].toUpperCase()+Or.slice(1)))}Mr(Cr,"onAnimationEnd"),Mr(Nr,"onAnimationIteration"),Mr(Pr,"onAnimationStart"),Mr("dblclick","onDoubleClick"),Mr("focusin","onFocus"),Mr("focusout","onBlur"),Mr(zr,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ir="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Fr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ir));function Dr(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,function(e,n,t,r,l,o,i,u,s){if(Ve.apply(this,arguments),Fe){if(!Fe)throw Error(a(198));var c=De;Fe=!1,De=null,Ue||(Ue=!0,Ae=c)}}(r,n,void 0,e),e.currentTarget=null}function Ur(e,n){n=0!=(4&n);for(var t=0;t<e.length;t++){var r=e[t],l=r.event;r=r.listeners;e:{var a=void 0;if(n)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==a&&l.isPropagationStopped())break e;Dr(l,i,s),a=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==a&&l.isPropagationStopped())break e;Dr(l,i,s),a=u}}}if(Ue)throw e=Ae,Ue=!1,Ae=null,e}function Ar(e,n){var t=n[ml];void 0===t&&(t=n[ml]=new Set);var r=e+"__bubble";t.has(r)||($r(n,e,2,!1),t.add(r))}function jr(e,n,t){var r=0;n&&(r|=4),$r(t,e,r,n)}var Vr="_reactListening"+Math.random().toString(36).slice(2);function Br(e){if(!e[Vr]){e[Vr]=!0,o.forEach((function(n){"selectionchange"!==n&&(Fr.has(n)||jr(n,!1,e),jr(n,!0,e))}));var n=9===e.nodeType?e:e.ownerDocument;null===n||n[Vr]||(n[Vr]=!0,jr("selectionchange",!1,n))}}function $r(e,n,t,r){switch(Gn(n)){case 1:var l=Qn;break;case 4:l=qn;break;default:l=Kn}t=l.bind(null,n,t,e),l=void 0,!Re||"touchstart"!==n&&"touchmove"!==n&&"wheel"!==n||(l=!0),r?void 0!==l?e.addEventListener(n,t,{capture:!0,passive:l}):e.addEventListener(n,t,!0):void 0!==l?e.addEventListener(n,t,{passive:l}):e.addEventListener(n,t,!1)}function Hr(e,n,t,r,l){var a=r;if(0==(1&n)&&0==(2&n)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===l||8===i.nodeType&&i.parentNode===l)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===l||8===u.nodeType&&u.parentNode===l))return;o=o.return}for(;null!==i;){if(null===(o=yl(i)))return;if(5===(u=o.tag)||6===u){r=a=o;continue e}i=i.parentNode}}r=r.return}Le((function(){var r=a,l=we(t),o=[];e:{var i=Tr.get(e);if(void 0!==i){var u=ct,s=e;switch(e){case"keypress":if(0===tt(t))break e;case"keydown":case"keyup":u=Nt;break;case"focusin":s="focus",u=gt;break;case"focusout":s="blur",u=gt;break;case"beforeblur":case"afterblur":u=gt;break;case"click":if(2===t.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=ht;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=mt;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=zt;break;case Cr:case Nr:case Pr:u=vt;break;case zr:u=Tt;break;case"scroll":u=dt;break;case"wheel":u=Mt;break;case"copy":case"cut":case"paste":u=bt;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=Pt}var c=0!=(4&n),f=!c&&"scroll"===e,d=c?null!==i?i+"Capture":null:i;c=[];for(var p,h=r;null!==h;){var m=(p=h).stateNode;if(5===p.tag&&null!==m&&(p=m,null!==d&&null!=(m=Me(h,d))&&c.push(Wr(h,m,p))),f)break;h=h.return}0<c.length&&(i=new u(i,s,null,t,l),o.push({event:i,listeners:c}))}}if(0==(7&n)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||t===ke||!(s=t.relatedTarget||t.fromElement)||!yl(s)&&!s[hl])&&(u||i)&&(i=l.window===l?l:(i=l.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=t.relatedTarget||t.toElement)?yl(s):null)&&(s!==(f=Be(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(u=null,s=r),u!==s)){if(c=ht,m="onMouseLeave",d="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(c=Pt,m="onPointerLeave",d="onPointerEnter",h="pointer"),f=null==u?i:kl(u),p=null==s?i:kl(s),(i=new c(m,h+"leave",u,t,l)).target=f,i.relatedTarget=p,m=null,yl(l)===r&&((c=new c(d,h+"enter",s,t,l)).target=p,c.relatedTarget=f,m=c),f=m,u&&s)e:{for(d=s,h=0,p=c=u;p;p=qr(p))h++;for(p=0,m=d;m;m=qr(m))p++;for(;0<h-p;)c=qr(c),h--;for(;0<p-h;)d=qr(d),p--;for(;h--;){if(c===d||null!==d&&c===d.alternate)break e;c=qr(c),d=qr(d)}c=null}else c=null;null!==u&&Kr(o,i,u,c,!1),null!==s&&null!==f&&Kr(o,f,s,c,!0)}if("select"===(u=(i=r?kl(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=Xt;else if(Ht(i))if(Gt)g=or;else{g=lr;var v=rr}else(u=i.nodeName)&&"input"===u.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(g=ar);switch(g&&(g=g(e,r))?Wt(o,g,t,l):(v&&v(e,i,r),"focusout"===e&&(v=i._wrapperState)&&v.controlled&&"number"===i.type&&ee(i,"number",i.value)),v=r?kl(r):window,e){case"focusin":(Ht(v)||"true"===v.contentEditable)&&(gr=v,vr=r,yr=null);break;case"focusout":yr=vr=gr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,kr(o,t,l);break;case"selectionchange":if(mr)break;case"keydown":case"keyup":kr(o,t,l)}var y;if(Ot)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Bt?jt(e,t)&&(b="onCompositionEnd"):"keydown"===e&&229===t.keyCode&&(b="onCompositionStart");b&&(Dt&&"ko"!==t.locale&&(Bt||"onCompositionStart"!==b?"onCompositionEnd"===b&&Bt&&(y=nt()):(Zn="value"in(Jn=l)?Jn.value:Jn.textContent,Bt=!0)),0<(v=Qr(r,b)).length&&(b=new kt(b,e,null,t,l),o.push({event:b,listeners:v}),(y||null!==(y=Vt(t)))&&(b.data=y))),(y=Ft?function(e,n){switch(e){case"compositionend":return Vt(n);case"keypress":return 32!==n.which?null:(At=!0,Ut);case"textInput":return(e=n.data)===Ut&&At?null:e;default:return null}}(e,t):function(e,n){if(Bt)return"compositionend"===e||!Ot&&jt(e,n)?(e=nt(),et=Zn=Jn=null,Bt=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Dt&&"ko"!==n.locale?null:n.data}}(e,t))&&0<(r=Qr(r,"onBeforeInput")).length&&(l=new kt("onBeforeInput","beforeinput",null,t,l),o.push({event:l,listeners:r}),l.data=y)}Ur(o,n)}))}function Wr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Qr(e,n){for(var t=n+"Capture",r=[];null!==e;){var l=e,a=l.stateNode;5===l.tag&&null!==a&&(l=a,null!=(a=Me(e,t))&&r.unshift(Wr(e,a,l)),null!=(a=Me(e,n))&&r.push(Wr(e,a,l))),e=e.return}return r}function qr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Kr(e,n,t,r,l){for(var a=n._reactName,o=[];null!==t&&t!==r;){var i=t,u=i.alternate,s=i.stateNode;if(null!==u&&u===r)break;5===i.tag&&null!==s&&(i=s,l?null!=(u=Me(t,a))&&o.unshift(Wr(t,u,i)):l||null!=(u=Me(t,a))&&o.push(Wr(t,u,i))),t=t.return}0!==o.length&&e.push({event:n,listeners:o})}var Yr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Gr(e){return("string"==typeof e?e:""+e).replace(Yr,"\n").replace(Xr,"")}function Jr(e,n,t){if(n=Gr(n),Gr(e)!==n&&t)throw Error(a(425))}function Zr(){}var el=null,nl=null;function tl(e,n){return"textarea"===e||"noscript"===e||"string"==typeof n.children||"number"==typeof n.children||"object"==typeof n.dangerouslySetInnerHTML&&null!==n.dangerouslySetInnerHTML&&null!=n.dangerouslySetInnerHTML.__html}var rl="function"==typeof setTimeout?setTimeout:void 0,ll="function"==typeof clearTimeout?clearTimeout:void 0,al="function"==typeof Promise?Promise:void 0,ol="function"==typeof queueMicrotask?queueMicrotask:void 0!==al?function(e){return al.resolve(null).then(e).catch(il)}:rl;function il(e){setTimeout((function(){throw e}))}function ul(e,n){var t=n,r=0;do{var l=t.nextSibling;if(e.removeChild(t),l&&8===l.nodeType)if("/$"===(t=l.data)){if(0===r)return e.removeChild(l),void $n(n);r--}else"$"!==t&&"$?"!==t&&"$!"!==t||r++;t=l}while(t);$n(n)}function sl(e){for(;null!=e;e=e.nextSibling){var n=e.nodeType;if(1===n||3===n)break;if(8===n){if("$"===(n=e.data)||"$!"===n||"$?"===n)break;if("/$"===n)return null}}return e}function cl(e){e=e.previousSibling;for(var n=0;e;){if(8===e.nodeType){var t=e.data;if("$"===t||"$!"===t||"$?"===t){if(0===n)return e;n--}else"/$"===t&&n++}e=e.previousSibling}return null}var fl=Math.random().toString(36).slice(2),dl="__reactFiber$"+fl,pl="__reactProps$"+fl,hl="__reactContainer$"+fl,ml="__reactEvents$"+fl,gl="__reactListeners$"+fl,vl="__reactHandles$"+fl;function yl(e){var n=e[dl];if(n)return n;for(var t=e.parentNode;t;){if(n=t[hl]||t[dl]){if(t=n.alternate,null!==n.child||null!==t&&null!==t.child)for(e=cl(e);null!==e;){if(t=e[dl])return t;e=cl(e)}return n}t=(e=t).parentNode}return null}function bl(e){return!(e=e[dl]||e[hl])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function kl(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function wl(e){return e[pl]||null}var Sl=[],xl=-1;function El(e){return{current:e}}function _l(e){0>xl||(e.current=Sl[xl],Sl[xl]=null,xl--)}function Cl(e,n){xl++,Sl[xl]=e.current,e.current=n}var Nl={},Pl=El(Nl),zl=El(!1),Tl=Nl;function Ll(e,n){var t=e.type.contextTypes;if(!t)return Nl;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var l,a={};for(l in t)a[l]=n[l];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=a),a}function Ml(e){return null!=e.childContextTypes}function Rl(){_l(zl),_l(Pl)}function Ol(e,n,t){if(Pl.current!==Nl)throw Error(a(168));Cl(Pl,n),Cl(zl,t)}function Il(e,n,t){var r=e.stateNode;if(n=n.childContextTypes,"function"!=typeof r.getChildContext)return t;for(var l in r=r.getChildContext())if(!(l in n))throw Error(a(108,$(e)||"Unknown",l));return D({},t,r)}function Fl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Nl,Tl=Pl.current,Cl(Pl,e),Cl(zl,zl.current),!0}function Dl(e,n,t){var r=e.stateNode;if(!r)throw Error(a(169));t?(e=Il(e,n,Tl),r.__reactInternalMemoizedMergedChildContext=e,_l(zl),_l(Pl),Cl(Pl,e)):_l(zl),Cl(zl,t)}var Ul=null,Al=!1,jl=!1;function Vl(e){null===Ul?Ul=[e]:Ul.push(e)}function Bl(){if(!jl&&null!==Ul){jl=!0;var e=0,n=kn;try{var t=Ul;for(kn=1;e<t.length;e++){var r=t[e];do{r=r(!0)}while(null!==r)}Ul=null,Al=!1}catch(n){throw null!==Ul&&(Ul=Ul.slice(e+1)),qe(Ze,Bl),n}finally{kn=n,jl=!1}}return null}var $l=[],Hl=0,Wl=null,Ql=0,ql=[],Kl=0,Yl=null,Xl=1,Gl="";function Jl(e,n){$l[Hl++]=Ql,$l[Hl++]=Wl,Wl=e,Ql=n}function Zl(e,n,t){ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Yl=e;var r=Xl;e=Gl;var l=32-on(r)-1;r&=~(1<<l),t+=1;var a=32-on(n)+l;if(30<a){var o=l-l%5;a=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Xl=1<<32-on(n)+l|t<<l|r,Gl=a+e}else Xl=1<<a|t<<l|r,Gl=e}function ea(e){null!==e.return&&(Jl(e,1),Zl(e,1,0))}function na(e){for(;e===Wl;)Wl=$l[--Hl],$l[Hl]=null,Ql=$l[--Hl],$l[Hl]=null;for(;e===Yl;)Yl=ql[--Kl],ql[Kl]=null,Gl=ql[--Kl],ql[Kl]=null,Xl=ql[--Kl],ql[Kl]=null}var ta=null,ra=null,la=!1,aa=null;function oa(e,n){var t=Ls(5,null,null,0);t.elementType="DELETED",t.stateNode=n,t.return=e,null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)}function ia(e,n){switch(e.tag){case 5:var t=e.type;return null!==(n=1!==n.nodeType||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n)&&(e.stateNode=n,ta=e,ra=sl(n.firstChild),!0);case 6:return null!==(n=""===e.pendingProps||3!==n.nodeType?null:n)&&(e.stateNode=n,ta=e,ra=null,!0);case 13:return null!==(n=8!==n.nodeType?null:n)&&(t=null!==Yl?{id:Xl,overflow:Gl}:null,e.memoizedState={dehydrated:n,treeContext:t,retryLane:1073741824},(t=Ls(18,null,null,0)).stateNode=n,t.return=e,e.child=t,ta=e,ra=null,!0);default:return!1}}function ua(e){return 0!=(1&e.mode)&&0==(128&e.flags)}function sa(e){if(la){var n=ra;if(n){var t=n;if(!ia(e,n)){if(ua(e))throw Error(a(418));n=sl(t.nextSibling);var r=ta;n&&ia(e,n)?oa(r,t):(e.flags=-4097&e.flags|2,la=!1,ta=e)}}else{if(ua(e))throw Error(a(418));e.flags=-4097&e.flags|2,la=!1,ta=e}}}function ca(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ta=e}function fa(e){if(e!==ta)return!1;if(!la)return ca(e),la=!0,!1;var n;if((n=3!==e.tag)&&!(n=5!==e.tag)&&(n="head"!==(n=e.type)&&"body"!==n&&!tl(e.type,e.memoizedProps)),n&&(n=ra)){if(ua(e))throw da(),Error(a(418));for(;n;)oa(e,n),n=sl(n.nextSibling)}if(ca(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType){var t=e.data;if("/$"===t){if(0===n){ra=sl(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++}e=e.nextSibling}ra=null}}else ra=ta?sl(e.stateNode.nextSibling):null;return!0}function da(){for(var e=ra;e;)e=sl(e.nextSibling)}function pa(){ra=ta=null,la=!1}function ha(e){null===aa?aa=[e]:aa.push(e)}var ma=k.ReactCurrentBatchConfig;function ga(e,n){if(e&&e.defaultProps){for(var t in n=D({},n),e=e.defaultProps)void 0===n[t]&&(n[t]=e[t]);return n}return n}var va=El(null),ya=null,ba=null,ka=null;function wa(){ka=ba=ya=null}function Sa(e){var n=va.current;_l(va),e._currentValue=n}function xa(e,n,t){for(;null!==e;){var r=e.alternate;if((e.childLanes&n)!==n?(e.childLanes|=n,null!==r&&(r.childLanes|=n)):null!==r&&(r.childLanes&n)!==n&&(r.childLanes|=n),e===t)break;e=e.return}}function Ea(e,n){ya=e,ka=ba=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!=(e.lanes&n)&&(ki=!0),e.firstContext=null)}function _a(e){var n=e._currentValue;if(ka!==e)if(e={context:e,memoizedValue:n,next:null},null===ba){if(null===ya)throw Error(a(308));ba=e,ya.dependencies={lanes:0,firstContext:e}}else ba=ba.next=e;return n}var Ca=null;function Na(e){null===Ca?Ca=[e]:Ca.push(e)}function Pa(e,n,t,r){var l=n.interleaved;return null===l?(t.next=t,Na(n)):(t.next=l.next,l.next=t),n.interleaved=t,za(e,r)}function za(e,n){e.lanes|=n;var t=e.alternate;for(null!==t&&(t.lanes|=n),t=e,e=e.return;null!==e;)e.childLanes|=n,null!==(t=e.alternate)&&(t.childLanes|=n),t=e,e=e.return;return 3===t.tag?t.stateNode:null}var Ta=!1;function La(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Ma(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ra(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function Oa(e,n,t){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!=(2&Pu)){var l=r.pending;return null===l?n.next=n:(n.next=l.next,l.next=n),r.pending=n,za(e,t)}return null===(l=r.interleaved)?(n.next=n,Na(r)):(n.next=l.next,l.next=n),r.interleaved=n,za(e,t)}function Ia(e,n,t){if(null!==(n=n.updateQueue)&&(n=n.shared,0!=(4194240&t))){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}function Fa(e,n){var t=e.updateQueue,r=e.alternate;if(null!==r&&t===(r=r.updateQueue)){var l=null,a=null;if(null!==(t=t.firstBaseUpdate)){do{var o={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};null===a?l=a=o:a=a.next=o,t=t.next}while(null!==t);null===a?l=a=n:a=a.next=n}else l=a=n;return t={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=t)}null===(e=t.lastBaseUpdate)?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function Da(e,n,t,r){var l=e.updateQueue;Ta=!1;var a=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(null!==i){l.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?a=s:o.next=s,o=u;var c=e.alternate;null!==c&&(i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u)}if(null!==a){var f=l.baseState;for(o=0,c=s=u=null,i=a;;){var d=i.lane,p=i.eventTime;if((r&d)===d){null!==c&&(c=c.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var h=e,m=i;switch(d=n,p=t,m.tag){case 1:if("function"==typeof(h=m.payload)){f=h.call(p,f,d);break e}f=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null==(d="function"==typeof(h=m.payload)?h.call(p,f,d):h))break e;f=D({},f,d);break e;case 2:Ta=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(d=l.effects)?l.effects=[i]:d.push(i))}else p={eventTime:p,lane:d,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=f):c=c.next=p,o|=d;if(null===(i=i.next)){if(null===(i=l.shared.pending))break;i=(d=i).next,d.next=null,l.lastBaseUpdate=d,l.shared.pending=null}}if(null===c&&(u=f),l.baseState=u,l.firstBaseUpdate=s,l.lastBaseUpdate=c,null!==(n=l.shared.interleaved)){l=n;do{o|=l.lane,l=l.next}while(l!==n)}else null===a&&(l.shared.lanes=0);Fu|=o,e.lanes=o,e.memoizedState=f}}function Ua(e,n,t){if(e=n.effects,n.effects=null,null!==e)for(n=0;n<e.length;n++){var r=e[n],l=r.callback;if(null!==l){if(r.callback=null,r=t,"function"!=typeof l)throw Error(a(191,l));l.call(r)}}}var Aa=(new r.Component).refs;function ja(e,n,t,r){t=null==(t=t(r,n=e.memoizedState))?n:D({},n,t),e.memoizedState=t,0===e.lanes&&(e.updateQueue.baseState=t)}var Va={isMounted:function(e){return!!(e=e._reactInternals)&&Be(e)===e},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ra(r,l);a.payload=n,null!=t&&(a.callback=t),null!==(n=Oa(e,a,l))&&(ts(n,e,l,r),Ia(n,e,l))},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ra(r,l);a.tag=1,a.payload=n,null!=t&&(a.callback=t),null!==(n=Oa(e,a,l))&&(ts(n,e,l,r),Ia(n,e,l))},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=es(),r=ns(e),l=Ra(t,r);l.tag=2,null!=n&&(l.callback=n),null!==(n=Oa(e,l,r))&&(ts(n,e,r,t),Ia(n,e,r))}};function Ba(e,n,t,r,l,a,o){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!(n.prototype&&n.prototype.isPureReactComponent&&ur(t,r)&&ur(l,a))}function $a(e,n,t){var r=!1,l=Nl,a=n.contextType;return"object"==typeof a&&null!==a?a=_a(a):(l=Ml(n)?Tl:Pl.current,a=(r=null!=(r=n.contextTypes))?Ll(e,l):Nl),n=new n(t,a),e.memoizedState=null!==n.state&&void 0!==n.state?n.state:null,n.updater=Va,e.stateNode=n,n._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=a),n}function Ha(e,n,t,r){e=n.state,"function"==typeof n.componentWillReceiveProps&&n.componentWillReceiveProps(t,r),"function"==typeof n.UNSAFE_componentWillReceiveProps&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&Va.enqueueReplaceState(n,n.state,null)}function Wa(e,n,t,r){var l=e.stateNode;l.props=t,l.state=e.memoizedState,l.refs=Aa,La(e);var a=n.contextType;"object"==typeof a&&null!==a?l.context=_a(a):(a=Ml(n)?Tl:Pl.current,l.context=Ll(e,a)),l.state=e.memoizedState,"function"==typeof(a=n.getDerivedStateFromProps)&&(ja(e,n,a,t),l.state=e.memoizedState),"function"==typeof n.getDerivedStateFromProps||"function"==typeof l.getSnapshotBeforeUpdate||"function"!=typeof l.UNSAFE_componentWillMount&&"function"!=typeof l.componentWillMount||(n=l.state,"function"==typeof l.componentWillMount&&l.componentWillMount(),"function"==typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),n!==l.state&&Va.enqueueReplaceState(l,l.state,null),Da(e,t,l,r),l.state=e.memoizedState),"function"==typeof l.componentDidMount&&(e.flags|=4194308)}function Qa(e,n,t){if(null!==(e=t.ref)&&"function"!=typeof e&&"object"!=typeof e){if(t._owner){if(t=t._owner){if(1!==t.tag)throw Error(a(309));var r=t.stateNode}if(!r)throw Error(a(147,e));var l=r,o=""+e;return null!==n&&null!==n.ref&&"function"==typeof n.ref&&n.ref._stringRef===o?n.ref:(n=function(e){var n=l.refs;n===Aa&&(n=l.refs={}),null===e?delete n[o]:n[o]=e},n._stringRef=o,n)}if("string"!=typeof e)throw Error(a(284));if(!t._owner)throw Error(a(290,e))}return e}function qa(e,n){throw e=Object.prototype.toString.call(n),Error(a(31,"[object Object]"===e?"object with keys {"+Object.keys(n).join(", ")+"}":e))}function Ka(e){return(0,e._init)(e._payload)}function Ya(e){function n(n,t){if(e){var r=n.deletions;null===r?(n.deletions=[t],n.flags|=16):r.push(t)}}function t(t,r){if(!e)return null;for(;null!==r;)n(t,r),r=r.sibling;return null}function r(e,n){for(e=new Map;null!==n;)null!==n.key?e.set(n.key,n):e.set(n.index,n),n=n.sibling;return e}function l(e,n){return(e=Rs(e,n)).index=0,e.sibling=null,e}function o(n,t,r){return n.index=r,e?null!==(r=n.alternate)?(r=r.index)<t?(n.flags|=2,t):r:(n.flags|=2,t):(n.flags|=1048576,t)}function i(n){return e&&null===n.alternate&&(n.flags|=2),n}function u(e,n,t,r){return null===n||6!==n.tag?((n=Ds(t,e.mode,r)).return=e,n):((n=l(n,t)).return=e,n)}function s(e,n,t,r){var a=t.type;return a===x?f(e,n,t.props.children,r,t.key):null!==n&&(n.elementType===a||"object"==typeof a&&null!==a&&a.$$typeof===M&&Ka(a)===n.type)?((r=l(n,t.props)).ref=Qa(e,n,t),r.return=e,r):((r=Os(t.type,t.key,t.props,null,e.mode,r)).ref=Qa(e,n,t),r.return=e,r)}function c(e,n,t,r){return null===n||4!==n.tag||n.stateNode.containerInfo!==t.containerInfo||n.stateNode.implementation!==t.implementation?((n=Us(t,e.mode,r)).return=e,n):((n=l(n,t.children||[])).return=e,n)}function f(e,n,t,r,a){return null===n||7!==n.tag?((n=Is(t,e.mode,r,a)).return=e,n):((n=l(n,t)).return=e,n)}function d(e,n,t){if("string"==typeof n&&""!==n||"number"==typeof n)return(n=Ds(""+n,e.mode,t)).return=e,n;if("object"==typeof n&&null!==n){switch(n.$$typeof){case w:return(t=Os(n.type,n.key,n.props,null,e.mode,t)).ref=Qa(e,null,n),t.return=e,t;case S:return(n=Us(n,e.mode,t)).return=e,n;case M:return d(e,(0,n._init)(n._payload),t)}if(ne(n)||I(n))return(n=Is(n,e.mode,t,null)).return=e,n;qa(e,n)}return null}function p(e,n,t,r){var l=null!==n?n.key:null;if("string"==typeof t&&""!==t||"number"==typeof t)return null!==l?null:u(e,n,""+t,r);if("object"==typeof t&&null!==t){switch(t.$$typeof){case w:return t.key===l?s(e,n,t,r):null;case S:return t.key===l?c(e,n,t,r):null;case M:return p(e,n,(l=t._init)(t._payload),r)}if(ne(t)||I(t))return null!==l?null:f(e,n,t,r,null);qa(e,t)}return null}function h(e,n,t,r,l){if("string"==typeof r&&""!==r||"number"==typeof r)return u(n,e=e.get(t)||null,""+r,l);if("object"==typeof r&&null!==r){switch(r.$$typeof){case w:return s(n,e=e.get(null===r.key?t:r.key)||null,r,l);case S:return c(n,e=e.get(null===r.key?t:r.key)||null,r,l);case M:return h(e,n,t,(0,r._init)(r._payload),l)}if(ne(r)||I(r))return f(n,e=e.get(t)||null,r,l,null);qa(n,r)}return null}function m(l,a,i,u){for(var s=null,c=null,f=a,m=a=0,g=null;null!==f&&m<i.length;m++){f.index>m?(g=f,f=null):g=f.sibling;var v=p(l,f,i[m],u);if(null===v){null===f&&(f=g);break}e&&f&&null===v.alternate&&n(l,f),a=o(v,a,m),null===c?s=v:c.sibling=v,c=v,f=g}if(m===i.length)return t(l,f),la&&Jl(l,m),s;if(null===f){for(;m<i.length;m++)null!==(f=d(l,i[m],u))&&(a=o(f,a,m),null===c?s=f:c.sibling=f,c=f);return la&&Jl(l,m),s}for(f=r(l,f);m<i.length;m++)null!==(g=h(f,l,m,i[m],u))&&(e&&null!==g.alternate&&f.delete(null===g.key?m:g.key),a=o(g,a,m),null===c?s=g:c.sibling=g,c=g);return e&&f.forEach((function(e){return n(l,e)})),la&&Jl(l,m),s}function g(l,i,u,s){var c=I(u);if("function"!=typeof c)throw Error(a(150));if(null==(u=c.call(u)))throw Error(a(151));for(var f=c=null,m=i,g=i=0,v=null,y=u.next();null!==m&&!y.done;g++,y=u.next()){m.index>g?(v=m,m=null):v=m.sibling;var b=p(l,m,y.value,s);if(null===b){null===m&&(m=v);break}e&&m&&null===b.alternate&&n(l,m),i=o(b,i,g),null===f?c=b:f.sibling=b,f=b,m=v}if(y.done)return t(l,m),la&&Jl(l,g),c;if(null===m){for(;!y.done;g++,y=u.next())null!==(y=d(l,y.value,s))&&(i=o(y,i,g),null===f?c=y:f.sibling=y,f=y);return la&&Jl(l,g),c}for(m=r(l,m);!y.done;g++,y=u.next())null!==(y=h(m,l,g,y.value,s))&&(e&&null!==y.alternate&&m.delete(null===y.key?g:y.key),i=o(y,i,g),null===f?c=y:f.sibling=y,f=y);return e&&m.forEach((function(e){return n(l,e)})),la&&Jl(l,g),c}return function e(r,a,o,u){if("object"==typeof o&&null!==o&&o.type===x&&null===o.key&&(o=o.props.children),"object"==typeof o&&null!==o){switch(o.$$typeof){case w:e:{for(var s=o.key,c=a;null!==c;){if(c.key===s){if((s=o.type)===x){if(7===c.tag){t(r,c.sibling),(a=l(c,o.props.children)).return=r,r=a;break e}}else if(c.elementType===s||"object"==typeof s&&null!==s&&s.$$typeof===M&&Ka(s)===c.type){t(r,c.sibling),(a=l(c,o.props)).ref=Qa(r,c,o),a.return=r,r=a;break e}t(r,c);break}n(r,c),c=c.sibling}o.type===x?((a=Is(o.props.children,r.mode,u,o.key)).return=r,r=a):((u=Os(o.type,o.key,o.props,null,r.mode,u)).ref=Qa(r,a,o),u.return=r,r=u)}return i(r);case S:e:{for(c=o.key;null!==a;){if(a.key===c){if(4===a.tag&&a.stateNode.containerInfo===o.containerInfo&&a.stateNode.implementation===o.implementation){t(r,a.sibling),(a=l(a,o.children||[])).return=r,r=a;break e}t(r,a);break}n(r,a),a=a.sibling}(a=Us(o,r.mode,u)).return=r,r=a}return i(r);case M:return e(r,a,(c=o._init)(o._payload),u)}if(ne(o))return m(r,a,o,u);if(I(o))return g(r,a,o,u);qa(r,o)}return"string"==typeof o&&""!==o||"number"==typeof o?(o=""+o,null!==a&&6===a.tag?(t(r,a.sibling),(a=l(a,o)).return=r,r=a):(t(r,a),(a=Ds(o,r.mode,u)).return=r,r=a),i(r)):t(r,a)}}var Xa=Ya(!0),Ga=Ya(!1),Ja={},Za=El(Ja),eo=El(Ja),no=El(Ja);function to(e){if(e===Ja)throw Error(a(174));return e}function ro(e,n){switch(Cl(no,n),Cl(eo,e),Cl(Za,Ja),e=n.nodeType){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:ue(null,"");break;default:n=ue(n=(e=8===e?n.parentNode:n).namespaceURI||null,e=e.tagName)}_l(Za),Cl(Za,n)}function lo(){_l(Za),_l(eo),_l(no)}function ao(e){to(no.current);var n=to(Za.current),t=ue(n,e.type);n!==t&&(Cl(eo,e),Cl(Za,t))}function oo(e){eo.current===e&&(_l(Za),_l(eo))}var io=El(0);function uo(e){for(var n=e;null!==n;){if(13===n.tag){var t=n.memoizedState;if(null!==t&&(null===(t=t.dehydrated)||"$?"===t.data||"$!"===t.data))return n}else if(19===n.tag&&void 0!==n.memoizedProps.revealOrder){if(0!=(128&n.flags))return n}else if(null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var so=[];function co(){for(var e=0;e<so.length;e++)so[e]._workInProgressVersionPrimary=null;so.length=0}var fo=k.ReactCurrentDispatcher,po=k.ReactCurrentBatchConfig,ho=0,mo=null,go=null,vo=null,yo=!1,bo=!1,ko=0,wo=0;function So(){throw Error(a(321))}function xo(e,n){if(null===n)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!ir(e[t],n[t]))return!1;return!0}function Eo(e,n,t,r,l,o){if(ho=o,mo=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,fo.current=null===e||null===e.memoizedState?ii:ui,e=t(r,l),bo){o=0;do{if(bo=!1,ko=0,25<=o)throw Error(a(301));o+=1,vo=go=null,n.updateQueue=null,fo.current=si,e=t(r,l)}while(bo)}if(fo.current=oi,n=null!==go&&null!==go.next,ho=0,vo=go=mo=null,yo=!1,n)throw Error(a(300));return e}function _o(){var e=0!==ko;return ko=0,e}function Co(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===vo?mo.memoizedState=vo=e:vo=vo.next=e,vo}function No(){if(null===go){var e=mo.alternate;e=null!==e?e.memoizedState:null}else e=go.next;var n=null===vo?mo.memoizedState:vo.next;if(null!==n)vo=n,go=e;else{if(null===e)throw Error(a(310));e={memoizedState:(go=e).memoizedState,baseState:go.baseState,baseQueue:go.baseQueue,queue:go.queue,next:null},null===vo?mo.memoizedState=vo=e:vo=vo.next=e}return vo}function Po(e,n){return"function"==typeof n?n(e):n}function zo(e){var n=No(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=go,l=r.baseQueue,o=t.pending;if(null!==o){if(null!==l){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,t.pending=null}if(null!==l){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var f=c.lane;if((ho&f)===f)null!==s&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var d={lane:f,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===s?(u=s=d,i=r):s=s.next=d,mo.lanes|=f,Fu|=f}c=c.next}while(null!==c&&c!==o);null===s?i=r:s.next=u,ir(r,n.memoizedState)||(ki=!0),n.memoizedState=r,n.baseState=i,n.baseQueue=s,t.lastRenderedState=r}if(null!==(e=t.interleaved)){l=e;do{o=l.lane,mo.lanes|=o,Fu|=o,l=l.next}while(l!==e)}else null===l&&(t.lanes=0);return[n.memoizedState,t.dispatch]}function To(e){var n=No(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=t.dispatch,l=t.pending,o=n.memoizedState;if(null!==l){t.pending=null;var i=l=l.next;do{o=e(o,i.action),i=i.next}while(i!==l);ir(o,n.memoizedState)||(ki=!0),n.memoizedState=o,null===n.baseQueue&&(n.baseState=o),t.lastRenderedState=o}return[o,r]}function Lo(){}function Mo(e,n){var t=mo,r=No(),l=n(),o=!ir(r.memoizedState,l);if(o&&(r.memoizedState=l,ki=!0),r=r.queue,Ho(Io.bind(null,t,r,e),[e]),r.getSnapshot!==n||o||null!==vo&&1&vo.memoizedState.tag){if(t.flags|=2048,Ao(9,Oo.bind(null,t,r,l,n),void 0,null),null===zu)throw Error(a(349));0!=(30&ho)||Ro(t,n,l)}return l}function Ro(e,n,t){e.flags|=16384,e={getSnapshot:n,value:t},null===(n=mo.updateQueue)?(n={lastEffect:null,stores:null},mo.updateQueue=n,n.stores=[e]):null===(t=n.stores)?n.stores=[e]:t.push(e)}function Oo(e,n,t,r){n.value=t,n.getSnapshot=r,Fo(n)&&Do(e)}function Io(e,n,t){return t((function(){Fo(n)&&Do(e)}))}function Fo(e){var n=e.getSnapshot;e=e.value;try{var t=n();return!ir(e,t)}catch(e){return!0}}function Do(e){var n=za(e,1);null!==n&&ts(n,e,1,-1)}function Uo(e){var n=Co();return"function"==typeof e&&(e=e()),n.memoizedState=n.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Po,lastRenderedState:e},n.queue=e,e=e.dispatch=ti.bind(null,mo,e),[n.memoizedState,e]}function Ao(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},null===(n=mo.updateQueue)?(n={lastEffect:null,stores:null},mo.updateQueue=n,n.lastEffect=e.next=e):null===(t=n.lastEffect)?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e),e}function jo(){return No().memoizedState}function Vo(e,n,t,r){var l=Co();mo.flags|=e,l.memoizedState=Ao(1|n,t,void 0,void 0===r?null:r)}function Bo(e,n,t,r){var l=No();r=void 0===r?null:r;var a=void 0;if(null!==go){var o=go.memoizedState;if(a=o.destroy,null!==r&&xo(r,o.deps))return void(l.memoizedState=Ao(n,t,a,r))}mo.flags|=e,l.memoizedState=Ao(1|n,t,a,r)}function $o(e,n){return Vo(8390656,8,e,n)}function Ho(e,n){return Bo(2048,8,e,n)}function Wo(e,n){return Bo(4,2,e,n)}function Qo(e,n){return Bo(4,4,e,n)}function qo(e,n){return"function"==typeof n?(e=e(),n(e),function(){n(null)}):null!=n?(e=e(),n.current=e,function(){n.current=null}):void 0}function Ko(e,n,t){return t=null!=t?t.concat([e]):null,Bo(4,4,qo.bind(null,n,e),t)}function Yo(){}function Xo(e,n){var t=No();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&xo(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function Go(e,n){var t=No();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&xo(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function Jo(e,n,t){return 0==(21&ho)?(e.baseState&&(e.baseState=!1,ki=!0),e.memoizedState=t):(ir(t,n)||(t=gn(),mo.lanes|=t,Fu|=t,e.baseState=!0),n)}function Zo(e,n){var t=kn;kn=0!==t&&4>t?t:4,e(!0);var r=po.transition;po.transition={};try{e(!1),n()}finally{kn=t,po.transition=r}}function ei(){return No().memoizedState}function ni(e,n,t){var r=ns(e);t={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null},ri(e)?li(n,t):null!==(t=Pa(e,n,t,r))&&(ts(t,e,r,es()),ai(t,n,r))}function ti(e,n,t){var r=ns(e),l={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null};if(ri(e))li(n,l);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=n.lastRenderedReducer))try{var o=n.lastRenderedState,i=a(o,t);if(l.hasEagerState=!0,l.eagerState=i,ir(i,o)){var u=n.interleaved;return null===u?(l.next=l,Na(n)):(l.next=u.next,u.next=l),void(n.interleaved=l)}}catch(e){}null!==(t=Pa(e,n,l,r))&&(ts(t,e,r,l=es()),ai(t,n,r))}}function ri(e){var n=e.alternate;return e===mo||null!==n&&n===mo}function li(e,n){bo=yo=!0;var t=e.pending;null===t?n.next=n:(n.next=t.next,t.next=n),e.pending=n}function ai(e,n,t){if(0!=(4194240&t)){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}var oi={readContext:_a,useCallback:So,useContext:So,useEffect:So,useImperativeHandle:So,useInsertionEffect:So,useLayoutEffect:So,useMemo:So,useReducer:So,useRef:So,useState:So,useDebugValue:So,useDeferredValue:So,useTransition:So,useMutableSource:So,useSyncExternalStore:So,useId:So,unstable_isNewReconciler:!1},ii={readContext:_a,useCallback:function(e,n){return Co().memoizedState=[e,void 0===n?null:n],e},useContext:_a,useEffect:$o,useImperativeHandle:function(e,n,t){return t=null!=t?t.concat([e]):null,Vo(4194308,4,qo.bind(null,n,e),t)},useLayoutEffect:function(e,n){return Vo(4194308,4,e,n)},useInsertionEffect:function(e,n){return Vo(4,2,e,n)},useMemo:function(e,n){var t=Co();return n=void 0===n?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=Co();return n=void 0!==t?t(n):n,r.memoizedState=r.baseState=n,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},r.queue=e,e=e.dispatch=ni.bind(null,mo,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Co().memoizedState=e},useState:Uo,useDebugValue:Yo,useDeferredValue:function(e){return Co().memoizedState=e},useTransition:function(){var e=Uo(!1),n=e[0];return e=Zo.bind(null,e[1]),Co().memoizedState=e,[n,e]},useMutableSource:function(){},useSyncExternalStore:function(e,n,t){var r=mo,l=Co();if(la){if(void 0===t)throw Error(a(407));t=t()}else{if(t=n(),null===zu)throw Error(a(349));0!=(30&ho)||Ro(r,n,t)}l.memoizedState=t;var o={value:t,getSnapshot:n};return l.queue=o,$o(Io.bind(null,r,o,e),[e]),r.flags|=2048,Ao(9,Oo.bind(null,r,o,t,n),void 0,null),t},useId:function(){var e=Co(),n=zu.identifierPrefix;if(la){var t=Gl;n=":"+n+"R"+(t=(Xl&~(1<<32-on(Xl)-1)).toString(32)+t),0<(t=ko++)&&(n+="H"+t.toString(32)),n+=":"}else n=":"+n+"r"+(t=wo++).toString(32)+":";return e.memoizedState=n},unstable_isNewReconciler:!1},ui={readContext:_a,useCallback:Xo,useContext:_a,useEffect:Ho,useImperativeHandle:Ko,useInsertionEffect:Wo,useLayoutEffect:Qo,useMemo:Go,useReducer:zo,useRef:jo,useState:function(){return zo(Po)},useDebugValue:Yo,useDeferredValue:function(e){return Jo(No(),go.memoizedState,e)},useTransition:function(){return[zo(Po)[0],No().memoizedState]},useMutableSource:Lo,useSyncExternalStore:Mo,useId:ei,unstable_isNewReconciler:!1},si={readContext:_a,useCallback:Xo,useContext:_a,useEffect:Ho,useImperativeHandle:Ko,useInsertionEffect:Wo,useLayoutEffect:Qo,useMemo:Go,useReducer:To,useRef:jo,useState:function(){return To(Po)},useDebugValue:Yo,useDeferredValue:function(e){var n=No();return null===go?n.memoizedState=e:Jo(n,go.memoizedState,e)},useTransition:function(){return[To(Po)[0],No().memoizedState]},useMutableSource:Lo,useSyncExternalStore:Mo,useId:ei,unstable_isNewReconciler:!1};function ci(e,n){try{var t="",r=n;do{t+=V(r),r=r.return}while(r);var l=t}catch(e){l="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:n,stack:l,digest:null}}function fi(e,n,t){return{value:e,source:null,stack:null!=t?t:null,digest:null!=n?n:null}}function di(e,n){try{console.error(n.value)}catch(e){setTimeout((function(){throw e}))}}var pi="function"==typeof WeakMap?WeakMap:Map;function hi(e,n,t){(t=Ra(-1,t)).tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){Hu||(Hu=!0,Wu=r),di(0,n)},t}function mi(e,n,t){(t=Ra(-1,t)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var l=n.value;t.payload=function(){return r(l)},t.callback=function(){di(0,n)}}var a=e.stateNode;return null!==a&&"function"==typeof a.componentDidCatch&&(t.callback=function(){di(0,n),"function"!=typeof r&&(null===Qu?Qu=new Set([this]):Qu.add(this));var e=n.stack;this.componentDidCatch(n.value,{componentStack:null!==e?e:""})}),t}function gi(e,n,t){var r=e.pingCache;if(null===r){r=e.pingCache=new pi;var l=new Set;r.set(n,l)}else void 0===(l=r.get(n))&&(l=new Set,r.set(n,l));l.has(t)||(l.add(t),e=_s.bind(null,e,n,t),n.then(e,e))}function vi(e){do{var n;if((n=13===e.tag)&&(n=null===(n=e.memoizedState)||null!==n.dehydrated),n)return e;e=e.return}while(null!==e);return null}function yi(e,n,t,r,l){return 0==(1&e.mode)?(e===n?e.flags|=65536:(e.flags|=128,t.flags|=131072,t.flags&=-52805,1===t.tag&&(null===t.alternate?t.tag=17:((n=Ra(-1,1)).tag=2,Oa(t,n,1))),t.lanes|=1),e):(e.flags|=65536,e.lanes=l,e)}var bi=k.ReactCurrentOwner,ki=!1;function wi(e,n,t,r){n.child=null===e?Ga(n,null,t,r):Xa(n,e.child,t,r)}function Si(e,n,t,r,l){t=t.render;var a=n.ref;return Ea(n,l),r=Eo(e,n,t,r,a,l),t=_o(),null===e||ki?(la&&t&&ea(n),n.flags|=1,wi(e,n,r,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Hi(e,n,l))}function xi(e,n,t,r,l){if(null===e){var a=t.type;return"function"!=typeof a||Ms(a)||void 0!==a.defaultProps||null!==t.compare||void 0!==t.defaultProps?((e=Os(t.type,null,r,n,n.mode,l)).ref=n.ref,e.return=n,n.child=e):(n.tag=15,n.type=a,Ei(e,n,a,r,l))}if(a=e.child,0==(e.lanes&l)){var o=a.memoizedProps;if((t=null!==(t=t.compare)?t:ur)(o,r)&&e.ref===n.ref)return Hi(e,n,l)}return n.flags|=1,(e=Rs(a,r)).ref=n.ref,e.return=n,n.child=e}function Ei(e,n,t,r,l){if(null!==e){var a=e.memoizedProps;if(ur(a,r)&&e.ref===n.ref){if(ki=!1,n.pendingProps=r=a,0==(e.lanes&l))return n.lanes=e.lanes,Hi(e,n,l);0!=(131072&e.flags)&&(ki=!0)}}return Ni(e,n,t,r,l)}function _i(e,n,t){var r=n.pendingProps,l=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0==(1&n.mode))n.memoizedState={baseLanes:0,cachePool:null,transitions:null},Cl(Ru,Mu),Mu|=t;else{if(0==(1073741824&t))return e=null!==a?a.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e,cachePool:null,transitions:null},n.updateQueue=null,Cl(Ru,Mu),Mu|=e,null;n.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==a?a.baseLanes:t,Cl(Ru,Mu),Mu|=r}else null!==a?(r=a.baseLanes|t,n.memoizedState=null):r=t,Cl(Ru,Mu),Mu|=r;return wi(e,n,l,t),n.child}function Ci(e,n){var t=n.ref;(null===e&&null!==t||null!==e&&e.ref!==t)&&(n.flags|=512,n.flags|=2097152)}function Ni(e,n,t,r,l){var a=Ml(t)?Tl:Pl.current;return a=Ll(n,a),Ea(n,l),t=Eo(e,n,t,r,a,l),r=_o(),null===e||ki?(la&&r&&ea(n),n.flags|=1,wi(e,n,t,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Hi(e,n,l))}function Pi(e,n,t,r,l){if(Ml(t)){var a=!0;Fl(n)}else a=!1;if(Ea(n,l),null===n.stateNode)$i(e,n),$a(n,t,r),Wa(n,t,r,l),r=!0;else if(null===e){var o=n.stateNode,i=n.memoizedProps;o.props=i;var u=o.context,s=t.contextType;s="object"==typeof s&&null!==s?_a(s):Ll(n,s=Ml(t)?Tl:Pl.current);var c=t.getDerivedStateFromProps,f="function"==typeof c||"function"==typeof o.getSnapshotBeforeUpdate;f||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==r||u!==s)&&Ha(n,o,r,s),Ta=!1;var d=n.memoizedState;o.state=d,Da(n,r,o,l),u=n.memoizedState,i!==r||d!==u||zl.current||Ta?("function"==typeof c&&(ja(n,t,c,r),u=n.memoizedState),(i=Ta||Ba(n,t,i,r,d,u,s))?(f||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||("function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"==typeof o.componentDidMount&&(n.flags|=4194308)):("function"==typeof o.componentDidMount&&(n.flags|=4194308),n.memoizedProps=r,n.memoizedState=u),o.props=r,o.state=u,o.context=s,r=i):("function"==typeof o.componentDidMount&&(n.flags|=4194308),r=!1)}else{o=n.stateNode,Ma(e,n),i=n.memoizedProps,s=n.type===n.elementType?i:ga(n.type,i),o.props=s,f=n.pendingProps,d=o.context,u="object"==typeof(u=t.contextType)&&null!==u?_a(u):Ll(n,u=Ml(t)?Tl:Pl.current);var p=t.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof o.getSnapshotBeforeUpdate)||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(i!==f||d!==u)&&Ha(n,o,r,u),Ta=!1,d=n.memoizedState,o.state=d,Da(n,r,o,l);var h=n.memoizedState;i!==f||d!==h||zl.current||Ta?("function"==typeof p&&(ja(n,t,p,r),h=n.memoizedState),(s=Ta||Ba(n,t,s,r,d,h,u)||!1)?(c||"function"!=typeof o.UNSAFE_componentWillUpdate&&"function"!=typeof o.componentWillUpdate||("function"==typeof o.componentWillUpdate&&o.componentWillUpdate(r,h,u),"function"==typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,h,u)),"function"==typeof o.componentDidUpdate&&(n.flags|=4),"function"==typeof o.getSnapshotBeforeUpdate&&(n.flags|=1024)):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),n.memoizedProps=r,n.memoizedState=h),o.props=r,o.state=h,o.context=u,r=s):("function"!=typeof o.componentDidUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&d===e.memoizedState||(n.flags|=1024),r=!1)}return zi(e,n,t,r,a,l)}function zi(e,n,t,r,l,a){Ci(e,n);var o=0!=(128&n.flags);if(!r&&!o)return l&&Dl(n,t,!1),Hi(e,n,a);r=n.stateNode,bi.current=n;var i=o&&"function"!=typeof t.getDerivedStateFromError?null:r.render();return n.flags|=1,null!==e&&o?(n.child=Xa(n,e.child,null,a),n.child=Xa(n,null,i,a)):wi(e,n,i,a),n.memoizedState=r.state,l&&Dl(n,t,!0),n.child}function Ti(e){var n=e.stateNode;n.pendingContext?Ol(0,n.pendingContext,n.pendingContext!==n.context):n.context&&Ol(0,n.context,!1),ro(e,n.containerInfo)}function Li(e,n,t,r,l){return pa(),ha(l),n.flags|=256,wi(e,n,t,r),n.child}var Mi,Ri,Oi,Ii={dehydrated:null,treeContext:null,retryLane:0};function Fi(e){return{baseLanes:e,cachePool:null,transitions:null}}function Di(e,n,t){var r,l=n.pendingProps,o=io.current,i=!1,u=0!=(128&n.flags);if((r=u)||(r=(null===e||null!==e.memoizedState)&&0!=(2&o)),r?(i=!0,n.flags&=-129):null!==e&&null===e.memoizedState||(o|=1),Cl(io,1&o),null===e)return sa(n),null!==(e=n.memoizedState)&&null!==(e=e.dehydrated)?(0==(1&n.mode)?n.lanes=1:"$!"===e.data?n.lanes=8:n.lanes=1073741824,null):(u=l.children,e=l.fallback,i?(l=n.mode,i=n.child,u={mode:"hidden",children:u},0==(1&l)&&null!==i?(i.childLanes=0,i.pendingProps=u):i=Fs(u,l,0,null),e=Is(e,l,t,null),i.return=n,e.return=n,i.sibling=e,n.child=i,n.child.memoizedState=Fi(t),n.memoizedState=Ii,e):Ui(n,u));if(null!==(o=e.memoizedState)&&null!==(r=o.dehydrated))return function(e,n,t,r,l,o,i){if(t)return 256&n.flags?(n.flags&=-257,Ai(e,n,i,r=fi(Error(a(422))))):null!==n.memoizedState?(n.child=e.child,n.flags|=128,null):(o=r.fallback,l=n.mode,r=Fs({mode:"visible",children:r.children},l,0,null),(o=Is(o,l,i,null)).flags|=2,r.return=n,o.return=n,r.sibling=o,n.child=r,0!=(1&n.mode)&&Xa(n,e.child,null,i),n.child.memoizedState=Fi(i),n.memoizedState=Ii,o);if(0==(1&n.mode))return Ai(e,n,i,null);if("$!"===l.data){if(r=l.nextSibling&&l.nextSibling.dataset)var u=r.dgst;return r=u,Ai(e,n,i,r=fi(o=Error(a(419)),r,void 0))}if(u=0!=(i&e.childLanes),ki||u){if(null!==(r=zu)){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}0!==(l=0!=(l&(r.suspendedLanes|i))?0:l)&&l!==o.retryLane&&(o.retryLane=l,za(e,l),ts(r,e,l,-1))}return ms(),Ai(e,n,i,r=fi(Error(a(421))))}return"$?"===l.data?(n.flags|=128,n.child=e.child,n=Ns.bind(null,e),l._reactRetry=n,null):(e=o.treeContext,ra=sl(l.nextSibling),ta=n,la=!0,aa=null,null!==e&&(ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Xl=e.id,Gl=e.overflow,Yl=n),(n=Ui(n,r.children)).flags|=4096,n)}(e,n,u,l,r,o,t);if(i){i=l.fallback,u=n.mode,r=(o=e.child).sibling;var s={mode:"hidden",children:l.children};return 0==(1&u)&&n.child!==o?((l=n.child).childLanes=0,l.pendingProps=s,n.deletions=null):(l=Rs(o,s)).subtreeFlags=14680064&o.subtreeFlags,null!==r?i=Rs(r,i):(i=Is(i,u,t,null)).flags|=2,i.return=n,l.return=n,l.sibling=i,n.child=l,l=i,i=n.child,u=null===(u=e.child.memoizedState)?Fi(t):{baseLanes:u.baseLanes|t,cachePool:null,transitions:u.transitions},i.memoizedState=u,i.childLanes=e.childLanes&~t,n.memoizedState=Ii,l}return e=(i=e.child).sibling,l=Rs(i,{mode:"visible",children:l.children}),0==(1&n.mode)&&(l.lanes=t),l.return=n,l.sibling=null,null!==e&&(null===(t=n.deletions)?(n.deletions=[e],n.flags|=16):t.push(e)),n.child=l,n.memoizedState=null,l}function Ui(e,n){return(n=Fs({mode:"visible",children:n},e.mode,0,null)).return=e,e.child=n}function Ai(e,n,t,r){return null!==r&&ha(r),Xa(n,e.child,null,t),(e=Ui(n,n.pendingProps.children)).flags|=2,n.memoizedState=null,e}function ji(e,n,t){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n),xa(e.return,n,t)}function Vi(e,n,t,r,l){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:l}:(a.isBackwards=n,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=t,a.tailMode=l)}function Bi(e,n,t){var r=n.pendingProps,l=r.revealOrder,a=r.tail;if(wi(e,n,r.children,t),0!=(2&(r=io.current)))r=1&r|2,n.flags|=128;else{if(null!==e&&0!=(128&e.flags))e:for(e=n.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&ji(e,t,n);else if(19===e.tag)ji(e,t,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Cl(io,r),0==(1&n.mode))n.memoizedState=null;else switch(l){case"forwards":for(t=n.child,l=null;null!==t;)null!==(e=t.alternate)&&null===uo(e)&&(l=t),t=t.sibling;null===(t=l)?(l=n.child,n.child=null):(l=t.sibling,t.sibling=null),Vi(n,!1,l,t,a);break;case"backwards":for(t=null,l=n.child,n.child=null;null!==l;){if(null!==(e=l.alternate)&&null===uo(e)){n.child=l;break}e=l.sibling,l.sibling=t,t=l,l=e}Vi(n,!0,t,null,a);break;case"together":Vi(n,!1,null,null,void 0);break;default:n.memoizedState=null}return n.child}function $i(e,n){0==(1&n.mode)&&null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2)}function Hi(e,n,t){if(null!==e&&(n.dependencies=e.dependencies),Fu|=n.lanes,0==(t&n.childLanes))return null;if(null!==e&&n.child!==e.child)throw Error(a(153));if(null!==n.child){for(t=Rs(e=n.child,e.pendingProps),n.child=t,t.return=n;null!==e.sibling;)e=e.sibling,(t=t.sibling=Rs(e,e.pendingProps)).return=n;t.sibling=null}return n.child}function Wi(e,n){if(!la)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;null!==n;)null!==n.alternate&&(t=n),n=n.sibling;null===t?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;null!==t;)null!==t.alternate&&(r=t),t=t.sibling;null===r?n||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Qi(e){var n=null!==e.alternate&&e.alternate.child===e.child,t=0,r=0;if(n)for(var l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=14680064&l.subtreeFlags,r|=14680064&l.flags,l.return=e,l=l.sibling;else for(l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=t,n}function qi(e,n,t){var r=n.pendingProps;switch(na(n),n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Qi(n),null;case 1:case 17:return Ml(n.type)&&Rl(),Qi(n),null;case 3:return r=n.stateNode,lo(),_l(zl),_l(Pl),co(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fa(n)?n.flags|=4:null===e||e.memoizedState.isDehydrated&&0==(256&n.flags)||(n.flags|=1024,null!==aa&&(os(aa),aa=null))),Qi(n),null;case 5:oo(n);var l=to(no.current);if(t=n.type,null!==e&&null!=n.stateNode)Ri(e,n,t,r),e.ref!==n.ref&&(n.flags|=512,n.flags|=2097152);else{if(!r){if(null===n.stateNode)throw Error(a(166));return Qi(n),null}if(e=to(Za.current),fa(n)){r=n.stateNode,t=n.type;var o=n.memoizedProps;switch(r[dl]=n,r[pl]=o,e=0!=(1&n.mode),t){case"dialog":Ar("cancel",r),Ar("close",r);break;case"iframe":case"object":case"embed":Ar("load",r);break;case"video":case"audio":for(l=0;l<Ir.length;l++)Ar(Ir[l],r);break;case"source":Ar("error",r);break;case"img":case"image":case"link":Ar("error",r),Ar("load",r);break;case"details":Ar("toggle",r);break;case"input":X(r,o),Ar("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Ar("invalid",r);break;case"textarea":le(r,o),Ar("invalid",r)}for(var u in ye(t,o),l=null,o)if(o.hasOwnProperty(u)){var s=o[u];"children"===u?"string"==typeof s?r.textContent!==s&&(!0!==o.suppressHydrationWarning&&Jr(r.textContent,s,e),l=["children",s]):"number"==typeof s&&r.textContent!==""+s&&(!0!==o.suppressHydrationWarning&&Jr(r.textContent,s,e),l=["children",""+s]):i.hasOwnProperty(u)&&null!=s&&"onScroll"===u&&Ar("scroll",r)}switch(t){case"input":Q(r),Z(r,o,!0);break;case"textarea":Q(r),oe(r);break;case"select":case"option":break;default:"function"==typeof o.onClick&&(r.onclick=Zr)}r=l,n.updateQueue=r,null!==r&&(n.flags|=4)}else{u=9===l.nodeType?l:l.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(t)),"http://www.w3.org/1999/xhtml"===e?"script"===t?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(t,{is:r.is}):(e=u.createElement(t),"select"===t&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,t),e[dl]=n,e[pl]=r,Mi(e,n),n.stateNode=e;e:{switch(u=be(t,r),t){case"dialog":Ar("cancel",e),Ar("close",e),l=r;break;case"iframe":case"object":case"embed":Ar("load",e),l=r;break;case"video":case"audio":for(l=0;l<Ir.length;l++)Ar(Ir[l],e);l=r;break;case"source":Ar("error",e),l=r;break;case"img":case"image":case"link":Ar("error",e),Ar("load",e),l=r;break;case"details":Ar("toggle",e),l=r;break;case"input":X(e,r),l=Y(e,r),Ar("invalid",e);break;case"option":default:l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=D({},r,{value:void 0}),Ar("invalid",e);break;case"textarea":le(e,r),l=re(e,r),Ar("invalid",e)}for(o in ye(t,l),s=l)if(s.hasOwnProperty(o)){var c=s[o];"style"===o?ge(e,c):"dangerouslySetInnerHTML"===o?null!=(c=c?c.__html:void 0)&&fe(e,c):"children"===o?"string"==typeof c?("textarea"!==t||""!==c)&&de(e,c):"number"==typeof c&&de(e,""+c):"suppressContentEditableWarning"!==o&&"suppressHydrationWarning"!==o&&"autoFocus"!==o&&(i.hasOwnProperty(o)?null!=c&&"onScroll"===o&&Ar("scroll",e):null!=c&&b(e,o,c,u))}switch(t){case"input":Q(e),Z(e,r,!1);break;case"textarea":Q(e),oe(e);break;case"option":null!=r.value&&e.setAttribute("value",""+H(r.value));break;case"select":e.multiple=!!r.multiple,null!=(o=r.value)?te(e,!!r.multiple,o,!1):null!=r.defaultValue&&te(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof l.onClick&&(e.onclick=Zr)}switch(t){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(n.flags|=4)}null!==n.ref&&(n.flags|=512,n.flags|=2097152)}return Qi(n),null;case 6:if(e&&null!=n.stateNode)Oi(0,n,e.memoizedProps,r);else{if("string"!=typeof r&&null===n.stateNode)throw Error(a(166));if(t=to(no.current),to(Za.current),fa(n)){if(r=n.stateNode,t=n.memoizedProps,r[dl]=n,(o=r.nodeValue!==t)&&null!==(e=ta))switch(e.tag){case 3:Jr(r.nodeValue,t,0!=(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Jr(r.nodeValue,t,0!=(1&e.mode))}o&&(n.flags|=4)}else(r=(9===t.nodeType?t:t.ownerDocument).createTextNode(r))[dl]=n,n.stateNode=r}return Qi(n),null;case 13:if(_l(io),r=n.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(la&&null!==ra&&0!=(1&n.mode)&&0==(128&n.flags))da(),pa(),n.flags|=98560,o=!1;else if(o=fa(n),null!==r&&null!==r.dehydrated){if(null===e){if(!o)throw Error(a(318));if(!(o=null!==(o=n.memoizedState)?o.dehydrated:null))throw Error(a(317));o[dl]=n}else pa(),0==(128&n.flags)&&(n.memoizedState=null),n.flags|=4;Qi(n),o=!1}else null!==aa&&(os(aa),aa=null),o=!0;if(!o)return 65536&n.flags?n:null}return 0!=(128&n.flags)?(n.lanes=t,n):((r=null!==r)!=(null!==e&&null!==e.memoizedState)&&r&&(n.child.flags|=8192,0!=(1&n.mode)&&(null===e||0!=(1&io.current)?0===Ou&&(Ou=3):ms())),null!==n.updateQueue&&(n.flags|=4),Qi(n),null);case 4:return lo(),null===e&&Br(n.stateNode.containerInfo),Qi(n),null;case 10:return Sa(n.type._context),Qi(n),null;case 19:if(_l(io),null===(o=n.memoizedState))return Qi(n),null;if(r=0!=(128&n.flags),null===(u=o.rendering))if(r)Wi(o,!1);else{if(0!==Ou||null!==e&&0!=(128&e.flags))for(e=n.child;null!==e;){if(null!==(u=uo(e))){for(n.flags|=128,Wi(o,!1),null!==(r=u.updateQueue)&&(n.updateQueue=r,n.flags|=4),n.subtreeFlags=0,r=t,t=n.child;null!==t;)e=r,(o=t).flags&=14680066,null===(u=o.alternate)?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=u.childLanes,o.lanes=u.lanes,o.child=u.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=u.memoizedProps,o.memoizedState=u.memoizedState,o.updateQueue=u.updateQueue,o.type=u.type,e=u.dependencies,o.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return Cl(io,1&io.current|2),n.child}e=e.sibling}null!==o.tail&&Ge()>Bu&&(n.flags|=128,r=!0,Wi(o,!1),n.lanes=4194304)}else{if(!r)if(null!==(e=uo(u))){if(n.flags|=128,r=!0,null!==(t=e.updateQueue)&&(n.updateQueue=t,n.flags|=4),Wi(o,!0),null===o.tail&&"hidden"===o.tailMode&&!u.alternate&&!la)return Qi(n),null}else 2*Ge()-o.renderingStartTime>Bu&&1073741824!==t&&(n.flags|=128,r=!0,Wi(o,!1),n.lanes=4194304);o.isBackwards?(u.sibling=n.child,n.child=u):(null!==(t=o.last)?t.sibling=u:n.child=u,o.last=u)}return null!==o.tail?(n=o.tail,o.rendering=n,o.tail=n.sibling,o.renderingStartTime=Ge(),n.sibling=null,t=io.current,Cl(io,r?1&t|2:1&t),n):(Qi(n),null);case 22:case 23:return fs(),r=null!==n.memoizedState,null!==e&&null!==e.memoizedState!==r&&(n.flags|=8192),r&&0!=(1&n.mode)?0!=(1073741824&Mu)&&(Qi(n),6&n.subtreeFlags&&(n.flags|=8192)):Qi(n),null;case 24:case 25:return null}throw Error(a(156,n.tag))}function Ki(e,n){switch(na(n),n.tag){case 1:return Ml(n.type)&&Rl(),65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 3:return lo(),_l(zl),_l(Pl),co(),0!=(65536&(e=n.flags))&&0==(128&e)?(n.flags=-65537&e|128,n):null;case 5:return oo(n),null;case 13:if(_l(io),null!==(e=n.memoizedState)&&null!==e.dehydrated){if(null===n.alternate)throw Error(a(340));pa()}return 65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 19:return _l(io),null;case 4:return lo(),null;case 10:return Sa(n.type._context),null;case 22:case 23:return fs(),null;default:return null}}Mi=function(e,n){for(var t=n.child;null!==t;){if(5===t.tag||6===t.tag)e.appendChild(t.stateNode);else if(4!==t.tag&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===n)break;for(;null===t.sibling;){if(null===t.return||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}},Ri=function(e,n,t,r){var l=e.memoizedProps;if(l!==r){e=n.stateNode,to(Za.current);var a,o=null;switch(t){case"input":l=Y(e,l),r=Y(e,r),o=[];break;case"select":l=D({},l,{value:void 0}),r=D({},r,{value:void 0}),o=[];break;case"textarea":l=re(e,l),r=re(e,r),o=[];break;default:"function"!=typeof l.onClick&&"function"==typeof r.onClick&&(e.onclick=Zr)}for(c in ye(t,r),t=null,l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&null!=l[c])if("style"===c){var u=l[c];for(a in u)u.hasOwnProperty(a)&&(t||(t={}),t[a]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(i.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=null!=l?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(null!=s||null!=u))if("style"===c)if(u){for(a in u)!u.hasOwnProperty(a)||s&&s.hasOwnProperty(a)||(t||(t={}),t[a]="");for(a in s)s.hasOwnProperty(a)&&u[a]!==s[a]&&(t||(t={}),t[a]=s[a])}else t||(o||(o=[]),o.push(c,t)),t=s;else"dangerouslySetInnerHTML"===c?(s=s?s.__html:void 0,u=u?u.__html:void 0,null!=s&&u!==s&&(o=o||[]).push(c,s)):"children"===c?"string"!=typeof s&&"number"!=typeof s||(o=o||[]).push(c,""+s):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(i.hasOwnProperty(c)?(null!=s&&"onScroll"===c&&Ar("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}t&&(o=o||[]).push("style",t);var c=o;(n.updateQueue=c)&&(n.flags|=4)}},Oi=function(e,n,t,r){t!==r&&(n.flags|=4)};var Yi=!1,Xi=!1,Gi="function"==typeof WeakSet?WeakSet:Set,Ji=null;function Zi(e,n){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Es(e,n,t)}else t.current=null}function eu(e,n,t){try{t()}catch(t){Es(e,n,t)}}var nu=!1;function tu(e,n,t){var r=n.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var l=r=r.next;do{if((l.tag&e)===e){var a=l.destroy;l.destroy=void 0,void 0!==a&&eu(n,t,a)}l=l.next}while(l!==r)}}function ru(e,n){if(null!==(n=null!==(n=n.updateQueue)?n.lastEffect:null)){var t=n=n.next;do{if((t.tag&e)===e){var r=t.create;t.destroy=r()}t=t.next}while(t!==n)}}function lu(e){var n=e.ref;if(null!==n){var t=e.stateNode;e.tag,e=t,"function"==typeof n?n(e):n.current=e}}function au(e){var n=e.alternate;null!==n&&(e.alternate=null,au(n)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&null!==(n=e.stateNode)&&(delete n[dl],delete n[pl],delete n[ml],delete n[gl],delete n[vl]),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ou(e){return 5===e.tag||3===e.tag||4===e.tag}function iu(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ou(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function uu(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?8===t.nodeType?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(8===t.nodeType?(n=t.parentNode).insertBefore(e,t):(n=t).appendChild(e),null!=(t=t._reactRootContainer)||null!==n.onclick||(n.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(uu(e,n,t),e=e.sibling;null!==e;)uu(e,n,t),e=e.sibling}function su(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?t.insertBefore(e,n):t.appendChild(e);else if(4!==r&&null!==(e=e.child))for(su(e,n,t),e=e.sibling;null!==e;)su(e,n,t),e=e.sibling}var cu=null,fu=!1;function du(e,n,t){for(t=t.child;null!==t;)pu(e,n,t),t=t.sibling}function pu(e,n,t){if(an&&"function"==typeof an.onCommitFiberUnmount)try{an.onCommitFiberUnmount(ln,t)}catch(e){}switch(t.tag){case 5:Xi||Zi(t,n);case 6:var r=cu,l=fu;cu=null,du(e,n,t),fu=l,null!==(cu=r)&&(fu?(e=cu,t=t.stateNode,8===e.nodeType?e.parentNode.removeChild(t):e.removeChild(t)):cu.removeChild(t.stateNode));break;case 18:null!==cu&&(fu?(e=cu,t=t.stateNode,8===e.nodeType?ul(e.parentNode,t):1===e.nodeType&&ul(e,t),$n(e)):ul(cu,t.stateNode));break;case 4:r=cu,l=fu,cu=t.stateNode.containerInfo,fu=!0,du(e,n,t),cu=r,fu=l;break;case 0:case 11:case 14:case 15:if(!Xi&&null!==(r=t.updateQueue)&&null!==(r=r.lastEffect)){l=r=r.next;do{var a=l,o=a.destroy;a=a.tag,void 0!==o&&(0!=(2&a)||0!=(4&a))&&eu(t,n,o),l=l.next}while(l!==r)}du(e,n,t);break;case 1:if(!Xi&&(Zi(t,n),"function"==typeof(r=t.stateNode).componentWillUnmount))try{r.props=t.memoizedProps,r.state=t.memoizedState,r.componentWillUnmount()}catch(e){Es(t,n,e)}du(e,n,t);break;case 21:du(e,n,t);break;case 22:1&t.mode?(Xi=(r=Xi)||null!==t.memoizedState,du(e,n,t),Xi=r):du(e,n,t);break;default:du(e,n,t)}}function hu(e){var n=e.updateQueue;if(null!==n){e.updateQueue=null;var t=e.stateNode;null===t&&(t=e.stateNode=new Gi),n.forEach((function(n){var r=Ps.bind(null,e,n);t.has(n)||(t.add(n),n.then(r,r))}))}}function mu(e,n){var t=n.deletions;if(null!==t)for(var r=0;r<t.length;r++){var l=t[r];try{var o=e,i=n,u=i;e:for(;null!==u;){switch(u.tag){case 5:cu=u.stateNode,fu=!1;break e;case 3:case 4:cu=u.stateNode.containerInfo,fu=!0;break e}u=u.return}if(null===cu)throw Error(a(160));pu(o,i,l),cu=null,fu=!1;var s=l.alternate;null!==s&&(s.return=null),l.return=null}catch(e){Es(l,n,e)}}if(12854&n.subtreeFlags)for(n=n.child;null!==n;)gu(n,e),n=n.sibling}function gu(e,n){var t=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(mu(n,e),vu(e),4&r){try{tu(3,e,e.return),ru(3,e)}catch(n){Es(e,e.return,n)}try{tu(5,e,e.return)}catch(n){Es(e,e.return,n)}}break;case 1:mu(n,e),vu(e),512&r&&null!==t&&Zi(t,t.return);break;case 5:if(mu(n,e),vu(e),512&r&&null!==t&&Zi(t,t.return),32&e.flags){var l=e.stateNode;try{de(l,"")}catch(n){Es(e,e.return,n)}}if(4&r&&null!=(l=e.stateNode)){var o=e.memoizedProps,i=null!==t?t.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===u&&"radio"===o.type&&null!=o.name&&G(l,o),be(u,i);var c=be(u,o);for(i=0;i<s.length;i+=2){var f=s[i],d=s[i+1];"style"===f?ge(l,d):"dangerouslySetInnerHTML"===f?fe(l,d):"children"===f?de(l,d):b(l,f,d,c)}switch(u){case"input":J(l,o);break;case"textarea":ae(l,o);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var h=o.value;null!=h?te(l,!!o.multiple,h,!1):p!==!!o.multiple&&(null!=o.defaultValue?te(l,!!o.multiple,o.defaultValue,!0):te(l,!!o.multiple,o.multiple?[]:"",!1))}l[pl]=o}catch(n){Es(e,e.return,n)}}break;case 6:if(mu(n,e),vu(e),4&r){if(null===e.stateNode)throw Error(a(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(n){Es(e,e.return,n)}}break;case 3:if(mu(n,e),vu(e),4&r&&null!==t&&t.memoizedState.isDehydrated)try{$n(n.containerInfo)}catch(n){Es(e,e.return,n)}break;case 4:default:mu(n,e),vu(e);break;case 13:mu(n,e),vu(e),8192&(l=e.child).flags&&(o=null!==l.memoizedState,l.stateNode.isHidden=o,!o||null!==l.alternate&&null!==l.alternate.memoizedState||(Vu=Ge())),4&r&&hu(e);break;case 22:if(f=null!==t&&null!==t.memoizedState,1&e.mode?(Xi=(c=Xi)||f,mu(n,e),Xi=c):mu(n,e),vu(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!f&&0!=(1&e.mode))for(Ji=e,f=e.child;null!==f;){for(d=Ji=f;null!==Ji;){switch(h=(p=Ji).child,p.tag){case 0:case 11:case 14:case 15:tu(4,p,p.return);break;case 1:Zi(p,p.return);var m=p.stateNode;if("function"==typeof m.componentWillUnmount){r=p,t=p.return;try{n=r,m.props=n.memoizedProps,m.state=n.memoizedState,m.componentWillUnmount()}catch(e){Es(r,t,e)}}break;case 5:Zi(p,p.return);break;case 22:if(null!==p.memoizedState){wu(d);continue}}null!==h?(h.return=p,Ji=h):wu(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{l=d.stateNode,c?"function"==typeof(o=l.style).setProperty?o.setProperty("display","none","important"):o.display="none":(u=d.stateNode,i=null!=(s=d.memoizedProps.style)&&s.hasOwnProperty("display")?s.display:null,u.style.display=me("display",i))}catch(n){Es(e,e.return,n)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=c?"":d.memoizedProps}catch(n){Es(e,e.return,n)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:mu(n,e),vu(e),4&r&&hu(e);case 21:}}function vu(e){var n=e.flags;if(2&n){try{e:{for(var t=e.return;null!==t;){if(ou(t)){var r=t;break e}t=t.return}throw Error(a(160))}switch(r.tag){case 5:var l=r.stateNode;32&r.flags&&(de(l,""),r.flags&=-33),su(e,iu(e),l);break;case 3:case 4:var o=r.stateNode.containerInfo;uu(e,iu(e),o);break;default:throw Error(a(161))}}catch(n){Es(e,e.return,n)}e.flags&=-3}4096&n&&(e.flags&=-4097)}function yu(e,n,t){Ji=e,bu(e,n,t)}function bu(e,n,t){for(var r=0!=(1&e.mode);null!==Ji;){var l=Ji,a=l.child;if(22===l.tag&&r){var o=null!==l.memoizedState||Yi;if(!o){var i=l.alternate,u=null!==i&&null!==i.memoizedState||Xi;i=Yi;var s=Xi;if(Yi=o,(Xi=u)&&!s)for(Ji=l;null!==Ji;)u=(o=Ji).child,22===o.tag&&null!==o.memoizedState?Su(l):null!==u?(u.return=o,Ji=u):Su(l);for(;null!==a;)Ji=a,bu(a,n,t),a=a.sibling;Ji=l,Yi=i,Xi=s}ku(e)}else 0!=(8772&l.subtreeFlags)&&null!==a?(a.return=l,Ji=a):ku(e)}}function ku(e){for(;null!==Ji;){var n=Ji;if(0!=(8772&n.flags)){var t=n.alternate;try{if(0!=(8772&n.flags))switch(n.tag){case 0:case 11:case 15:Xi||ru(5,n);break;case 1:var r=n.stateNode;if(4&n.flags&&!Xi)if(null===t)r.componentDidMount();else{var l=n.elementType===n.type?t.memoizedProps:ga(n.type,t.memoizedProps);r.componentDidUpdate(l,t.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=n.updateQueue;null!==o&&Ua(n,o,r);break;case 3:var i=n.updateQueue;if(null!==i){if(t=null,null!==n.child)switch(n.child.tag){case 5:case 1:t=n.child.stateNode}Ua(n,i,t)}break;case 5:var u=n.stateNode;if(null===t&&4&n.flags){t=u;var s=n.memoizedProps;switch(n.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&t.focus();break;case"img":s.src&&(t.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===n.memoizedState){var c=n.alternate;if(null!==c){var f=c.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&$n(d)}}}break;default:throw Error(a(163))}Xi||512&n.flags&&lu(n)}catch(e){Es(n,n.return,e)}}if(n===e){Ji=null;break}if(null!==(t=n.sibling)){t.return=n.return,Ji=t;break}Ji=n.return}}function wu(e){for(;null!==Ji;){var n=Ji;if(n===e){Ji=null;break}var t=n.sibling;if(null!==t){t.return=n.return,Ji=t;break}Ji=n.return}}function Su(e){for(;null!==Ji;){var n=Ji;try{switch(n.tag){case 0:case 11:case 15:var t=n.return;try{ru(4,n)}catch(e){Es(n,t,e)}break;case 1:var r=n.stateNode;if("function"==typeof r.componentDidMount){var l=n.return;try{r.componentDidMount()}catch(e){Es(n,l,e)}}var a=n.return;try{lu(n)}catch(e){Es(n,a,e)}break;case 5:var o=n.return;try{lu(n)}catch(e){Es(n,o,e)}}}catch(e){Es(n,n.return,e)}if(n===e){Ji=null;break}var i=n.sibling;if(null!==i){i.return=n.return,Ji=i;break}Ji=n.return}}var xu,Eu=Math.ceil,_u=k.ReactCurrentDispatcher,Cu=k.ReactCurrentOwner,Nu=k.ReactCurrentBatchConfig,Pu=0,zu=null,Tu=null,Lu=0,Mu=0,Ru=El(0),Ou=0,Iu=null,Fu=0,Du=0,Uu=0,Au=null,ju=null,Vu=0,Bu=1/0,$u=null,Hu=!1,Wu=null,Qu=null,qu=!1,Ku=null,Yu=0,Xu=0,Gu=null,Ju=-1,Zu=0;function es(){return 0!=(6&Pu)?Ge():-1!==Ju?Ju:Ju=Ge()}function ns(e){return 0==(1&e.mode)?1:0!=(2&Pu)&&0!==Lu?Lu&-Lu:null!==ma.transition?(0===Zu&&(Zu=gn()),Zu):0!==(e=kn)?e:e=void 0===(e=window.event)?16:Gn(e.type)}function ts(e,n,t,r){if(50<Xu)throw Xu=0,Gu=null,Error(a(185));yn(e,t,r),0!=(2&Pu)&&e===zu||(e===zu&&(0==(2&Pu)&&(Du|=t),4===Ou&&is(e,Lu)),rs(e,r),1===t&&0===Pu&&0==(1&n.mode)&&(Bu=Ge()+500,Al&&Bl()))}function rs(e,n){var t=e.callbackNode;!function(e,n){for(var t=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,a=e.pendingLanes;0<a;){var o=31-on(a),i=1<<o,u=l[o];-1===u?0!=(i&t)&&0==(i&r)||(l[o]=hn(i,n)):u<=n&&(e.expiredLanes|=i),a&=~i}}(e,n);var r=pn(e,e===zu?Lu:0);if(0===r)null!==t&&Ke(t),e.callbackNode=null,e.callbackPriority=0;else if(n=r&-r,e.callbackPriority!==n){if(null!=t&&Ke(t),1===n)0===e.tag?function(e){Al=!0,Vl(e)}(us.bind(null,e)):Vl(us.bind(null,e)),ol((function(){0==(6&Pu)&&Bl()})),t=null;else{switch(wn(r)){case 1:t=Ze;break;case 4:t=en;break;case 16:default:t=nn;break;case 536870912:t=rn}t=zs(t,ls.bind(null,e))}e.callbackPriority=n,e.callbackNode=t}}function ls(e,n){if(Ju=-1,Zu=0,0!=(6&Pu))throw Error(a(327));var t=e.callbackNode;if(Ss()&&e.callbackNode!==t)return null;var r=pn(e,e===zu?Lu:0);if(0===r)return null;if(0!=(30&r)||0!=(r&e.expiredLanes)||n)n=gs(e,r);else{n=r;var l=Pu;Pu|=2;var o=hs();for(zu===e&&Lu===n||($u=null,Bu=Ge()+500,ds(e,n));;)try{ys();break}catch(n){ps(e,n)}wa(),_u.current=o,Pu=l,null!==Tu?n=0:(zu=null,Lu=0,n=Ou)}if(0!==n){if(2===n&&0!==(l=mn(e))&&(r=l,n=as(e,l)),1===n)throw t=Iu,ds(e,0),is(e,r),rs(e,Ge()),t;if(6===n)is(e,r);else{if(l=e.current.alternate,0==(30&r)&&!function(e){for(var n=e;;){if(16384&n.flags){var t=n.updateQueue;if(null!==t&&null!==(t=t.stores))for(var r=0;r<t.length;r++){var l=t[r],a=l.getSnapshot;l=l.value;try{if(!ir(a(),l))return!1}catch(e){return!1}}}if(t=n.child,16384&n.subtreeFlags&&null!==t)t.return=n,n=t;else{if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return!0;n=n.return}n.sibling.return=n.return,n=n.sibling}}return!0}(l)&&(2===(n=gs(e,r))&&0!==(o=mn(e))&&(r=o,n=as(e,o)),1===n))throw t=Iu,ds(e,0),is(e,r),rs(e,Ge()),t;switch(e.finishedWork=l,e.finishedLanes=r,n){case 0:case 1:throw Error(a(345));case 2:case 5:ws(e,ju,$u);break;case 3:if(is(e,r),(130023424&r)===r&&10<(n=Vu+500-Ge())){if(0!==pn(e,0))break;if(((l=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=rl(ws.bind(null,e,ju,$u),n);break}ws(e,ju,$u);break;case 4:if(is(e,r),(4194240&r)===r)break;for(n=e.eventTimes,l=-1;0<r;){var i=31-on(r);o=1<<i,(i=n[i])>l&&(l=i),r&=~o}if(r=l,10<(r=(120>(r=Ge()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Eu(r/1960))-r)){e.timeoutHandle=rl(ws.bind(null,e,ju,$u),r);break}ws(e,ju,$u);break;default:throw Error(a(329))}}}return rs(e,Ge()),e.callbackNode===t?ls.bind(null,e):null}function as(e,n){var t=Au;return e.current.memoizedState.isDehydrated&&(ds(e,n).flags|=256),2!==(e=gs(e,n))&&(n=ju,ju=t,null!==n&&os(n)),e}function os(e){null===ju?ju=e:ju.push.apply(ju,e)}function is(e,n){for(n&=~Uu,n&=~Du,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-on(n),r=1<<t;e[t]=-1,n&=~r}}function us(e){if(0!=(6&Pu))throw Error(a(327));Ss();var n=pn(e,0);if(0==(1&n))return rs(e,Ge()),null;var t=gs(e,n);if(0!==e.tag&&2===t){var r=mn(e);0!==r&&(n=r,t=as(e,r))}if(1===t)throw t=Iu,ds(e,0),is(e,n),rs(e,Ge()),t;if(6===t)throw Error(a(345));return e.finishedWork=e.current.alternate,e.finishedLanes=n,ws(e,ju,$u),rs(e,Ge()),null}function ss(e,n){var t=Pu;Pu|=1;try{return e(n)}finally{0===(Pu=t)&&(Bu=Ge()+500,Al&&Bl())}}function cs(e){null!==Ku&&0===Ku.tag&&0==(6&Pu)&&Ss();var n=Pu;Pu|=1;var t=Nu.transition,r=kn;try{if(Nu.transition=null,kn=1,e)return e()}finally{kn=r,Nu.transition=t,0==(6&(Pu=n))&&Bl()}}function fs(){Mu=Ru.current,_l(Ru)}function ds(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(-1!==t&&(e.timeoutHandle=-1,ll(t)),null!==Tu)for(t=Tu.return;null!==t;){var r=t;switch(na(r),r.tag){case 1:null!=(r=r.type.childContextTypes)&&Rl();break;case 3:lo(),_l(zl),_l(Pl),co();break;case 5:oo(r);break;case 4:lo();break;case 13:case 19:_l(io);break;case 10:Sa(r.type._context);break;case 22:case 23:fs()}t=t.return}if(zu=e,Tu=e=Rs(e.current,null),Lu=Mu=n,Ou=0,Iu=null,Uu=Du=Fu=0,ju=Au=null,null!==Ca){for(n=0;n<Ca.length;n++)if(null!==(r=(t=Ca[n]).interleaved)){t.interleaved=null;var l=r.next,a=t.pending;if(null!==a){var o=a.next;a.next=l,r.next=o}t.pending=r}Ca=null}return e}function ps(e,n){for(;;){var t=Tu;try{if(wa(),fo.current=oi,yo){for(var r=mo.memoizedState;null!==r;){var l=r.queue;null!==l&&(l.pending=null),r=r.next}yo=!1}if(ho=0,vo=go=mo=null,bo=!1,ko=0,Cu.current=null,null===t||null===t.return){Ou=1,Iu=n,Tu=null;break}e:{var o=e,i=t.return,u=t,s=n;if(n=Lu,u.flags|=32768,null!==s&&"object"==typeof s&&"function"==typeof s.then){var c=s,f=u,d=f.tag;if(0==(1&f.mode)&&(0===d||11===d||15===d)){var p=f.alternate;p?(f.updateQueue=p.updateQueue,f.memoizedState=p.memoizedState,f.lanes=p.lanes):(f.updateQueue=null,f.memoizedState=null)}var h=vi(i);if(null!==h){h.flags&=-257,yi(h,i,u,0,n),1&h.mode&&gi(o,c,n),s=c;var m=(n=h).updateQueue;if(null===m){var g=new Set;g.add(s),n.updateQueue=g}else m.add(s);break e}if(0==(1&n)){gi(o,c,n),ms();break e}s=Error(a(426))}else if(la&&1&u.mode){var v=vi(i);if(null!==v){0==(65536&v.flags)&&(v.flags|=256),yi(v,i,u,0,n),ha(ci(s,u));break e}}o=s=ci(s,u),4!==Ou&&(Ou=2),null===Au?Au=[o]:Au.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,n&=-n,o.lanes|=n,Fa(o,hi(0,s,n));break e;case 1:u=s;var y=o.type,b=o.stateNode;if(0==(128&o.flags)&&("function"==typeof y.getDerivedStateFromError||null!==b&&"function"==typeof b.componentDidCatch&&(null===Qu||!Qu.has(b)))){o.flags|=65536,n&=-n,o.lanes|=n,Fa(o,mi(o,u,n));break e}}o=o.return}while(null!==o)}ks(t)}catch(e){n=e,Tu===t&&null!==t&&(Tu=t=t.return);continue}break}}function hs(){var e=_u.current;return _u.current=oi,null===e?oi:e}function ms(){0!==Ou&&3!==Ou&&2!==Ou||(Ou=4),null===zu||0==(268435455&Fu)&&0==(268435455&Du)||is(zu,Lu)}function gs(e,n){var t=Pu;Pu|=2;var r=hs();for(zu===e&&Lu===n||($u=null,ds(e,n));;)try{vs();break}catch(n){ps(e,n)}if(wa(),Pu=t,_u.current=r,null!==Tu)throw Error(a(261));return zu=null,Lu=0,Ou}function vs(){for(;null!==Tu;)bs(Tu)}function ys(){for(;null!==Tu&&!Ye();)bs(Tu)}function bs(e){var n=xu(e.alternate,e,Mu);e.memoizedProps=e.pendingProps,null===n?ks(e):Tu=n,Cu.current=null}function ks(e){var n=e;do{var t=n.alternate;if(e=n.return,0==(32768&n.flags)){if(null!==(t=qi(t,n,Mu)))return void(Tu=t)}else{if(null!==(t=Ki(t,n)))return t.flags&=32767,void(Tu=t);if(null===e)return Ou=6,void(Tu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(n=n.sibling))return void(Tu=n);Tu=n=e}while(null!==n);0===Ou&&(Ou=5)}function ws(e,n,t){var r=kn,l=Nu.transition;try{Nu.transition=null,kn=1,function(e,n,t,r){do{Ss()}while(null!==Ku);if(0!=(6&Pu))throw Error(a(327));t=e.finishedWork;var l=e.finishedLanes;if(null===t)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(a(177));e.callbackNode=null,e.callbackPriority=0;var o=t.lanes|t.childLanes;if(function(e,n){var t=e.pendingLanes&~n;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=n,e.mutableReadLanes&=n,e.entangledLanes&=n,n=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<t;){var l=31-on(t),a=1<<l;n[l]=0,r[l]=-1,e[l]=-1,t&=~a}}(e,o),e===zu&&(Tu=zu=null,Lu=0),0==(2064&t.subtreeFlags)&&0==(2064&t.flags)||qu||(qu=!0,zs(nn,(function(){return Ss(),null}))),o=0!=(15990&t.flags),0!=(15990&t.subtreeFlags)||o){o=Nu.transition,Nu.transition=null;var i=kn;kn=1;var u=Pu;Pu|=4,Cu.current=null,function(e,n){if(el=Wn,pr(e=dr())){if("selectionStart"in e)var t={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(t=(t=e.ownerDocument)&&t.defaultView||window).getSelection&&t.getSelection();if(r&&0!==r.rangeCount){t=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{t.nodeType,o.nodeType}catch(e){t=null;break e}var i=0,u=-1,s=-1,c=0,f=0,d=e,p=null;n:for(;;){for(var h;d!==t||0!==l&&3!==d.nodeType||(u=i+l),d!==o||0!==r&&3!==d.nodeType||(s=i+r),3===d.nodeType&&(i+=d.nodeValue.length),null!==(h=d.firstChild);)p=d,d=h;for(;;){if(d===e)break n;if(p===t&&++c===l&&(u=i),p===o&&++f===r&&(s=i),null!==(h=d.nextSibling))break;p=(d=p).parentNode}d=h}t=-1===u||-1===s?null:{start:u,end:s}}else t=null}t=t||{start:0,end:0}}else t=null;for(nl={focusedElem:e,selectionRange:t},Wn=!1,Ji=n;null!==Ji;)if(e=(n=Ji).child,0!=(1028&n.subtreeFlags)&&null!==e)e.return=n,Ji=e;else for(;null!==Ji;){n=Ji;try{var m=n.alternate;if(0!=(1024&n.flags))switch(n.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==m){var g=m.memoizedProps,v=m.memoizedState,y=n.stateNode,b=y.getSnapshotBeforeUpdate(n.elementType===n.type?g:ga(n.type,g),v);y.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var k=n.stateNode.containerInfo;1===k.nodeType?k.textContent="":9===k.nodeType&&k.documentElement&&k.removeChild(k.documentElement);break;default:throw Error(a(163))}}catch(e){Es(n,n.return,e)}if(null!==(e=n.sibling)){e.return=n.return,Ji=e;break}Ji=n.return}m=nu,nu=!1}(e,t),gu(t,e),hr(nl),Wn=!!el,nl=el=null,e.current=t,yu(t,e,l),Xe(),Pu=u,kn=i,Nu.transition=o}else e.current=t;if(qu&&(qu=!1,Ku=e,Yu=l),0===(o=e.pendingLanes)&&(Qu=null),function(e){if(an&&"function"==typeof an.onCommitFiberRoot)try{an.onCommitFiberRoot(ln,e,void 0,128==(128&e.current.flags))}catch(e){}}(t.stateNode),rs(e,Ge()),null!==n)for(r=e.onRecoverableError,t=0;t<n.length;t++)r((l=n[t]).value,{componentStack:l.stack,digest:l.digest});if(Hu)throw Hu=!1,e=Wu,Wu=null,e;0!=(1&Yu)&&0!==e.tag&&Ss(),0!=(1&(o=e.pendingLanes))?e===Gu?Xu++:(Xu=0,Gu=e):Xu=0,Bl()}(e,n,t,r)}finally{Nu.transition=l,kn=r}return null}function Ss(){if(null!==Ku){var e=wn(Yu),n=Nu.transition,t=kn;try{if(Nu.transition=null,kn=16>e?16:e,null===Ku)var r=!1;else{if(e=Ku,Ku=null,Yu=0,0!=(6&Pu))throw Error(a(331));var l=Pu;for(Pu|=4,Ji=e.current;null!==Ji;){var o=Ji,i=o.child;if(0!=(16&Ji.flags)){var u=o.deletions;if(null!==u){for(var s=0;s<u.length;s++){var c=u[s];for(Ji=c;null!==Ji;){var f=Ji;switch(f.tag){case 0:case 11:case 15:tu(8,f,o)}var d=f.child;if(null!==d)d.return=f,Ji=d;else for(;null!==Ji;){var p=(f=Ji).sibling,h=f.return;if(au(f),f===c){Ji=null;break}if(null!==p){p.return=h,Ji=p;break}Ji=h}}}var m=o.alternate;if(null!==m){var g=m.child;if(null!==g){m.child=null;do{var v=g.sibling;g.sibling=null,g=v}while(null!==g)}}Ji=o}}if(0!=(2064&o.subtreeFlags)&&null!==i)i.return=o,Ji=i;else e:for(;null!==Ji;){if(0!=(2048&(o=Ji).flags))switch(o.tag){case 0:case 11:case 15:tu(9,o,o.return)}var y=o.sibling;if(null!==y){y.return=o.return,Ji=y;break e}Ji=o.return}}var b=e.current;for(Ji=b;null!==Ji;){var k=(i=Ji).child;if(0!=(2064&i.subtreeFlags)&&null!==k)k.return=i,Ji=k;else e:for(i=b;null!==Ji;){if(0!=(2048&(u=Ji).flags))try{switch(u.tag){case 0:case 11:case 15:ru(9,u)}}catch(e){Es(u,u.return,e)}if(u===i){Ji=null;break e}var w=u.sibling;if(null!==w){w.return=u.return,Ji=w;break e}Ji=u.return}}if(Pu=l,Bl(),an&&"function"==typeof an.onPostCommitFiberRoot)try{an.onPostCommitFiberRoot(ln,e)}catch(e){}r=!0}return r}finally{kn=t,Nu.transition=n}}return!1}function xs(e,n,t){e=Oa(e,n=hi(0,n=ci(t,n),1),1),n=es(),null!==e&&(yn(e,1,n),rs(e,n))}function Es(e,n,t){if(3===e.tag)xs(e,e,t);else for(;null!==n;){if(3===n.tag){xs(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Qu||!Qu.has(r))){n=Oa(n,e=mi(n,e=ci(t,e),1),1),e=es(),null!==n&&(yn(n,1,e),rs(n,e));break}}n=n.return}}function _s(e,n,t){var r=e.pingCache;null!==r&&r.delete(n),n=es(),e.pingedLanes|=e.suspendedLanes&t,zu===e&&(Lu&t)===t&&(4===Ou||3===Ou&&(130023424&Lu)===Lu&&500>Ge()-Vu?ds(e,0):Uu|=t),rs(e,n)}function Cs(e,n){0===n&&(0==(1&e.mode)?n=1:(n=fn,0==(130023424&(fn<<=1))&&(fn=4194304)));var t=es();null!==(e=za(e,n))&&(yn(e,n,t),rs(e,t))}function Ns(e){var n=e.memoizedState,t=0;null!==n&&(t=n.retryLane),Cs(e,t)}function Ps(e,n){var t=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;null!==l&&(t=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(n),Cs(e,t)}function zs(e,n){return qe(e,n)}function Ts(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ls(e,n,t,r){return new Ts(e,n,t,r)}function Ms(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Rs(e,n){var t=e.alternate;return null===t?((t=Ls(e.tag,n,e.key,e.mode)).elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.subtreeFlags=0,t.deletions=null),t.flags=14680064&e.flags,t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=null===n?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function Os(e,n,t,r,l,o){var i=2;if(r=e,"function"==typeof e)Ms(e)&&(i=1);else if("string"==typeof e)i=5;else e:switch(e){case x:return Is(t.children,l,o,n);case E:i=8,l|=8;break;case _:return(e=Ls(12,t,n,2|l)).elementType=_,e.lanes=o,e;case z:return(e=Ls(13,t,n,l)).elementType=z,e.lanes=o,e;case T:return(e=Ls(19,t,n,l)).elementType=T,e.lanes=o,e;case R:return Fs(t,l,o,n);default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case C:i=10;break e;case N:i=9;break e;case P:i=11;break e;case L:i=14;break e;case M:i=16,r=null;break e}throw Error(a(130,null==e?e:typeof e,""))}return(n=Ls(i,t,n,l)).elementType=e,n.type=r,n.lanes=o,n}function Is(e,n,t,r){return(e=Ls(7,e,r,n)).lanes=t,e}function Fs(e,n,t,r){return(e=Ls(22,e,r,n)).elementType=R,e.lanes=t,e.stateNode={isHidden:!1},e}function Ds(e,n,t){return(e=Ls(6,e,null,n)).lanes=t,e}function Us(e,n,t){return(n=Ls(4,null!==e.children?e.children:[],e.key,n)).lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function As(e,n,t,r,l){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vn(0),this.expirationTimes=vn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vn(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function js(e,n,t,r,l,a,o,i,u){return e=new As(e,n,t,i,u),1===n?(n=1,!0===a&&(n|=8)):n=0,a=Ls(3,null,null,n),e.current=a,a.stateNode=e,a.memoizedState={element:r,isDehydrated:t,cache:null,transitions:null,pendingSuspenseBoundaries:null},La(a),e}function Vs(e,n,t){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:S,key:null==r?null:""+r,children:e,containerInfo:n,implementation:t}}function Bs(e){if(!e)return Nl;e:{if(Be(e=e._reactInternals)!==e||1!==e.tag)throw Error(a(170));var n=e;do{switch(n.tag){case 3:n=n.stateNode.context;break e;case 1:if(Ml(n.type)){n=n.stateNode.__reactInternalMemoizedMergedChildContext;break e}}n=n.return}while(null!==n);throw Error(a(171))}if(1===e.tag){var t=e.type;if(Ml(t))return Il(e,t,n)}return n}function $s(e,n,t,r,l,a,o,i,u){return(e=js(t,r,!0,e,0,a,0,i,u)).context=Bs(null),t=e.current,(a=Ra(r=es(),l=ns(t))).callback=null!=n?n:null,Oa(t,a,l),e.current.lanes=l,yn(e,l,r),rs(e,r),e}function Hs(e,n,t,r){var l=n.current,a=es(),o=ns(l);return t=Bs(t),null===n.context?n.context=t:n.pendingContext=t,(n=Ra(a,o)).payload={element:e},null!==(r=void 0===r?null:r)&&(n.callback=r),null!==(e=Oa(l,n,o))&&(ts(e,l,o,a),Ia(e,l,o)),o}function Ws(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Qs(e,n){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var t=e.retryLane;e.retryLane=0!==t&&t<n?t:n}}function qs(e,n){Qs(e,n),(e=e.alternate)&&Qs(e,n)}xu=function(e,n,t){if(null!==e)if(e.memoizedProps!==n.pendingProps||zl.current)ki=!0;else{if(0==(e.lanes&t)&&0==(128&n.flags))return ki=!1,function(e,n,t){switch(n.tag){case 3:Ti(n),pa();break;case 5:ao(n);break;case 1:Ml(n.type)&&Fl(n);break;case 4:ro(n,n.stateNode.containerInfo);break;case 10:var r=n.type._context,l=n.memoizedProps.value;Cl(va,r._currentValue),r._currentValue=l;break;case 13:if(null!==(r=n.memoizedState))return null!==r.dehydrated?(Cl(io,1&io.current),n.flags|=128,null):0!=(t&n.child.childLanes)?Di(e,n,t):(Cl(io,1&io.current),null!==(e=Hi(e,n,t))?e.sibling:null);Cl(io,1&io.current);break;case 19:if(r=0!=(t&n.childLanes),0!=(128&e.flags)){if(r)return Bi(e,n,t);n.flags|=128}if(null!==(l=n.memoizedState)&&(l.rendering=null,l.tail=null,l.lastEffect=null),Cl(io,io.current),r)break;return null;case 22:case 23:return n.lanes=0,_i(e,n,t)}return Hi(e,n,t)}(e,n,t);ki=0!=(131072&e.flags)}else ki=!1,la&&0!=(1048576&n.flags)&&Zl(n,Ql,n.index);switch(n.lanes=0,n.tag){case 2:var r=n.type;$i(e,n),e=n.pendingProps;var l=Ll(n,Pl.current);Ea(n,t),l=Eo(null,n,r,e,l,t);var o=_o();return n.flags|=1,"object"==typeof l&&null!==l&&"function"==typeof l.render&&void 0===l.$$typeof?(n.tag=1,n.memoizedState=null,n.updateQueue=null,Ml(r)?(o=!0,Fl(n)):o=!1,n.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,La(n),l.updater=Va,n.stateNode=l,l._reactInternals=n,Wa(n,r,e,t),n=zi(null,n,r,!0,o,t)):(n.tag=0,la&&o&&ea(n),wi(null,n,l,t),n=n.child),n;case 16:r=n.elementType;e:{switch($i(e,n),e=n.pendingProps,r=(l=r._init)(r._payload),n.type=r,l=n.tag=function(e){if("function"==typeof e)return Ms(e)?1:0;if(null!=e){if((e=e.$$typeof)===P)return 11;if(e===L)return 14}return 2}(r),e=ga(r,e),l){case 0:n=Ni(null,n,r,e,t);break e;case 1:n=Pi(null,n,r,e,t);break e;case 11:n=Si(null,n,r,e,t);break e;case 14:n=xi(null,n,r,ga(r.type,e),t);break e}throw Error(a(306,r,""))}return n;case 0:return r=n.type,l=n.pendingProps,Ni(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 1:return r=n.type,l=n.pendingProps,Pi(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 3:e:{if(Ti(n),null===e)throw Error(a(387));r=n.pendingProps,l=(o=n.memoizedState).element,Ma(e,n),Da(n,r,null,t);var i=n.memoizedState;if(r=i.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},n.updateQueue.baseState=o,n.memoizedState=o,256&n.flags){n=Li(e,n,r,t,l=ci(Error(a(423)),n));break e}if(r!==l){n=Li(e,n,r,t,l=ci(Error(a(424)),n));break e}for(ra=sl(n.stateNode.containerInfo.firstChild),ta=n,la=!0,aa=null,t=Ga(n,null,r,t),n.child=t;t;)t.flags=-3&t.flags|4096,t=t.sibling}else{if(pa(),r===l){n=Hi(e,n,t);break e}wi(e,n,r,t)}n=n.child}return n;case 5:return ao(n),null===e&&sa(n),r=n.type,l=n.pendingProps,o=null!==e?e.memoizedProps:null,i=l.children,tl(r,l)?i=null:null!==o&&tl(r,o)&&(n.flags|=32),Ci(e,n),wi(e,n,i,t),n.child;case 6:return null===e&&sa(n),null;case 13:return Di(e,n,t);case 4:return ro(n,n.stateNode.containerInfo),r=n.pendingProps,null===e?n.child=Xa(n,null,r,t):wi(e,n,r,t),n.child;case 11:return r=n.type,l=n.pendingProps,Si(e,n,r,l=n.elementType===r?l:ga(r,l),t);case 7:return wi(e,n,n.pendingProps,t),n.child;case 8:case 12:return wi(e,n,n.pendingProps.children,t),n.child;case 10:e:{if(r=n.type._context,l=n.pendingProps,o=n.memoizedProps,i=l.value,Cl(va,r._currentValue),r._currentValue=i,null!==o)if(ir(o.value,i)){if(o.children===l.children&&!zl.current){n=Hi(e,n,t);break e}}else for(null!==(o=n.child)&&(o.return=n);null!==o;){var u=o.dependencies;if(null!==u){i=o.child;for(var s=u.firstContext;null!==s;){if(s.context===r){if(1===o.tag){(s=Ra(-1,t&-t)).tag=2;var c=o.updateQueue;if(null!==c){var f=(c=c.shared).pending;null===f?s.next=s:(s.next=f.next,f.next=s),c.pending=s}}o.lanes|=t,null!==(s=o.alternate)&&(s.lanes|=t),xa(o.return,t,n),u.lanes|=t;break}s=s.next}}else if(10===o.tag)i=o.type===n.type?null:o.child;else if(18===o.tag){if(null===(i=o.return))throw Error(a(341));i.lanes|=t,null!==(u=i.alternate)&&(u.lanes|=t),xa(i,t,n),i=o.sibling}else i=o.child;if(null!==i)i.return=o;else for(i=o;null!==i;){if(i===n){i=null;break}if(null!==(o=i.sibling)){o.return=i.return,i=o;break}i=i.return}o=i}wi(e,n,l.children,t),n=n.child}return n;case 9:return l=n.type,r=n.pendingProps.children,Ea(n,t),r=r(l=_a(l)),n.flags|=1,wi(e,n,r,t),n.child;case 14:return l=ga(r=n.type,n.pendingProps),xi(e,n,r,l=ga(r.type,l),t);case 15:return Ei(e,n,n.type,n.pendingProps,t);case 17:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:ga(r,l),$i(e,n),n.tag=1,Ml(r)?(e=!0,Fl(n)):e=!1,Ea(n,t),$a(n,r,l),Wa(n,r,l,t),zi(null,n,r,!0,e,t);case 19:return Bi(e,n,t);case 22:return _i(e,n,t)}throw Error(a(156,n.tag))};var Ks="function"==typeof reportError?reportError:function(e){console.error(e)};function Ys(e){this._internalRoot=e}function Xs(e){this._internalRoot=e}function Gs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Js(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Zs(){}function ec(e,n,t,r,l){var a=t._reactRootContainer;if(a){var o=a;if("function"==typeof l){var i=l;l=function(){var e=Ws(o);i.call(e)}}Hs(n,o,e,l)}else o=function(e,n,t,r,l){if(l){if("function"==typeof r){var a=r;r=function(){var e=Ws(o);a.call(e)}}var o=$s(n,r,e,0,null,!1,0,"",Zs);return e._reactRootContainer=o,e[hl]=o.current,Br(8===e.nodeType?e.parentNode:e),cs(),o}for(;l=e.lastChild;)e.removeChild(l);if("function"==typeof r){var i=r;r=function(){var e=Ws(u);i.call(e)}}var u=js(e,0,!1,null,0,!1,0,"",Zs);return e._reactRootContainer=u,e[hl]=u.current,Br(8===e.nodeType?e.parentNode:e),cs((function(){Hs(n,u,t,r)})),u}(t,n,e,l,r);return Ws(o)}Xs.prototype.render=Ys.prototype.render=function(e){var n=this._internalRoot;if(null===n)throw Error(a(409));Hs(e,n,null,null)},Xs.prototype.unmount=Ys.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var n=e.containerInfo;cs((function(){Hs(null,e,null,null)})),n[hl]=null}},Xs.prototype.unstable_scheduleHydration=function(e){if(e){var n=_n();e={blockedOn:null,target:e,priority:n};for(var t=0;t<On.length&&0!==n&&n<On[t].priority;t++);On.splice(t,0,e),0===t&&Un(e)}},Sn=function(e){switch(e.tag){case 3:var n=e.stateNode;if(n.current.memoizedState.isDehydrated){var t=dn(n.pendingLanes);0!==t&&(bn(n,1|t),rs(n,Ge()),0==(6&Pu)&&(Bu=Ge()+500,Bl()))}break;case 13:cs((function(){var n=za(e,1);if(null!==n){var t=es();ts(n,e,1,t)}})),qs(e,1)}},xn=function(e){if(13===e.tag){var n=za(e,134217728);null!==n&&ts(n,e,134217728,es()),qs(e,134217728)}},En=function(e){if(13===e.tag){var n=ns(e),t=za(e,n);null!==t&&ts(t,e,n,es()),qs(e,n)}},_n=function(){return kn},Cn=function(e,n){var t=kn;try{return kn=e,n()}finally{kn=t}},Se=function(e,n,t){switch(n){case"input":if(J(e,t),n=t.name,"radio"===t.type&&null!=n){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var l=wl(r);if(!l)throw Error(a(90));q(r),J(r,l)}}}break;case"textarea":ae(e,t);break;case"select":null!=(n=t.value)&&te(e,!!t.multiple,n,!1)}},Pe=ss,ze=cs;var nc={usingClientEntryPoint:!1,Events:[bl,kl,wl,Ce,Ne,ss]},tc={findFiberByHostInstance:yl,bundleType:0,version:"18.2.0",rendererPackageName:"react-dom"},rc={bundleType:tc.bundleType,version:tc.version,rendererPackageName:tc.rendererPackageName,rendererConfig:tc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:k.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=We(e))?null:e.stateNode},findFiberByHostInstance:tc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.2.0-next-9e3b772b8-20220608"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var lc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!lc.isDisabled&&lc.supportsFiber)try{ln=lc.inject(rc),an=lc}catch(ce){}}n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=nc,n.createPortal=function(e,n){var t=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Gs(n))throw Error(a(200));return Vs(e,n,null,t)},n.createRoot=function(e,n){if(!Gs(e))throw Error(a(299));var t=!1,r="",l=Ks;return null!=n&&(!0===n.unstable_strictMode&&(t=!0),void 0!==n.identifierPrefix&&(r=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),n=js(e,1,!1,null,0,t,0,r,l),e[hl]=n.current,Br(8===e.nodeType?e.parentNode:e),new Ys(n)},n.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var n=e._reactInternals;if(void 0===n){if("function"==typeof e.render)throw Error(a(188));throw e=Object.keys(e).join(","),Error(a(268,e))}return null===(e=We(n))?null:e.stateNode},n.flushSync=function(e){return cs(e)},n.hydrate=function(e,n,t){if(!Js(n))throw Error(a(200));return ec(null,e,n,!0,t)},n.hydrateRoot=function(e,n,t){if(!Gs(e))throw Error(a(405));var r=null!=t&&t.hydratedSources||null,l=!1,o="",i=Ks;if(null!=t&&(!0===t.unstable_strictMode&&(l=!0),void 0!==t.identifierPrefix&&(o=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),n=$s(n,null,e,1,null!=t?t:null,l,0,o,i),e[hl]=n.current,Br(e),r)for(e=0;e<r.length;e++)l=(l=(t=r[e])._getVersion)(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,l]:n.mutableSourceEagerHydrationData.push(t,l);return new Xs(n)},n.render=function(e,n,t){if(!Js(n))throw Error(a(200));return ec(null,e,n,!1,t)},n.unmountComponentAtNode=function(e){if(!Js(e))throw Error(a(40));return!!e._reactRootContainer&&(cs((function(){ec(null,null,e,!1,(function(){e._reactRootContainer=null,e[hl]=null}))})),!0)},n.unstable_batchedUpdates=ss,n.unstable_renderSubtreeIntoContainer=function(e,n,t,r){if(!Js(t))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return ec(e,n,t,!1,r)},n.version="18.2.0-next-9e3b772b8-20220608"},935:(e,n,t)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=t(448)},408:(e,n)=>{"use strict";var t=Symbol.for("react.element"),r=Symbol.for("react.portal"),l=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),p=Symbol.iterator,h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},m=Object.assign,g={};function v(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}function y(){}function b(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||h}v.prototype.isReactComponent={},v.prototype.setState=function(e,n){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,n,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},y.prototype=v.prototype;var k=b.prototype=new y;k.constructor=b,m(k,v.prototype),k.isPureReactComponent=!0;var w=Array.isArray,S=Object.prototype.hasOwnProperty,x={current:null},E={key:!0,ref:!0,__self:!0,__source:!0};function _(e,n,r){var l,a={},o=null,i=null;if(null!=n)for(l in void 0!==n.ref&&(i=n.ref),void 0!==n.key&&(o=""+n.key),n)S.call(n,l)&&!E.hasOwnProperty(l)&&(a[l]=n[l]);var u=arguments.length-2;if(1===u)a.children=r;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];a.children=s}if(e&&e.defaultProps)for(l in u=e.defaultProps)void 0===a[l]&&(a[l]=u[l]);return{$$typeof:t,type:e,key:o,ref:i,props:a,_owner:x.current}}function C(e){return"object"==typeof e&&null!==e&&e.$$typeof===t}var N=/\/+/g;function P(e,n){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return n[e]}))}(""+e.key):n.toString(36)}function z(e,n,l,a,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u=!1;if(null===e)u=!0;else switch(i){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case t:case r:u=!0}}if(u)return o=o(u=e),e=""===a?"."+P(u,0):a,w(o)?(l="",null!=e&&(l=e.replace(N,"$&/")+"/"),z(o,n,l,"",(function(e){return e}))):null!=o&&(C(o)&&(o=function(e,n){return{$$typeof:t,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}(o,l+(!o.key||u&&u.key===o.key?"":(""+o.key).replace(N,"$&/")+"/")+e)),n.push(o)),1;if(u=0,a=""===a?".":a+":",w(e))for(var s=0;s<e.length;s++){var c=a+P(i=e[s],s);u+=z(i,n,l,c,o)}else if(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"==typeof c)for(e=c.call(e),s=0;!(i=e.next()).done;)u+=z(i=i.value,n,l,c=a+P(i,s++),o);else if("object"===i)throw n=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n)+"). If you meant to render a collection of children, use an array instead.");return u}function T(e,n,t){if(null==e)return e;var r=[],l=0;return z(e,r,"","",(function(e){return n.call(t,e,l++)})),r}function L(e){if(-1===e._status){var n=e._result;(n=n()).then((function(n){0!==e._status&&-1!==e._status||(e._status=1,e._result=n)}),(function(n){0!==e._status&&-1!==e._status||(e._status=2,e._result=n)})),-1===e._status&&(e._status=0,e._result=n)}if(1===e._status)return e._result.default;throw e._result}var M={current:null},R={transition:null},O={ReactCurrentDispatcher:M,ReactCurrentBatchConfig:R,ReactCurrentOwner:x};n.Children={map:T,forEach:function(e,n,t){T(e,(function(){n.apply(this,arguments)}),t)},count:function(e){var n=0;return T(e,(function(){n++})),n},toArray:function(e){return T(e,(function(e){return e}))||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},n.Component=v,n.Fragment=l,n.Profiler=o,n.PureComponent=b,n.StrictMode=a,n.Suspense=c,n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=O,n.cloneElement=function(e,n,r){if(null==e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var l=m({},e.props),a=e.key,o=e.ref,i=e._owner;if(null!=n){if(void 0!==n.ref&&(o=n.ref,i=x.current),void 0!==n.key&&(a=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)S.call(n,s)&&!E.hasOwnProperty(s)&&(l[s]=void 0===n[s]&&void 0!==u?u[s]:n[s])}var s=arguments.length-2;if(1===s)l.children=r;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];l.children=u}return{$$typeof:t,type:e.type,key:a,ref:o,props:l,_owner:i}},n.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},n.createElement=_,n.createFactory=function(e){var n=_.bind(null,e);return n.type=e,n},n.createRef=function(){return{current:null}},n.forwardRef=function(e){return{$$typeof:s,render:e}},n.isValidElement=C,n.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:L}},n.memo=function(e,n){return{$$typeof:f,type:e,compare:void 0===n?null:n}},n.startTransition=function(e){var n=R.transition;R.transition={};try{e()}finally{R.transition=n}},n.unstable_act=function(){throw Error("act(...) is not supported in production builds of React.")},n.useCallback=function(e,n){return M.current.useCallback(e,n)},n.useContext=function(e){return M.current.useContext(e)},n.useDebugValue=function(){},n.useDeferredValue=function(e){return M.current.useDeferredValue(e)},n.useEffect=function(e,n){return M.current.useEffect(e,n)},n.useId=function(){return M.current.useId()},n.useImperativeHandle=function(e,n,t){return M.current.useImperativeHandle(e,n,t)},n.useInsertionEffect=function(e,n){return M.current.useInsertionEffect(e,n)},n.useLayoutEffect=function(e,n){return M.current.useLayoutEffect(e,n)},n.useMemo=function(e,n){return M.current.useMemo(e,n)},n.useReducer=function(e,n,t){return M.current.useReducer(e,n,t)},n.useRef=function(e){return M.current.useRef(e)},n.useState=function(e){return M.current.useState(e)},n.useSyncExternalStore=function(e,n,t){return M.current.useSyncExternalStore(e,n,t)},n.useTransition=function(){return M.current.useTransition()},n.version="18.2.0"},294:(e,n,t)=>{"use strict";e.exports=t(408)},53:(e,n)=>{"use strict";function t(e,n){var t=e.length;e.push(n);e:for(;0<t;){var r=t-1>>>1,l=e[r];if(!(0<a(l,n)))break e;e[r]=n,e[t]=l,t=r}}function r(e){return 0===e.length?null:e[0]}function l(e){if(0===e.length)return null;var n=e[0],t=e.pop();if(t!==n){e[0]=t;e:for(var r=0,l=e.length,o=l>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>a(u,t))s<l&&0>a(c,u)?(e[r]=c,e[s]=t,r=s):(e[r]=u,e[i]=t,r=i);else{if(!(s<l&&0>a(c,t)))break e;e[r]=c,e[s]=t,r=s}}}return n}function a(e,n){var t=e.sortIndex-n.sortIndex;return 0!==t?t:e.id-n.id}if("object"==typeof performance&&"function"==typeof performance.now){var o=performance;n.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();n.unstable_now=function(){return i.now()-u}}var s=[],c=[],f=1,d=null,p=3,h=!1,m=!1,g=!1,v="function"==typeof setTimeout?setTimeout:null,y="function"==typeof clearTimeout?clearTimeout:null,b="undefined"!=typeof setImmediate?setImmediate:null;function k(e){for(var n=r(c);null!==n;){if(null===n.callback)l(c);else{if(!(n.startTime<=e))break;l(c),n.sortIndex=n.expirationTime,t(s,n)}n=r(c)}}function w(e){if(g=!1,k(e),!m)if(null!==r(s))m=!0,R(S);else{var n=r(c);null!==n&&O(w,n.startTime-e)}}function S(e,t){m=!1,g&&(g=!1,y(C),C=-1),h=!0;var a=p;try{for(k(t),d=r(s);null!==d&&(!(d.expirationTime>t)||e&&!z());){var o=d.callback;if("function"==typeof o){d.callback=null,p=d.priorityLevel;var i=o(d.expirationTime<=t);t=n.unstable_now(),"function"==typeof i?d.callback=i:d===r(s)&&l(s),k(t)}else l(s);d=r(s)}if(null!==d)var u=!0;else{var f=r(c);null!==f&&O(w,f.startTime-t),u=!1}return u}finally{d=null,p=a,h=!1}}"undefined"!=typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var x,E=!1,_=null,C=-1,N=5,P=-1;function z(){return!(n.unstable_now()-P<N)}function T(){if(null!==_){var e=n.unstable_now();P=e;var t=!0;try{t=_(!0,e)}finally{t?x():(E=!1,_=null)}}else E=!1}if("function"==typeof b)x=function(){b(T)};else if("undefined"!=typeof MessageChannel){var L=new MessageChannel,M=L.port2;L.port1.onmessage=T,x=function(){M.postMessage(null)}}else x=function(){v(T,0)};function R(e){_=e,E||(E=!0,x())}function O(e,t){C=v((function(){e(n.unstable_now())}),t)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(e){e.callback=null},n.unstable_continueExecution=function(){m||h||(m=!0,R(S))},n.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):N=0<e?Math.floor(1e3/e):5},n.unstable_getCurrentPriorityLevel=function(){return p},n.unstable_getFirstCallbackNode=function(){return r(s)},n.unstable_next=function(e){switch(p){case 1:case 2:case 3:var n=3;break;default:n=p}var t=p;p=n;try{return e()}finally{p=t}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(e,n){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var t=p;p=e;try{return n()}finally{p=t}},n.unstable_scheduleCallback=function(e,l,a){var o=n.unstable_now();switch(a="object"==typeof a&&null!==a&&"number"==typeof(a=a.delay)&&0<a?o+a:o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:f++,callback:l,priorityLevel:e,startTime:a,expirationTime:i=a+i,sortIndex:-1},a>o?(e.sortIndex=a,t(c,e),null===r(s)&&e===r(c)&&(g?(y(C),C=-1):g=!0,O(w,a-o))):(e.sortIndex=i,t(s,e),m||h||(m=!0,R(S))),e},n.unstable_shouldYield=z,n.unstable_wrapCallback=function(e){var n=p;return function(){var t=p;p=n;try{return e.apply(this,arguments)}finally{p=t}}}},840:(e,n,t)=>{"use strict";e.exports=t(53)}},n={};function t(r){var l=n[r];if(void 0!==l)return l.exports;var a=n[r]={exports:{}};return e[r].call(a.exports,a,a.exports,t),a.exports}t.n=e=>{var n=e&&e.__esModule?()=>e.default:()=>e;return t.d(n,{a:n}),n},t.d=(e,n)=>{for(var r in n)t.o(n,r)&&!t.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:n[r]})},t.o=(e,n)=>Object.prototype.hasOwnProperty.call(e,n),(()=>{"use strict";var e,n=t(294),r=t(935),l=t(302),a=t.n(l),o=t(184),i=t.n(o);!function(e){e.Row="row",e.Column="column"}(e||(e={}));var u=function(e,n,t){return void 0===t&&(t=.5),e.map((function(r,l){return Math.round(r+t*(n[l]-e[l]))}))},s={applyBackgroundColor:!1,askColor:[235,64,52],bidColor:[0,216,101],fullOpacity:!1,interpolateColor:u,layout:e.Column,listLength:10,showHeaders:!1,showSpread:!0,spread:void 0,stylePrefix:"rob_OrderBook"},c=function(e,t){var r=t.applyBackgroundColor,l=t.color,a=t.fullOpacity,o=t.interpolateColor,i=t.reverse,u=t.stylePrefix,s={display:"flex",flexDirection:i?"column-reverse":"column"};return n.createElement("ol",{style:s,className:u+"__list"},e.map((function(t,i){var s=t[0],c=t[1],f=i/(e.length-1),d="rgba("+o(l,[255,255,255],f).join()+", "+(a?1:1-f)+")",p={backgroundColor:r?d:void 0,"--row-color":d};return n.createElement("li",{className:u+"__list-item",key:s,style:p},n.createElement("span",{className:u+"__price"},s),n.createElement("span",{className:u+"__size"},c))})))},f=function(t){var r=t.applyBackgroundColor,l=t.askColor,o=t.bidColor,f=t.book,d=t.fullOpacity,p=t.interpolateColor,h=t.layout,m=t.listLength,g=t.showHeaders,v=t.showSpread,y=t.spread,b=t.stylePrefix,k=f.bids,w=f.asks,S=null!=y?y:new(a())(w[0][0]).minus(new(a())(k[0][0])).toString(),x=i()(b),E=w.slice(0,m),_=k.slice(0,m),C=h!==e.Row,N={display:"flex",flexDirection:h===e.Row?"row-reverse":"column"};return n.createElement("div",{style:N,className:x},n.createElement("div",{className:b+"__side "+b+"__side--asks"},g&&n.createElement("p",{className:b+"__side-header"},"Ask"),c(E,{applyBackgroundColor:r,color:null!=l?l:s.askColor,fullOpacity:d,interpolateColor:null!=p?p:u,reverse:C,stylePrefix:b})),v&&n.createElement("div",{className:b+"__spread"},n.createElement("p",{className:b+"__spread-header"},"Spread"),n.createElement("span",{className:b+"__spread-value"},S)),n.createElement("div",{className:b+"__side "+b+"__side--bids"},g&&n.createElement("p",{className:b+"__side-header"},"Bid"),c(_,{applyBackgroundColor:r,color:null!=o?o:s.bidColor,fullOpacity:d,interpolateColor:null!=p?p:u,stylePrefix:b})))};f.defaultProps=s;var d={asks:[["19233.63","0.71772706"],["19233.62","0.00488478"],["19232.77","0.07"],["19231.43","0.14"],["19231.42","0.0921495"]],bids:[["19227.69","0.05"],["19227.48","0.02417"],["19227.11","0.04969543"],["19226.99","0.19"],["19226.97","0.001"]]};!function(){function e(){var e;d=JSON.parse(("api/data",(e=new XMLHttpRequest).open("GET","api/data",!1),e.send(null),e.responseText)),p.render(h(d))}if("undefined"!=typeof EventSource){var t=!1,o=new EventSource("api/stream");o.onmessage=function(e){t=!0,d=JSON.parse(e.data),p.render(h(d))},o.onerror=function(){t||(o.close(),setInterval(e,1e3))}}else setInterval(e,1e3)}();var p=r.createRoot(document.getElementById("root")),h=function(e){return n.createElement(n.Fragment,null,n.createElement("style",{dangerouslySetInnerHTML:{__html:"\n            .MakeItNiceAgain {\n              background-color: #151825;\n              color: rgba(255, 255, 255, 0.6);\n              display: inline-block;\n              font-family: -apple-system, BlinkMacSystemFont, sans-serif;\n              font-size: 13px;\n              font-variant-numeric: tabular-nums;\n              padding: 50px 0;\n            }\n            .MakeItNiceAgain__side-header {\n              font-weight: 700;\n              margin: 0 0 5px 0;\n              text-align: right;\n            }\n            .MakeItNiceAgain__list {\n              list-style-type: none;\n              margin: 0;\n              padding: 0;\n            }\n            .MakeItNiceAgain__list-item {\n              border-top: 1px solid rgba(255, 255, 255, 0.1);\n              cursor: pointer;\n              display: flex;\n              justify-content: flex-end;\n            }\n            .MakeItNiceAgain__list-item:before {\n              content: '';\n              flex: 1 1;\n              padding: 3px 5px;\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__list-item {\n              flex-direction: row-reverse;\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__list-item:last-child {\n              border-bottom: 1px solid rgba(255, 255, 255, 0.1);\n            }\n            .MakeItNiceAgain__side--bids .MakeItNiceAgain__size {\n              text-align: right;\n            }\n            .MakeItNiceAgain__list-item:hover {\n              background: #262935;\n            }\n            .MakeItNiceAgain__price {\n              border-left: 1px solid rgba(255, 255, 255, 0.1);\n              border-right: 1px solid rgba(255, 255, 255, 0.1);\n              color: #b7bdc1;\n              display: inline-block;\n              flex: 0 0 50px;\n              margin: 0;\n              padding: 3px 5px;\n              text-align: center;\n            }\n            .MakeItNiceAgain__size {\n              flex: 1 1;\n              margin: 0;\n              padding: 3px 5px;\n              position: relative;\n            }\n            .MakeItNiceAgain__size:before {\n              background-color: var(--row-color);\n              content: '';\n              height: 100%;\n              left: 0;\n              opacity: 0.08;\n              position: absolute;\n              top: 0;\n              width: 100%;\n            }\n          "}}),n.createElement(f,{book:{bids:e.bids,asks:e.asks},fullOpacity:!0,interpolateColor:function(e){return e},listLength:5,stylePrefix:"MakeItNiceAgain",showSpread:!1}))}})()})();
\ No newline at end of file